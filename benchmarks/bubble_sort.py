@@ -0,0 +1,17 @@
+# Bubble sort of 64 values in descending order (the worst case).
+data = [0] * 64
+for i in range(64):
+    data[i] = 64 - i
+
+n = 64
+swapped = 1
+while swapped == 1:
+    swapped = 0
+    n = n - 1
+    for i in range(n):
+        if data[i] > data[i + 1]:
+            t = data[i]
+            data[i] = data[i + 1]
+            data[i + 1] = t
+            swapped = 1
+print(data[0], data[31], data[63])
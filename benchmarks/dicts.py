@@ -0,0 +1,8 @@
+# Dictionary lookups: a 16-entry table of squares, read 20 times over.
+squares = {1: 1, 2: 4, 3: 9, 4: 16, 5: 25, 6: 36, 7: 49, 8: 64,
+           9: 81, 10: 100, 11: 121, 12: 144, 13: 169, 14: 196, 15: 225, 16: 256}
+total = 0
+for rounds in range(20):
+    for k in range(1, 17):
+        total = total + squares[k]
+print(total)
@@ -0,0 +1,14 @@
+# Iterative Fibonacci: fib(0) .. fib(22); fib(22) still needs fib(23), the largest that fits in 16 bits signed.
+def fib(n):
+    a = 0
+    b = 1
+    for k in range(n):
+        t = a + b
+        a = b
+        b = t
+    return a
+
+total = 0
+for n in range(23):
+    total = fib(n)
+print(total)
@@ -0,0 +1,8 @@
+# f-string building: 100 status lines mixing constant text, a string
+# variable and two integers, printing only the last one.
+player = "ADA"
+score = 0
+for level in range(100):
+    score = score + level * 3
+    line = f"{player} LEVEL {level} SCORE {score}"
+print(line)
@@ -0,0 +1,15 @@
+# Insertion sort of 64 pseudo-random values from a linear congruential generator.
+data = [0] * 64
+seed = 1
+for i in range(64):
+    seed = (seed * 77 + 13) & 255
+    data[i] = seed
+
+for i in range(1, 64):
+    key = data[i]
+    j = i - 1
+    while j >= 0 and data[j] > key:
+        data[j + 1] = data[j]
+        j = j - 1
+    data[j + 1] = key
+print(data[0], data[32], data[63])
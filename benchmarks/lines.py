@@ -0,0 +1,8 @@
+# Line drawing stress: a fan of 16 lines from each of two corners, shallow
+# and steep, so both Bresenham octant paths are exercised.
+gfx_turn_on()
+gfx_clear_screen()
+for k in range(16):
+    gfx_draw_line(0, 0, 319, k * 13)
+    gfx_draw_line(319, 199, k * 20, 0)
+print(k)
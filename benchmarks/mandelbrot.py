@@ -0,0 +1,23 @@
+# Mandelbrot set in 4-bit fixed point (16 = 1.0) on a 20 x 13 grid, one point
+# per 16 x 16 pixel cell; the escape test keeps every product inside 16 bits.
+gfx_turn_on()
+inside = 0
+for row in range(13):
+    ci = row * 4 - 24
+    for col in range(20):
+        cr = col * 4 - 56
+        zr = 0
+        zi = 0
+        k = 0
+        while k < 12:
+            zr2 = zr * zr // 16
+            zi2 = zi * zi // 16
+            if zr2 + zi2 > 64:
+                break
+            zi = zr * zi // 8 + ci
+            zr = zr2 - zi2 + cr
+            k = k + 1
+        if k == 12:
+            inside = inside + 1
+            gfx_plot_point(col * 16, row * 16)
+print(inside)
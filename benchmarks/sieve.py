@@ -0,0 +1,13 @@
+# Sieve of Eratosthenes: the primes below 128.
+flags = [1] * 128
+count = 0
+i = 2
+while i < 128:
+    if flags[i] == 1:
+        count = count + 1
+        j = i + i
+        while j < 128:
+            flags[j] = 0
+            j = j + i
+    i = i + 1
+print(count)
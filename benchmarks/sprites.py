@@ -0,0 +1,17 @@
+# Sprite bouncing: sprite 0 moves diagonally for 200 frames, reversing at the
+# edges of the visible area; there is no frame wait, so only the updates are timed.
+x = 100
+y = 60
+dx = 3
+dy = 2
+for frame in range(200):
+    x = x + dx
+    y = y + dy
+    if x < 24 or x > 252:
+        dx = 0 - dx
+        x = x + dx
+    if y < 50 or y > 226:
+        dy = 0 - dy
+        y = y + dy
+    sprite_set_pos(0, x, y)
+print(x, y)
@@ -1,7 +1,11 @@
 # globals.py in py2c64
 # Global variables and configuration
 import ast
+import contextvars
 import sys  # For printing to stderr in report_compiler_error
+import threading
+import types
+from contextlib import contextmanager
 
 # Directory base per gli output attesi dei test, relativa alla directory test_suite
 # Esempio: se test.py è in py2asm/ e expected_outputs è in py2asm/test_suite/expected_outputs/
@@ -10,12 +14,6 @@ TEST_SUITE_DIR = "test_suite"
 EXPECTED_OUTPUTS_SUBDIR = "expected_outputs"
 
 
-# Changed to: variables = { 'var_name': {'address': int, 'is_8bit_semantic': bool, possibly 'py_type': str} }
-# We start with 'address', 'size', and 'is_8bit_semantic'.
-# The default for 'is_8bit_semantic' will be False (i.e., 16 bit) unless overridden.
-variables = {}
-data_definitions = []  # To collect variable and constant definitions
-
 # --- Code Generator Class ---
 class CodeGenerator:
     def __init__(self):
@@ -33,8 +31,23 @@ class CodeGenerator:
         """Extends the code section with a list of lines."""
         self._code.extend(lines)
 
+    def position(self):
+        """Returns the current end of the code, to come back to it later."""
+        return len(self._code)
+
+    def lines_since(self, position):
+        """Returns the lines emitted after `position`."""
+        return self._code[position:]
+
+    def insert(self, position, lines):
+        """Inserts lines at a position returned by position()."""
+        self._code[position:position] = lines
+
+    def truncate(self, position):
+        """Drops every line emitted after `position`."""
+        del self._code[position:]
+
 
-generated_code = CodeGenerator()
 INITIAL_MEMORY_POINTER = 0xC100
 MAX_MEMORY = 0xCFFF # Upper limit for variable allocation before I/O area
 CHROUT_ADDRESS = "$FFD2"
@@ -46,62 +59,145 @@ VIC_BASE_ADDR = 0xD000
 
 ROUTINES_START = 0x8000
 
-# Zero Page pointers for routines (PRINT_STRING_ZP_BASE_PTR is deprecated by new print_string)
-PRINT_STRING_ZP_BASE_PTR = 0xFA # Base address in Zero Page for the print_string pointer ($FA, $FB)
-COMPARE_STR_ZP_PTR1 = 0xF8     # ZP pointer for the first string in compare_string_const ($F8, $F9)
-COMPARE_STR_ZP_PTR2 = 0xF6     # ZP pointer for the second string in compare_string_const ($F6, $F7)
-INPUT_ZP_PTR = 0xF4            # ZP pointer for read_string_loop/end ($F4, $F5)
-FOR_LOOP_ZP_PTR = 0xF2  # ZP pointer for for loop iteration ($F2, $F3)
-FSTRING_SRC_ZP_PTR = 0xEE  # ZP pointer for the f-string source ($EE, $EF)
-FSTRING_DEST_ZP_PTR = 0xF0      # ZP pointer for the f-string destination ($F0, $F1)
-memory_pointer = INITIAL_MEMORY_POINTER
-TEMP_PTR1 = 0xF2 # A general purpose ZP pointer for routines ($F2, $F3, $F4, $F5)
-TEMP_VAR_1 = 0xBA  # temporary variables in zero page (2 bytes each). Used by FP conversion.
-TEMP_VAR_2 = 0xBC
-TEMP_VAR_3 = 0xBE
+# --- Zero Page Map ---
+class ZeroPageAllocator:
+    """
+    Single owner of the zero-page bytes used by the compiler.
+
+    Fixed regions (the runtime pointers below, the FP accumulators, ...) are
+    registered with reserve(); an overlap with an existing region raises a
+    ValueError unless the two regions explicitly list each other in
+    `shared_with` (routines that never run at the same time may share scratch
+    bytes). Hot user variables are then handed out from the free pool with
+    allocate(), which never returns a reserved byte.
+    """
+    def __init__(self, free_ranges):
+        self._regions = {}  # name -> {'address': int, 'size': int, 'shared_with': set, 'fixed': bool}
+        self._free_pool = sorted({addr for start, end in free_ranges for addr in range(start, end + 1)})
+
+    def _overlapping(self, address, size):
+        """Returns the names of the registered regions that overlap [address, address+size)."""
+        names = []
+        for name, region in self._regions.items():
+            if address < region['address'] + region['size'] and region['address'] < address + size:
+                names.append(name)
+        return names
+
+    def reserve(self, name, address, size, shared_with=()):
+        """Registers a fixed zero-page region and returns its start address."""
+        if address < 0 or address + size > 0x100:
+            raise ValueError(f"Zero page region '{name}' (${address:02X}, {size} bytes) is outside the zero page.")
+        shared_with = set(shared_with)
+        for other in self._overlapping(address, size):
+            if other == name:
+                continue
+            if other not in shared_with and name not in self._regions[other]['shared_with']:
+                region = self._regions[other]
+                raise ValueError(
+                    f"Zero page region '{name}' (${address:02X}-${address + size - 1:02X}) overlaps "
+                    f"'{other}' (${region['address']:02X}-${region['address'] + region['size'] - 1:02X})."
+                )
+        self._regions[name] = {'address': address, 'size': size, 'shared_with': shared_with, 'fixed': True}
+        return address
+
+    def allocate(self, name, size):
+        """
+        Allocates `size` contiguous free bytes for `name` from the free pool.
+        Returns the start address, or None if the pool has no room left.
+        """
+        if name in self._regions:
+            return self._regions[name]['address']
+        for address in self._free_pool:
+            if all(address + i in self._free_pool for i in range(size)) and not self._overlapping(address, size):
+                self._regions[name] = {'address': address, 'size': size, 'shared_with': set(), 'fixed': False}
+                return address
+        return None
+
+    def free_bytes(self):
+        """Returns the number of pool bytes not yet handed out."""
+        return sum(1 for address in self._free_pool if not self._overlapping(address, 1))
+
+    def allocations(self):
+        """Returns {name: (address, size)} for the dynamically allocated regions."""
+        return {name: (r['address'], r['size']) for name, r in self._regions.items() if not r['fixed']}
+
+    def restore(self, allocations):
+        """Records the dynamic allocations returned by allocations(), e.g. those of a cached compilation."""
+        for name, (address, size) in allocations.items():
+            self._regions[name] = {'address': address, 'size': size, 'shared_with': set(), 'fixed': False}
+
+    def reset(self):
+        """Drops all dynamic allocations, keeping the fixed reservations."""
+        self._regions = {name: r for name, r in self._regions.items() if r['fixed']}
+
+    def fingerprint(self):
+        """Hashable summary of the fixed reservations, for caches of code that uses them."""
+        return tuple(sorted((name, r['address'], r['size']) for name, r in self._regions.items() if r['fixed']))
+
+    def copy(self):
+        """Returns an allocator with the same reservations and allocations, independent of this one."""
+        allocator = ZeroPageAllocator(())
+        allocator._regions = {name: dict(r, shared_with=set(r['shared_with'])) for name, r in self._regions.items()}
+        allocator._free_pool = list(self._free_pool)
+        return allocator
+
+
+# Bytes handed out to hot user variables. BASIC is not running while the
+# compiled program executes, so its scratch areas are free to use:
+# $02 (unused), $22-$2A (BASIC temporary pointers), $4B-$72 (BASIC work area
+# and floating point accumulators; our FP package keeps its own at $F3-$FE).
+ZP_FREE_RANGES = [(0x02, 0x02), (0x22, 0x2A), (0x4B, 0x72)]
+ZERO_PAGE_MAP = ZeroPageAllocator(ZP_FREE_RANGES)  # Fixed reservations; each compilation allocates from a copy
+
+# --- Stack Pointer and Frame Pointer ---
+STACK_POINTER_ZP = ZERO_PAGE_MAP.reserve('STACK_POINTER_ZP', 0xE0, 2)  # Software stack pointer ($E0, $E1)
+FRAME_POINTER_ZP = ZERO_PAGE_MAP.reserve('FRAME_POINTER_ZP', 0xE2, 2)  # Software frame pointer ($E2, $E3)
 
 # --- Wozniak/Apple II Floating Point Zero Page Addresses ---
-WOZ_FP_SIGN = 0xF3
-WOZ_FP_X2   = 0xF4 # Exponent FP2 (Floating Point Accumulator 2)
-WOZ_FP_M2   = 0xF5 # Mantissa FP2 (3 bytes: $F5, $F6, $F7)
-WOZ_FP_X1   = 0xF8 # Exponent FP1 (Floating Point Accumulator 1)
-WOZ_FP_M1   = 0xF9 # Mantissa FP1 (3 bytes: $F9, $FA, $FB)
-WOZ_FP_E    = 0xFC # Mantissa FP1 extension / scratch (3 bytes: $FC, $FD, $FE)
-WOZ_FP_OVLOC = 0x03F5 # Standard Apple II overflow vector
+_WOZ_FP_SCRATCH = ('PRINT_STRING_ZP_BASE_PTR', 'COMPARE_STR_ZP_PTR1', 'COMPARE_STR_ZP_PTR2',
+                   'INPUT_ZP_PTR', 'FOR_LOOP_ZP_PTR', 'TEMP_PTR1')
+WOZ_FP_SIGN = ZERO_PAGE_MAP.reserve('WOZ_FP_SIGN', 0xF3, 1, shared_with=_WOZ_FP_SCRATCH)
+WOZ_FP_X2   = ZERO_PAGE_MAP.reserve('WOZ_FP_X2', 0xF4, 1, shared_with=_WOZ_FP_SCRATCH) # Exponent FP2 (Floating Point Accumulator 2)
+WOZ_FP_M2   = ZERO_PAGE_MAP.reserve('WOZ_FP_M2', 0xF5, 3, shared_with=_WOZ_FP_SCRATCH) # Mantissa FP2 (3 bytes: $F5, $F6, $F7)
+WOZ_FP_X1   = ZERO_PAGE_MAP.reserve('WOZ_FP_X1', 0xF8, 1, shared_with=_WOZ_FP_SCRATCH) # Exponent FP1 (Floating Point Accumulator 1)
+WOZ_FP_M1   = ZERO_PAGE_MAP.reserve('WOZ_FP_M1', 0xF9, 3, shared_with=_WOZ_FP_SCRATCH) # Mantissa FP1 (3 bytes: $F9, $FA, $FB)
+WOZ_FP_E    = ZERO_PAGE_MAP.reserve('WOZ_FP_E', 0xFC, 3)  # Mantissa FP1 extension / scratch (3 bytes: $FC, $FD, $FE)
+WOZ_FP_OVLOC = 0x03F5 # Standard Apple II overflow vector (not in zero page)
+
+# Zero Page pointers for routines. These are scratch pointers that live only for the
+# duration of a single runtime routine, so several of them share bytes with each other
+# and with the FP accumulators above. Every sharing is declared explicitly.
+PRINT_STRING_ZP_BASE_PTR = ZERO_PAGE_MAP.reserve('PRINT_STRING_ZP_BASE_PTR', 0xFA, 2)  # print_string pointer ($FA, $FB)
+COMPARE_STR_ZP_PTR1 = ZERO_PAGE_MAP.reserve('COMPARE_STR_ZP_PTR1', 0xF8, 2)  # First string in compare_string_const ($F8, $F9)
+COMPARE_STR_ZP_PTR2 = ZERO_PAGE_MAP.reserve('COMPARE_STR_ZP_PTR2', 0xF6, 2)  # Second string in compare_string_const ($F6, $F7)
+INPUT_ZP_PTR = ZERO_PAGE_MAP.reserve('INPUT_ZP_PTR', 0xF4, 2, shared_with=('TEMP_PTR1',))  # read_string_loop/end ($F4, $F5)
+FOR_LOOP_ZP_PTR = ZERO_PAGE_MAP.reserve('FOR_LOOP_ZP_PTR', 0xF2, 2, shared_with=('TEMP_PTR1',))  # for loop iteration ($F2, $F3)
+TEMP_PTR1 = ZERO_PAGE_MAP.reserve('TEMP_PTR1', 0xF2, 4)  # General purpose pointer for routines ($F2, $F3, $F4, $F5)
+FSTRING_DEST_ZP_PTR = ZERO_PAGE_MAP.reserve('FSTRING_DEST_ZP_PTR', 0xF0, 2)  # f-string destination ($F0, $F1)
+FSTRING_SRC_ZP_PTR = ZERO_PAGE_MAP.reserve('FSTRING_SRC_ZP_PTR', 0xEE, 2)  # f-string source ($EE, $EF)
+
+# Temporary variables in zero page (2 bytes each). Used by FP conversion in the
+# graphics routines, which also keep their own work area at $B0-$C9.
+_GFX_SCRATCH = ('TEMP_VAR_1', 'TEMP_VAR_2', 'TEMP_VAR_3')
+GFX_ZP_WORKSPACE = ZERO_PAGE_MAP.reserve('GFX_ZP_WORKSPACE', 0xB0, 26, shared_with=_GFX_SCRATCH)
+TEMP_VAR_1 = ZERO_PAGE_MAP.reserve('TEMP_VAR_1', 0xBA, 2)
+TEMP_VAR_2 = ZERO_PAGE_MAP.reserve('TEMP_VAR_2', 0xBC, 2)
+TEMP_VAR_3 = ZERO_PAGE_MAP.reserve('TEMP_VAR_3', 0xBE, 2)
 
 # --- Temporary Variable Management ---
-temp_var_counter = 0 # Counter for generating new unique temp var names
-temp_var_pool = []   # Pool of released temp var names for reuse
-
-label_counter = 0
-current_loop_labels_stack = [] # Stack to manage break/continue labels for nested loops
+# Temporaries get storage only after code generation (see lib/temp_allocation.py),
+# where temps whose lifetimes never overlap share the same bytes.
+# temp_0 is not a pool temp: it is the fixed argument cell of the runtime
+# routines (print_string, the *_error_msg routines) and comparison scratch.
+FIRST_POOL_TEMP = 1
 
 # --- Function call globals ---
-defined_functions = {}  # Stores func_name -> {'label': str, 'params': [str], 'ret_label': str}
 MAX_FUNC_ARGS = 3  # Maximum number of arguments a function can take (for predefining __func_arg_N)
 
-# --- Stack Pointer and Frame Pointer ---
-STACK_POINTER_ZP = 0x00E0  # Zero Page address for the software stack pointer (2 bytes)
-FRAME_POINTER_ZP = 0x00E2  # Zero Page address for the software frame pointer (2 bytes)
-
+# --- Software Stack ---
 STACK_BASE_ADDRESS = 0x0200 # Start of the software stack memory area
 STACK_TOP_ADDRESS = 0x02FF  # End of the software stack memory area (grows downwards)
 
-temp_variables = {}
-
-used_routines = set()  # Tracks routines used by the generated code
-
-# --- New/Moved Global State ---
-has_errors = False
-error_handler_generated = False
-current_scope = 'global' # Track current scope (global or function name)
-
-str_pointer = 0
-list_pointer = 0
-max_len_input = 0
-input_pointer = 0
-result_compare = 0
-
 # --- Configurazione Sintassi Assembler ---
 
 # Defines sets of directives for supported assemblers.
@@ -113,13 +209,15 @@ SUPPORTED_ASSEMBLERS_DIRECTIVES = {
             'res':  '* = * +',   # Directive to reserve a block of bytes.
                                  # Used as: {label} {res_directive} {size}
                                  # For CBM Prg Studio, this translates to: label * = * + size
-            'asciiz': 'text'    # Directive for null-terminated strings
+            'asciiz': 'text',   # Directive for null-terminated strings
+            'equ': '='          # Directive to bind a symbol to a fixed address: {label} {equ} {value}
         },
         "GENERIC_DEFAULT": { # Original values or a common alternative
             'byte': 'byte',
         'word': 'word',
         'res':  '.res',      # Many assemblers use .res or .block, ds.b, etc.
-        'asciiz': 'text'     # '.asciiz' is common, 'text' is used here as a generic placeholder
+        'asciiz': 'text',    # '.asciiz' is common, 'text' is used here as a generic placeholder
+        'equ': '='
     }
     # Add other assembler profiles here, e.g., "ACME", "CA65"
     # "ACME": {
@@ -159,9 +257,27 @@ _initialize_assembly_data_types()
 
 # --- Fine Configurazione Sintassi Assembler ---
 
+# --- Compiler Options ---
+# Code generation switches. Every compilation context starts from a copy of
+# these; front-ends (test.py, a CLI, ...) change `compiler_options` (the
+# options of the current context) before calling python_to_assembly, or give
+# a CompilationContext its own options. reset_globals() leaves them untouched.
+DEFAULT_COMPILER_OPTIONS = {
+    'zp_allocation': True,  # Move the most used variables into free zero-page bytes
+    'peephole': True,       # Run the peephole optimizer on the program code
+    'multiply': 'bitserial',  # 'bitserial' (small) or 'table' (quarter squares, faster, +1 KB tables)
+    'register_calls': True, # Pass the arguments of small leaf functions in X/A and zero page
+    'inline': True,         # Inline calls to small functions (opt out per function with @noinline)
+    'inline_budget': 256,   # Code growth allowed by inlining, in AST nodes
+    'byte_arithmetic': True, # Compile values the range analysis keeps in 0..255 with 8-bit operations
+    'overflow_checks': True, # Trap on integer overflow (False for shipping builds: --no-overflow-checks)
+    'register_loops': True, # Count range() loops whose values fit in a byte in the X or Y register
+    'prg': False,           # Also assemble the output into a .prg (with BASIC SYS stub) and a .sym label map
+    'profile': False,       # Record per-pass times, allocations and counts in compile_profile (lib/compile_profile.py)
+    'incremental': False,   # Reuse the code of functions unchanged since an earlier compilation in the process (lib/function_cache.py)
+}
+
 # --- Compiler Error Reporting ---
-_compiler_error_count = 0
-_compiler_warning_count = 0
 
 def report_compiler_error(message: str, node: ast.AST = None, level: str = "ERROR"):
     """
@@ -171,8 +287,6 @@ def report_compiler_error(message: str, node: ast.AST = None, level: str = "ERRO
         node (ast.AST, optional): The AST node related to the error, for line/col info.
         level (str, optional): "ERROR" or "WARNING".
     """
-    global _compiler_error_count, _compiler_warning_count
-
     location = ""
     if node and hasattr(node, 'lineno'):
         location = f" (line {node.lineno}"
@@ -182,14 +296,15 @@ def report_compiler_error(message: str, node: ast.AST = None, level: str = "ERRO
 
     full_message = f"{level.upper()}: {message}{location}"
     print(full_message, file=sys.stderr)
+    current_context().diagnostics.append((level.upper(), message, getattr(node, 'lineno', None)))
 
     if level.upper() == "ERROR":
-        _compiler_error_count += 1
+        current_context().error_count += 1
     elif level.upper() == "WARNING":
-        _compiler_warning_count += 1
+        current_context().warning_count += 1
 
 def get_compiler_error_count():
-    return _compiler_error_count
+    return current_context().error_count
 
 
 class ErrorCodes:
@@ -227,41 +342,110 @@ exception_name_to_code = {
 }
 
 
+# --- Compilation Context ---
+# All the state of one compilation lives in a CompilationContext, so that
+# several compilations can run in the same process (in threads, in a pool, or
+# interleaved by a server) without interfering. The compiler modules keep
+# reading and writing it as `globals.variables`, `globals.label_counter`, ...:
+# these module attributes are forwarded to the current context (see
+# _GlobalsModule at the end of this file), so they must never be copied into
+# module-level aliases, which would keep pointing into one context.
+# The current context is the one activated with use_context() in this thread
+# or asyncio task, else an implicit context of the thread. Implicit contexts of
+# other threads start from DEFAULT_COMPILER_OPTIONS, not from the options
+# changed on the main thread: pass the options to the CompilationContext.
+
+class CompilationContext:
+    """The state of one compilation, forwarded as the module attributes listed in STATE."""
+    STATE = (
+        'variables', 'data_definitions', 'generated_code', 'zero_page', 'memory_pointer',
+        'temp_var_counter', 'temp_var_peak', 'overflow_check_stats', 'label_counter',
+        'current_loop_labels_stack', 'defined_functions', 'temp_variables', 'used_routines',
+        'has_errors', 'error_handler_generated', 'current_scope', 'str_pointer', 'list_pointer',
+        'max_len_input', 'input_pointer', 'result_compare', 'compiler_options', 'compile_profile',
+    )
+
+    def __init__(self, options=None):
+        self.compiler_options = dict(DEFAULT_COMPILER_OPTIONS)
+        if options:
+            self.compiler_options.update(options)
+        self.reset()
+
+    def reset(self):
+        """Starts a new compilation in this context, keeping its compiler options."""
+        # variables = { 'var_name': {'address': int, 'size': int, 'is_8bit_semantic': bool, 'type': str, ...} }
+        # 'is_8bit_semantic' defaults to False (i.e., 16 bit) unless overridden.
+        self.variables = {}
+        self.data_definitions = []  # To collect variable and constant definitions
+        self.generated_code = CodeGenerator()
+        self.zero_page = ZERO_PAGE_MAP.copy()
+        self.memory_pointer = INITIAL_MEMORY_POINTER
+        self.temp_var_counter = FIRST_POOL_TEMP  # Counter for generating new unique temp var names
+        self.temp_var_peak = 0  # Highest number of temps held at the same time (cost of a LIFO pool)
+        # Overflow tests after 16-bit arithmetic: emitted inline, proved unnecessary, or disabled
+        self.overflow_check_stats = {'inline': 0, 'removed': 0, 'disabled': 0}
+        self.label_counter = 0
+        self.current_loop_labels_stack = []  # Stack to manage break/continue labels for nested loops
+        self.defined_functions = {}  # Stores func_name -> {'label': str, 'params': [str], 'ret_label': str}
+        self.temp_variables = {}
+        self.used_routines = set()  # Tracks routines used by the generated code
+        self.has_errors = False
+        self.error_handler_generated = False
+        self.current_scope = 'global'  # Track current scope (global or function name)
+        self.str_pointer = 0
+        self.list_pointer = 0
+        self.max_len_input = 0
+        self.input_pointer = 0
+        self.result_compare = 0
+        self.error_count = 0
+        self.warning_count = 0
+        self.diagnostics = []  # (level, message, line) of each reported error and warning
+        self.cached = False  # True when the output was replayed from a compile cache
+        # Profile of the compilation when compiler_options['profile'] is set, else None
+        self.compile_profile = None
+        self.profile_handler_stack = []  # Handler calls in progress (lib/compile_profile.py)
+        self.profile_started_tracemalloc = False
+
+
+_active_context = contextvars.ContextVar('py2c64_compilation_context', default=None)
+_thread_state = threading.local()
+
+
+def current_context():
+    """Returns the context of the compilation running in this thread or task."""
+    context = _active_context.get()
+    if context is None:
+        context = getattr(_thread_state, 'context', None)
+        if context is None:
+            context = _thread_state.context = CompilationContext()
+    return context
+
+
+@contextmanager
+def use_context(context):
+    """Makes `context` the current context inside the with block."""
+    token = _active_context.set(context)
+    try:
+        yield context
+    finally:
+        _active_context.reset(token)
+
+
 def reset_globals(): # Renamed from clear_variables for clarity
-    """Resets all global state for a new compilation run."""
-    global variables, memory_pointer, label_counter, temp_variables, current_loop_labels_stack
-    global temp_var_counter, temp_var_pool, str_pointer, list_pointer, max_len_input
-    global input_pointer, result_compare, used_routines, data_definitions, generated_code
-    global _compiler_error_count, _compiler_warning_count, has_errors, error_handler_generated
-    global current_scope, defined_functions
-
-    variables.clear()
-    defined_functions.clear()
-    data_definitions.clear()
-    used_routines.clear()
-    temp_variables.clear()
-    current_loop_labels_stack.clear()
-    temp_var_pool.clear()
-
-    # Reset counters and pointers
-    memory_pointer = INITIAL_MEMORY_POINTER
-    label_counter = 0
-    temp_var_counter = 0
-    str_pointer = 0
-    list_pointer = 0
-    max_len_input = 0
-    input_pointer = 0
-    result_compare = 0
-
-    # Reset compilation status
-    _compiler_error_count = 0
-    _compiler_warning_count = 0
-    has_errors = False
-    error_handler_generated = False
-    current_scope = 'global'
-
-    # Re-create the code generator
-    generated_code = CodeGenerator()
+    """Resets the state of the current context for a new compilation run."""
+    current_context().reset()
 
     # Re-initialize assembler syntax settings
     _initialize_assembly_data_types()
+
+
+class _GlobalsModule(types.ModuleType):
+    """Module type of this module: forwards the names in CompilationContext.STATE to the current context."""
+
+
+for _name in CompilationContext.STATE:
+    setattr(_GlobalsModule, _name, property(
+        lambda module, name=_name: getattr(current_context(), name),
+        lambda module, value, name=_name: setattr(current_context(), name, value)))
+
+sys.modules[__name__].__class__ = _GlobalsModule
@@ -0,0 +1,472 @@
+# py2c64/lib/assembler.py
+# Two-pass 6502 assembler for the compiler's own output.
+# Understands the syntax python_to_assembly writes (CBM Prg Studio style, see
+# SUPPORTED_ASSEMBLERS_DIRECTIVES): labels with or without a colon, `name = expr`
+# equates, `* = $xxxx` origins, `label * = * + n` / `.res n` reservations and
+# `byte` / `word` / `text` data. Pass 1 gives every line its address and size,
+# pass 2 encodes it. Operands that refer to a symbol not yet defined in pass 1
+# are assembled as absolute addresses, the way assemblers treat forward
+# references, so both passes agree on every instruction's size.
+#
+# The result is a .prg: the load address, a BASIC stub `10 SYS <start>` at
+# $0801 so the program starts with RUN, then the program image.
+
+import re
+from lib.peephole import IDENTIFIER_RE
+
+BASIC_START = 0x0801
+BASIC_LINE_NUMBER = 10
+SYS_TOKEN = 0x9E
+
+# Opcode bytes per addressing mode:
+# imp (implied/accumulator), imm, zp, zpx, zpy, abs, absx, absy, ind, indx, indy, rel
+OPCODES = {
+    'ADC': {'imm': 0x69, 'zp': 0x65, 'zpx': 0x75, 'abs': 0x6D, 'absx': 0x7D, 'absy': 0x79, 'indx': 0x61, 'indy': 0x71},
+    'AND': {'imm': 0x29, 'zp': 0x25, 'zpx': 0x35, 'abs': 0x2D, 'absx': 0x3D, 'absy': 0x39, 'indx': 0x21, 'indy': 0x31},
+    'ASL': {'imp': 0x0A, 'zp': 0x06, 'zpx': 0x16, 'abs': 0x0E, 'absx': 0x1E},
+    'BCC': {'rel': 0x90}, 'BCS': {'rel': 0xB0}, 'BEQ': {'rel': 0xF0}, 'BMI': {'rel': 0x30},
+    'BNE': {'rel': 0xD0}, 'BPL': {'rel': 0x10}, 'BVC': {'rel': 0x50}, 'BVS': {'rel': 0x70},
+    'BIT': {'zp': 0x24, 'abs': 0x2C},
+    'BRK': {'imp': 0x00}, 'CLC': {'imp': 0x18}, 'CLD': {'imp': 0xD8}, 'CLI': {'imp': 0x58}, 'CLV': {'imp': 0xB8},
+    'CMP': {'imm': 0xC9, 'zp': 0xC5, 'zpx': 0xD5, 'abs': 0xCD, 'absx': 0xDD, 'absy': 0xD9, 'indx': 0xC1, 'indy': 0xD1},
+    'CPX': {'imm': 0xE0, 'zp': 0xE4, 'abs': 0xEC},
+    'CPY': {'imm': 0xC0, 'zp': 0xC4, 'abs': 0xCC},
+    'DEC': {'zp': 0xC6, 'zpx': 0xD6, 'abs': 0xCE, 'absx': 0xDE},
+    'DEX': {'imp': 0xCA}, 'DEY': {'imp': 0x88},
+    'EOR': {'imm': 0x49, 'zp': 0x45, 'zpx': 0x55, 'abs': 0x4D, 'absx': 0x5D, 'absy': 0x59, 'indx': 0x41, 'indy': 0x51},
+    'INC': {'zp': 0xE6, 'zpx': 0xF6, 'abs': 0xEE, 'absx': 0xFE},
+    'INX': {'imp': 0xE8}, 'INY': {'imp': 0xC8},
+    'JMP': {'abs': 0x4C, 'ind': 0x6C},
+    'JSR': {'abs': 0x20},
+    'LDA': {'imm': 0xA9, 'zp': 0xA5, 'zpx': 0xB5, 'abs': 0xAD, 'absx': 0xBD, 'absy': 0xB9, 'indx': 0xA1, 'indy': 0xB1},
+    'LDX': {'imm': 0xA2, 'zp': 0xA6, 'zpy': 0xB6, 'abs': 0xAE, 'absy': 0xBE},
+    'LDY': {'imm': 0xA0, 'zp': 0xA4, 'zpx': 0xB4, 'abs': 0xAC, 'absx': 0xBC},
+    'LSR': {'imp': 0x4A, 'zp': 0x46, 'zpx': 0x56, 'abs': 0x4E, 'absx': 0x5E},
+    'NOP': {'imp': 0xEA},
+    'ORA': {'imm': 0x09, 'zp': 0x05, 'zpx': 0x15, 'abs': 0x0D, 'absx': 0x1D, 'absy': 0x19, 'indx': 0x01, 'indy': 0x11},
+    'PHA': {'imp': 0x48}, 'PHP': {'imp': 0x08}, 'PLA': {'imp': 0x68}, 'PLP': {'imp': 0x28},
+    'ROL': {'imp': 0x2A, 'zp': 0x26, 'zpx': 0x36, 'abs': 0x2E, 'absx': 0x3E},
+    'ROR': {'imp': 0x6A, 'zp': 0x66, 'zpx': 0x76, 'abs': 0x6E, 'absx': 0x7E},
+    'RTI': {'imp': 0x40}, 'RTS': {'imp': 0x60},
+    'SBC': {'imm': 0xE9, 'zp': 0xE5, 'zpx': 0xF5, 'abs': 0xED, 'absx': 0xFD, 'absy': 0xF9, 'indx': 0xE1, 'indy': 0xF1},
+    'SEC': {'imp': 0x38}, 'SED': {'imp': 0xF8}, 'SEI': {'imp': 0x78},
+    'STA': {'zp': 0x85, 'zpx': 0x95, 'abs': 0x8D, 'absx': 0x9D, 'absy': 0x99, 'indx': 0x81, 'indy': 0x91},
+    'STX': {'zp': 0x86, 'zpy': 0x96, 'abs': 0x8E},
+    'STY': {'zp': 0x84, 'zpx': 0x94, 'abs': 0x8C},
+    'TAX': {'imp': 0xAA}, 'TAY': {'imp': 0xA8}, 'TSX': {'imp': 0xBA}, 'TXA': {'imp': 0x8A},
+    'TXS': {'imp': 0x9A}, 'TYA': {'imp': 0x98},
+}
+MODE_SIZES = {'imp': 1, 'imm': 2, 'zp': 2, 'zpx': 2, 'zpy': 2, 'abs': 3, 'absx': 3, 'absy': 3,
+              'ind': 3, 'indx': 2, 'indy': 2, 'rel': 2}
+ZERO_PAGE_FORMS = {'abs': 'zp', 'absx': 'zpx', 'absy': 'zpy'}
+
+DATA_DIRECTIVES = {'byte': 1, 'word': 2}
+DIRECTIVES = {'.byte', '.word', '.text', '.asciiz', '.res'}
+RESERVE_RE = re.compile(r'^\*\s*=\s*\*\s*\+\s*(.+)$')  # `* = * + n` after a label
+TOKEN_RE = re.compile(r"\s*(\$[0-9A-Fa-f]+|%[01]+|\d+|'.'|[A-Za-z_][A-Za-z0-9_]*|[-+*/()<>])\s*")
+
+
+class AssemblerError(Exception):
+    """An error in the assembly source, with the 1-based line it was found on."""
+
+    def __init__(self, message, line_number=None):
+        super().__init__(f"line {line_number}: {message}" if line_number else message)
+        self.line_number = line_number
+
+
+def _strip_comment(line):
+    """Removes a ';' comment, leaving semicolons inside quotes alone."""
+    quote = None
+    for index, char in enumerate(line):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == ';':
+            return line[:index].rstrip()
+    return line.rstrip()
+
+
+class _UndefinedSymbol(Exception):
+    pass
+
+
+def _tokenize(expression):
+    tokens, position = [], 0
+    while position < len(expression):
+        match = TOKEN_RE.match(expression, position)
+        if not match:
+            raise AssemblerError(f"Cannot parse expression '{expression}'")
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
+
+
+def evaluate(expression, symbols, pc=None):
+    """
+    Evaluates an operand expression: numbers ($hex, %binary, decimal, 'c'),
+    symbols and `*` (the program counter), with + - * / and parentheses,
+    optionally prefixed by < (low byte) or > (high byte) of everything that
+    follows. Returns None when a symbol is not defined (yet).
+    """
+    expression = expression.strip()
+    tokens = _tokenize(expression)
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def take():
+        nonlocal position
+        if position >= len(tokens):
+            raise AssemblerError(f"Cannot parse expression '{expression}'")
+        position += 1
+        return tokens[position - 1]
+
+    def byte_part():
+        if peek() in ('<', '>'):
+            part = take()
+            value = sum_()
+            return value & 0xFF if part == '<' else (value >> 8) & 0xFF
+        return sum_()
+
+    def sum_():
+        value = product()
+        while peek() in ('+', '-'):
+            value = value + product() if take() == '+' else value - product()
+        return value
+
+    def product():
+        value = unary()
+        while peek() in ('*', '/'):
+            if take() == '*':
+                value *= unary()
+            else:
+                divisor = unary()
+                if divisor == 0:
+                    raise AssemblerError(f"Division by zero in '{expression}'")
+                value //= divisor
+        return value
+
+    def unary():
+        if peek() == '-':
+            take()
+            return -unary()
+        return primary()
+
+    def primary():
+        token = take()
+        if token == '(':
+            value = byte_part()
+            if take() != ')':
+                raise AssemblerError(f"Cannot parse expression '{expression}'")
+            return value
+        if token.startswith('$'):
+            return int(token[1:], 16)
+        if token.startswith('%'):
+            return int(token[1:], 2)
+        if token.isdigit():
+            return int(token)
+        if token.startswith("'"):
+            return ord(token[1])
+        if token == '*':
+            if pc is None:
+                raise _UndefinedSymbol()
+            return pc
+        if token[0].isalpha() or token[0] == '_':
+            if token not in symbols:
+                raise _UndefinedSymbol()
+            return symbols[token]
+        raise AssemblerError(f"Cannot parse expression '{expression}'")
+
+    try:
+        value = byte_part()
+    except _UndefinedSymbol:
+        return None
+    if position != len(tokens):
+        raise AssemblerError(f"Cannot parse expression '{expression}'")
+    return value
+
+
+def _parse_operand(opcode, operand):
+    """Returns (addressing_mode, expression) with abs* standing for 'zp or abs'."""
+    operand = operand.strip()
+    modes = OPCODES[opcode]
+    if 'rel' in modes:
+        return 'rel', operand
+    if not operand or (operand.upper() == 'A' and 'imp' in modes):
+        return 'imp', None  # `A` is the accumulator only for the shifts; elsewhere it is a label
+    if operand.startswith('#'):
+        return 'imm', operand[1:]
+    compact = operand.replace(' ', '')
+    upper = compact.upper()
+    if compact.startswith('('):
+        if upper.endswith(',X)'):
+            return 'indx', compact[1:-3]
+        if upper.endswith('),Y'):
+            return 'indy', compact[1:-3]
+        if compact.endswith(')'):
+            return 'ind', compact[1:-1]
+    if upper.endswith(',X'):
+        return 'absx', compact[:-2]
+    if upper.endswith(',Y'):
+        return 'absy', compact[:-2]
+    return 'abs', compact
+
+
+def _split_statement(code):
+    """Splits a code line into (label, opcode_or_directive, rest)."""
+    if code.startswith('*'):
+        return None, '*', code[1:].strip()
+    directive = re.match(r'^\.?([A-Za-z]+)(?:\s+(.*))?$', code)
+    if directive and '.' + directive.group(1).lower() in DIRECTIVES:
+        operand = directive.group(2) or ''
+        if not operand.startswith(('=', '*')):  # Otherwise a label that looks like a directive
+            return None, '.' + directive.group(1).lower(), operand
+    match = re.match(r'^([A-Za-z_][A-Za-z0-9_]*)(:?)\s*(.*)$', code)
+    if not match:
+        raise AssemblerError(f"Cannot parse '{code}'")
+    word, colon, rest = match.groups()
+    if not colon and word.upper() in OPCODES:
+        return None, word.upper(), rest
+    if not colon and rest.startswith('='):
+        return word, '=', rest[1:].strip()
+    if not rest:
+        return word, None, ''
+    if rest.startswith('*'):
+        return word, '*', rest[1:].strip()
+    second = re.match(r'^\.?([A-Za-z]+)\b\s*(.*)$', rest)
+    if not second:
+        raise AssemblerError(f"Cannot parse '{code}'")
+    keyword, operand = second.groups()
+    if keyword.upper() in OPCODES and not rest.startswith('.'):
+        return word, keyword.upper(), operand
+    return word, '.' + keyword.lower(), operand
+
+
+def _data_items(operand):
+    """Splits a data operand on commas outside quotes."""
+    items, current, quote = [], '', None
+    for char in operand:
+        if quote:
+            current += char
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+            current += char
+        elif char == ',':
+            items.append(current.strip())
+            current = ''
+        else:
+            current += char
+    if current.strip():
+        items.append(current.strip())
+    return items
+
+
+def _text_bytes(operand, line_number):
+    operand = operand.strip()
+    if len(operand) < 2 or operand[0] != '"' or operand[-1] != '"':
+        raise AssemblerError(f"Expected a quoted string, got '{operand}'", line_number)
+    return operand[1:-1].encode('ascii')
+
+
+class _Statement:
+    __slots__ = ('line_number', 'label', 'kind', 'operand', 'address', 'size', 'mode')
+
+    def __init__(self, line_number, label, kind, operand):
+        self.line_number = line_number
+        self.label = label
+        self.kind = kind        # Opcode, '=', '*', '.byte', '.word', '.text', '.res', or None
+        self.operand = operand
+        self.address = None
+        self.size = 0
+        self.mode = None
+
+
+def _parse(source):
+    statements = []
+    for line_number, line in enumerate(source.split('\n'), start=1):
+        code = _strip_comment(line).strip()
+        if not code:
+            continue
+        try:
+            label, kind, operand = _split_statement(code)
+        except AssemblerError as error:
+            raise AssemblerError(str(error), line_number)
+        if kind == '.asciiz':
+            kind = '.text'
+        statements.append(_Statement(line_number, label, kind, operand))
+    return statements
+
+
+def _evaluate_equates(pending, symbols):
+    """Resolves the equates whose expressions only use known symbols; repeats until none is left to do."""
+    progress = True
+    while progress and pending:
+        progress = False
+        for statement in list(pending):
+            value = evaluate(statement.operand, symbols)
+            if value is not None:
+                symbols[statement.label] = value
+                pending.remove(statement)
+                progress = True
+
+
+def _define(symbols, statement, value):
+    if statement.label in symbols:
+        raise AssemblerError(f"Duplicate definition of '{statement.label}'", statement.line_number)
+    symbols[statement.label] = value
+
+
+def _first_pass(statements, origin):
+    symbols, pending_equates = {}, []
+    pc = origin
+    for statement in statements:
+        kind = statement.kind
+        if kind == '=':
+            if statement.label in symbols or any(p.label == statement.label for p in pending_equates):
+                raise AssemblerError(f"Duplicate definition of '{statement.label}'", statement.line_number)
+            pending_equates.append(statement)
+            _evaluate_equates(pending_equates, symbols)
+            continue
+        if kind == '*' and statement.label is None:
+            value = evaluate(statement.operand.lstrip('= '), symbols, pc)
+            if value is None:
+                raise AssemblerError("Origin must be known in the first pass", statement.line_number)
+            pc = value
+            continue
+        statement.address = pc
+        if statement.label is not None:
+            _define(symbols, statement, pc)
+        if kind is None:
+            continue
+        if kind == '*' or kind == '.res':
+            reserve = RESERVE_RE.match('*' + statement.operand) if kind == '*' else None
+            if kind == '*' and not reserve:
+                raise AssemblerError(f"Unsupported origin expression '* {statement.operand}'", statement.line_number)
+            size = evaluate(reserve.group(1) if reserve else statement.operand, symbols, pc)
+            if size is None:
+                raise AssemblerError("Reserved size must be known in the first pass", statement.line_number)
+            statement.size = size
+        elif kind in ('.byte', '.word'):
+            statement.size = DATA_DIRECTIVES[kind[1:]] * len(_data_items(statement.operand))
+        elif kind == '.text':
+            statement.size = len(_text_bytes(statement.operand, statement.line_number))
+        elif kind in OPCODES:
+            mode, expression = _parse_operand(kind, statement.operand)
+            if mode in ZERO_PAGE_FORMS:
+                # Zero page only when the address is already known to be below $100
+                value = evaluate(expression, symbols, pc)
+                short_mode = ZERO_PAGE_FORMS[mode]
+                if value is not None and 0 <= value <= 0xFF and short_mode in OPCODES[kind]:
+                    mode = short_mode
+            if mode not in OPCODES[kind]:
+                raise AssemblerError(f"{kind} has no {mode} addressing mode", statement.line_number)
+            statement.mode = mode
+            statement.size = MODE_SIZES[mode]
+        else:
+            raise AssemblerError(f"Unknown directive or opcode '{kind}'", statement.line_number)
+        pc += statement.size
+    _evaluate_equates(pending_equates, symbols)
+    if pending_equates:
+        statement = pending_equates[0]
+        raise AssemblerError(f"Cannot resolve '{statement.label} = {statement.operand}'", statement.line_number)
+    return symbols
+
+
+def _value(expression, symbols, pc, statement):
+    value = evaluate(expression, symbols, pc)
+    if value is None:
+        undefined = [name for name in re.findall(r'[A-Za-z_][A-Za-z0-9_]*', expression) if name not in symbols]
+        raise AssemblerError(f"Undefined symbol '{undefined[0] if undefined else expression}'", statement.line_number)
+    return value
+
+
+def _encode(statement, symbols):
+    kind, pc = statement.kind, statement.address
+    if kind in OPCODES:
+        mode = statement.mode
+        _, expression = _parse_operand(kind, statement.operand)
+        encoded = [OPCODES[kind][mode]]
+        if mode == 'imp':
+            return encoded
+        value = _value(expression, symbols, pc, statement)
+        if mode == 'rel':
+            offset = value - (pc + 2)
+            if not -128 <= offset <= 127:
+                raise AssemblerError(f"Branch to '{expression}' out of range ({offset} bytes)", statement.line_number)
+            return encoded + [offset & 0xFF]
+        if MODE_SIZES[mode] == 2:
+            if not -128 <= value <= 0xFF:
+                raise AssemblerError(f"Value {value} does not fit in a byte", statement.line_number)
+            return encoded + [value & 0xFF]
+        return encoded + [value & 0xFF, (value >> 8) & 0xFF]
+    if kind in ('*', '.res'):
+        return [0] * statement.size
+    if kind == '.text':
+        return list(_text_bytes(statement.operand, statement.line_number))
+    if kind in ('.byte', '.word'):
+        encoded = []
+        for item in _data_items(statement.operand):
+            value = _value(item, symbols, pc, statement)
+            encoded += [value & 0xFF] if kind == '.byte' else [value & 0xFF, (value >> 8) & 0xFF]
+        return encoded
+    return []
+
+
+def basic_stub(start_address):
+    """The tokenized BASIC line `10 SYS <start_address>`, loaded at $0801."""
+    digits = str(start_address).encode('ascii')
+    next_line = BASIC_START + 2 + 2 + 1 + len(digits) + 1
+    return bytes([next_line & 0xFF, next_line >> 8, BASIC_LINE_NUMBER, 0, SYS_TOKEN]) + digits + bytes([0, 0, 0])
+
+
+def assemble(source, origin=0x1000):
+    """
+    Assembles the text produced by python_to_assembly. Returns a dict with
+      'prg':        the loadable .prg bytes (load address, BASIC stub, program)
+      'start':      address of the first program byte (the SYS target)
+      'end':        address after the last program byte
+      'symbols':    {name: value} for every label and equate
+      'code_bytes': bytes of instructions
+      'data_bytes': bytes of data and reserved storage
+    Raises AssemblerError on invalid source.
+    """
+    statements = _parse(source)
+    symbols = _first_pass(statements, origin)
+
+    image = {}
+    code_bytes = data_bytes = 0
+    for statement in statements:
+        if statement.address is None or statement.kind in (None, '='):
+            continue
+        encoded = _encode(statement, symbols)
+        for offset, byte in enumerate(encoded):
+            image[statement.address + offset] = byte
+        if statement.kind in OPCODES:
+            code_bytes += len(encoded)
+        else:
+            data_bytes += len(encoded)
+    if not image:
+        raise AssemblerError("Nothing to assemble")
+
+    start, end = min(image), max(image) + 1
+    stub = basic_stub(start)
+    if BASIC_START + len(stub) > start:
+        raise AssemblerError(f"Program start ${start:04X} overlaps the BASIC stub")
+    body = bytearray(end - BASIC_START)
+    body[:len(stub)] = stub
+    for address, byte in image.items():
+        body[address - BASIC_START] = byte
+    prg = bytes([BASIC_START & 0xFF, BASIC_START >> 8]) + bytes(body)
+    return {'prg': prg, 'start': start, 'end': end, 'symbols': symbols,
+            'code_bytes': code_bytes, 'data_bytes': data_bytes}
+
+
+def format_symbol_map(symbols):
+    """One `name = $xxxx` line per symbol, sorted by value: the label map of the program."""
+    return "\n".join(f"{name} = ${value & 0xFFFF:04X}"
+                     for name, value in sorted(symbols.items(), key=lambda item: (item[1], item[0]))) + "\n"
@@ -7,11 +7,10 @@ from . import func_dict
 from . import func_c64
 from . import func_builtins
 from . import func_structures
+from . import func_lists
+from . import compile_profile
 
 # Aliases
-gen_code = globals.generated_code
-variables = globals.variables
-used_routines = globals.used_routines
 report_error = globals.report_compiler_error
 
 def _evaluate_expression_to_ax(node, error_handler_func, current_func_info=None):
@@ -21,21 +20,22 @@ def _evaluate_expression_to_ax(node, error_handler_func, current_func_info=None)
     temp_result_var = func_core.get_temp_var()
     func_expressions.translate_expression_recursive(temp_result_var, node, current_func_info.get('name') if current_func_info else None)
 
-    is_float_result = variables.get(temp_result_var, {}).get('type') == 'float'
+    is_float_result = globals.variables.get(temp_result_var, {}).get('type') == 'float'
 
     if is_float_result:
         # Convert float to int for pushing onto the 16-bit stack.
         # This is a temporary simplification. Proper float argument handling is needed.
         func_core._generate_float_to_int_conversion(temp_result_var, temp_result_var)
         # Now temp_result_var holds the 16-bit integer representation.
-        gen_code.append(f"    LDA {temp_result_var}+1") # High byte
-        gen_code.append(f"    LDX {temp_result_var}")   # Low byte
+        globals.generated_code.append(f"    LDA {temp_result_var}+1") # High byte
+        globals.generated_code.append(f"    LDX {temp_result_var}")   # Low byte
     else:
-        gen_code.append(f"    LDA {temp_result_var}+1") # High byte
-        gen_code.append(f"    LDX {temp_result_var}")   # Low byte
+        globals.generated_code.append(f"    LDA {temp_result_var}+1") # High byte
+        globals.generated_code.append(f"    LDX {temp_result_var}")   # Low byte
 
     func_core.release_temp_var(temp_result_var)
 
+@compile_profile.handler
 def process_expr_node(node, error_handler_func, current_func_info=None):
     """Processes an ast.Expr node, which is a wrapper for standalone expressions like function calls."""
     if not isinstance(node, ast.Expr):
@@ -74,22 +74,33 @@ def process_expr_node(node, error_handler_func, current_func_info=None):
                 report_error(f"Function '{func_name}' called with {len(call_node.args)} arguments, but expected {len(func_info['params'])}.", node=call_node)
                 return
 
-            gen_code.append(f"    ; --- Preparazione chiamata a {func_name} ---")
+            globals.generated_code.append(f"    ; --- Preparazione chiamata a {func_name} ---")
+
+            if func_info.get('convention') in ('static', 'register'):
+                # Non-recursive function: arguments go in registers or straight into its static frame
+                current_func_name = current_func_info.get('name') if current_func_info else None
+                if func_info['convention'] == 'register':
+                    func_expressions.pass_register_arguments(func_name, call_node.args, current_func_name)
+                else:
+                    func_expressions.store_static_call_arguments(func_name, call_node.args, current_func_name)
+                globals.generated_code.append(f"    JSR {func_info['label']}")
+                globals.generated_code.append(f"    ; --- Fine chiamata a {func_name} (valore di ritorno in A/X scartato) ---")
+                return
 
             # 1. Evaluate and push arguments onto the stack (in reverse order)
             total_arg_size = 0
             for arg_node in reversed(call_node.args):
                 _evaluate_expression_to_ax(arg_node, error_handler_func, current_func_info)
-                gen_code.append("    JSR push_word_ax")
-                used_routines.add('push_word_ax')
+                globals.generated_code.append("    JSR push_word_ax")
+                globals.used_routines.add('push_word_ax')
                 total_arg_size += 2
 
             # 2. Call the function
-            gen_code.append(f"    JSR {func_info['label']}")
+            globals.generated_code.append(f"    JSR {func_info['label']}")
 
             # 3. Clean up the stack (caller's responsibility)
             if total_arg_size > 0:
-                gen_code.extend([
+                globals.generated_code.extend([
                     f"    ; Caller pulisce {total_arg_size} byte di argomenti dallo stack",
                     "    CLC",
                     f"    LDA ${globals.STACK_POINTER_ZP:02X}",
@@ -101,7 +112,7 @@ def process_expr_node(node, error_handler_func, current_func_info=None):
                 ])
 
             # The return value is now in A/X, but since this is a standalone expression, it's discarded.
-            gen_code.append(f"    ; --- Fine chiamata a {func_name} (valore di ritorno in A/X scartato) ---")
+            globals.generated_code.append(f"    ; --- Fine chiamata a {func_name} (valore di ritorno in A/X scartato) ---")
 
         else:
             report_error(f"Chiamata a funzione non definita '{func_name}'.", node=call_node)
@@ -110,6 +121,7 @@ def process_expr_node(node, error_handler_func, current_func_info=None):
         _evaluate_expression_to_ax(node.value, error_handler_func, current_func_info)
 
 
+@compile_profile.handler
 def process_assign_node(node, current_func_info=None):
     """Processes an ast.Assign node."""
     # --- REFACTORED: Delegate assignments from function calls ---
@@ -140,6 +152,8 @@ def process_assign_node(node, current_func_info=None):
         current_func_name = current_func_info.get('name') if current_func_info else None
         resolved_var_name = func_core.resolve_variable_name(var_name, current_func_name)
         func_expressions.translate_expression_recursive(resolved_var_name, node.value, current_func_name)
+    elif func_lists.subscript_list_name(target, func_core.get_current_func_name(current_func_info)):
+        func_lists.store_element(target, node.value, func_core.get_current_func_name(current_func_info))
     elif isinstance(target, ast.Subscript):
         # This handles my_dict['key'] = value. This is not yet implemented.
         # The old call to handle_dict_assignment was incorrect for this case.
@@ -147,35 +161,60 @@ def process_assign_node(node, current_func_info=None):
     else:
         report_error(f"Assignment to target of type {type(target).__name__} not supported.", node=target)
 
+@compile_profile.handler
 def process_function_def_node(node, error_handler_func):
     func_name = node.name
     func_info = globals.defined_functions[func_name]
     func_label = func_info['label']
     ret_label = func_info['ret_label']
 
-    gen_code.append(f"\n{func_label}:")
-    gen_code.append(f"    ; --- Function Prologue for {func_name} ---")
+    globals.generated_code.append(f"\n{func_label}:")
+    is_static = func_info.get('convention') in ('static', 'register')
+    if func_info.get('convention') == 'register':
+        # The first argument arrives in X/A, a second one already sits in its zero-page word
+        globals.generated_code.append(f"    ; --- {func_name}: register arguments ---")
+        for param in func_info['register_params']:
+            if param['store'] == 'ax':
+                func_core.store_ax_in_var(func_core._get_mangled_local_var_name(func_name, param['name']))
+    elif is_static:
+        # Params and locals live at fixed addresses (lib/call_graph.py): no frame to set up
+        globals.generated_code.append(f"    ; --- {func_name}: static frame, no prologue ---")
+    else:
+        _generate_stack_prologue(func_name, func_info)
+
+    _process_function_body(node, func_info, error_handler_func)
+
+    # Function Epilogue
+    globals.generated_code.append(f"\n{ret_label}:")
+    if is_static:
+        globals.generated_code.append(f"    RTS")
+    else:
+        _generate_stack_epilogue(func_name)
+
+
+def _generate_stack_prologue(func_name, func_info):
+    globals.generated_code.append(f"    ; --- Function Prologue for {func_name} ---")
 
     # 1. Save old Frame Pointer (FP) onto the stack
-    gen_code.extend([
-        f"    LDA #<{globals.FRAME_POINTER_ZP:04X}",
+    globals.generated_code.extend([
+        f"    LDA #<${globals.FRAME_POINTER_ZP:04X}",
         f"    STA ${globals.TEMP_PTR1:02X}",
-        f"    LDA #>{globals.FRAME_POINTER_ZP:04X}",
+        f"    LDA #>${globals.FRAME_POINTER_ZP:04X}",
         f"    STA ${globals.TEMP_PTR1+1:02X}",
         f"    JSR push_word_from_addr"
     ])
-    used_routines.add('push_word_from_addr')
+    globals.used_routines.add('push_word_from_addr')
 
     # 2. Set new Frame Pointer (FP) to current Stack Pointer (SP)
-    gen_code.extend(func_core._generate_copy_2_bytes(
+    globals.generated_code.extend(func_core._generate_copy_2_bytes(
         globals.STACK_POINTER_ZP, globals.FRAME_POINTER_ZP
     ))
 
     # 3. Allocate space for local variables
     total_locals_size = func_info.get('total_locals_size', 0)
     if total_locals_size > 0:
-        gen_code.append(f"    ; Allocate {total_locals_size} bytes for local variables")
-        gen_code.extend([
+        globals.generated_code.append(f"    ; Allocate {total_locals_size} bytes for local variables")
+        globals.generated_code.extend([
             f"    SEC",
             f"    LDA ${globals.STACK_POINTER_ZP:02X}",
             f"    SBC #{total_locals_size & 0xFF}",
@@ -185,78 +224,98 @@ def process_function_def_node(node, error_handler_func):
             f"    STA ${globals.STACK_POINTER_ZP+1:02X}"
         ])
 
-    gen_code.append(f"    ; --- End Function Prologue ---")
+    globals.generated_code.append(f"    ; --- End Function Prologue ---")
 
-    # Process function body
-    current_func_info = {'name': func_name, 'params': func_info['params']}
+
+def _process_function_body(node, func_info, error_handler_func):
+    current_func_info = {'name': node.name, 'params': func_info['params']}
     for statement in node.body:
-        if isinstance(statement, ast.Expr):
-            process_expr_node(statement, error_handler_func, current_func_info)
-        elif isinstance(statement, ast.Assign):
-            process_assign_node(statement, current_func_info)
-        elif isinstance(statement, ast.Return):
-            if statement.value:
-                # Determine the type of the return expression to use the correct return register(s)
-                temp_return_var = func_core.get_temp_var()
-                func_expressions.translate_expression_recursive(
-                    temp_return_var, statement.value, current_func_info.get('name')
-                )
-                return_type = variables.get(temp_return_var, {}).get('type', 'int')
-
-                if return_type == 'float':
-                    # Load float value into FP1 for return
-                    func_core.load_fp1_from_var(temp_return_var)
-                else:
-                    # Load integer/pointer value into A/X for return
-                    func_core.load_ax_from_var(temp_return_var)
-
-                func_core.release_temp_var(temp_return_var)
-            else:
-                # No return value (or `return None`), so return 0 in A/X
-                gen_code.extend(["    LDA #0", "    LDX #0"])
-            gen_code.append(f"    JMP {ret_label}")
-        # --- MODIFIED: Call functions from the new module ---
-        if isinstance(statement, ast.If):
-            func_structures.process_if_node(statement, error_handler_func, current_func_info)
-        elif isinstance(statement, ast.For):
-            func_structures.process_for_node(statement, error_handler_func, current_func_info)
-        elif isinstance(statement, ast.While):
-            func_structures.process_while_node(statement, error_handler_func, current_func_info)
-        elif isinstance(statement, ast.Global):
-            pass # Handled in collection pass
+        process_node(statement, error_handler_func, current_func_info)
+
+
+@compile_profile.handler
+def process_return_node(node, current_func_info=None):
+    """Processes a return statement: the value goes in A/X (or FP1 for floats)."""
+    if not current_func_info:
+        report_error("'return' outside of a function.", node=node)
+        return
+    ret_label = globals.defined_functions[current_func_info['name']]['ret_label']
+    if node.value:
+        # Determine the type of the return expression to use the correct return register(s)
+        temp_return_var = func_core.get_temp_var()
+        func_expressions.translate_expression_recursive(
+            temp_return_var, node.value, current_func_info.get('name')
+        )
+        return_type = globals.variables.get(temp_return_var, {}).get('type', 'int')
+
+        if return_type == 'float':
+            # Load float value into FP1 for return
+            func_core.load_fp1_from_var(temp_return_var)
         else:
-            report_error(f"Unhandled statement type in function '{func_name}': {type(statement).__name__}", node=statement, level="WARNING")
+            # Load integer/pointer value into A/X for return
+            func_core.load_ax_from_var(temp_return_var)
 
-    # Function Epilogue
-    gen_code.append(f"\n{ret_label}:")
-    gen_code.append(f"    ; --- Function Epilogue for {func_name} ---")
+        func_core.release_temp_var(temp_return_var)
+    else:
+        # No return value (or `return None`), so return 0 in A/X
+        globals.generated_code.extend(["    LDA #0", "    LDX #0"])
+    globals.generated_code.append(f"    JMP {ret_label}")
+
+
+def process_node(node, error_handler_func, current_func_info=None):
+    """Processes one statement of a function body or of an if/loop block."""
+    if isinstance(node, ast.Expr):
+        process_expr_node(node, error_handler_func, current_func_info)
+    elif isinstance(node, ast.Assign):
+        process_assign_node(node, current_func_info)
+    elif isinstance(node, ast.Return):
+        process_return_node(node, current_func_info)
+    elif isinstance(node, ast.If):
+        func_structures.process_if_node(node, error_handler_func, current_func_info)
+    elif isinstance(node, ast.For):
+        func_structures.process_for_node(node, error_handler_func, current_func_info)
+    elif isinstance(node, ast.While):
+        func_structures.process_while_node(node, error_handler_func, current_func_info)
+    elif isinstance(node, (ast.Break, ast.Continue)):
+        func_structures.process_loop_jump_node(node)
+    elif isinstance(node, (ast.Global, ast.Pass)):
+        pass # Handled in collection pass / no code needed
+    else:
+        scope = f" in function '{current_func_info['name']}'" if current_func_info else ""
+        report_error(f"Unhandled statement type{scope}: {type(node).__name__}", node=node, level="WARNING")
+
+
+def _generate_stack_epilogue(func_name):
+    globals.generated_code.append(f"    ; --- Function Epilogue for {func_name} ---")
 
     # 1. Deallocate local variables (restore SP from FP)
-    gen_code.extend(func_core._generate_copy_2_bytes(
+    globals.generated_code.extend(func_core._generate_copy_2_bytes(
         globals.FRAME_POINTER_ZP, globals.STACK_POINTER_ZP
     ))
 
     # 2. Restore old Frame Pointer (FP) from stack
-    gen_code.extend([
-        f"    LDA #<{globals.FRAME_POINTER_ZP:04X}",
+    globals.generated_code.extend([
+        f"    LDA #<${globals.FRAME_POINTER_ZP:04X}",
         f"    STA ${globals.TEMP_PTR1:02X}",
-        f"    LDA #>{globals.FRAME_POINTER_ZP:04X}",
+        f"    LDA #>${globals.FRAME_POINTER_ZP:04X}",
         f"    STA ${globals.TEMP_PTR1+1:02X}",
         f"    JSR pop_word_to_addr"
     ])
-    used_routines.add('pop_word_to_addr')
+    globals.used_routines.add('pop_word_to_addr')
 
     # 3. Return from subroutine
-    gen_code.append(f"    RTS")
-    gen_code.append(f"    ; --- End Function Epilogue ---")
+    globals.generated_code.append(f"    RTS")
+    globals.generated_code.append(f"    ; --- End Function Epilogue ---")
+
 
 # --- Placeholder functions for other AST nodes ---
 
 def process_delete_node(node):
-    gen_code.append(f"; Placeholder per Delete")
+    globals.generated_code.append(f"; Placeholder per Delete")
 
+@compile_profile.handler
 def process_try_node(node, error_handler_func):
-    gen_code.append(f"; Placeholder per Try block")
+    globals.generated_code.append(f"; Placeholder per Try block")
 
 class AstProcessor:  # Add the class definition here
     def __init__(self, func_expressions, func_core, func_dict, func_c64, func_builtins):
@@ -266,12 +325,7 @@ class AstProcessor:  # Add the class definition here
         self.func_c64 = func_c64
         self.func_builtins = func_builtins
     def process_node(self, node, error_handler_func, current_func_info=None):
-        if isinstance(node, ast.Assign):
-            self.process_assign_node(node, current_func_info)
-        elif isinstance(node, ast.Expr):
-            self.process_expr_node(node, error_handler_func, current_func_info)
-        else:
-            report_error(f"Unhandled node type: {type(node).__name__}", node=node)
+        process_node(node, error_handler_func, current_func_info)
 
     def process_assign_node(self, node, current_func_info=None):
         process_assign_node(node, current_func_info)
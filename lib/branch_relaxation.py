@@ -0,0 +1,203 @@
+# py2c64/lib/branch_relaxation.py
+# Branch relaxation: the final layout pass over the program code.
+# The 6502 relative branches reach -128..+127 bytes from the next instruction.
+# Code generators emit plain `Bxx target` branches; this pass models every
+# instruction with its size, lays the code out and rewrites the branches whose
+# target is out of reach as `B!xx *+5` / `JMP target`. Lengthening a branch
+# moves the code after it, so the layout is repeated until nothing changes
+# (branches only ever grow, so this terminates).
+# The long forms that the generators still write out by hand (an inverted
+# branch over a JMP) are folded back into one branch first, and come back only
+# when the target really is too far.
+
+import re
+from lib.peephole import (
+    parse_line, _collect_equates, BRANCH_OPCODES, IDENTIFIER_RE, SYMBOL_OPERAND_RE, NUMERIC_OPERAND_RE, EQUATE_RE
+)
+
+INVERSE_BRANCHES = {'BEQ': 'BNE', 'BNE': 'BEQ', 'BCC': 'BCS', 'BCS': 'BCC',
+                    'BMI': 'BPL', 'BPL': 'BMI', 'BVC': 'BVS', 'BVS': 'BVC'}
+SHORT_BRANCH_SIZE = 2
+LONG_BRANCH_SIZE = 5  # B!xx *+5 (2) + JMP target (3)
+BRANCH_RANGE = (-128, 127)
+
+IMPLIED_OPCODES = {
+    'BRK', 'CLC', 'CLD', 'CLI', 'CLV', 'DEX', 'DEY', 'INX', 'INY', 'NOP', 'PHA', 'PHP', 'PLA', 'PLP',
+    'RTI', 'RTS', 'SEC', 'SED', 'SEI', 'TAX', 'TAY', 'TSX', 'TXA', 'TXS', 'TYA',
+}
+# Opcodes with a zero-page,Y mode; the others only have absolute,Y
+ZERO_PAGE_Y_OPCODES = {'LDX', 'STX'}
+ORIGIN_RE = re.compile(r'^\*\s*=\s*\$([0-9A-Fa-f]{1,4})$')
+RELATIVE_OPERAND_RE = re.compile(r'^\*\s*\+\s*(\d+)$')
+
+
+class Instruction:
+    """One line of program code with what the layout needs to know about it."""
+    __slots__ = ('line', 'label', 'opcode', 'operand', 'size', 'long')
+
+    def __init__(self, line, label=None, opcode=None, operand=None, size=0):
+        self.line = line        # Original text, written back unchanged unless the branch form changes
+        self.label = label
+        self.opcode = opcode
+        self.operand = operand
+        self.size = size        # Bytes; None for lines whose size is unknown (e.g. data directives)
+        self.long = None        # For relaxable branches: False (short) or True (branch over JMP)
+
+    @property
+    def relaxable(self):
+        return self.long is not None
+
+
+def _address_value(operand, equates):
+    """Value of a plain address operand, or None when it is not known before layout."""
+    match = NUMERIC_OPERAND_RE.match(operand)
+    if match:
+        return int(match.group(1), 16)
+    match = SYMBOL_OPERAND_RE.match(operand)
+    if match and match.group(1) in equates:
+        return equates[match.group(1)] + int(match.group(2) or 0)
+    return None
+
+
+def instruction_size(opcode, operand, equates):
+    """
+    Size in bytes of one instruction. Addresses the assembler cannot know
+    before the layout (labels) are taken as absolute, like assemblers treat
+    forward references; equated addresses below $100 use the zero-page modes.
+    """
+    operand = operand.replace(' ', '')
+    if opcode in IMPLIED_OPCODES or operand in ('', 'A', 'a'):
+        return 1
+    if opcode in BRANCH_OPCODES or operand.startswith('#'):
+        return 2
+    if opcode in ('JMP', 'JSR'):
+        return 3
+    if operand.startswith('('):
+        return 2  # (zp,X) and (zp),Y; JMP (abs) is handled above
+    if operand.upper().endswith(',Y') and opcode not in ZERO_PAGE_Y_OPCODES:
+        return 3
+    value = _address_value(operand.split(',')[0], equates)
+    return 2 if value is not None and value <= 0xFF else 3
+
+
+def build_model(lines):
+    """Turns assembly lines into Instructions, marking the branches to labels as relaxable."""
+    equates = _collect_equates(lines)
+    model = []
+    for line in lines:
+        label, opcode, operand = parse_line(line)
+        if opcode is not None:
+            instruction = Instruction(line, opcode=opcode, operand=operand,
+                                      size=instruction_size(opcode, operand, equates))
+            if opcode in BRANCH_OPCODES and IDENTIFIER_RE.match(operand):
+                instruction.long = False
+            model.append(instruction)
+        elif label is not None:
+            model.append(Instruction(line, label=label))
+        elif operand is None or ORIGIN_RE.match(operand) or EQUATE_RE.match(operand):
+            model.append(Instruction(line, operand=operand))
+        else:
+            model.append(Instruction(line, operand=operand, size=None))
+    return model
+
+
+def _fold_long_branches(model):
+    """
+    Replaces `Bxx *+5` / `JMP target` and `Bxx skip` / `JMP target` / `skip:`
+    with one relaxable `B!xx target`, when nothing else can reach the JMP.
+    """
+    result = []
+    index = 0
+    while index < len(model):
+        instruction = model[index]
+        following = model[index + 1] if index + 1 < len(model) else None
+        if (instruction.opcode in BRANCH_OPCODES and following is not None and following.opcode == 'JMP'
+                and IDENTIFIER_RE.match(following.operand)):
+            relative = RELATIVE_OPERAND_RE.match(instruction.operand.replace(' ', ''))
+            after = model[index + 2] if index + 2 < len(model) else None
+            skips_jump = (relative and int(relative.group(1)) == LONG_BRANCH_SIZE) or \
+                (after is not None and after.label is not None and after.label == instruction.operand)
+            if skips_jump:
+                folded = Instruction(f"    {INVERSE_BRANCHES[instruction.opcode]} {following.operand}",
+                                     opcode=INVERSE_BRANCHES[instruction.opcode], operand=following.operand,
+                                     size=SHORT_BRANCH_SIZE)
+                folded.long = True  # Marks it as folded; the layout picks its final form
+                result.append(folded)
+                index += 2
+                continue
+        result.append(instruction)
+        index += 1
+    return result
+
+
+def _layout(model, origin):
+    """Returns (addresses, label_addresses); addresses after an unknown-size line are None."""
+    addresses, labels = [], {}
+    address = origin
+    for instruction in model:
+        if instruction.operand is not None and instruction.opcode is None:
+            match = ORIGIN_RE.match(instruction.operand)
+            if match:
+                address = int(match.group(1), 16)
+        addresses.append(address)
+        if instruction.label is not None and address is not None:
+            labels[instruction.label] = address
+        if address is not None:
+            if instruction.relaxable:
+                address += LONG_BRANCH_SIZE if instruction.long else SHORT_BRANCH_SIZE
+            elif instruction.size is None:
+                address = None
+            else:
+                address += instruction.size
+    return addresses, labels
+
+
+def _in_range(instruction, address, labels):
+    target = labels.get(instruction.operand)
+    if address is None or target is None:
+        return False  # Outside this code (e.g. a runtime routine) or after an unknown-size line
+    offset = target - (address + SHORT_BRANCH_SIZE)
+    return BRANCH_RANGE[0] <= offset <= BRANCH_RANGE[1]
+
+
+def relax_branches(program_lines, origin=0x1000):
+    """
+    Lays out the program code and gives every branch its short form when the
+    target is in range, or an inverted branch over a JMP when it is not.
+    Returns (lines, stats).
+    """
+    stats = {'short': 0, 'long': 0, 'folded': 0, 'passes': 0}
+    model = _fold_long_branches(build_model(program_lines))
+    relaxable = [i for i, instruction in enumerate(model) if instruction.relaxable]
+
+    # Start from the smallest layout, then lengthen whatever does not reach
+    folded_long = {i for i in relaxable if model[i].long}
+    for i in relaxable:
+        model[i].long = False
+    while True:
+        stats['passes'] += 1
+        addresses, labels = _layout(model, origin)
+        grown = [i for i in relaxable if not model[i].long and not _in_range(model[i], addresses[i], labels)]
+        if not grown:
+            break
+        for i in grown:
+            model[i].long = True
+
+    lines = []
+    for i, instruction in enumerate(model):
+        if not instruction.relaxable:
+            lines.append(instruction.line)
+        elif instruction.long:
+            stats['long'] += 1
+            lines.extend([f"    {INVERSE_BRANCHES[instruction.opcode]} *+{LONG_BRANCH_SIZE}",
+                          f"    JMP {instruction.operand}"])
+        else:
+            stats['short'] += 1
+            lines.append(instruction.line)
+    stats['folded'] = sum(1 for i in folded_long if not model[i].long)
+    return lines, stats
+
+
+def format_report(stats):
+    return (f"; Branches: {stats['short']} short, {stats['long']} long "
+            f"({stats['folded']} branch-over-JMP pairs shortened, {stats['passes']} layout passes)")
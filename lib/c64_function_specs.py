@@ -34,13 +34,27 @@ C64_FUNCTION_SPECS = {
         'routine': 'gfx_clear_screen',
         'params': []
     },
+    'gfx_plot_point': {
+        'routine': 'gfx_plot_point',
+        'params': [
+            {'name': 'x', 'store': 'zp', 'address': 0xb0, 'size': 16},
+            {'name': 'y', 'store': 'zp', 'address': 0xb2, 'size': 8},
+        ]
+    },
+    'gfx_unplot_point': {
+        'routine': 'gfx_unplot_point',
+        'params': [
+            {'name': 'x', 'store': 'zp', 'address': 0xb0, 'size': 16},
+            {'name': 'y', 'store': 'zp', 'address': 0xb2, 'size': 8},
+        ]
+    },
     'gfx_draw_line': {
         'routine': 'gfx_draw_line',
         'params': [
-            {'name': 'x1', 'store': 'zp', 'address': 0xfb, 'size': 16},
-            {'name': 'y1', 'store': 'zp', 'address': 0xfd, 'size': 8},
-            {'name': 'x2', 'store': 'ax', 'size': 16},
-            {'name': 'y2', 'store': 'y', 'size': 8},
+            {'name': 'x1', 'store': 'zp', 'address': 0xb0, 'size': 16},
+            {'name': 'y1', 'store': 'zp', 'address': 0xb2, 'size': 8},
+            {'name': 'x2', 'store': 'zp', 'address': 0xb6, 'size': 16},
+            {'name': 'y2', 'store': 'zp', 'address': 0xb8, 'size': 8},
         ]
     },
     'gfx_draw_ellipse': {
@@ -74,9 +88,9 @@ C64_FUNCTION_SPECS = {
     'sprite_set_pos': {
         'routine': 'sprite_set_pos',
         'params': [
-            {'name': 'sprite_num', 'store': 'y', 'size': 8},
-            {'name': 'x', 'store': 'a', 'size': 8},
-            {'name': 'y', 'store': 'x', 'size': 8},
+            {'name': 'sprite_num', 'store': 'x', 'size': 8},
+            {'name': 'x', 'store': 'zp', 'address': 0xb0, 'size': 8},
+            {'name': 'y', 'store': 'a', 'size': 8},
         ]
     },
     'sprite_enable': {
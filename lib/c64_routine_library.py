@@ -13,7 +13,6 @@ that are actually used in the final assembly output.
 """
 
 import V1.globals as py2asm_globals
-from lib.func_core import create_label
 
 def _generate_gfx_turn_on():
     """
@@ -88,40 +87,37 @@ def _generate_gfx_clear_screen():
     """
     Generates assembly to clear the 8K bitmap graphics screen memory.
     Based on section 4.2.1.2 of "The Graphics Book for the Commodore 64".
-    Assumes graphics memory is at $2000-$3F3F.
+    Assumes graphics memory is at $2000-$3FFF.
     """
-    clear_loop_label = create_label("gfx_clear_loop", str(py2asm_globals.label_counter))
-    py2asm_globals.label_counter += 1
+    clear_loop_label = "gfx_clear_loop"
 
     code = f"""
 gfx_clear_screen
-    ; --- Clear 8K HGR screen from $2000 to $3F3F ---
+    ; --- Clear 8K HGR screen from $2000 to $3FFF ---
     ; Based on "The Graphics Book for the Commodore 64", Sec 4.2.1.2
+    LDA #$20        ; High byte of start address ($2000)
+    STA {clear_loop_label}_store+2 ; Self-modifying: page of the STA below
     LDA #$00        ; Value to clear memory with
-    LDX #$20        ; High byte of start address ($2000)
-    STX {clear_loop_label}_hi_byte+1 ; Store high byte for the loop
-
-{clear_loop_label}:
+    LDX #$20        ; 32 pages of 256 bytes
     LDY #$00        ; Low byte index
-{clear_loop_label}_inner:
-    STA ({clear_loop_label}_hi_byte),Y
+{clear_loop_label}:
+{clear_loop_label}_store:
+    STA $2000,Y
     INY
-    BNE {clear_loop_label}_inner ; Clear one 256-byte page
-
-    INC {clear_loop_label}_hi_byte+1 ; Move to next page
-    LDA {clear_loop_label}_hi_byte+1
-    CMP #$40        ; Have we cleared up to $3FFF?
+    BNE {clear_loop_label} ; Clear one 256-byte page
+    INC {clear_loop_label}_store+2 ; Move to next page
+    DEX
     BNE {clear_loop_label}
     RTS
-
-{clear_loop_label}_hi_byte:
-    .word $0000 ; Self-modifying pointer for the loop
 """
     return code.strip()
 
 # Placeholder for more complex routines like plotting points, lines, etc.
 # These would require parameters, likely passed via ZP locations or registers.
 
+# Routine name of each plot_mode of _generate_gfx_plot_point
+PLOT_POINT_ROUTINES = {'set': 'gfx_plot_point', 'unplot': 'gfx_unplot_point'}
+
 def _generate_gfx_plot_point(plot_mode='set'):
     """
     Generates assembly to plot or unplot a point on the HGR screen.
@@ -133,7 +129,11 @@ def _generate_gfx_plot_point(plot_mode='set'):
     - gfx_plot_y_coord ($B2): 8-bit Y coordinate.
 
     Args:
-        plot_mode (str): 'set' to turn the pixel on, 'unplot' to turn it off.
+        plot_mode (str): 'set' to turn the pixel on (gfx_plot_point), 'unplot'
+            to turn it off (gfx_unplot_point).
+
+    Every label derives from the routine name, so rendering a variant twice
+    gives the same text; both variants use the gfx_plot_tables lookup tables.
     """
     # Define Zero Page locations for parameters and temporary storage
     # These should be defined as variables in the final assembly output.
@@ -143,20 +143,19 @@ def _generate_gfx_plot_point(plot_mode='set'):
     ZP_PTR = "$B3"      # 16-bit pointer for final address
     ZP_TMP1 = "$B5"     # 8-bit temp
 
-    plot_label = create_label("gfx_plot_point", str(py2asm_globals.label_counter))
-    py2asm_globals.label_counter += 1
+    plot_label = PLOT_POINT_ROUTINES[plot_mode]
 
     # Determine the plotting operation
     if plot_mode == 'set':
-        plot_op = f"ORA {ZP_TMP1}"
+        plot_op = f"LDA ({ZP_PTR}),Y ; Load the byte from screen memory\n    ORA {ZP_TMP1}"
     else: # unplot
         # To unplot, we need to AND with the inverted mask
         # EOR #$FF inverts all bits of the mask
-        plot_op = f"EOR #$FF\n    AND ({ZP_PTR}),Y"
+        plot_op = f"LDA {ZP_TMP1}\n    EOR #$FF\n    AND ({ZP_PTR}),Y ; Clear the bit in the screen byte"
 
     code = f"""
 {plot_label}
-    ; --- Plot a point on the HGR screen ---
+    ; --- Plot ('set') or unplot a point on the HGR screen ---
     ; Based on "The Graphics Book for the Commodore 64", Sec 4.2.2.1
     ; Input: X in {ZP_X_COORD}/{ZP_X_COORD}+1, Y in {ZP_Y_COORD}
 
@@ -173,9 +172,9 @@ def _generate_gfx_plot_point(plot_mode='set'):
 
     ; 2. Look up base address for the character row: (Y/8) * 320
     ; This is much faster than multiplication.
-    LDA {plot_label}_y_lookup_hi,X
+    LDA gfx_plot_y_lookup_hi,X
     STA {ZP_PTR}+1
-    LDA {plot_label}_y_lookup_lo,X
+    LDA gfx_plot_y_lookup_lo,X
     STA {ZP_PTR}
 
     ; 3. Add (Y%8) to get the final row address offset
@@ -210,28 +209,35 @@ def _generate_gfx_plot_point(plot_mode='set'):
     LDA {ZP_X_COORD}
     AND #%00000111  ; A = X % 8
     TAX             ; Use as index for the mask table
-    LDA {plot_label}_bit_mask,X
+    LDA gfx_plot_bit_mask,X
     STA {ZP_TMP1}   ; Store mask in a temporary ZP location
 
     ; --- Modify the screen byte ---
     ; 7. Load, modify, and store the byte
     LDY #$00
-    LDA ({ZP_PTR}),Y ; Load the byte from screen memory
-    {plot_op}       ; ORA mask (set) or AND NOT mask (unplot)
+    {plot_op}
     STA ({ZP_PTR}),Y ; Store it back
     RTS
+"""
+    return code.strip()
 
-; --- Lookup Tables for gfx_plot_point ---
-{plot_label}_bit_mask:
+def _generate_gfx_plot_tables():
+    """
+    Lookup tables shared by gfx_plot_point and gfx_unplot_point: the bit mask
+    of each pixel in a byte, and the offset of each character row ((Y/8)*320).
+    """
+    code = """
+gfx_plot_tables
+gfx_plot_bit_mask:
     .byte %10000000, %01000000, %00100000, %00010000, %00001000, %00000100, %00000010, %00000001
 
-{plot_label}_y_lookup_lo:
+gfx_plot_y_lookup_lo:
     .byte <(0*320), <(1*320), <(2*320), <(3*320), <(4*320), <(5*320), <(6*320), <(7*320)
     .byte <(8*320), <(9*320), <(10*320), <(11*320), <(12*320), <(13*320), <(14*320), <(15*320)
     .byte <(16*320), <(17*320), <(18*320), <(19*320), <(20*320), <(21*320), <(22*320), <(23*320)
     .byte <(24*320)
 
-{plot_label}_y_lookup_hi:
+gfx_plot_y_lookup_hi:
     .byte >(0*320), >(1*320), >(2*320), >(3*320), >(4*320), >(5*320), >(6*320), >(7*320)
     .byte >(8*320), >(9*320), >(10*320), >(11*320), >(12*320), >(13*320), >(14*320), >(15*320)
     .byte >(16*320), >(17*320), >(18*320), >(19*320), >(20*320), >(21*320), >(22*320), >(23*320)
@@ -250,6 +256,8 @@ def _generate_gfx_draw_line():
     - y1 ($B2): 8-bit start Y coordinate.
     - x2 ($B6, $B7): 16-bit end X coordinate.
     - y2 ($B8): 8-bit end Y coordinate.
+    Every point is drawn with gfx_plot_point, which takes its input in the
+    same locations as x1/y1 (and uses $B3-$B5), so x1/y1 are copied first.
     """
     # ZP locations for input coordinates
     ZP_X1 = "$B0"
@@ -260,104 +268,79 @@ def _generate_gfx_draw_line():
     # ZP locations for Bresenham's algorithm state
     ZP_CURRENT_X = "$BC" # 16-bit
     ZP_CURRENT_Y = "$BE" # 8-bit
-    ZP_DX = "$BF"        # 16-bit
-    ZP_DY = "$C1"        # 8-bit
-    ZP_SX = "$C2"        # 8-bit step direction for X
-    ZP_SY = "$C3"        # 8-bit step direction for Y
-    ZP_ERR = "$C4"       # 16-bit error term
-    ZP_E2 = "$C6"        # 16-bit temporary for 2*err
+    ZP_DX = "$BF"        # 16-bit, abs(x2 - x1)
+    ZP_DY = "$C1"        # 8-bit, abs(y2 - y1)
+    ZP_SX = "$C2"        # $00: x grows, $FF: x shrinks
+    ZP_SY = "$C3"        # $00: y grows, $FF: y shrinks
+    ZP_ERR = "$C4"       # 16-bit signed error term
+    ZP_E2 = "$C6"        # 16-bit 2*err
+    ZP_TMP = "$C8"       # 8-bit scratch
 
     # ZP locations used by the plot_point subroutine
     ZP_PLOT_X = "$B0"
     ZP_PLOT_Y = "$B2"
 
     # Define labels for control flow
-    draw_line_label = create_label("gfx_draw_line", str(py2asm_globals.label_counter))
-    plot_loop_label = create_label("plot_loop", str(py2asm_globals.label_counter))
-    dx_neg_label = create_label("dx_neg", str(py2asm_globals.label_counter))
-    dx_pos_label = create_label("dx_pos", str(py2asm_globals.label_counter))
-    dy_neg_label = create_label("dy_neg", str(py2asm_globals.label_counter))
-    dy_pos_label = create_label("dy_pos", str(py2asm_globals.label_counter))
-    update_x_label = create_label("update_x", str(py2asm_globals.label_counter))
-    update_y_label = create_label("update_y", str(py2asm_globals.label_counter))
-    end_plot_label = create_label("end_plot", str(py2asm_globals.label_counter))
-    py2asm_globals.label_counter += 1
+    draw_line_label = "gfx_draw_line"
 
     code = f"""
-{draw_line_label}
+gfx_draw_line
     ; --- Draw a line using Bresenham's algorithm ---
     ; Input: X1({ZP_X1}), Y1({ZP_Y1}), X2({ZP_X2}), Y2({ZP_Y2})
 
     ; --- Setup Phase ---
-    ; 1. Calculate dx = x2 - x1 and dy = y2 - y1
-    LDA {ZP_X2}
+    ; 1. current = (x1, y1)
+    LDA {ZP_X1}
+    STA {ZP_CURRENT_X}
+    LDA {ZP_X1}+1
+    STA {ZP_CURRENT_X}+1
+    LDA {ZP_Y1}
+    STA {ZP_CURRENT_Y}
+
+    ; 2. dx = abs(x2 - x1), sx = direction of x
+    LDA #$00
+    STA {ZP_SX}
+    STA {ZP_SY}
     SEC
+    LDA {ZP_X2}
     SBC {ZP_X1}
     STA {ZP_DX}
     LDA {ZP_X2}+1
     SBC {ZP_X1}+1
     STA {ZP_DX}+1
+    BPL {draw_line_label}_dx_positive
+    DEC {ZP_SX}         ; sx = -1
+    SEC                 ; Negate dx (2's complement) to get abs(dx)
+    LDA #$00
+    SBC {ZP_DX}
+    STA {ZP_DX}
+    LDA #$00
+    SBC {ZP_DX}+1
+    STA {ZP_DX}+1
+{draw_line_label}_dx_positive:
 
+    ; 3. dy = abs(y2 - y1), sy = direction of y (y is unsigned 0-199)
     LDA {ZP_Y2}
     SEC
     SBC {ZP_Y1}
-    STA {ZP_DY}
-
-    ; 2. Determine step directions (sx, sy) and get absolute values of dx, dy
-    LDA {ZP_DX}+1       ; Check sign of dx
-    BPL {dx_pos_label}
-{dx_neg_label}:
-    LDA #$FF            ; sx = -1
-    STA {ZP_SX}
-    ; Negate dx (2's complement) to get abs(dx)
-    LDA {ZP_DX}
-    EOR #$FF
-    STA {ZP_DX}
-    LDA {ZP_DX}+1
-    EOR #$FF
-    STA {ZP_DX}+1
-    INC {ZP_DX}
-    BNE {dy_pos_label}
-    INC {ZP_DX}+1
-    JMP {dy_pos_label}
-{dx_pos_label}:
-    LDA #$01            ; sx = 1
-    STA {ZP_SX}
-
-{dy_pos_label}:
-    LDA {ZP_DY}         ; Check sign of dy
-    BPL {dy_neg_label}
-    LDA #$FF            ; sy = -1
-    STA {ZP_SY}
-    LDA {ZP_DY}         ; Negate dy to get abs(dy)
-    EOR #$FF
-    CLC
+    BCS {draw_line_label}_dy_positive
+    DEC {ZP_SY}         ; sy = -1
+    EOR #$FF            ; Carry is clear: ADC #1 completes the negation
     ADC #$01
+{draw_line_label}_dy_positive:
     STA {ZP_DY}
-    JMP {plot_loop_label}
-{dy_neg_label}:
-    LDA #$01            ; sy = 1
-    STA {ZP_SY}
 
-    ; 3. Initialize current coordinates and error term
-{plot_loop_label}:
-    LDA {ZP_X1}         ; current_x = x1
-    STA {ZP_CURRENT_X}
-    LDA {ZP_X1}+1
-    STA {ZP_CURRENT_X}+1
-    LDA {ZP_Y1}         ; current_y = y1
-    STA {ZP_CURRENT_Y}
-
-    LDA {ZP_DX}         ; err = dx - dy
+    ; 4. err = dx - dy
+    LDA {ZP_DX}
     SEC
     SBC {ZP_DY}
     STA {ZP_ERR}
-    LDA {ZP_DX}+1       ; No high byte for dy, so just subtract borrow
+    LDA {ZP_DX}+1
     SBC #$00
     STA {ZP_ERR}+1
 
     ; --- Main Plotting Loop ---
-{plot_loop_label}_main:
+{draw_line_label}_loop:
     ; Plot current point. Must copy current coords to plot_point's ZP inputs.
     LDA {ZP_CURRENT_X}
     STA {ZP_PLOT_X}
@@ -370,72 +353,77 @@ def _generate_gfx_draw_line():
     ; Check if we've reached the end point
     LDA {ZP_CURRENT_X}
     CMP {ZP_X2}
-    BNE {plot_loop_label}_continue_check
+    BNE {draw_line_label}_step
     LDA {ZP_CURRENT_X}+1
     CMP {ZP_X2}+1
-    BNE {plot_loop_label}_continue_check
+    BNE {draw_line_label}_step
     LDA {ZP_CURRENT_Y}
     CMP {ZP_Y2}
-    BEQ {end_plot_label} ; If all match, we are done
+    BEQ {draw_line_label}_end ; If all match, we are done
 
-{plot_loop_label}_continue_check:
-    ; Calculate e2 = 2 * err
-    ASL {ZP_ERR}
-    ROL {ZP_ERR}+1
+{draw_line_label}_step:
+    ; e2 = 2 * err
     LDA {ZP_ERR}
+    ASL A
     STA {ZP_E2}
     LDA {ZP_ERR}+1
+    ROL A
     STA {ZP_E2}+1
 
-    ; if (e2 > -dy)
-    LDA {ZP_DY}         ; Get -dy
-    EOR #$FF
+    ; if e2 > -dy, i.e. e2 + dy > 0: err -= dy, x += sx
     CLC
-    ADC #$01
-    SEC
-    SBC {ZP_E2}         ; Compare by subtracting: (-dy) - e2
-    LDA #$00
-    SBC {ZP_E2}+1       ; High byte comparison
-    BPL {update_y_label} ; If result is positive or zero, e2 <= -dy, so skip x update
-{update_x_label}:
-    LDA {ZP_ERR}        ; err -= dy
+    LDA {ZP_E2}
+    ADC {ZP_DY}
+    STA {ZP_TMP}
+    LDA {ZP_E2}+1
+    ADC #$00
+    BMI {draw_line_label}_skip_x
+    ORA {ZP_TMP}
+    BEQ {draw_line_label}_skip_x
     SEC
+    LDA {ZP_ERR}
     SBC {ZP_DY}
     STA {ZP_ERR}
     LDA {ZP_ERR}+1
     SBC #$00
     STA {ZP_ERR}+1
-    LDA {ZP_CURRENT_X}  ; x += sx
-    CLC
-    ADC {ZP_SX}
-    STA {ZP_CURRENT_X}
-    BCC {update_y_label}
+    LDA {ZP_SX}
+    BMI {draw_line_label}_x_left
+    INC {ZP_CURRENT_X}
+    BNE {draw_line_label}_skip_x
     INC {ZP_CURRENT_X}+1
+    JMP {draw_line_label}_skip_x
+{draw_line_label}_x_left:
+    LDA {ZP_CURRENT_X}
+    BNE {draw_line_label}_x_left_low
+    DEC {ZP_CURRENT_X}+1
+{draw_line_label}_x_left_low:
+    DEC {ZP_CURRENT_X}
+{draw_line_label}_skip_x:
 
-{update_y_label}:
-    ; if (e2 < dx)
-    LDA {ZP_E2}
+    ; if e2 < dx: err += dx, y += sy
     SEC
+    LDA {ZP_E2}
     SBC {ZP_DX}
     LDA {ZP_E2}+1
     SBC {ZP_DX}+1
-    BCS {plot_loop_label}_main ; If result has no borrow, e2 >= dx, so skip y update
-
-    LDA {ZP_ERR}        ; err += dx
+    BPL {draw_line_label}_loop
     CLC
+    LDA {ZP_ERR}
     ADC {ZP_DX}
     STA {ZP_ERR}
     LDA {ZP_ERR}+1
     ADC {ZP_DX}+1
     STA {ZP_ERR}+1
-    LDA {ZP_CURRENT_Y}  ; y += sy
-    CLC
-    ADC {ZP_SY}
-    STA {ZP_CURRENT_Y}
-
-    JMP {plot_loop_label}_main
-
-{end_plot_label}:
+    LDA {ZP_SY}
+    BMI {draw_line_label}_y_up
+    INC {ZP_CURRENT_Y}
+    JMP {draw_line_label}_loop
+{draw_line_label}_y_up:
+    DEC {ZP_CURRENT_Y}
+    JMP {draw_line_label}_loop
+
+{draw_line_label}_end:
     RTS
 """
 
@@ -468,12 +456,11 @@ def _generate_gfx_draw_ellipse():
     ZP_PLOT_Y = "$B2" # 8-bit
 
     # Labels
-    draw_ellipse_label = create_label("gfx_draw_ellipse", str(py2asm_globals.label_counter))
-    main_loop_label = create_label("ellipse_main_loop", str(py2asm_globals.label_counter))
-    x_loop_label = create_label("ellipse_x_loop", str(py2asm_globals.label_counter))
-    plot_points_label = create_label("ellipse_plot_points", str(py2asm_globals.label_counter))
-    end_ellipse_label = create_label("end_ellipse", str(py2asm_globals.label_counter))
-    py2asm_globals.label_counter += 1
+    draw_ellipse_label = "gfx_draw_ellipse"
+    main_loop_label = "ellipse_main_loop"
+    x_loop_label = "ellipse_x_loop"
+    plot_points_label = "ellipse_plot_points"
+    end_ellipse_label = "end_ellipse"
 
     # Wozniak FP ZP locations (from globals)
     FP1 = f"${py2asm_globals.WOZ_FP_X1:02X}"
@@ -819,11 +806,17 @@ def _generate_sprite_set_pos():
     code = f"""
 sprite_set_pos
     ; Input: X=sprite_num, A=Y, $B0=X_LSB
+    ; I registri X/Y dello sprite n sono a $D000 + 2n
+    PHA
+    TXA
+    ASL A
+    TAX
+    PLA
     ; Imposta la posizione Y
-    STA ${py2asm_globals.VIC_BASE_ADDR:04X} + {VIC_SPRITE0_Y},X
+    STA ${py2asm_globals.VIC_BASE_ADDR + VIC_SPRITE0_Y:04X},X
     ; Imposta la posizione X (LSB)
     LDA $B0 ; Prende la coordinata X da una locazione ZP
-    STA ${py2asm_globals.VIC_BASE_ADDR:04X} + {VIC_SPRITE0_X},X
+    STA ${py2asm_globals.VIC_BASE_ADDR + VIC_SPRITE0_X:04X},X
     RTS
 """
     return code.strip()
@@ -1039,8 +1032,7 @@ def _generate_sprite_create_from_data():
     # Quindi per $3000 il puntatore è $3000/64 = $C0. Per $3040 è $C1, etc.
     SPRITE_DATA_POINTER_START = 0xC0 # Valore puntatore per sprite in $3000
 
-    copy_loop_label = create_label("sprite_copy_loop", str(py2asm_globals.label_counter))
-    py2asm_globals.label_counter += 1
+    copy_loop_label = "sprite_copy_loop"
 
     code = f"""
 sprite_create_from_data
@@ -1086,6 +1078,8 @@ ROUTINE_GENERATORS = {
     'gfx_turn_off': _generate_gfx_turn_off,
     'gfx_clear_screen': _generate_gfx_clear_screen,
     'gfx_plot_point': _generate_gfx_plot_point,
+    'gfx_unplot_point': lambda: _generate_gfx_plot_point('unplot'),
+    'gfx_plot_tables': _generate_gfx_plot_tables,
     'gfx_draw_line': _generate_gfx_draw_line,
     'gfx_draw_ellipse': _generate_gfx_draw_ellipse,
     'gfx_draw_rect': _generate_gfx_draw_rect,
@@ -0,0 +1,207 @@
+# py2c64/lib/call_graph.py
+# Call-graph analysis and static frame allocation.
+# Functions that can never be part of a recursive cycle do not need the
+# software stack: at most one activation of each exists at any time, so their
+# params and locals can live at fixed addresses. Functions that can never be
+# active at the same time (e.g. two leaves called one after the other) share
+# the same bytes. Recursive functions keep the stack calling convention.
+
+import ast
+import V1.globals as globals
+from lib.func_core import variable_storage_size, _generate_res_definition, _get_mangled_local_var_name
+
+STATIC_FRAMES_LABEL = "__static_frames"
+
+# Register convention for small leaf functions: the first argument comes in
+# X (low byte) / A (high byte), a second one in a reserved zero-page word.
+# Only leaves (no calls to user functions) qualify, so at most one of them is
+# active at a time and they can all share that zero-page word.
+MAX_REGISTER_PARAMS = 2
+REGISTER_ARGS_ZP = "REGISTER_ARGS_ZP"
+
+
+def build_call_graph(tree):
+    """
+    Returns {func_name: set(called_func_names)} for every user function,
+    with the calls made by the main program under the key None.
+    """
+    graph = {None: set()}
+    for func_name in globals.defined_functions:
+        graph[func_name] = set()
+
+    def visit(node, caller):
+        if isinstance(node, ast.FunctionDef) and node.name in globals.defined_functions:
+            for child in node.body:
+                visit(child, node.name)
+            return
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in globals.defined_functions:
+            graph[caller].add(node.func.id)
+        for child in ast.iter_child_nodes(node):
+            visit(child, caller)
+
+    visit(tree, None)
+    return graph
+
+
+def _strongly_connected_components(graph):
+    """Tarjan's algorithm. Returns the components in reverse topological order."""
+    index_of, low_link, on_stack = {}, {}, set()
+    stack, components = [], []
+    counter = [0]
+
+    def connect(node):
+        index_of[node] = low_link[node] = counter[0]
+        counter[0] += 1
+        stack.append(node)
+        on_stack.add(node)
+        for callee in sorted(graph.get(node, ()), key=str):
+            if callee not in index_of:
+                connect(callee)
+                low_link[node] = min(low_link[node], low_link[callee])
+            elif callee in on_stack:
+                low_link[node] = min(low_link[node], index_of[callee])
+        if low_link[node] == index_of[node]:
+            component = set()
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component.add(member)
+                if member == node:
+                    break
+            components.append(component)
+
+    for node in sorted(graph, key=str):
+        if node not in index_of:
+            connect(node)
+    return components
+
+
+def find_recursive_functions(graph):
+    """Returns the functions that can (directly or indirectly) call themselves."""
+    recursive = set()
+    for component in _strongly_connected_components(graph):
+        if len(component) > 1 or any(member in graph.get(member, ()) for member in component):
+            recursive.update(component)
+    recursive.discard(None)
+    return recursive
+
+
+def _frame_variables(func_name):
+    return sorted(
+        name for name, info in globals.variables.items()
+        if info.get('function') == func_name and info.get('scope') in ('param', 'local')
+        and not info.get('zero_page')
+    )
+
+
+def _assign_register_conventions(graph):
+    """
+    Switches eligible static functions to the 'register' convention and
+    records how each parameter is passed in func_info['register_params'],
+    using the same 'store' vocabulary as the C64 hardware function specs.
+    """
+    zp_address = None
+    for func_name in sorted(globals.defined_functions):
+        func_info = globals.defined_functions[func_name]
+        params = func_info['params']
+        if func_info.get('convention') != 'static' or graph.get(func_name):
+            continue
+        if not 1 <= len(params) <= MAX_REGISTER_PARAMS:
+            continue
+        if any(globals.variables[_get_mangled_local_var_name(func_name, p)].get('type') == 'float' for p in params):
+            continue
+        if len(params) == 2 and zp_address is None:
+            zp_address = globals.zero_page.allocate(REGISTER_ARGS_ZP, 2)
+            if zp_address is None:
+                continue  # No zero page left for the second argument
+
+        register_params = [{'name': params[0], 'store': 'ax', 'size': 16}]
+        if len(params) == 2:
+            register_params.append({'name': params[1], 'store': 'zp', 'address': zp_address, 'size': 16})
+            globals.variables[_get_mangled_local_var_name(func_name, params[1])].update(
+                {'address': zp_address, 'size': 2, 'zero_page': True})
+        func_info['convention'] = 'register'
+        func_info['register_params'] = register_params
+
+
+def generate_register_equates():
+    """Returns the lines binding the zero-page register arguments to their address."""
+    equ = globals.assembly_data_types['equ']
+    lines = []
+    for func_name in sorted(globals.defined_functions):
+        for param in globals.defined_functions[func_name].get('register_params', []):
+            if param['store'] == 'zp':
+                lines.append(f"{_get_mangled_local_var_name(func_name, param['name'])} {equ} ${param['address']:02X} ; register argument")
+    if lines:
+        lines.insert(0, "; --- Register Arguments ---")
+    return lines
+
+
+def assign_static_frames(tree):
+    """
+    Marks every user function with its calling convention ('stack',
+    'static' or 'register') and gives the params and locals of the
+    non-recursive ones fixed addresses inside one shared block. A function's
+    frame starts after the frames of all the functions that can be active
+    while it runs, so frames only overlap when the functions can never be
+    live at the same time.
+    Must run after the variable collection pass and before code generation.
+
+    Returns {'functions': n_static, 'bytes': block_size, 'bytes_unshared': sum_of_frames}.
+    """
+    graph = build_call_graph(tree)
+    recursive = find_recursive_functions(graph)
+
+    for func_name, func_info in globals.defined_functions.items():
+        func_info['convention'] = 'stack' if func_name in recursive else 'static'
+    if globals.compiler_options.get('register_calls', True):
+        _assign_register_conventions(graph)
+
+    frame_sizes = {}
+    for func_name, func_info in globals.defined_functions.items():
+        if func_info['convention'] != 'stack':
+            frame_sizes[func_name] = sum(variable_storage_size(globals.variables[v]) for v in _frame_variables(func_name))
+
+    # Walk the components callers-first; a recursive component has no frame of
+    # its own but passes on the frames that are live while it runs.
+    callers = {node: set() for node in graph}
+    for caller, callees in graph.items():
+        for callee in callees:
+            callers[callee].add(caller)
+    frame_start, frame_end = {}, {}
+    for component in reversed(_strongly_connected_components(graph)):
+        start = max((frame_end[c] for member in component for c in callers[member]
+                     if c not in component and c in frame_end), default=0)
+        for member in component:
+            frame_start[member] = start
+            frame_end[member] = start + frame_sizes.get(member, 0)
+
+    block_size = max((frame_end[f] for f in frame_sizes), default=0)
+    if block_size == 0:
+        return {'functions': len(frame_sizes), 'bytes': 0, 'bytes_unshared': 0}
+
+    block_address = globals.memory_pointer
+    if block_address + block_size > globals.MAX_MEMORY:
+        globals.report_compiler_error(f"Out of memory allocating static frames (size {block_size}).", level="ERROR")
+        for func_name in frame_sizes:
+            globals.defined_functions[func_name]['convention'] = 'stack'
+            globals.defined_functions[func_name].pop('register_params', None)
+        return {'functions': 0, 'bytes': 0, 'bytes_unshared': 0}
+    globals.memory_pointer += block_size
+
+    equ = globals.assembly_data_types['equ']
+    block_lines = [_generate_res_definition(STATIC_FRAMES_LABEL, block_size)]
+    for func_name in sorted(frame_sizes):
+        offset = frame_start[func_name]
+        globals.defined_functions[func_name]['frame_offset'] = offset
+        globals.defined_functions[func_name]['frame_size'] = frame_sizes[func_name]
+        for var_name in _frame_variables(func_name):
+            var_info = globals.variables[var_name]
+            size = variable_storage_size(var_info)
+            var_info.update({'address': block_address + offset, 'size': size, 'static_frame': True})
+            block_lines.append(f"{var_name} {equ} {STATIC_FRAMES_LABEL}+{offset}")
+            offset += size
+    # One entry, so sorting the data definitions keeps the equates after the block
+    globals.data_definitions.append("\n".join(block_lines))
+
+    return {'functions': len(frame_sizes), 'bytes': block_size, 'bytes_unshared': sum(frame_sizes.values())}
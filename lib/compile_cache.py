@@ -0,0 +1,196 @@
+# py2c64/lib/compile_cache.py
+# On-disk cache of whole compilations. An entry is keyed by a sha256 of the
+# normalized source, the compiler version (a hash of the compiler's own
+# sources, so any change to the compiler starts a new generation of keys), the
+# assembler syntax and the compiler options that change the output. It holds
+# the final assembly, the zero-page allocations of the compilation and, once
+# the program has been assembled, the .prg and its label map; a hit skips
+# every compiler pass. Only compilations without errors are stored, and the
+# warnings of a compilation are not replayed on a hit.
+# Entries are JSON files under <directory>/<first 2 hex digits>/<key>.json,
+# written to a temporary file in the same directory and renamed into place, so
+# builders sharing the directory never read a partial entry. A hit touches the
+# entry; when the directory grows past max_bytes the least recently used
+# entries are deleted. An entry deleted by another builder is just a miss.
+
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+
+import V1.globals as globals
+
+DEFAULT_CACHE_DIR = os.environ.get('PY2C64_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'py2c64')
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Options that do not change the output, left out of the key
+UNKEYED_OPTIONS = ('profile',)
+ENTRY_FORMAT = 1
+
+_COMPILER_DIR = os.path.dirname(os.path.abspath(globals.__file__))
+_compiler_version = None
+
+
+def normalize_source(source_code):
+    """
+    The source without its leading blank lines and trailing whitespace. The
+    output embeds the source as comments, so nothing else is normalized.
+    """
+    return re.sub(r'\A(?:[ \t\f\r]*\n)+', '', source_code).rstrip()
+
+
+def compiler_version():
+    """Hash of main.py, globals.py and lib/*.py, computed once per process."""
+    global _compiler_version
+    if _compiler_version is None:
+        digest = hashlib.sha256()
+        lib_dir = os.path.join(_COMPILER_DIR, 'lib')
+        paths = [os.path.join(_COMPILER_DIR, 'main.py'), os.path.join(_COMPILER_DIR, 'globals.py')]
+        paths += [os.path.join(lib_dir, name) for name in sorted(os.listdir(lib_dir)) if name.endswith('.py')]
+        for path in paths:
+            with open(path, 'rb') as f:
+                digest.update(os.path.relpath(path, _COMPILER_DIR).encode() + b'\0' + f.read() + b'\0')
+        _compiler_version = digest.hexdigest()
+    return _compiler_version
+
+
+def cache_key(source_code, options=None):
+    """Key of a compilation of `source_code` with `options` (default: the current context's)."""
+    options = globals.compiler_options if options is None else options
+    keyed_options = sorted((name, value) for name, value in options.items() if name not in UNKEYED_OPTIONS)
+    material = json.dumps({
+        'format': ENTRY_FORMAT,
+        'compiler': compiler_version(),
+        'syntax': globals.CURRENT_ASSEMBLER_SYNTAX,
+        'options': keyed_options,
+        'source': normalize_source(source_code),
+    }, sort_keys=True)
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class CompileCache:
+    """A cache directory with a size cap, and the hit/miss statistics of this process."""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        self._stats_lock = threading.Lock()
+        self._estimated_bytes = None  # Directory size as last scanned plus what this process stored since
+
+    def _count(self, name):
+        """Adds one to stats[name]: the compile server looks entries up in several threads at once."""
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def load(self, key):
+        """Returns the entry stored under `key` (marking it recently used), or None."""
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            entry = None
+        except (OSError, ValueError):
+            # Unreadable or corrupt entry: drop it and compile again
+            entry = None
+            self._remove(path)
+        if entry is None or entry.get('format') != ENTRY_FORMAT:
+            self._count('misses')
+            return None
+        self._count('hits')
+        if entry.get('prg') is not None:
+            entry['prg'] = base64.b64decode(entry['prg'])
+        return entry
+
+    def store(self, key, assembly, zero_page=None, prg=None, symbols=None):
+        """Writes an entry atomically, then evicts the least recently used entries past max_bytes."""
+        entry = {
+            'format': ENTRY_FORMAT,
+            'assembly': assembly,
+            'zero_page': {name: list(region) for name, region in (zero_page or {}).items()},
+            'prg': base64.b64encode(prg).decode('ascii') if prg is not None else None,
+            'symbols': symbols,
+        }
+        data = json.dumps(entry).encode()
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-', suffix='.json')
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            self._remove(temp_path)
+            raise
+        self._count('stores')
+        if self._estimated_bytes is not None:
+            self._estimated_bytes += len(data)
+        if self._estimated_bytes is None or self._estimated_bytes > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        """[(mtime, size, path)] of the entries in the directory."""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for item in os.scandir(shard.path):
+                if item.name.endswith('.json') and not item.name.startswith('.tmp-'):
+                    try:
+                        status = item.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((status.st_mtime, status.st_size, item.path))
+        return entries
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def evict(self):
+        """Deletes the least recently used entries until the directory fits in max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                self._count('evictions')
+            total -= size
+        self._estimated_bytes = total
+
+    def usage(self):
+        """Returns (entries, bytes) of the cache directory."""
+        entries = self._entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    def clear(self):
+        """Deletes every entry."""
+        for _, _, path in self._entries():
+            self._remove(path)
+        self._estimated_bytes = 0
+
+
+def format_report(stats, cache=None):
+    """One line with the hit/miss statistics, and the directory usage when `cache` is given."""
+    lookups = stats['hits'] + stats['misses']
+    line = (f"Compile cache: {stats['hits']} hits, {stats['misses']} misses"
+            f" ({100 * stats['hits'] / lookups if lookups else 0:.0f}% hit rate), "
+            f"{stats['stores']} stored, {stats['evictions']} evicted")
+    if cache is not None:
+        entries, size = cache.usage()
+        line += f"; {entries} entries, {size / 1024:.1f} KB in {cache.directory}"
+    return line
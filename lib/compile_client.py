@@ -0,0 +1,151 @@
+# py2c64/lib/compile_client.py
+# Thin client of the compile server (lib/compile_server.py). It imports none
+# of the compiler, so it starts as fast as Python does: it sends the source to
+# a running server and gets back the assembly, the diagnostics and the
+# statistics of the compilation.
+# The protocol is JSON lines: every request is one JSON object on one line,
+# answered by one JSON object on one line carrying the same "id". Requests on a
+# connection are compiled concurrently, so the answers may come back in any
+# order. A request is
+#   {"id": 1, "source": "...", "options": {"multiply": "table"}, "output": "x.asm"}
+# ("options" and "output" are optional; with "output" the server also writes
+# the .asm, and the .prg with the 'prg' option, as python_to_assembly would),
+# or {"id": 2, "command": "stats"} / {"id": 3, "command": "shutdown"}. An answer
+# to a compilation is
+#   {"id": 1, "ok": true, "assembly": "...", "diagnostics": [{"level": "WARNING",
+#    "message": "...", "line": 3}], "stats": {"seconds": 0.004, "cached": false, ...}}
+# and a request the server cannot handle gets {"id": ..., "ok": false, "error": "..."}.
+
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+
+DEFAULT_SOCKET = os.environ.get('PY2C64_SOCKET') or os.path.join(
+    tempfile.gettempdir(), f"py2c64-{getattr(os, 'getuid', lambda: 'user')()}.sock")
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 6502
+# Longest line a server or client reads: a request holds a whole source file
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+
+def connect(socket_path=None, port=None, host=DEFAULT_HOST):
+    """A connection to the server: TCP when `port` is given (or there are no Unix sockets), else the Unix socket."""
+    if port is not None or not hasattr(socket, 'AF_UNIX'):
+        return socket.create_connection((host, port or DEFAULT_PORT))
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(socket_path or DEFAULT_SOCKET)
+    except OSError:
+        connection.close()
+        raise
+    return connection
+
+
+def send_requests(requests, socket_path=None, port=None, host=DEFAULT_HOST):
+    """
+    Sends every request on one connection and returns the answers in the order
+    of the requests. Requests without an "id" are numbered.
+    """
+    requests = [dict(request) for request in requests]
+    for number, request in enumerate(requests):
+        request.setdefault('id', number)
+    with connect(socket_path, port, host) as connection:
+        connection.sendall(b''.join(json.dumps(request).encode() + b'\n' for request in requests))
+        connection.shutdown(socket.SHUT_WR)
+        answers = {}
+        with connection.makefile('rb') as stream:
+            for line in stream:
+                answer = json.loads(line)
+                answers[answer.get('id')] = answer
+    missing = {'ok': False, 'error': 'no answer from the server'}
+    return [answers.get(request['id'], dict(missing, id=request['id'])) for request in requests]
+
+
+def compile_source(source_code, options=None, output=None, **address):
+    """Compiles `source_code` on the server and returns its answer."""
+    request = {'source': source_code}
+    if options:
+        request['options'] = options
+    if output is not None:
+        request['output'] = os.path.abspath(output)
+    return send_requests([request], **address)[0]
+
+
+def _parse_option(text):
+    """NAME=VALUE of --option, VALUE read as JSON when it is valid JSON (true, 3, ...)."""
+    name, separator, value = text.partition('=')
+    if not separator:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got '{text}'")
+    try:
+        return name, json.loads(value)
+    except ValueError:
+        return name, value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile Python files on a running py2c64 compile server.")
+    parser.add_argument('files', nargs='*', help="Python files to compile ('-' reads standard input).")
+    parser.add_argument('-o', '--output', help="Write the assembly here (one file only); default: standard output.")
+    parser.add_argument('--option', action='append', type=_parse_option, default=[], metavar='NAME=VALUE',
+                        help="Compiler option for these compilations, e.g. --option multiply=table.")
+    parser.add_argument('--socket', help=f"Unix socket of the server (default: {DEFAULT_SOCKET}).")
+    parser.add_argument('--port', type=int, help="Connect over TCP to this port instead.")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="Host of the TCP server.")
+    parser.add_argument('--stats', action='store_true', help="Print the server statistics afterwards.")
+    parser.add_argument('--shutdown', action='store_true', help="Stop the server afterwards.")
+    args = parser.parse_args(argv)
+    if args.output and len(args.files) != 1:
+        parser.error("--output needs exactly one file")
+
+    requests = []
+    for path in args.files:
+        if path == '-':
+            source_code = sys.stdin.read()
+        else:
+            with open(path, 'r') as f:
+                source_code = f.read()
+        request = {'source': source_code}
+        if args.option:
+            request['options'] = dict(args.option)
+        requests.append(request)
+    # Sent once the compilations are answered, so the statistics include them
+    commands = [{'command': 'stats'}] * args.stats + [{'command': 'shutdown'}] * args.shutdown
+    if not requests and not commands:
+        parser.error("nothing to do: give files, --stats or --shutdown")
+
+    try:
+        answers = send_requests(requests, args.socket, args.port, args.host) if requests else []
+        if commands:
+            answers += send_requests(commands, args.socket, args.port, args.host)
+    except OSError as e:
+        print(f"Error: cannot reach the compile server: {e}", file=sys.stderr)
+        return 2
+
+    status = 0
+    for path, answer in zip(args.files, answers):
+        for diagnostic in answer.get('diagnostics', []):
+            line = diagnostic.get('line')
+            print(f"{path}:{line if line is not None else '?'}: {diagnostic['level']}: {diagnostic['message']}",
+                  file=sys.stderr)
+        if not answer.get('ok'):
+            print(f"{path}: {answer.get('error', 'compilation failed')}", file=sys.stderr)
+            status = 1
+        elif args.output:
+            with open(args.output, 'w') as f:
+                f.write(answer['assembly'])
+        else:
+            sys.stdout.write(answer['assembly'])
+    for answer in answers[len(args.files):]:
+        if 'server' in answer:
+            print(json.dumps(answer['server'], indent=2), file=sys.stderr)
+        elif not answer.get('ok'):
+            print(f"Error: {answer.get('error')}", file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
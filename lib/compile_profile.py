@@ -0,0 +1,173 @@
+# py2c64/lib/compile_profile.py
+# Optional profiling of the compiler itself (not of the generated program).
+# With compiler_options['profile'] set, python_to_assembly records into
+# globals.compile_profile:
+#   passes    - wall time and memory allocated by each compiler pass
+#               (tracemalloc: net bytes kept and peak bytes above the start)
+#   ast_nodes - number of AST nodes of each type in the parsed program
+#   handlers  - per statement handler (process_assign_node, process_for_node,
+#               ...): calls, and the seconds spent and program lines emitted
+#               by the handler itself, without the handlers it called
+#   temps     - the temporaries allocated and the storage they got
+#   routines  - the runtime routines linked, with their size in lines
+# A profile is a plain dict, so json.dump() writes it; merge() adds up the
+# profiles of many compilations and format_report() prints one as text.
+# With profiling off, the only cost is a check in phase() and in every
+# decorated handler call. The profile and the handler stack belong to the
+# compilation context; tracemalloc is process-wide, so the memory figures of
+# compilations profiled at the same time in other threads include each other.
+
+import ast
+import functools
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+import V1.globals as globals
+
+
+def start():
+    """Starts a new profile for the compilation that is beginning."""
+    context = globals.current_context()
+    # Per handler call in progress: [lines emitted by the handlers it called, seconds spent in them]
+    context.profile_handler_stack = []
+    context.profile_started_tracemalloc = not tracemalloc.is_tracing()
+    if context.profile_started_tracemalloc:
+        tracemalloc.start()
+    context.compile_profile = {
+        'compiles': 1,
+        'passes': {},
+        'ast_nodes': {},
+        'handlers': {},
+        'temps': {},
+        'routines': {},
+        'output_lines': 0,
+    }
+    return context.compile_profile
+
+
+def finish():
+    """Stops the memory tracing started by start(); the profile stays in globals.compile_profile."""
+    context = globals.current_context()
+    if context.profile_started_tracemalloc and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    context.profile_started_tracemalloc = False
+    return context.compile_profile
+
+
+@contextmanager
+def phase(name):
+    """Times one compiler pass and measures the memory it allocates."""
+    profile = globals.compile_profile
+    if profile is None:
+        yield
+        return
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        memory_before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry = profile['passes'].setdefault(name, {'seconds': 0.0, 'allocated_bytes': 0, 'peak_bytes': 0})
+        entry['seconds'] += time.perf_counter() - started
+        if tracing and tracemalloc.is_tracing():
+            memory_after, peak = tracemalloc.get_traced_memory()
+            entry['allocated_bytes'] += memory_after - memory_before
+            entry['peak_bytes'] = max(entry['peak_bytes'], peak - memory_before)
+
+
+def handler(func):
+    """Decorator for the statement handlers: counts their calls, self time and emitted lines."""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def profiled(*args, **kwargs):
+        context = globals.current_context()
+        profile = context.compile_profile
+        if profile is None:
+            return func(*args, **kwargs)
+        handler_stack = context.profile_handler_stack
+        first_line = context.generated_code.position()
+        started = time.perf_counter()
+        handler_stack.append([0, 0.0])
+        try:
+            return func(*args, **kwargs)
+        finally:
+            nested_lines, nested_seconds = handler_stack.pop()
+            lines = context.generated_code.position() - first_line
+            seconds = time.perf_counter() - started
+            entry = profile['handlers'].setdefault(name, {'calls': 0, 'lines': 0, 'seconds': 0.0})
+            entry['calls'] += 1
+            entry['lines'] += lines - nested_lines
+            entry['seconds'] += seconds - nested_seconds
+            if handler_stack:
+                handler_stack[-1][0] += lines
+                handler_stack[-1][1] += seconds
+    return profiled
+
+
+def record_ast(tree):
+    """Counts the AST nodes of each type."""
+    if globals.compile_profile is not None:
+        counts = Counter(type(node).__name__ for node in ast.walk(tree))
+        globals.compile_profile['ast_nodes'] = dict(counts)
+
+
+def record(key, value):
+    """Stores a value (temps, routines, output_lines) in the current profile."""
+    if globals.compile_profile is not None:
+        globals.compile_profile[key] = value
+
+
+def merge(profiles):
+    """Adds up the profiles of several compilations into one."""
+    total = {'compiles': 0, 'passes': {}, 'ast_nodes': {}, 'handlers': {}, 'temps': {}, 'routines': {},
+             'output_lines': 0}
+    for profile in profiles:
+        total['compiles'] += profile.get('compiles', 1)
+        total['output_lines'] += profile.get('output_lines', 0)
+        for name, entry in profile.get('passes', {}).items():
+            merged = total['passes'].setdefault(name, {'seconds': 0.0, 'allocated_bytes': 0, 'peak_bytes': 0})
+            merged['seconds'] += entry['seconds']
+            merged['allocated_bytes'] += entry['allocated_bytes']
+            merged['peak_bytes'] = max(merged['peak_bytes'], entry['peak_bytes'])
+        for name, entry in profile.get('handlers', {}).items():
+            merged = total['handlers'].setdefault(name, {'calls': 0, 'lines': 0, 'seconds': 0.0})
+            for key in merged:
+                merged[key] += entry[key]
+        for key in ('ast_nodes', 'temps', 'routines'):
+            for name, value in profile.get(key, {}).items():
+                total[key][name] = total[key].get(name, 0) + value
+    return total
+
+
+def format_report(profile, top=12):
+    """Text report of a profile (of one compilation or merged)."""
+    lines = [f"Compiler profile: {profile['compiles']} compilation(s), {profile['output_lines']} output lines"]
+    total_seconds = sum(entry['seconds'] for entry in profile['passes'].values()) or 1e-12
+    lines.append(f"{'pass':<22} {'seconds':>9} {'share':>7} {'alloc KB':>9} {'peak KB':>9}")
+    for name, entry in profile['passes'].items():
+        lines.append(f"{name:<22} {entry['seconds']:>9.4f} {100 * entry['seconds'] / total_seconds:>6.1f}% "
+                     f"{entry['allocated_bytes'] / 1024:>9.1f} {entry['peak_bytes'] / 1024:>9.1f}")
+    lines.append(f"{'total':<22} {sum(e['seconds'] for e in profile['passes'].values()):>9.4f}")
+
+    lines.append("")
+    lines.append(f"{'handler':<28} {'calls':>7} {'lines':>8} {'seconds':>9}")
+    for name, entry in sorted(profile['handlers'].items(), key=lambda item: -item[1]['seconds']):
+        lines.append(f"{name:<28} {entry['calls']:>7} {entry['lines']:>8} {entry['seconds']:>9.4f}")
+
+    nodes = sorted(profile['ast_nodes'].items(), key=lambda item: (-item[1], item[0]))
+    lines.append("")
+    lines.append(f"AST nodes: {sum(count for _, count in nodes)} "
+                 f"({', '.join(f'{name} {count}' for name, count in nodes[:top])})")
+    temps = profile['temps']
+    if temps:
+        lines.append(f"Temporaries: {temps.get('temps', 0)} allocated in {temps.get('slots', 0)} slots, "
+                     f"{temps.get('bytes_after', 0)} bytes")
+    routines = sorted(profile['routines'].items(), key=lambda item: (-item[1], item[0]))
+    lines.append(f"Routines linked: {len(routines)} distinct, {sum(size for _, size in routines)} lines in all "
+                 f"({', '.join(f'{name} {size}' for name, size in routines[:top])})")
+    return "\n".join(lines)
@@ -0,0 +1,304 @@
+# py2c64/lib/compile_server.py
+# Long-running compile server. Every compiler invocation pays for the Python
+# start-up, the imports of lib/* and the rendering of the runtime routines;
+# the server pays them once and keeps them warm: the modules stay imported,
+# the routine registry keeps the rendered routines, function_cache keeps the
+# code of the functions it compiled (the server turns the 'incremental' option
+# on) and, with --cache, the on-disk compile cache answers the compilations it
+# has already seen. Editors and asset pipelines that compile many small
+# programs then pay milliseconds per compilation.
+# The server speaks the JSON-lines protocol described in lib/compile_client.py
+# on a Unix socket (the default), a local TCP port or standard input/output.
+# asyncio serves the connections; the compilations themselves run in a pool of
+# threads, each in a CompilationContext of its own, so a long compilation does
+# not hold up the small ones queued behind it.
+#
+# Start it with:  python lib/compile_server.py [--socket PATH | --port N | --stdio]
+# and compile with:  python lib/compile_client.py program.py -o program.asm
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+if __name__ == '__main__':
+    # Run as a script: make 'lib' and the compiler package importable, as test_suites/main.py does
+    _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if _PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, _PROJECT_ROOT)
+
+import V1.globals as globals
+import V1.main as compiler_main
+from lib import c64_routine_library
+from lib import compile_cache
+from lib import compile_client
+from lib import function_cache
+from lib import routine_registry
+from lib import routines
+
+DEFAULT_WORKERS = 4
+# Options of the server's compilations, unless a request overrides them
+SERVER_OPTIONS = {'incremental': True}
+# Compiled at start-up so the first request does not pay for the code paths run once per process
+WARM_UP_SOURCE = """
+def square(n):
+    return n * n
+
+total = 0
+for i in range(10):
+    total = total + square(i)
+print(total)
+"""
+
+
+class RequestError(Exception):
+    """A request the server cannot handle: answered with its message."""
+
+
+class CompileServer:
+    """The warm compiler state and the statistics of one server process."""
+
+    def __init__(self, workers=DEFAULT_WORKERS, options=None, cache=None):
+        self.options = dict(SERVER_OPTIONS)
+        self.options.update(options or {})
+        self.cache = cache
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix='py2c64-compile')
+        self.stats = {'requests': 0, 'compilations': 0, 'failed': 0, 'cached': 0, 'seconds': 0.0}
+        self._stats_lock = threading.Lock()
+        self.started = time.time()
+        self.stopping = None  # asyncio.Event, set by a shutdown request
+
+    def warm_up(self):
+        """Renders every routine of every multiply variant and compiles a small program."""
+        for variant in routines.MULTIPLY_VARIANTS:
+            context = globals.CompilationContext(dict(self.options, multiply=variant))
+            # A routine a library cannot generate is reported by the compilations that link it, not here
+            with globals.use_context(context), contextlib.redirect_stdout(io.StringIO()):
+                globals.reset_globals()
+                key = routine_registry.configuration()
+                for routine_name in sorted(set(routines.routines_map) | set(c64_routine_library.ROUTINE_GENERATORS)):
+                    routine_registry.rendered_routine(routine_name, key)
+            compiler_main.python_to_assembly(WARM_UP_SOURCE, None, lambda message, lineno: None,
+                                             context=globals.CompilationContext(dict(self.options, multiply=variant)))
+
+    def compile(self, request):
+        """Compiles one request (in a worker thread) and returns its answer."""
+        source_code = request.get('source')
+        if not isinstance(source_code, str):
+            raise RequestError("a compilation request needs a 'source' string")
+        options = dict(self.options)
+        options.update(request.get('options') or {})
+        unknown = sorted(set(options) - set(globals.DEFAULT_COMPILER_OPTIONS))
+        if unknown:
+            raise RequestError(f"unknown compiler options: {', '.join(unknown)}")
+        output_file = request.get('output')
+        context = globals.CompilationContext(options)
+        errors = []
+        start = time.perf_counter()
+        assembly = compiler_main.python_to_assembly(
+            source_code, output_file, lambda message, lineno: errors.append((message, lineno)),
+            context=context, cache=self.cache)
+        seconds = time.perf_counter() - start
+        ok = assembly is not None and not context.has_errors and not context.error_count and not errors
+        diagnostics = [{'level': level, 'message': message, 'line': line}
+                       for level, message, line in context.diagnostics]
+        diagnostics += [{'level': 'ERROR', 'message': message, 'line': lineno} for message, lineno in errors]
+        with self._stats_lock:
+            self.stats['compilations'] += 1
+            self.stats['failed'] += not ok
+            self.stats['cached'] += context.cached
+            self.stats['seconds'] += seconds
+        answer = {
+            'ok': ok,
+            'assembly': assembly,
+            'diagnostics': diagnostics,
+            'stats': {
+                'seconds': round(seconds, 6),
+                'cached': context.cached,
+                'lines': assembly.count("\n") if assembly else 0,
+                'errors': context.error_count + len(errors),
+                'warnings': context.warning_count,
+            },
+        }
+        if not ok:
+            answer['error'] = "compilation failed"
+        return answer
+
+    def server_stats(self):
+        """The statistics of the process: requests, compilation times and the warm caches."""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats['seconds'] = round(stats['seconds'], 6)
+        stats['mean_ms'] = round(1000 * stats['seconds'] / stats['compilations'], 3) if stats['compilations'] else 0
+        stats['uptime'] = round(time.time() - self.started, 3)
+        stats['workers'] = self.workers
+        stats['routine_registry'] = dict(routine_registry.stats)
+        stats['function_cache'] = dict(function_cache.stats)
+        if self.cache is not None:
+            stats['compile_cache'] = dict(self.cache.stats, directory=self.cache.directory)
+        return stats
+
+    async def handle(self, line):
+        """The answer to one request line."""
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise RequestError("a request is a JSON object")
+            request_id = request.get('id')
+            with self._stats_lock:
+                self.stats['requests'] += 1
+            command = request.get('command', 'compile')
+            if command == 'compile':
+                answer = await asyncio.get_running_loop().run_in_executor(self.executor, self.compile, request)
+            elif command == 'stats':
+                answer = {'ok': True, 'server': self.server_stats()}
+            elif command == 'shutdown':
+                self.stopping.set()
+                answer = {'ok': True}
+            else:
+                raise RequestError(f"unknown command '{command}'")
+        except (RequestError, ValueError) as e:
+            answer = {'ok': False, 'error': str(e)}
+        except Exception as e:
+            # A compiler crash answers this request and leaves the server running
+            answer = {'ok': False, 'error': f"internal error: {type(e).__name__}: {e}"}
+        answer['id'] = request_id
+        return answer
+
+    async def serve_connection(self, reader, writer):
+        """Answers the requests of one connection concurrently, each as soon as it is done."""
+        write_lock = asyncio.Lock()
+        pending = set()
+
+        async def answer(line):
+            data = json.dumps(await self.handle(line)).encode() + b'\n'
+            async with write_lock:
+                writer.write(data)
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    task = asyncio.create_task(answer(line))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError) as e:
+            print(f"Compile server: dropped a connection: {e}", file=sys.__stderr__)
+        finally:
+            writer.close()
+
+    async def serve_socket(self, socket_path=None, port=None, host=compile_client.DEFAULT_HOST):
+        """Serves on the Unix socket, or on the TCP port, until a shutdown request."""
+        self.stopping = asyncio.Event()
+        connections = set()
+
+        async def on_connection(reader, writer):
+            task = asyncio.current_task()
+            connections.add(task)
+            try:
+                await self.serve_connection(reader, writer)
+            finally:
+                connections.discard(task)
+
+        if port is not None:
+            server = await asyncio.start_server(on_connection, host, port, limit=compile_client.MAX_LINE_BYTES)
+            address = f"{host}:{port}"
+        else:
+            socket_path = socket_path or compile_client.DEFAULT_SOCKET
+            if os.path.exists(socket_path):
+                os.remove(socket_path)  # Left behind by a server that did not stop cleanly
+            server = await asyncio.start_unix_server(on_connection, socket_path, limit=compile_client.MAX_LINE_BYTES)
+            address = socket_path
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, self.stopping.set)
+        except (NotImplementedError, AttributeError):
+            pass  # No signal handlers in this event loop (Windows): stop with a shutdown request
+        print(f"Compile server listening on {address} ({self.workers} workers)", file=sys.__stderr__)
+        try:
+            await self.stopping.wait()
+            server.close()
+            await server.wait_closed()
+            if connections:
+                await asyncio.gather(*connections, return_exceptions=True)
+        finally:
+            if port is None and os.path.exists(socket_path):
+                os.remove(socket_path)
+
+    async def serve_stdio(self, output):
+        """Serves the requests read from standard input, answering on `output`, until end of input or shutdown."""
+        self.stopping = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        pending = set()
+
+        async def answer(line):
+            output.write(json.dumps(await self.handle(line)) + "\n")
+            output.flush()
+
+        while not self.stopping.is_set():
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                break
+            if line.strip():
+                task = asyncio.create_task(answer(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                await asyncio.sleep(0)  # Let a shutdown request set stopping before the next read
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep the py2c64 compiler warm and compile on request.")
+    transport = parser.add_mutually_exclusive_group()
+    transport.add_argument('--socket', help=f"Unix socket to listen on (default: {compile_client.DEFAULT_SOCKET}).")
+    transport.add_argument('--port', type=int, help="Listen on this local TCP port instead.")
+    transport.add_argument('--stdio', action='store_true',
+                           help="Read requests from standard input and answer on standard output.")
+    parser.add_argument('--host', default=compile_client.DEFAULT_HOST, help="Address of the TCP server.")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="Compilations running at the same time.")
+    parser.add_argument('--cache', nargs='?', const=compile_cache.DEFAULT_CACHE_DIR, default=None, metavar='DIR',
+                        help=f"Use the on-disk compile cache (default directory: {compile_cache.DEFAULT_CACHE_DIR}).")
+    parser.add_argument('--cache-size', type=int, default=compile_cache.DEFAULT_MAX_BYTES // (1024 * 1024),
+                        metavar='MB', help="Size cap of the compile cache directory in MB.")
+    parser.add_argument('--quiet', action='store_true',
+                        help="Do not print the compiler's messages; the answers carry the diagnostics anyway.")
+    args = parser.parse_args(argv)
+
+    cache = compile_cache.CompileCache(args.cache, args.cache_size * 1024 * 1024) if args.cache else None
+    server = CompileServer(args.workers, cache=cache)
+    # The answers own standard output in --stdio mode: the compiler's messages go to standard error
+    protocol_output = sys.stdout
+    sys.stdout = open(os.devnull, 'w') if args.quiet else sys.stderr
+    if args.quiet:
+        sys.stderr = sys.stdout
+    start = time.perf_counter()
+    server.warm_up()
+    print(f"Compile server warmed up in {time.perf_counter() - start:.2f}s", file=sys.__stderr__)
+    try:
+        if args.stdio:
+            asyncio.run(server.serve_stdio(protocol_output))
+        else:
+            asyncio.run(server.serve_socket(args.socket, args.port, args.host))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.executor.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,456 @@
+# py2c64/lib/emulator.py
+# Headless 6502 / C64 harness for measuring the generated code.
+# A pure-Python NMOS 6502 core (documented opcodes, exact cycle counts with
+# the page-crossing and taken-branch penalties) on a flat 64 KB memory: the
+# C64 RAM, with the VIC, SID and CIA registers as plain memory. The KERNAL is
+# not present. Only CHROUT (globals.CHROUT_ADDRESS) is trapped: it captures
+# the printed characters instead of drawing them. A call to any other KERNAL
+# entry point lands on empty memory, executes BRK and stops the run ('brk').
+# run_prg() starts a program the way `SYS` does, stops when the main program
+# returns, and reports the cycles, the output and the cycles spent in every
+# routine of the label map.
+
+import V1.globals as globals
+from lib.assembler import OPCODES, assemble
+
+RETURN_ADDRESS = 0x0000  # Where the main program's final RTS lands; never executed
+DEFAULT_MAX_CYCLES = 50_000_000
+STACK_BASE = 0x0100
+
+FLAG_C, FLAG_Z, FLAG_I, FLAG_D, FLAG_B, FLAG_U, FLAG_V, FLAG_N = 0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80
+
+# Base cycles per addressing mode for instructions that read memory; absx,
+# absy and indy take one more cycle when the index crosses a page
+READ_CYCLES = {'imp': 2, 'imm': 2, 'zp': 3, 'zpx': 4, 'zpy': 4, 'abs': 4, 'absx': 4, 'absy': 4, 'indx': 6, 'indy': 5}
+WRITE_CYCLES = {'zp': 3, 'zpx': 4, 'zpy': 4, 'abs': 4, 'absx': 5, 'absy': 5, 'indx': 6, 'indy': 6}
+READ_MODIFY_WRITE_CYCLES = {'imp': 2, 'zp': 5, 'zpx': 6, 'abs': 6, 'absx': 7}
+FIXED_CYCLES = {'JMP': {'abs': 3, 'ind': 5}, 'JSR': {'abs': 6}, 'RTS': {'imp': 6}, 'RTI': {'imp': 6},
+                'BRK': {'imp': 7}, 'PHA': {'imp': 3}, 'PHP': {'imp': 3}, 'PLA': {'imp': 4}, 'PLP': {'imp': 4}}
+STORES = {'STA', 'STX', 'STY'}
+READ_MODIFY_WRITE = {'ASL', 'LSR', 'ROL', 'ROR', 'INC', 'DEC'}
+BRANCH_FLAGS = {'BPL': (FLAG_N, False), 'BMI': (FLAG_N, True), 'BVC': (FLAG_V, False), 'BVS': (FLAG_V, True),
+                'BCC': (FLAG_C, False), 'BCS': (FLAG_C, True), 'BNE': (FLAG_Z, False), 'BEQ': (FLAG_Z, True)}
+
+
+class EmulatorError(Exception):
+    """The program did something the harness cannot continue from."""
+
+
+def _build_decode_table():
+    """{opcode_byte: (mnemonic, mode, base_cycles, page_penalty)} from the assembler's opcode table."""
+    table = {}
+    for mnemonic, modes in OPCODES.items():
+        for mode, byte in modes.items():
+            if mnemonic in FIXED_CYCLES:
+                cycles, penalty = FIXED_CYCLES[mnemonic][mode], False
+            elif mode == 'rel':
+                cycles, penalty = 2, False
+            elif mnemonic in STORES:
+                cycles, penalty = WRITE_CYCLES[mode], False
+            elif mnemonic in READ_MODIFY_WRITE:
+                cycles, penalty = READ_MODIFY_WRITE_CYCLES[mode], False
+            else:
+                cycles, penalty = READ_CYCLES[mode], mode in ('absx', 'absy', 'indy')
+            table[byte] = (mnemonic, mode, cycles, penalty)
+    return table
+
+
+DECODE = _build_decode_table()
+
+
+def petscii_to_text(codes):
+    """Decodes CHROUT output: RETURN becomes a newline, shifted letters map to A-Z."""
+    chars = []
+    for code in codes:
+        if code == 13:
+            chars.append('\n')
+        elif 0xC1 <= code <= 0xDA:
+            chars.append(chr(code - 0x80))
+        else:
+            chars.append(chr(code))
+    return ''.join(chars)
+
+
+class CPU:
+    """An NMOS 6502 on a flat 64 KB memory, with the KERNAL CHROUT entry point trapped."""
+
+    def __init__(self, memory=None):
+        self.memory = memory if memory is not None else bytearray(0x10000)
+        self.a = self.x = self.y = 0
+        self.sp = 0xFF
+        self.pc = 0
+        self.flags = FLAG_U | FLAG_I
+        self.cycles = 0
+        self.output = []    # Bytes sent to CHROUT
+        self.traps = {int(globals.CHROUT_ADDRESS.lstrip('$'), 16): self._chrout}
+
+    # --- Memory and stack ---
+    def read_word(self, address):
+        return self.memory[address & 0xFFFF] | (self.memory[(address + 1) & 0xFFFF] << 8)
+
+    def push(self, value):
+        self.memory[STACK_BASE + self.sp] = value & 0xFF
+        self.sp = (self.sp - 1) & 0xFF
+
+    def pull(self):
+        self.sp = (self.sp + 1) & 0xFF
+        return self.memory[STACK_BASE + self.sp]
+
+    def push_word(self, value):
+        self.push(value >> 8)
+        self.push(value)
+
+    def pull_word(self):
+        low = self.pull()
+        return low | (self.pull() << 8)
+
+    # --- CHROUT trap ---
+    def _chrout(self):
+        self.output.append(self.a)
+
+    def _return_from_trap(self):
+        self.pc = (self.pull_word() + 1) & 0xFFFF
+        self.cycles += 6
+
+    # --- Flags ---
+    def _set_nz(self, value):
+        self.flags = (self.flags & ~(FLAG_N | FLAG_Z)) | (value & FLAG_N) | (0 if value else FLAG_Z)
+        return value
+
+    def _set_flag(self, flag, condition):
+        self.flags = (self.flags | flag) if condition else (self.flags & ~flag)
+
+    # --- Addressing ---
+    def _operand_address(self, mode):
+        """Returns (address, page_crossed) and advances PC past the operand."""
+        memory, pc = self.memory, self.pc
+        if mode == 'zp':
+            self.pc = pc + 1
+            return memory[pc], False
+        if mode == 'zpx':
+            self.pc = pc + 1
+            return (memory[pc] + self.x) & 0xFF, False
+        if mode == 'zpy':
+            self.pc = pc + 1
+            return (memory[pc] + self.y) & 0xFF, False
+        if mode == 'abs':
+            self.pc = pc + 2
+            return memory[pc] | (memory[pc + 1] << 8), False
+        if mode in ('absx', 'absy'):
+            self.pc = pc + 2
+            base = memory[pc] | (memory[pc + 1] << 8)
+            address = (base + (self.x if mode == 'absx' else self.y)) & 0xFFFF
+            return address, (base & 0xFF00) != (address & 0xFF00)
+        if mode == 'indx':
+            self.pc = pc + 1
+            pointer = (memory[pc] + self.x) & 0xFF
+            return memory[pointer] | (memory[(pointer + 1) & 0xFF] << 8), False
+        if mode == 'indy':
+            self.pc = pc + 1
+            pointer = memory[pc]
+            base = memory[pointer] | (memory[(pointer + 1) & 0xFF] << 8)
+            address = (base + self.y) & 0xFFFF
+            return address, (base & 0xFF00) != (address & 0xFF00)
+        if mode == 'ind':
+            self.pc = pc + 2
+            pointer = memory[pc] | (memory[pc + 1] << 8)
+            # NMOS bug: the high byte is fetched without carrying into the page
+            return memory[pointer] | (memory[(pointer & 0xFF00) | ((pointer + 1) & 0xFF)] << 8), False
+        raise EmulatorError(f"No operand address for mode {mode}")
+
+    # --- Arithmetic ---
+    def _adc(self, value):
+        carry = self.flags & FLAG_C
+        if self.flags & FLAG_D:
+            low = (self.a & 0x0F) + (value & 0x0F) + carry
+            if low > 9:
+                low += 6
+            high = (self.a >> 4) + (value >> 4) + (1 if low > 0x0F else 0)
+            binary = self.a + value + carry
+            self._set_flag(FLAG_Z, (binary & 0xFF) == 0)
+            self._set_flag(FLAG_N, high & 0x08)
+            self._set_flag(FLAG_V, (~(self.a ^ value) & (self.a ^ (high << 4)) & 0x80))
+            if high > 9:
+                high += 6
+            self._set_flag(FLAG_C, high > 0x0F)
+            self.a = ((high << 4) | (low & 0x0F)) & 0xFF
+            return
+        total = self.a + value + carry
+        self._set_flag(FLAG_C, total > 0xFF)
+        self._set_flag(FLAG_V, (~(self.a ^ value) & (self.a ^ total) & 0x80))
+        self.a = self._set_nz(total & 0xFF)
+
+    def _sbc(self, value):
+        if self.flags & FLAG_D:
+            borrow = 1 - (self.flags & FLAG_C)
+            binary = self.a - value - borrow
+            low = (self.a & 0x0F) - (value & 0x0F) - borrow
+            high = (self.a >> 4) - (value >> 4)
+            if low < 0:
+                low -= 6
+                high -= 1
+            if high < 0:
+                high -= 6
+            self._set_flag(FLAG_C, binary >= 0)
+            self._set_flag(FLAG_V, ((self.a ^ value) & (self.a ^ binary) & 0x80))
+            self._set_nz(binary & 0xFF)
+            self.a = ((high << 4) | (low & 0x0F)) & 0xFF
+            return
+        self._adc(value ^ 0xFF)
+
+    def _compare(self, register, value):
+        result = register - value
+        self._set_flag(FLAG_C, result >= 0)
+        self._set_nz(result & 0xFF)
+
+    def _shift(self, mnemonic, value):
+        if mnemonic == 'ASL':
+            self._set_flag(FLAG_C, value & 0x80)
+            value = (value << 1) & 0xFF
+        elif mnemonic == 'LSR':
+            self._set_flag(FLAG_C, value & 0x01)
+            value >>= 1
+        elif mnemonic == 'ROL':
+            carry = self.flags & FLAG_C
+            self._set_flag(FLAG_C, value & 0x80)
+            value = ((value << 1) | carry) & 0xFF
+        elif mnemonic == 'ROR':
+            carry = self.flags & FLAG_C
+            self._set_flag(FLAG_C, value & 0x01)
+            value = (value >> 1) | (carry << 7)
+        elif mnemonic == 'INC':
+            value = (value + 1) & 0xFF
+        else:  # DEC
+            value = (value - 1) & 0xFF
+        return self._set_nz(value)
+
+    # --- Execution ---
+    def step(self):
+        """Executes one instruction (or the CHROUT trap). Returns the mnemonic executed."""
+        trap = self.traps.get(self.pc)
+        if trap is not None:
+            trap()
+            self._return_from_trap()
+            return 'RTS'
+        memory = self.memory
+        opcode = memory[self.pc]
+        decoded = DECODE.get(opcode)
+        if decoded is None:
+            raise EmulatorError(f"Illegal opcode ${opcode:02X} at ${self.pc:04X}")
+        mnemonic, mode, cycles, penalty = decoded
+        self.pc = (self.pc + 1) & 0xFFFF
+
+        if mode == 'rel':
+            offset = memory[self.pc]
+            self.pc = (self.pc + 1) & 0xFFFF
+            flag, wanted = BRANCH_FLAGS[mnemonic]
+            if bool(self.flags & flag) == wanted:
+                target = (self.pc + (offset - 256 if offset & 0x80 else offset)) & 0xFFFF
+                cycles += 2 if (target & 0xFF00) != (self.pc & 0xFF00) else 1
+                self.pc = target
+            self.cycles += cycles
+            return mnemonic
+
+        if mode == 'imm':
+            address, crossed = self.pc, False
+            self.pc = (self.pc + 1) & 0xFFFF
+        elif mode == 'imp':
+            address, crossed = None, False
+        else:
+            address, crossed = self._operand_address(mode)
+        if penalty and crossed:
+            cycles += 1
+        self.cycles += cycles
+
+        if mnemonic == 'LDA':
+            self.a = self._set_nz(memory[address])
+        elif mnemonic == 'LDX':
+            self.x = self._set_nz(memory[address])
+        elif mnemonic == 'LDY':
+            self.y = self._set_nz(memory[address])
+        elif mnemonic == 'STA':
+            memory[address] = self.a
+        elif mnemonic == 'STX':
+            memory[address] = self.x
+        elif mnemonic == 'STY':
+            memory[address] = self.y
+        elif mnemonic == 'ADC':
+            self._adc(memory[address])
+        elif mnemonic == 'SBC':
+            self._sbc(memory[address])
+        elif mnemonic == 'AND':
+            self.a = self._set_nz(self.a & memory[address])
+        elif mnemonic == 'ORA':
+            self.a = self._set_nz(self.a | memory[address])
+        elif mnemonic == 'EOR':
+            self.a = self._set_nz(self.a ^ memory[address])
+        elif mnemonic == 'CMP':
+            self._compare(self.a, memory[address])
+        elif mnemonic == 'CPX':
+            self._compare(self.x, memory[address])
+        elif mnemonic == 'CPY':
+            self._compare(self.y, memory[address])
+        elif mnemonic == 'BIT':
+            value = memory[address]
+            self._set_flag(FLAG_Z, not (self.a & value))
+            self.flags = (self.flags & ~(FLAG_N | FLAG_V)) | (value & (FLAG_N | FLAG_V))
+        elif mnemonic in READ_MODIFY_WRITE:
+            if address is None:
+                self.a = self._shift(mnemonic, self.a)
+            else:
+                memory[address] = self._shift(mnemonic, memory[address])
+        elif mnemonic == 'INX':
+            self.x = self._set_nz((self.x + 1) & 0xFF)
+        elif mnemonic == 'INY':
+            self.y = self._set_nz((self.y + 1) & 0xFF)
+        elif mnemonic == 'DEX':
+            self.x = self._set_nz((self.x - 1) & 0xFF)
+        elif mnemonic == 'DEY':
+            self.y = self._set_nz((self.y - 1) & 0xFF)
+        elif mnemonic == 'TAX':
+            self.x = self._set_nz(self.a)
+        elif mnemonic == 'TAY':
+            self.y = self._set_nz(self.a)
+        elif mnemonic == 'TXA':
+            self.a = self._set_nz(self.x)
+        elif mnemonic == 'TYA':
+            self.a = self._set_nz(self.y)
+        elif mnemonic == 'TSX':
+            self.x = self._set_nz(self.sp)
+        elif mnemonic == 'TXS':
+            self.sp = self.x
+        elif mnemonic == 'PHA':
+            self.push(self.a)
+        elif mnemonic == 'PHP':
+            self.push(self.flags | FLAG_B | FLAG_U)
+        elif mnemonic == 'PLA':
+            self.a = self._set_nz(self.pull())
+        elif mnemonic == 'PLP':
+            self.flags = (self.pull() & ~FLAG_B) | FLAG_U
+        elif mnemonic == 'JMP':
+            self.pc = address
+        elif mnemonic == 'JSR':
+            self.push_word((self.pc - 1) & 0xFFFF)
+            self.pc = address
+        elif mnemonic == 'RTS':
+            self.pc = (self.pull_word() + 1) & 0xFFFF
+        elif mnemonic == 'RTI':
+            self.flags = (self.pull() & ~FLAG_B) | FLAG_U
+            self.pc = self.pull_word()
+        elif mnemonic == 'CLC':
+            self.flags &= ~FLAG_C
+        elif mnemonic == 'SEC':
+            self.flags |= FLAG_C
+        elif mnemonic == 'CLI':
+            self.flags &= ~FLAG_I
+        elif mnemonic == 'SEI':
+            self.flags |= FLAG_I
+        elif mnemonic == 'CLD':
+            self.flags &= ~FLAG_D
+        elif mnemonic == 'SED':
+            self.flags |= FLAG_D
+        elif mnemonic == 'CLV':
+            self.flags &= ~FLAG_V
+        elif mnemonic == 'BRK':
+            pass  # Ends the run; the caller checks for it
+        # NOP: nothing to do
+        return mnemonic
+
+
+def _routine_names(symbols):
+    """{address: name} from the label map; public names win over '_' ones."""
+    names = {}
+    for name, address in sorted(symbols.items(), key=lambda item: (item[0].startswith('_'), item[0])):
+        names.setdefault(address, name)
+    return names
+
+
+def run_prg(prg, symbols=None, max_cycles=DEFAULT_MAX_CYCLES, start=None):
+    """
+    Loads a .prg and runs it from `start` (by default the SYS address of the
+    assembler's BASIC stub) until the main program returns, BRK or max_cycles.
+    Returns a dict with
+      'cycles':       total CPU cycles
+      'instructions': instructions executed
+      'output':       CHROUT output decoded as text, 'output_bytes' raw
+      'stopped':      'return', 'brk' or 'cycle_limit'
+      'routines':     {name: {'calls', 'self_cycles', 'total_cycles'}} for the
+                      routines entered with JSR, main included, when symbols are given
+    """
+    load_address = prg[0] | (prg[1] << 8)
+    cpu = CPU()
+    cpu.memory[load_address:load_address + len(prg) - 2] = prg[2:]
+    if start is None:
+        start = _sys_address(cpu.memory, load_address)
+    cpu.pc = start
+    cpu.push_word((RETURN_ADDRESS - 1) & 0xFFFF)
+
+    names = _routine_names(symbols or {})
+    main_name = names.get(start, 'main')
+    routines = {main_name: {'calls': 1, 'self_cycles': 0, 'total_cycles': 0}}
+    call_stack = [(main_name, 0)]  # (routine, cycles at entry)
+    instructions = 0
+    stopped = 'cycle_limit'
+    while cpu.cycles < max_cycles:
+        before = cpu.cycles
+        mnemonic = cpu.step()
+        instructions += 1
+        routine = call_stack[-1][0] if call_stack else main_name
+        routines[routine]['self_cycles'] += cpu.cycles - before
+        if mnemonic == 'JSR':
+            name = names.get(cpu.pc, f"${cpu.pc:04X}")
+            entry = routines.setdefault(name, {'calls': 0, 'self_cycles': 0, 'total_cycles': 0})
+            entry['calls'] += 1
+            call_stack.append((name, cpu.cycles))
+        elif mnemonic == 'RTS' and call_stack:
+            name, entered = call_stack.pop()
+            routines[name]['total_cycles'] += cpu.cycles - entered
+        if cpu.pc == RETURN_ADDRESS:
+            stopped = 'return'
+            break
+        if mnemonic == 'BRK':
+            stopped = 'brk'
+            break
+    for name, entered in call_stack:
+        routines[name]['total_cycles'] += cpu.cycles - entered
+    return {
+        'cycles': cpu.cycles,
+        'instructions': instructions,
+        'output': petscii_to_text(cpu.output),
+        'output_bytes': bytes(cpu.output),
+        'stopped': stopped,
+        'routines': routines if symbols else {},
+    }
+
+
+def _sys_address(memory, load_address):
+    """Reads the number after the SYS token of the BASIC stub at load_address."""
+    position = load_address + 4
+    if memory[position] != 0x9E:
+        return load_address  # No BASIC stub: machine code starts right away
+    digits = bytearray()
+    position += 1
+    while memory[position] == 0x20:
+        position += 1
+    while 0x30 <= memory[position] <= 0x39:
+        digits.append(memory[position])
+        position += 1
+    return int(digits)
+
+
+def run_assembly(assembly, max_cycles=DEFAULT_MAX_CYCLES):
+    """Assembles python_to_assembly output and runs it; the result also has the assembler's size counts."""
+    assembled = assemble(assembly)
+    result = run_prg(assembled['prg'], assembled['symbols'], max_cycles=max_cycles)
+    result['code_bytes'] = assembled['code_bytes']
+    result['data_bytes'] = assembled['data_bytes']
+    return result
+
+
+def format_profile(result, limit=10):
+    """Text report: totals, then the routines that used the most cycles."""
+    lines = [f"; Cycles: {result['cycles']} in {result['instructions']} instructions ({result['stopped']})"]
+    ranked = sorted(result['routines'].items(), key=lambda item: -item[1]['self_cycles'])
+    for name, stats in ranked[:limit]:
+        lines.append(f";   {name}: {stats['self_cycles']} self, {stats['total_cycles']} total, {stats['calls']} calls")
+    return "\n".join(lines)
@@ -8,9 +8,6 @@ from lib import func_expressions
 from lib.builtin_function_specs import BUILTIN_FUNCTION_SPECS
 
 # Aliases
-gen_code = globals.generated_code
-variables = globals.variables
-used_routines = globals.used_routines
 report_error = globals.report_compiler_error
 
 # --- Special Handlers ---
@@ -21,38 +18,38 @@ def _handle_print(call_node, spec, current_func_info, target_var_name=None):
     Handles multiple arguments of different types.
     """
     if not call_node.args:
-        gen_code.append("jsr print_newline")
-        used_routines.add('print_newline')
+        globals.generated_code.append("jsr print_newline")
+        globals.used_routines.add('print_newline')
         return
 
     for i, arg_node in enumerate(call_node.args):
         if i > 0:
-            gen_code.append("jsr print_space")
-            used_routines.add('print_space')
+            globals.generated_code.append("jsr print_space")
+            globals.used_routines.add('print_space')
 
         temp_arg_var = func_core.get_temp_var()
         func_expressions.translate_expression_recursive(temp_arg_var, arg_node, func_core.get_current_func_name(current_func_info))
-        arg_type = variables.get(temp_arg_var, {}).get('type', 'int')
+        arg_type = globals.variables.get(temp_arg_var, {}).get('type', 'int')
 
         if arg_type == 'float':
             func_core.load_fp1_from_var(temp_arg_var)
-            gen_code.append("jsr print_float")
-            used_routines.add('print_float')
+            globals.generated_code.append("jsr print_float")
+            globals.used_routines.add('print_float')
         elif arg_type == 'pointer': # Assumes string pointer
             func_core.load_ax_from_var(temp_arg_var)
-            gen_code.append(f"sta ${globals.PRINT_STRING_ZP_BASE_PTR:02x}")
-            gen_code.append(f"stx ${globals.PRINT_STRING_ZP_BASE_PTR+1:02x}")
-            gen_code.append("jsr print_string_from_zp")
-            used_routines.add('print_string_from_zp')
+            globals.generated_code.append(f"stx ${globals.PRINT_STRING_ZP_BASE_PTR:02x}")
+            globals.generated_code.append(f"sta ${globals.PRINT_STRING_ZP_BASE_PTR+1:02x}")
+            globals.generated_code.append("jsr print_string_from_zp")
+            globals.used_routines.add('print_string_from_zp')
         else: # int
             func_core.load_ax_from_var(temp_arg_var)
-            gen_code.append("jsr print_integer")
-            used_routines.add('print_integer')
+            globals.generated_code.append("jsr print_integer")
+            globals.used_routines.add('print_integer')
 
         func_core.release_temp_var(temp_arg_var)
 
-    gen_code.append("jsr print_newline")
-    used_routines.add('print_newline')
+    globals.generated_code.append("jsr print_newline")
+    globals.used_routines.add('print_newline')
 
 def _handle_abs(call_node, spec, current_func_info, target_var_name):
     """
@@ -65,19 +62,19 @@ def _handle_abs(call_node, spec, current_func_info, target_var_name):
     resolved_target_name = func_core.resolve_variable_name(target_var_name, func_core.get_current_func_name(current_func_info))
     temp_arg_var = func_core.get_temp_var()
     func_expressions.translate_expression_recursive(temp_arg_var, call_node.args[0], func_core.get_current_func_name(current_func_info))
-    arg_type = variables.get(temp_arg_var, {}).get('type', 'int')
+    arg_type = globals.variables.get(temp_arg_var, {}).get('type', 'int')
 
     if arg_type == 'float':
         func_core.handle_variable(resolved_target_name, size=4, var_type='float')
         func_core.load_fp1_from_var(temp_arg_var)
-        gen_code.append("jsr FP_ABS")
-        used_routines.add('FP_ABS')
+        globals.generated_code.append("jsr FP_ABS")
+        globals.used_routines.add('FP_ABS')
         func_core.store_fp1_in_var(resolved_target_name)
     else: # int
         func_core.handle_variable(resolved_target_name, size=2, var_type='int')
         func_core.load_ax_from_var(temp_arg_var)
-        gen_code.append("jsr integer_abs")
-        used_routines.add('integer_abs')
+        globals.generated_code.append("jsr integer_abs")
+        globals.used_routines.add('integer_abs')
         func_core.store_ax_in_var(resolved_target_name)
 
     func_core.release_temp_var(temp_arg_var)
@@ -95,7 +92,7 @@ def _handle_len(call_node, spec, current_func_info, target_var_name):
 
     temp_arg_var = func_core.get_temp_var()
     func_expressions.translate_expression_recursive(temp_arg_var, call_node.args[0], func_core.get_current_func_name(current_func_info))
-    arg_type = variables.get(temp_arg_var, {}).get('type', 'unknown')
+    arg_type = globals.variables.get(temp_arg_var, {}).get('type', 'unknown')
 
     if arg_type != 'pointer':
         report_error(f"len() is only supported for strings, but got type '{arg_type}'.", call_node.lineno)
@@ -103,8 +100,8 @@ def _handle_len(call_node, spec, current_func_info, target_var_name):
         return
 
     func_core.load_ax_from_var(temp_arg_var) # Load string pointer into AX
-    gen_code.append("jsr strlen")
-    used_routines.add('strlen')
+    globals.generated_code.append("jsr strlen")
+    globals.used_routines.add('strlen')
     func_core.store_ax_in_var(resolved_target_name) # Store resulting length
     func_core.release_temp_var(temp_arg_var)
 
@@ -120,21 +117,21 @@ def _handle_input(call_node, spec, current_func_info, target_var_name):
         prompt_node = call_node.args[0]
         temp_prompt_var = func_core.get_temp_var()
         func_expressions.translate_expression_recursive(temp_prompt_var, prompt_node, func_core.get_current_func_name(current_func_info))
-        if variables.get(temp_prompt_var, {}).get('type') != 'pointer':
+        if globals.variables.get(temp_prompt_var, {}).get('type') != 'pointer':
             report_error(f"input() prompt must be a string.", call_node.lineno)
             func_core.release_temp_var(temp_prompt_var)
             return
         func_core.load_ax_from_var(temp_prompt_var)
-        gen_code.append(f"sta ${globals.PRINT_STRING_ZP_BASE_PTR:02x}")
-        gen_code.append(f"stx ${globals.PRINT_STRING_ZP_BASE_PTR+1:02x}")
-        gen_code.append("jsr print_string_from_zp")
-        used_routines.add('print_string_from_zp')
+        globals.generated_code.append(f"stx ${globals.PRINT_STRING_ZP_BASE_PTR:02x}")
+        globals.generated_code.append(f"sta ${globals.PRINT_STRING_ZP_BASE_PTR+1:02x}")
+        globals.generated_code.append("jsr print_string_from_zp")
+        globals.used_routines.add('print_string_from_zp')
         func_core.release_temp_var(temp_prompt_var)
 
     resolved_target_name = func_core.resolve_variable_name(target_var_name, func_core.get_current_func_name(current_func_info))
     func_core.handle_variable(resolved_target_name, size=2, var_type='pointer')
-    gen_code.append("jsr read_string_input")
-    used_routines.add('read_string_input')
+    globals.generated_code.append("jsr read_string_input")
+    globals.used_routines.add('read_string_input')
     func_core.store_ax_in_var(resolved_target_name)
 
 SPECIAL_HANDLERS = {
@@ -162,14 +159,14 @@ def _process_builtin_call(call_node, spec, current_func_info, target_var_name=No
     if args:
         temp_arg_var = func_core.get_temp_var()
         func_expressions.translate_expression_recursive(temp_arg_var, args[0], func_core.get_current_func_name(current_func_info))
-        if variables.get(temp_arg_var, {}).get('type') == 'float':
+        if globals.variables.get(temp_arg_var, {}).get('type') == 'float':
             func_core.load_fp1_from_var(temp_arg_var)
         else:
             func_core.load_ax_from_var(temp_arg_var)
         func_core.release_temp_var(temp_arg_var)
 
-    gen_code.append(f"jsr {spec['routine']}")
-    used_routines.add(spec['routine'])
+    globals.generated_code.append(f"jsr {spec['routine']}")
+    globals.used_routines.add(spec['routine'])
 
     if target_var_name:
         resolved_target_name = func_core.resolve_variable_name(target_var_name, func_core.get_current_func_name(current_func_info))
@@ -6,11 +6,11 @@ from lib import func_expressions
 from lib.c64_function_specs import C64_FUNCTION_SPECS, C64_HARDWARE_ALIASES
 
 # Aliases
-gen_code = globals.generated_code
-variables = globals.variables
-used_routines = globals.used_routines
 report_error = globals.report_compiler_error
 
+# Order in which arguments are loaded: storing a zero-page argument goes through A and X
+_LOAD_ORDER = {'zp': 0, 'y': 1, 'x': 2, 'ax': 3, 'a': 4}
+
 def _get_spec(func_name):
     """
     Retrieves the function specification, resolving aliases.
@@ -32,11 +32,16 @@ def _process_c64_call(call_node, spec, current_func_info=None):
         report_error(f"Incorrect number of arguments for C64 function '{func_name}'. Expected {len(params)}, got {len(args)}.", call_node.lineno)
         return
 
-    # Process arguments
-    for arg_node, param_spec in zip(args, params):
+    # Evaluate every argument first: evaluating one may use A, X and Y
+    current_func_name = current_func_info.get('name') if current_func_info else None
+    temp_vars = []
+    for arg_node in args:
         temp_var = func_core.get_temp_var()
-        func_expressions.translate_expression_recursive(temp_var, arg_node, current_func_info.get('name') if current_func_info else None)
+        func_expressions.translate_expression_recursive(temp_var, arg_node, current_func_name)
+        temp_vars.append(temp_var)
 
+    # Then load them, zero page first (through A) and the registers last
+    for param_spec, temp_var in sorted(zip(params, temp_vars), key=lambda pair: _LOAD_ORDER[pair[0]['store']]):
         if param_spec['store'] == 'ax':
             func_core.load_ax_from_var(temp_var)
         elif param_spec['store'] == 'a':
@@ -49,16 +54,17 @@ def _process_c64_call(call_node, spec, current_func_info=None):
             # Assumes the ZP address is specified in the spec
             zp_addr = param_spec['address']
             func_core.load_ax_from_var(temp_var)
-            gen_code.append(f"    sta ${zp_addr:02x}")
+            globals.generated_code.append(f"    stx ${zp_addr:02x}")
             if param_spec['size'] == 16:
-                gen_code.append(f"    stx ${zp_addr+1:02x}")
-        
+                globals.generated_code.append(f"    sta ${zp_addr+1:02x}")
+
+    for temp_var in temp_vars:
         func_core.release_temp_var(temp_var)
 
     # Call the routine
     routine_name = spec['routine']
-    gen_code.append(f"    jsr {routine_name}")
-    used_routines.add(routine_name)
+    globals.generated_code.append(f"    jsr {routine_name}")
+    globals.used_routines.add(routine_name)
 
 def handle_c64_call(call_node, current_func_info=None):
     """
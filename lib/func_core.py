@@ -8,6 +8,50 @@ def _get_mangled_local_var_name(func_name, var_name):
     """Mangles a local variable name with its function scope."""
     return f"__{func_name}_{var_name}"
 
+# Identifiers an assembler reads as a register: `ASL a` shifts the accumulator,
+# not the variable labelled `a`
+REGISTER_NAMES = frozenset({'A'})
+
+def rename_register_identifiers(tree):
+    """
+    Renames the variables, parameters and functions of `tree` whose label would
+    read as a register operand (`a`, `A`) to a name the program does not use.
+    Locals are prefixed by mangling, but globals keep their own name as label.
+    Returns {old name: new name}.
+    """
+    used = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            used.add(node.id)
+        elif isinstance(node, ast.arg):
+            used.add(node.arg)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            used.add(node.name)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            used.update(node.names)
+    renames = {}
+    for name in sorted(used):
+        if name.upper() in REGISTER_NAMES:
+            new_name, number = f"{name}_var", 1
+            while new_name in used or new_name in renames.values():
+                number += 1
+                new_name = f"{name}_var{number}"
+            renames[name] = new_name
+    if not renames:
+        return renames
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id in renames:
+            node.id = renames[node.id]
+        elif isinstance(node, ast.arg) and node.arg in renames:
+            node.arg = renames[node.arg]
+        elif isinstance(node, ast.keyword) and node.arg in renames:
+            node.arg = renames[node.arg]
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and node.name in renames:
+            node.name = renames[node.name]
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            node.names = [renames.get(name, name) for name in node.names]
+    return renames
+
 def resolve_variable_name(var_name, current_func_name=None):
     """
     Resolves a variable name to its mangled form if it's a local or parameter,
@@ -70,7 +114,7 @@ def handle_variable(var_name, size=None, is_8bit_semantic=None, var_type=None):
     if var_name not in py2asm_globals.variables:
         py2asm_globals.variables[var_name] = {} # Access py2asm_globals.variables
 
-    # If scope is not set, default to global. This handles temp vars.
+    # If scope is not set, default to global.
     if 'scope' not in py2asm_globals.variables[var_name]:
         py2asm_globals.variables[var_name]['scope'] = 'global'
 
@@ -92,6 +136,11 @@ def handle_variable(var_name, size=None, is_8bit_semantic=None, var_type=None):
     if var_type is not None:
         py2asm_globals.variables[var_name]['type'] = var_type
 
+    # Temporaries only record their shape here; their storage is assigned after
+    # code generation by the temp allocation pass (lib/temp_allocation.py).
+    if py2asm_globals.variables[var_name]['scope'] == 'temp':
+        return None
+
     # --- Allocate memory and create data definition ---
     address = py2asm_globals.memory_pointer # Access py2asm_globals.memory_pointer
     # Check for memory overflow
@@ -102,15 +151,25 @@ def handle_variable(var_name, size=None, is_8bit_semantic=None, var_type=None):
 
     py2asm_globals.memory_pointer += alloc_size # Access py2asm_globals.memory_pointer
     py2asm_globals.variables[var_name]['address'] = address
+    py2asm_globals.data_definitions.append(_generate_res_definition(var_name, alloc_size))
+
+    return address
+
 
+def variable_storage_size(var_info):
+    """Returns the number of bytes a variable needs, based on its inferred type."""
+    if var_info.get('type') == 'float':
+        return 4
+    return var_info.get('size', 2)
+
+
+def _generate_res_definition(label, size):
+    """Returns the data definition line reserving `size` bytes at `label`."""
     res_directive = py2asm_globals.assembly_data_types['res']
     # Handle CBM Prg Studio's special syntax for reserving memory.
     if res_directive.strip() == '*':
-        py2asm_globals.data_definitions.append(f"{var_name} {res_directive} = * + {alloc_size}")
-    else:
-        py2asm_globals.data_definitions.append(f"{var_name} {res_directive} {alloc_size}")
-
-    return address
+        return f"{label} {res_directive} = * + {size}"
+    return f"{label} {res_directive} {size}"
 
 
 def create_label(base_name, unique_id):
@@ -119,23 +178,17 @@ def create_label(base_name, unique_id):
 
 
 def get_temp_var():
-    """Gets a temporary variable, allocating it with max size (4 bytes for float).
-    Prioritizes reusing released variables from the pool.
+    """Gets a new temporary variable.
+    Every call returns a fresh name; no storage is reserved yet. Once code
+    generation is complete, the temp allocation pass sizes each temp by its
+    real type and lets temps with disjoint lifetimes share the same bytes.
     """
-    if py2asm_globals.temp_var_pool:
-        var_name = py2asm_globals.temp_var_pool.pop() # Reuse from pool
-        py2asm_globals.temp_variables[var_name] = True # Mark as in use
-        # No need to call handle_variable again, as its memory is already allocated.
-        # handle_variable checks if already allocated.
-        return var_name
-    else:
-        # Generate a new unique name using the counter from py2asm_globals
-        var_name = f"temp_{py2asm_globals.temp_var_counter}"
-        py2asm_globals.temp_var_counter += 1
-        py2asm_globals.temp_variables[var_name] = True
-        # Temp vars can hold anything, so allocate enough for a float.
-        handle_variable(var_name, size=4, var_type='any')
-        return var_name
+    var_name = f"temp_{py2asm_globals.temp_var_counter}"
+    py2asm_globals.temp_var_counter += 1
+    py2asm_globals.variables[var_name] = {'scope': 'temp', 'type': 'any'}
+    py2asm_globals.temp_variables[var_name] = True # Mark as in use
+    py2asm_globals.temp_var_peak = max(py2asm_globals.temp_var_peak, len(py2asm_globals.temp_variables))
+    return var_name
 
 def _generate_load_2_bytes_to_zp(source_var_name, dest_zp_addr):
     """Generates assembly to load 2 bytes (a pointer) from a variable to a zero-page address."""
@@ -233,10 +286,9 @@ def _generate_load_float_to_fp2(source_var_name):
 
 
 def release_temp_var(var_name):
-    """Releases a temporary variable for reuse.""" # Access py2asm_globals.temp_variables
+    """Marks a temporary variable as no longer held by the code generator.""" # Access py2asm_globals.temp_variables
     if var_name in py2asm_globals.temp_variables:
         del py2asm_globals.temp_variables[var_name]
-        py2asm_globals.temp_var_pool.append(var_name) # Add to pool for reuse
     else:
         py2asm_globals.report_compiler_error(f"Attempted to release non-active temporary variable '{var_name}'.", level="WARNING")
 
@@ -278,6 +330,7 @@ def type_value(var_name, node):
         py2asm_globals.label_counter += 1
         escaped_value = value.replace('"', '""') # Basic escape for assembly string
         py2asm_globals.data_definitions.append(f"{string_literal_label} {py2asm_globals.assembly_data_types['asciiz']} \"{escaped_value}\"")
+        py2asm_globals.data_definitions.append(f"          {py2asm_globals.assembly_data_types['byte']} 0 ; Null terminator for {string_literal_label}")
 
         py2asm_globals.variables[var_name]['size'] = 2 # Pointers are 2 bytes
         py2asm_globals.variables[var_name]['type'] = 'pointer'
@@ -392,8 +445,15 @@ def _copy_variable_content(source_var_name, dest_var_name, current_func_name=Non
     source_type = source_info.get('type', 'unknown')
     dest_type = dest_info.get('type', 'unknown')
     source_size = source_info.get('size', 2) # Default to 2 bytes
+    if source_type == 'float':
+        source_size = 4
     dest_size = dest_info.get('size', 2) # Default to 2 bytes
 
+    # A temporary takes the shape of the value copied into it
+    if dest_info.get('scope') == 'temp':
+        dest_info['type'] = dest_type = source_type
+        dest_info['size'] = dest_size = source_size
+
     # Handle type coercion (int <-> float)
     if source_type == 'int' and dest_type == 'float': # Access py2asm_globals.generated_code
         _generate_int_to_float_conversion(source_var_name, dest_var_name)
@@ -439,6 +499,7 @@ class FuncCore:  # Placeholder to satisfy the instantiation in main.py
             py2asm_globals.label_counter += 1
             escaped_value = arg_node.value.replace('"', '""')
             py2asm_globals.data_definitions.append(f"{string_literal_label} {py2asm_globals.assembly_data_types['asciiz']} \"{escaped_value}\"")
+            py2asm_globals.data_definitions.append(f"          {py2asm_globals.assembly_data_types['byte']} 0 ; Null terminator for {string_literal_label}")
 
             py2asm_globals.generated_code.append(f"    LDA #<{string_literal_label}")
             py2asm_globals.generated_code.append(f"    STA temp_0")
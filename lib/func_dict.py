@@ -8,9 +8,6 @@ import lib.func_expressions
 from lib.dict_method_specs import DICT_METHOD_SPECS
 
 # Aliases
-gen_code = globals.generated_code
-variables = globals.variables
-used_routines = globals.used_routines
 report_error = globals.report_compiler_error
 
 # --- Calling Convention for Dictionary Runtime Routines ---
@@ -38,16 +35,16 @@ def _process_dict_method_call(call_node, spec, dict_var_name, current_func_info,
     # --- 2. Prepare Dictionary Pointer ---
     # The runtime routine needs to know which dictionary to operate on.
     resolved_dict_name = func_core.resolve_variable_name(dict_var_name, current_func_name)
-    dict_info = variables.get(resolved_dict_name)
+    dict_info = globals.variables.get(resolved_dict_name)
     if not dict_info or dict_info.get('type') != 'dict':
         report_error(f"Variable '{dict_var_name}' is not a dictionary.", call_node.lineno)
         return
 
-    gen_code.append(f"; --- Preparing call to dict.{method_name} on '{resolved_dict_name}' ---")
-    gen_code.append(f"lda #<{resolved_dict_name}")
-    gen_code.append(f"ldx #>{resolved_dict_name}")
-    gen_code.append(f"sta {ZP_DICT_PTR}")
-    gen_code.append(f"stx {ZP_DICT_PTR}+1")
+    globals.generated_code.append(f"; --- Preparing call to dict.{method_name} on '{resolved_dict_name}' ---")
+    globals.generated_code.append(f"lda #<{resolved_dict_name}")
+    globals.generated_code.append(f"ldx #>{resolved_dict_name}")
+    globals.generated_code.append(f"sta {ZP_DICT_PTR}")
+    globals.generated_code.append(f"stx {ZP_DICT_PTR}+1")
 
     # --- 3. Process and Pass Arguments ---
     arg_zp_locs = [ZP_ARG1_PTR, ZP_ARG2_PTR]
@@ -63,15 +60,15 @@ def _process_dict_method_call(call_node, spec, dict_var_name, current_func_info,
 
         # Pass a pointer to the *variable* that holds the argument's value
         zp_loc = arg_zp_locs[i]
-        gen_code.append(f"lda #<{temp_arg_var}")
-        gen_code.append(f"ldx #>{temp_arg_var}")
-        gen_code.append(f"sta {zp_loc}")
-        gen_code.append(f"stx {zp_loc}+1")
+        globals.generated_code.append(f"lda #<{temp_arg_var}")
+        globals.generated_code.append(f"ldx #>{temp_arg_var}")
+        globals.generated_code.append(f"sta {zp_loc}")
+        globals.generated_code.append(f"stx {zp_loc}+1")
 
     # --- 4. Call the Routine ---
     routine_name = spec['routine']
-    gen_code.append(f"jsr {routine_name}")
-    used_routines.add(routine_name)
+    globals.generated_code.append(f"jsr {routine_name}")
+    globals.used_routines.add(routine_name)
 
     # --- 5. Handle Return Value ---
     if target_var_name:
@@ -89,7 +86,7 @@ def _process_dict_method_call(call_node, spec, dict_var_name, current_func_info,
     # --- 6. Cleanup ---
     for temp_var in temp_vars_to_release:
         func_core.release_temp_var(temp_var)
-    gen_code.append(f"; --- End call to dict.{method_name} ---")
+    globals.generated_code.append(f"; --- End call to dict.{method_name} ---")
 
 
 def handle_dict_method_call(call_node, current_func_info=None):
@@ -7,14 +7,12 @@ from lib.func_core import (
     type_value, handle_variable, get_temp_var, release_temp_var,
     _generate_int_to_float_conversion, _generate_float_to_int_conversion,
     _generate_load_float_to_fp1, _generate_store_float_from_fp1, _copy_variable_content,
-    resolve_variable_name
+    resolve_variable_name, _get_mangled_local_var_name, load_ax_from_var
 )
 from lib.func_strings import join_str_value
+from lib.value_ranges import is_byte_operation, expression_range
 
 # Aliases
-gen_code = _globals.generated_code
-variables = _globals.variables
-used_routines = _globals.used_routines
 report_error = _globals.report_compiler_error
 
 
@@ -78,12 +76,12 @@ def _handle_builtin_functions(func_name, args, var_name, current_func_name):
         translate_expression_recursive(temp_arg, args[0], current_func_name)
         handle_variable(var_name)
         
-        if variables.get(temp_arg, {}).get('is_float', False):
-            variables[var_name].update({'is_float': True, 'size': 4})
-            gen_code.extend(_generate_load_float_to_fp1(temp_arg))
-            gen_code.append("    JSR FP_ABS")
-            gen_code.extend(_generate_store_float_from_fp1(var_name))
-            used_routines.add('FP_ABS')
+        if _globals.variables.get(temp_arg, {}).get('is_float', False):
+            _globals.variables[var_name].update({'is_float': True, 'size': 4})
+            _globals.generated_code.extend(_generate_load_float_to_fp1(temp_arg))
+            _globals.generated_code.append("    JSR FP_ABS")
+            _globals.generated_code.extend(_generate_store_float_from_fp1(var_name))
+            _globals.used_routines.add('FP_ABS')
         else:
             # Import to avoid circular dependency
             from .func_operations import _handle_integer_abs
@@ -103,8 +101,37 @@ def translate_expression(var_name, node, current_func_name=None):
     left = node.value.left
     right = node.value.right
 
-    left_id = _resolve_operand(left, current_func_name)
-    right_id = _resolve_operand(right, current_func_name)
+    # Result known to fit in a byte (lib/value_ranges.py): single-byte operation
+    if is_byte_operation(node.value):
+        left_id, left_temp = resolve_byte_operand(left, current_func_name)
+        right_id, right_temp = resolve_byte_operand(right, current_func_name)
+        from .func_operations import byte_binop_handler
+        byte_binop_handler(left_id, op, right_id, var_name)
+        for temp in (left_temp, right_temp):
+            if temp:
+                release_temp_var(temp)
+        return
+
+    # Multiplication/floor division by an integer constant: try shifts and adds first
+    left_id = right_id = None
+    reduction = _strength_reduction_candidate(op, left, right)
+    if reduction:
+        operand_node, constant = reduction
+        operand_id = _resolve_operand(operand_node, current_func_name)
+        from .func_operations import constant_binop_handler
+        if constant_binop_handler(operand_id, op, constant, var_name, expression_range(node.value)):
+            if isinstance(operand_node, (ast.Constant, ast.BinOp)):
+                release_temp_var(operand_id)
+            return
+        if operand_node is left:
+            left_id = operand_id
+        else:
+            right_id = operand_id
+
+    if left_id is None:
+        left_id = _resolve_operand(left, current_func_name)
+    if right_id is None:
+        right_id = _resolve_operand(right, current_func_name)
     
     temp_vars = []
     if isinstance(left, (ast.Constant, ast.BinOp)):
@@ -117,12 +144,28 @@ def translate_expression(var_name, node, current_func_name=None):
 
     # Import to avoid circular dependency
     from .func_operations import binop_handler
-    binop_handler(left_id, op, right_id, var_name)
+    binop_handler(left_id, op, right_id, var_name, expression_range(node.value))
 
     for temp in temp_vars:
         release_temp_var(temp)
 
 
+def _is_int_constant(node):
+    return isinstance(node, ast.Constant) and type(node.value) is int
+
+
+def _strength_reduction_candidate(op, left, right):
+    """
+    Returns (operand_node, constant) for `x * c`, `c * x` and `x // c` with an
+    integer constant c, or None for any other operation.
+    """
+    if isinstance(op, (ast.Mult, ast.FloorDiv)) and _is_int_constant(right) and not _is_int_constant(left):
+        return left, right.value
+    if isinstance(op, ast.Mult) and _is_int_constant(left) and not _is_int_constant(right):
+        return right, left.value
+    return None
+
+
 def _resolve_operand(operand, current_func_name):
     """Resolve an operand to a variable name."""
     if isinstance(operand, ast.Constant):
@@ -138,10 +181,21 @@ def _resolve_operand(operand, current_func_name):
         return temp_var
 
 
+def resolve_byte_operand(operand, current_func_name):
+    """
+    Like _resolve_operand for 8-bit code: an integer constant becomes an
+    immediate operand instead of a temp. Returns (operand, temp_to_release).
+    """
+    if isinstance(operand, ast.Constant) and type(operand.value) in (int, bool):
+        return f"#${int(operand.value) & 0xFF:02X}", None
+    resolved = _resolve_operand(operand, current_func_name)
+    return resolved, (None if isinstance(operand, ast.Name) else resolved)
+
+
 def _handle_type_coercion(left_id, right_id):
     """Handle type coercion between operands."""
-    left_is_float = variables.get(left_id, {}).get('is_float', False)
-    right_is_float = variables.get(right_id, {}).get('is_float', False)
+    left_is_float = _globals.variables.get(left_id, {}).get('is_float', False)
+    right_is_float = _globals.variables.get(right_id, {}).get('is_float', False)
     
     coerced_temps = []
     
@@ -170,7 +224,7 @@ def get_value(node, current_func_name=None):
         return temp_var
     elif isinstance(node, ast.Name):
         resolved = resolve_variable_name(node.id, current_func_name)
-        return resolved if resolved in variables else None
+        return resolved if resolved in _globals.variables else None
     elif isinstance(node, ast.BinOp):
         temp_var = get_temp_var()
         translate_expression_recursive(temp_var, node, current_func_name)
@@ -182,7 +236,14 @@ def get_value(node, current_func_name=None):
 
 def translate_expression_recursive(var_name, node, current_func_name=None):
     """Recursive function for handling expressions."""
-    if isinstance(node, ast.BinOp):
+    from lib import func_lists
+    if func_lists.is_list_value(node):
+        func_lists.initialize_list(var_name, node, current_func_name)
+
+    elif func_lists.subscript_list_name(node, current_func_name):
+        func_lists.load_element(var_name, node, current_func_name)
+
+    elif isinstance(node, ast.BinOp):
         folded = _perform_constant_folding(node)
         if folded:
             type_value(var_name, folded)
@@ -205,7 +266,7 @@ def translate_expression_recursive(var_name, node, current_func_name=None):
         _handle_function_call_in_expression(var_name, node, current_func_name)
     
     elif isinstance(node, ast.JoinedStr):
-        join_str_value(var_name, node)
+        join_str_value(var_name, node, current_func_name)
 
     elif isinstance(node, ast.UnaryOp):
         if isinstance(node.op, ast.USub):
@@ -248,6 +309,72 @@ def _handle_function_call_in_expression(var_name, node, current_func_name):
         type_value(var_name, ast.Constant(value=0))
 
 
+def _calls_user_function(node):
+    return any(isinstance(n, ast.Call) and isinstance(n.func, ast.Name) and n.func.id in _globals.defined_functions
+               for n in ast.walk(node))
+
+
+def store_static_call_arguments(func_name, args, current_func_name):
+    """
+    Passes the arguments of a call to a function with a static frame by
+    evaluating them straight into its params. If an argument calls another
+    user function, whose frame may share bytes with the callee's, all the
+    arguments are evaluated into temps first and copied afterwards.
+    """
+    params = [_get_mangled_local_var_name(func_name, p) for p in _globals.defined_functions[func_name]['params']]
+    if not any(_calls_user_function(arg_node) for arg_node in args):
+        for param, arg_node in zip(params, args):
+            translate_expression_recursive(param, arg_node, current_func_name)
+        return
+
+    arg_temps = []
+    for arg_node in args:
+        temp_arg = get_temp_var()
+        translate_expression_recursive(temp_arg, arg_node, current_func_name)
+        arg_temps.append(temp_arg)
+    for param, temp_arg in zip(params, arg_temps):
+        _copy_variable_content(temp_arg, param, current_func_name)
+        release_temp_var(temp_arg)
+
+
+def pass_register_arguments(func_name, args, current_func_name):
+    """
+    Passes the arguments of a call to a 'register' convention function: the
+    zero-page ones are stored first, the X/A one is loaded last, right before
+    the JSR. If an argument contains a call, every argument is evaluated into
+    a temp first so the call cannot clobber X/A or the zero-page word.
+    """
+    specs = _globals.defined_functions[func_name]['register_params']
+    arg_temps = [None] * len(args)
+    if any(isinstance(n, ast.Call) for arg_node in args for n in ast.walk(arg_node)):
+        for i, arg_node in enumerate(args):
+            arg_temps[i] = get_temp_var()
+            translate_expression_recursive(arg_temps[i], arg_node, current_func_name)
+
+    for spec, arg_node, temp_arg in zip(specs, args, arg_temps):
+        if spec['store'] == 'zp':
+            param = _get_mangled_local_var_name(func_name, spec['name'])
+            if temp_arg:
+                _copy_variable_content(temp_arg, param, current_func_name)
+            else:
+                translate_expression_recursive(param, arg_node, current_func_name)
+
+    for i, (spec, arg_node) in enumerate(zip(specs, args)):
+        if spec['store'] != 'ax':
+            continue
+        source = arg_temps[i]
+        if source is None and isinstance(arg_node, ast.Name):
+            source = resolve_variable_name(arg_node.id, current_func_name)
+        if source is None:
+            source = arg_temps[i] = get_temp_var()
+            translate_expression_recursive(source, arg_node, current_func_name)
+        load_ax_from_var(source)
+
+    for temp_arg in arg_temps:
+        if temp_arg:
+            release_temp_var(temp_arg)
+
+
 def _handle_user_function_call(var_name, func_name, args, current_func_name):
     """Handle user-defined function calls."""
     func_info = _globals.defined_functions[func_name]
@@ -258,17 +385,22 @@ def _handle_user_function_call(var_name, func_name, args, current_func_name):
         type_value(var_name, ast.Constant(value=0))
         return
     
-    for i, arg_node in enumerate(args):
-        arg_holder = f"__func_arg_{i}"
-        handle_variable(arg_holder)
-        translate_expression_recursive(arg_holder, arg_node, current_func_name)
+    if func_info.get('convention') == 'register':
+        pass_register_arguments(func_name, args, current_func_name)
+    elif func_info.get('convention') == 'static':
+        store_static_call_arguments(func_name, args, current_func_name)
+    else:
+        for i, arg_node in enumerate(args):
+            arg_holder = f"__func_arg_{i}"
+            handle_variable(arg_holder)
+            translate_expression_recursive(arg_holder, arg_node, current_func_name)
     
-    gen_code.append(f"    JSR {func_info['label']}")
+    _globals.generated_code.append(f"    JSR {func_info['label']}")
     
     return_type = func_info.get('return_type', 'int')
     handle_variable(var_name, size=4 if return_type == 'float' else 2, var_type=return_type)
     
     if return_type == 'float':
-        gen_code.extend(_generate_store_float_from_fp1(var_name))
+        _globals.generated_code.extend(_generate_store_float_from_fp1(var_name))
     else:
-        gen_code.extend([f"    STX {var_name}", f"    STA {var_name}+1"])
\ No newline at end of file
+        _globals.generated_code.extend([f"    STX {var_name}", f"    STA {var_name}+1"])
\ No newline at end of file
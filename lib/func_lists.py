@@ -0,0 +1,182 @@
+# py2c64/lib/func_lists.py
+# Lists of 16-bit integers with a length fixed at compile time.
+# A list is a global variable created from a literal (`a = [3, 1, 2]`) or a
+# repeated one-element literal (`a = [0] * 100`); its storage is a block of
+# 2 * length bytes at the variable's label. Elements are read and written
+# with absolute,Y addressing on twice the index, so a list holds at most 128
+# elements; the fill loops count X up and compare against 2 * length, which
+# wraps to 0 for exactly 128 elements. There is no bounds checking: like every other variable access
+# on the C64, an index past the end reads or writes the following bytes.
+
+import ast
+import V1.globals as globals
+from lib import func_core
+from lib.func_core import resolve_variable_name
+
+report_error = globals.report_compiler_error
+
+MAX_LIST_LENGTH = 128  # 2 * index must fit in the Y register
+
+
+def _int_value(node):
+    if isinstance(node, ast.Constant) and type(node.value) in (int, bool):
+        return int(node.value)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _int_value(node.operand)
+        return None if value is None else -value
+    return None
+
+
+def _repeated_literal(node):
+    """For `[x] * n` (or `n * [x]`) returns (x, n); None for anything else."""
+    if not (isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult)):
+        return None
+    for items, count in ((node.left, node.right), (node.right, node.left)):
+        if isinstance(items, ast.List) and len(items.elts) == 1 and _int_value(count) is not None:
+            return items.elts[0], _int_value(count)
+    return None
+
+
+def is_list_value(node):
+    """True for the expressions that create a list."""
+    return isinstance(node, ast.List) or _repeated_literal(node) is not None
+
+
+def list_length(node):
+    """Number of elements of a list-creating expression, or None."""
+    if isinstance(node, ast.List):
+        return len(node.elts)
+    repeated = _repeated_literal(node)
+    return max(repeated[1], 0) if repeated else None
+
+
+def is_list_variable(var_name):
+    return globals.variables.get(var_name, {}).get('type') == 'list'
+
+
+def _load_word_lines(node, func_name, temps):
+    """Returns (low, high) operands for an element value, evaluating it into a temp if needed."""
+    from lib import func_expressions
+    value = _int_value(node)
+    if value is not None:
+        return f"#${value & 0xFF:02X}", f"#${(value >> 8) & 0xFF:02X}"
+    if isinstance(node, ast.Name):
+        name = resolve_variable_name(node.id, func_name)
+        return name, f"{name}+1"
+    temp = func_core.get_temp_var()
+    temps.append(temp)
+    func_expressions.translate_expression_recursive(temp, node, func_name)
+    return temp, f"{temp}+1"
+
+
+def initialize_list(var_name, node, func_name):
+    """Fills the storage of list variable `var_name` from a list-creating expression."""
+    gen = globals.generated_code
+    info = globals.variables.get(var_name, {})
+    if info.get('scope') != 'global' or 'length' not in info:
+        report_error("Lists are only supported as global variables.", node=node)
+        return
+    length = list_length(node)
+    if length != info['length']:
+        report_error(f"List '{var_name}' is reassigned with a different length ({length}, was {info['length']}).", node=node)
+        return
+    if length == 0:
+        return
+    label_id = str(globals.label_counter)
+    globals.label_counter += 1
+    loop_label = func_core.create_label("list_init", label_id)
+    temps = []
+
+    repeated = _repeated_literal(node)
+    if repeated is not None:
+        low, high = _load_word_lines(repeated[0], func_name, temps)
+        gen.extend([
+            f"    ; {var_name} = [...] * {length}",
+            "    LDX #$00",
+            f"{loop_label}:",
+            f"    LDA {low}",
+            f"    STA {var_name},X",
+            f"    LDA {high}",
+            f"    STA {var_name}+1,X",
+            "    INX",
+            "    INX",
+            f"    CPX #${2 * length & 0xFF:02X}",
+            f"    BNE {loop_label}",
+        ])
+    elif all(_int_value(element) is not None for element in node.elts):
+        # Constant elements: copy them from a table in the data segment
+        table_label = f"{var_name}_init_{label_id}"
+        words = ", ".join(f"${_int_value(element) & 0xFFFF:04X}" for element in node.elts)
+        globals.data_definitions.append(f"{table_label} {globals.assembly_data_types['word']} {words}")
+        gen.extend([
+            f"    ; {var_name} = [{length} constants]",
+            "    LDX #$00",
+            f"{loop_label}:",
+            f"    LDA {table_label},X",
+            f"    STA {var_name},X",
+            "    INX",
+            f"    CPX #${2 * length & 0xFF:02X}",
+            f"    BNE {loop_label}",
+        ])
+    else:
+        for index, element in enumerate(node.elts):
+            low, high = _load_word_lines(element, func_name, temps)
+            gen.extend([f"    LDA {low}", f"    STA {var_name}+{2 * index}",
+                        f"    LDA {high}", f"    STA {var_name}+{2 * index + 1}"])
+    for temp in temps:
+        func_core.release_temp_var(temp)
+
+
+def _element_address(list_name, subscript, func_name):
+    """
+    Returns the operand of the element's low byte, e.g. `a+6` for a constant
+    index or `a,Y` after emitting the code that puts twice the index in Y.
+    """
+    from lib import func_expressions
+    length = globals.variables[list_name]['length']
+    index = _int_value(subscript.slice)
+    if index is not None:
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            report_error(f"List index {_int_value(subscript.slice)} out of range for '{list_name}' ({length} elements).", node=subscript)
+        return f"{list_name}+{2 * index}", f"{list_name}+{2 * index + 1}"
+    if isinstance(subscript.slice, ast.Name):
+        globals.generated_code.append(f"    LDA {resolve_variable_name(subscript.slice.id, func_name)}")
+    else:
+        temp = func_core.get_temp_var()
+        func_expressions.translate_expression_recursive(temp, subscript.slice, func_name)
+        globals.generated_code.append(f"    LDA {temp}")
+        func_core.release_temp_var(temp)
+    globals.generated_code.extend(["    ASL A", "    TAY"])
+    return f"{list_name},Y", f"{list_name}+1,Y"
+
+
+def subscript_list_name(node, func_name):
+    """The list variable indexed by a Subscript node, or None when it is not a list."""
+    if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name):
+        name = resolve_variable_name(node.value.id, func_name)
+        if is_list_variable(name):
+            return name
+    return None
+
+
+def load_element(var_name, node, func_name):
+    """var_name = list[index]"""
+    list_name = subscript_list_name(node, func_name)
+    func_core.handle_variable(var_name, size=2, var_type='int')
+    low, high = _element_address(list_name, node, func_name)
+    globals.generated_code.extend([f"    LDA {low}", f"    STA {var_name}",
+                                   f"    LDA {high}", f"    STA {var_name}+1"])
+
+
+def store_element(target, value_node, func_name):
+    """list[index] = value. The value is evaluated first, as it may index a list too."""
+    list_name = subscript_list_name(target, func_name)
+    temps = []
+    low, high = _load_word_lines(value_node, func_name, temps)
+    element_low, element_high = _element_address(list_name, target, func_name)
+    globals.generated_code.extend([f"    LDA {low}", f"    STA {element_low}",
+                                   f"    LDA {high}", f"    STA {element_high}"])
+    for temp in temps:
+        func_core.release_temp_var(temp)
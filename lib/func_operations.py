@@ -8,24 +8,30 @@ from lib.func_core import (
     _generate_int_to_float_conversion, _generate_load_float_to_fp1,
     _generate_load_float_to_fp2, _generate_store_float_from_fp1
 )
+from lib import routines
+from lib import value_ranges
 
 # Aliases
-gen_code = _globals.generated_code
-variables = _globals.variables
-used_routines = _globals.used_routines
 report_error = _globals.report_compiler_error
 
 
-def _handle_binop_multiply_16bit(left_op, right_op, target):
-    """Handles 16-bit multiplication."""
-    mul_vars = ['m16_arg1_l', 'm16_arg1_h', 'm16_arg2_l', 'm16_arg2_h',
-                'm16_res_l', 'm16_res_h', 'm16_p0_l', 'm16_p0_h',
-                'm16_term2', 'm16_term3', 'm16_mul8_val1', 'm16_mul8_val2']
-    
+def _declare_multiply_workspace(mul_vars):
+    """Declares the cells used by the selected multiply routine family."""
     for var in mul_vars:
         handle_variable(var)
+    if routines.multiply_variant() == 'table':
+        for var in ('qs_a', 'qs_b', 'qs_prod_l', 'qs_prod_h'):
+            handle_variable(var)
 
-    gen_code.extend([
+
+def _handle_binop_multiply_16bit(left_op, right_op, target):
+    """Handles 16-bit multiplication."""
+    mul_vars = ['m16_arg1_l', 'm16_arg1_h', 'm16_arg2_l', 'm16_arg2_h', 'm16_res_l', 'm16_res_h', 'm16_sign']
+    if routines.multiply_variant() == 'bitserial':
+        mul_vars += ['m16_p0_l', 'm16_p0_h']
+    _declare_multiply_workspace(mul_vars)
+
+    _globals.generated_code.extend([
         f"    LDA {left_op}", f"    STA m16_arg1_l",
         f"    LDA {left_op}+1", f"    STA m16_arg1_h",
         f"    LDA {right_op}", f"    STA m16_arg2_l",
@@ -34,7 +40,7 @@ def _handle_binop_multiply_16bit(left_op, right_op, target):
         f"    LDA m16_res_l", f"    STA {target}",
         f"    LDA m16_res_h", f"    STA {target}+1"
     ])
-    used_routines.add('multiply16x16_16')
+    _globals.used_routines.add('multiply16x16_16')
 
 
 def _handle_binop_divide_16bit(left_op, right_op, target):
@@ -45,7 +51,7 @@ def _handle_binop_divide_16bit(left_op, right_op, target):
     for var in div_vars:
         handle_variable(var)
 
-    gen_code.extend([
+    _globals.generated_code.extend([
         f"    LDA {left_op}", f"    STA d16_orig_dividend_l",
         f"    LDA {left_op}+1", f"    STA d16_orig_dividend_h",
         f"    LDA {right_op}", f"    STA d16_divisor_l",
@@ -54,23 +60,303 @@ def _handle_binop_divide_16bit(left_op, right_op, target):
         f"    LDA d16_quotient_l", f"    STA {target}",
         f"    LDA d16_quotient_h", f"    STA {target}+1"
     ])
-    used_routines.add('divide16x16_16')
+    _globals.used_routines.add('divide16x16_16')
+
+
+# --- Strength reduction for multiplication/division by a constant ---
+# The inline sequences below give the results of the signed 16-bit routines:
+# a product that does not fit in a signed word traps, a quotient is the
+# floor of the signed division.
+
+MAX_SHIFT_ADD_STEPS = 10  # Longest shift-and-add chain worth emitting inline
+
+
+def _multiply_steps(constant):
+    """
+    Returns the steps computing x * constant with Horner's rule over the bits
+    of the constant, after the leading one: 'shift' doubles the running
+    product, 'add' adds x to it. Eight trailing shifts become one 'byte' move.
+    """
+    steps = []
+    for bit in bin(constant)[3:]:
+        steps.append('shift')
+        if bit == '1':
+            steps.append('add')
+    trailing = (constant & -constant).bit_length() - 1
+    if trailing >= 8:
+        steps = steps[:len(steps) - trailing] + ['byte'] + ['shift_high'] * (trailing - 8)
+    return steps
+
+
+def _reciprocal_for_divisor(divisor):
+    """
+    Returns (pre_shift, multiplier, shift, add_back) such that for every 16-bit x
+        x // divisor == ((x >> pre_shift) * multiplier) >> shift
+    with a 16-bit multiplier, or None when no such multiplier exists.
+    Uses the round-up reciprocal: multiplier = ceil(2**shift / odd divisor)
+    is exact while (multiplier * odd - 2**shift) * max_x < 2**shift.
+
+    Some divisors (7, 21, ...) need a 17-bit multiplier. Then add_back is True,
+    multiplier holds its low 16 bits and, with t = (x * multiplier) >> 16,
+        x // divisor == (((x - t) >> 1) + t) >> (shift - 17)
+    """
+    pre_shift = (divisor & -divisor).bit_length() - 1
+    odd_divisor = divisor >> pre_shift
+    max_x = 0xFFFF >> pre_shift
+    for shift in range(16, 32):
+        multiplier = -(-(1 << shift) // odd_divisor)
+        if multiplier > 0xFFFF:
+            break
+        if (multiplier * odd_divisor - (1 << shift)) * max_x < (1 << shift):
+            return pre_shift, multiplier, shift, False
+    for shift in range(17, 33):
+        multiplier = -(-(1 << shift) // divisor)
+        if multiplier > 0x1FFFF:
+            break
+        if multiplier > 0xFFFF and (multiplier * divisor - (1 << shift)) * 0xFFFF < (1 << shift):
+            return 0, multiplier - 0x10000, shift, True
+    return None
+
+
+def is_reducible_constant_op(op, constant):
+    """True if `operand op constant` can be emitted without the 16-bit routines."""
+    if not 0 <= constant <= 0xFFFF:
+        return False
+    if isinstance(op, ast.Mult):
+        is_power_of_two = constant & (constant - 1) == 0
+        return constant <= 1 or is_power_of_two or len(_multiply_steps(constant)) <= MAX_SHIFT_ADD_STEPS
+    if isinstance(op, ast.FloorDiv):
+        if constant == 0:
+            return False  # Keep the runtime ZeroDivisionError of divide16x16_16
+        return constant & (constant - 1) == 0 or _reciprocal_for_divisor(constant) is not None
+    return False
+
+
+SIGNED_WORD = (-32768, 32767)
+
+
+def _overflow_check_needed(value_range, safe_range=SIGNED_WORD):
+    """
+    Decides whether an arithmetic operation keeps its overflow test, and
+    counts the decision for the report: no test when checks are disabled or
+    when the range analysis proved the result stays inside `safe_range`.
+    """
+    stats = _globals.overflow_check_stats
+    if not _globals.compiler_options.get('overflow_checks', True):
+        stats['disabled'] += 1
+        return False
+    if value_range is not None and safe_range[0] <= value_range[0] and value_range[1] <= safe_range[1]:
+        stats['removed'] += 1
+        return False
+    stats['inline'] += 1
+    _globals.used_routines.add('overflow_trap')
+    return True
+
+
+def _overflow_check(value_range):
+    """Returns the signed overflow test to put after the high byte of a 16-bit add/sub."""
+    if not _overflow_check_needed(value_range):
+        return []
+    # Branch over the jump when V is clear: 3 cycles instead of a JSR/RTS pair
+    return ["    BVC *+5", "    JMP overflow_trap"]
+
+
+def _copy_word(source, target):
+    return [f"    LDA {source}", f"    STA {target}", f"    LDA {source}+1", f"    STA {target}+1"]
+
+
+def _handle_multiply_by_constant(source, constant, target, value_range=None):
+    """
+    Multiplies by a constant with ASL/ROL shifts and ADC additions. The
+    steps build the product of the signed x in place, so every partial
+    product k * x has the sign of x and is no larger than the result: the
+    result fits in a signed word exactly when no step overflows. A shift
+    overflows when the bit shifted out of bit 15 (the carry) differs from
+    the new bit 15, an addition when it sets V.
+    """
+    if constant == 0:
+        _globals.generated_code.extend(["    LDA #0", f"    STA {target}", f"    STA {target}+1"])
+        return
+    steps = _multiply_steps(constant)
+    checked = bool(steps) and _overflow_check_needed(value_range)
+
+    addend = source
+    temp_addend = None
+    if source == target and 'add' in steps:
+        # The running product lives in target, so keep a copy of x to add
+        temp_addend = get_temp_var()
+        addend = temp_addend
+        _globals.generated_code.extend(_copy_word(source, addend))
+    if source != target:
+        _globals.generated_code.extend(_copy_word(source, target))
+
+    label_id = str(_globals.label_counter)
+    _globals.label_counter += 1
+    overflow_label = create_label("mulc_ovf", label_id)
+    done_label = create_label("mulc_done", label_id)
+
+    def shift_check(number):
+        # After ASL/ROL of the high byte: C is the old bit 15, N the new one
+        if not checked:
+            return []
+        carry_label = create_label(f"mulc_c{number}", label_id)
+        ok_label = create_label(f"mulc_ok{number}", label_id)
+        return [f"    BCC {carry_label}", f"    BPL {overflow_label}", f"    BCS {ok_label}",
+                f"{carry_label}:", f"    BMI {overflow_label}", f"{ok_label}:"]
+
+    for number, step in enumerate(steps):
+        if step == 'shift':
+            _globals.generated_code.extend([f"    ASL {target}", f"    ROL {target}+1"] + shift_check(number))
+        elif step == 'add':
+            _globals.generated_code.extend([
+                f"    LDA {target}", "    CLC", f"    ADC {addend}", f"    STA {target}",
+                f"    LDA {target}+1", f"    ADC {addend}+1", f"    STA {target}+1"
+            ] + ([f"    BVS {overflow_label}"] if checked else []))
+        elif step == 'byte':
+            # x << 8: the high byte must be the sign extension of the low byte,
+            # $00 below $80 and $FF from $80 up, so that it adds with the carry to 0
+            if checked:
+                _globals.generated_code.extend([
+                    f"    LDA {target}", "    CMP #$80", f"    LDA {target}+1", "    ADC #0", f"    BNE {overflow_label}"
+                ])
+            _globals.generated_code.extend([f"    LDA {target}", f"    STA {target}+1", "    LDA #0", f"    STA {target}"])
+        else:  # 'shift_high': the low byte is already zero
+            _globals.generated_code.extend([f"    ASL {target}+1"] + shift_check(number))
+
+    if checked:
+        _globals.generated_code.extend([
+            f"    JMP {done_label}",
+            f"{overflow_label}:",
+            "    JMP overflow_trap",
+            f"{done_label}:"
+        ])
+    if temp_addend:
+        release_temp_var(temp_addend)
+
+
+def _handle_divide_by_constant(source, constant, target, value_range=None):
+    """
+    Divides by a constant with shifts or a reciprocal multiplication. Both
+    are unsigned; unless the range analysis proved the result non-negative,
+    a power of two shifts arithmetically and a reciprocal divides ~x, as
+    x // d == ~(~x // d) for d > 0 (floor division, like Python's).
+    """
+    signed = value_range is None or value_range[0] < 0
+    if constant & (constant - 1) == 0:
+        shift = constant.bit_length() - 1
+        if source != target:
+            _globals.generated_code.extend(_copy_word(source, target))
+        if not signed and shift >= 8:
+            _globals.generated_code.extend([f"    LDA {target}+1", f"    STA {target}", "    LDA #0", f"    STA {target}+1"])
+            _globals.generated_code.extend([f"    LSR {target}"] * (shift - 8))
+        elif not signed:
+            for _ in range(shift):
+                _globals.generated_code.extend([f"    LSR {target}+1", f"    ROR {target}"])
+        else:
+            for _ in range(shift):
+                # Bit 7 of the high byte goes to the carry and back in: x >> 1 keeps the sign
+                _globals.generated_code.extend([f"    LDA {target}+1", "    CMP #$80", f"    ROR {target}+1", f"    ROR {target}"])
+        return
+
+    pre_shift, multiplier, shift, add_back = _reciprocal_for_divisor(constant)
+    mul_vars = ['m32_arg1_l', 'm32_arg1_h', 'm32_arg2_l', 'm32_arg2_h',
+                'm32_res0', 'm32_res1', 'm32_res2', 'm32_res3']
+    _declare_multiply_workspace(mul_vars)
+
+    _globals.generated_code.extend([
+        f"    LDA {source}", "    STA m32_arg1_l",
+        f"    LDA {source}+1", "    STA m32_arg1_h",
+    ])
+    if signed:
+        positive_label = create_label("divc_pos", str(_globals.label_counter))
+        _globals.label_counter += 1
+        _globals.generated_code.extend([
+            "    PHP                 ; N: the dividend is negative",
+            f"    BPL {positive_label}",
+            "    EOR #$FF", "    STA m32_arg1_h",
+            "    LDA m32_arg1_l", "    EOR #$FF", "    STA m32_arg1_l",
+            f"{positive_label}:",
+        ])
+    for _ in range(pre_shift):
+        _globals.generated_code.extend(["    LSR m32_arg1_h", "    ROR m32_arg1_l"])
+    _globals.generated_code.extend([
+        f"    LDA #<{multiplier}", "    STA m32_arg2_l",
+        f"    LDA #>{multiplier}", "    STA m32_arg2_h",
+        "    JSR multiply16x16_32",
+    ])
+    if add_back:
+        # target = ((x - t) >> 1) + t, with t the high word of the product (no pre-shift here)
+        _globals.generated_code.extend([
+            "    LDA m32_arg1_l", "    SEC", "    SBC m32_res2", f"    STA {target}",
+            "    LDA m32_arg1_h", "    SBC m32_res3", f"    STA {target}+1",
+            f"    LSR {target}+1", f"    ROR {target}",
+            f"    LDA {target}", "    CLC", "    ADC m32_res2", f"    STA {target}",
+            f"    LDA {target}+1", "    ADC m32_res3", f"    STA {target}+1",
+        ])
+        for _ in range(shift - 17):
+            _globals.generated_code.extend([f"    LSR {target}+1", f"    ROR {target}"])
+    # Otherwise the quotient is the product shifted right by `shift` (>= 16) bits
+    elif shift >= 24:
+        _globals.generated_code.extend(["    LDA m32_res3", f"    STA {target}", "    LDA #0", f"    STA {target}+1"])
+        _globals.generated_code.extend([f"    LSR {target}"] * (shift - 24))
+    else:
+        _globals.generated_code.extend(["    LDA m32_res2", f"    STA {target}", "    LDA m32_res3", f"    STA {target}+1"])
+        for _ in range(shift - 16):
+            _globals.generated_code.extend([f"    LSR {target}+1", f"    ROR {target}"])
+    if signed:
+        done_label = create_label("divc_done", str(_globals.label_counter))
+        _globals.label_counter += 1
+        _globals.generated_code.extend([
+            "    PLP",
+            f"    BPL {done_label}",
+            f"    LDA {target}", "    EOR #$FF", f"    STA {target}",
+            f"    LDA {target}+1", "    EOR #$FF", f"    STA {target}+1",
+            f"{done_label}:",
+        ])
+    _globals.used_routines.add('multiply16x16_32')
+
 
+def constant_binop_handler(operand_name, op, constant, target_variable_name, value_range=None):
+    """
+    Handles `operand * constant`, `constant * operand` and `operand // constant`
+    for integer operands without calling the 16-bit multiply/divide routines.
+    Returns False, emitting nothing, when the constant is not worth reducing.
+    """
+    if _globals.variables.get(operand_name, {}).get('is_float') or _globals.variables.get(operand_name, {}).get('type') == 'float':
+        return False
+    if not is_reducible_constant_op(op, constant):
+        return False
 
-def _handle_integer_operation(left_op, right_op, target, operator):
+    handle_variable(target_variable_name)
+    if isinstance(op, ast.Mult):
+        _handle_multiply_by_constant(operand_name, constant, target_variable_name, value_range)
+    else:
+        _handle_divide_by_constant(operand_name, constant, target_variable_name, value_range)
+    return True
+
+
+def _handle_integer_operation(left_op, right_op, target, operator, value_range=None):
     """Handle integer arithmetic operations."""
     ops = {
-        "add": ([
+        "add": lambda: ([
             f"    LDA {left_op}", "    CLC", f"    ADC {right_op}", f"    STA {target}",
-            f"    LDA {left_op}+1", f"    ADC {right_op}+1", "    JSR check_overflow", f"    STA {target}+1"
-        ], 'check_overflow'),
-        "sub": ([
+            f"    LDA {left_op}+1", f"    ADC {right_op}+1", f"    STA {target}+1"
+        ] + _overflow_check(value_range), None),
+        "sub": lambda: ([
             f"    LDA {left_op}", "    SEC", f"    SBC {right_op}", f"    STA {target}",
-            f"    LDA {left_op}+1", f"    SBC {right_op}+1", "    JSR check_overflow", f"    STA {target}+1"
-        ], 'check_overflow'),
-        "xor": ([
+            f"    LDA {left_op}+1", f"    SBC {right_op}+1", f"    STA {target}+1"
+        ] + _overflow_check(value_range), None),
+        "xor": lambda: ([
             f"    LDA {left_op}", f"    EOR {right_op}", f"    STA {target}",
             f"    LDA {left_op}+1", f"    EOR {right_op}+1", f"    STA {target}+1"
+        ], None),
+        "and": lambda: ([
+            f"    LDA {left_op}", f"    AND {right_op}", f"    STA {target}",
+            f"    LDA {left_op}+1", f"    AND {right_op}+1", f"    STA {target}+1"
+        ], None),
+        "or": lambda: ([
+            f"    LDA {left_op}", f"    ORA {right_op}", f"    STA {target}",
+            f"    LDA {left_op}+1", f"    ORA {right_op}+1", f"    STA {target}+1"
         ], None)
     }
     
@@ -79,10 +365,10 @@ def _handle_integer_operation(left_op, right_op, target, operator):
     elif operator == "div":
         _handle_binop_divide_16bit(left_op, right_op, target)
     elif operator in ops:
-        code, routine = ops[operator]
-        gen_code.extend(code)
+        code, routine = ops[operator]()
+        _globals.generated_code.extend(code)
         if routine:
-            used_routines.add(routine)
+            _globals.used_routines.add(routine)
 
 
 def _handle_float_operation(left_op, right_op, target, operator):
@@ -99,22 +385,50 @@ def _handle_float_operation(left_op, right_op, target, operator):
         return
     
     routine, load_func1, load_func2 = fp_ops[operator]
-    gen_code.extend(load_func1(left_op))
-    gen_code.extend(load_func2(right_op))
-    gen_code.append(f"    JSR {routine}")
-    gen_code.extend(_generate_store_float_from_fp1(target))
-    used_routines.add(routine)
+    _globals.generated_code.extend(load_func1(left_op))
+    _globals.generated_code.extend(load_func2(right_op))
+    _globals.generated_code.append(f"    JSR {routine}")
+    _globals.generated_code.extend(_generate_store_float_from_fp1(target))
+    _globals.used_routines.add(routine)
+
 
+BYTE_OPCODES = {
+    ast.Add: ("CLC", "ADC"), ast.Sub: ("SEC", "SBC"),
+    ast.BitAnd: (None, "AND"), ast.BitOr: (None, "ORA"), ast.BitXor: (None, "EOR")
+}
 
-def binop_handler(left_operand_name, op, right_operand_name, target_variable_name):
-    """Handles binary operations (add, sub, mult, div)."""
-    left_is_float = variables.get(left_operand_name, {}).get('is_float', False)
-    right_is_float = variables.get(right_operand_name, {}).get('is_float', False)
+
+def byte_binop_handler(left_operand, op, right_operand, target_variable_name):
+    """
+    8-bit version of binop_handler, for results the range analysis
+    (lib/value_ranges.py) proved to fit in a byte, or whose high byte is never
+    used. Operands are variable names or immediates; the target's high byte
+    is cleared so it still reads as a 16-bit int.
+    """
+    handle_variable(target_variable_name)
+    _globals.variables[target_variable_name]['is_8bit_semantic'] = True
+    carry, opcode = BYTE_OPCODES[type(op)]
+    _globals.generated_code.append(f"    LDA {left_operand}")
+    if carry:
+        _globals.generated_code.append(f"    {carry}")
+    _globals.generated_code.extend([
+        f"    {opcode} {right_operand}", f"    STA {target_variable_name}",
+        "    LDA #0", f"    STA {target_variable_name}+1"
+    ])
+
+
+def binop_handler(left_operand_name, op, right_operand_name, target_variable_name, value_range=None):
+    """
+    Handles binary operations (add, sub, mult, div). `value_range` is the
+    result interval from lib/value_ranges.py, used to drop overflow checks.
+    """
+    left_is_float = _globals.variables.get(left_operand_name, {}).get('is_float', False)
+    right_is_float = _globals.variables.get(right_operand_name, {}).get('is_float', False)
     is_fp_op = left_is_float or right_is_float
 
     op_map = {
         ast.Add: "add", ast.Sub: "sub", ast.Mult: "mult",
-        ast.FloorDiv: "div", ast.BitXor: "xor"
+        ast.FloorDiv: "div", ast.BitXor: "xor", ast.BitAnd: "and", ast.BitOr: "or"
     }
     
     operator = op_map.get(type(op))
@@ -124,7 +438,7 @@ def binop_handler(left_operand_name, op, right_operand_name, target_variable_nam
 
     handle_variable(target_variable_name)
     if is_fp_op:
-        variables[target_variable_name].update({
+        _globals.variables[target_variable_name].update({
             'is_float': True, 'size': 4, 'is_8bit_semantic': False
         })
         
@@ -134,7 +448,7 @@ def binop_handler(left_operand_name, op, right_operand_name, target_variable_nam
         
         _handle_float_operation(left_operand_name, right_operand_name, target_variable_name, operator)
     else:
-        _handle_integer_operation(left_operand_name, right_operand_name, target_variable_name, operator)
+        _handle_integer_operation(left_operand_name, right_operand_name, target_variable_name, operator, value_range)
 
 
 def _generate_comparison_labels():
@@ -147,8 +461,8 @@ def _generate_comparison_labels():
 
 def _handle_float_comparison(left_op, right_op, op, true_label):
     """Handle floating-point comparisons."""
-    gen_code.extend(_generate_load_float_to_fp1(left_op))
-    gen_code.extend(_generate_load_float_to_fp2(right_op))
+    _globals.generated_code.extend(_generate_load_float_to_fp1(left_op))
+    _globals.generated_code.extend(_generate_load_float_to_fp2(right_op))
     
     comp_ops = {
         ast.Eq: ("BEQ", "FP_EQ"), ast.NotEq: ("BNE", "FP_NE"),
@@ -157,21 +471,21 @@ def _handle_float_comparison(left_op, right_op, op, true_label):
     } # Added closing parenthesis
     
     if isinstance(op, (ast.Gt, ast.GtE)):
-        gen_code.extend(_generate_load_float_to_fp1(right_op))
-        gen_code.extend(_generate_load_float_to_fp2(left_op))
+        _globals.generated_code.extend(_generate_load_float_to_fp1(right_op))
+        _globals.generated_code.extend(_generate_load_float_to_fp2(left_op))
     
-    gen_code.append("    JSR FP_FCMP")
-    used_routines.add('FP_FCMP')
-    used_routines.add('FP_FSUB') # FP_COMPARE calls FP_FSUB
+    _globals.generated_code.append("    JSR FP_FCMP")
+    _globals.used_routines.add('FP_FCMP')
+    _globals.used_routines.add('FP_FSUB') # FP_COMPARE calls FP_FSUB
     
     branch_op, flag = comp_ops.get(type(op), ("BEQ", "FP_EQ"))
-    gen_code.extend([f"    {branch_op} {flag}", f"    JMP {true_label}"])
+    _globals.generated_code.extend([f"    {branch_op} {flag}", f"    JMP {true_label}"])
 
 
 def _handle_integer_comparison(left_op, right_op, op, true_label, end_label):
     """Handle 16-bit signed integer comparisons using N and V flags."""
     # Perform 16-bit subtraction: left - right
-    gen_code.extend([
+    _globals.generated_code.extend([
         f"    SEC",  # Set carry for subtraction
         f"    LDA {left_op}",
         f"    SBC {right_op}",
@@ -182,31 +496,28 @@ def _handle_integer_comparison(left_op, right_op, op, true_label, end_label):
     
     # Handle different comparison operators
     if isinstance(op, ast.Eq):  # ==
-        gen_code.extend([
+        _globals.generated_code.extend([
             f"    BNE {end_label}_false",  # High byte not equal -> false
             f"    LDA temp_0",
-            f"    BNE {end_label}_false",  # Low byte not equal -> false
-            f"    JMP {true_label}",  # Both equal -> true
+            f"    BEQ {true_label}",  # Both equal -> true
             f"{end_label}_false:"
         ])
     elif isinstance(op, ast.NotEq):  # !=
-        gen_code.extend([
+        _globals.generated_code.extend([
             f"    BNE {true_label}",  # High byte not equal -> true
             f"    LDA temp_0",
-            f"    BEQ {end_label}_false",  # Both bytes equal -> false
-            f"    JMP {true_label}",  # Low byte not equal -> true
-            f"{end_label}_false:"
+            f"    BNE {true_label}",  # Low byte not equal -> true
         ])
     elif isinstance(op, ast.Lt):  # <
         # For signed: (N != V) indicates left < right
-        gen_code.extend([
+        _globals.generated_code.extend([
             f"    BVC no_overflow_{end_label}",
             f"    EOR #$80",  # Invert sign bit if overflow occurred
             f"no_overflow_{end_label}:",
             f"    BMI {true_label}"  # If negative after adjustment, left < right
         ])
     elif isinstance(op, ast.LtE):  # <=
-        gen_code.extend([
+        _globals.generated_code.extend([
             f"    BVC no_overflow_{end_label}",
             f"    EOR #$80",  # Invert sign bit if overflow occurred
             f"no_overflow_{end_label}:",
@@ -217,7 +528,7 @@ def _handle_integer_comparison(left_op, right_op, op, true_label, end_label):
         ])
     elif isinstance(op, ast.Gt):  # >
         # For signed: (N == V) and (Z == 0) indicates left > right
-        gen_code.extend([
+        _globals.generated_code.extend([
             f"    BEQ {end_label}_check_zero",  # Check if high byte equal
             f"    BVC no_overflow_{end_label}",
             f"    EOR #$80",  # Invert sign bit if overflow occurred
@@ -226,13 +537,12 @@ def _handle_integer_comparison(left_op, right_op, op, true_label, end_label):
             f"    JMP {end_label}_done",
             f"{end_label}_check_zero:",
             f"    LDA temp_0",
-            f"    BEQ {end_label}_done",  # Both zero -> not greater
-            f"    JMP {true_label}",  # Low byte not zero -> greater
+            f"    BNE {true_label}",  # Low byte not zero -> greater
             f"{end_label}_done:"
         ])
     elif isinstance(op, ast.GtE):  # >=
         # For signed: (N == V) indicates left >= right
-        gen_code.extend([
+        _globals.generated_code.extend([
             f"    BVC no_overflow_{end_label}",
             f"    EOR #$80",  # Invert sign bit if overflow occurred
             f"no_overflow_{end_label}:",
@@ -249,11 +559,16 @@ def handle_comparison(target_var_name, node, current_func_name):
         return
 
     op = node.ops[0]
+    if value_ranges.fits_byte(node.left) and value_ranges.fits_byte(node.comparators[0]) \
+            and _globals.compiler_options.get('byte_arithmetic', True):
+        _handle_byte_comparison(target_var_name, node, current_func_name)
+        return
+
     left_op_name = get_value(node.left, current_func_name)
     right_op_name = get_value(node.comparators[0], current_func_name)
 
-    left_type = variables.get(left_op_name, {}).get('type', 'int')
-    right_type = variables.get(right_op_name, {}).get('type', 'int')
+    left_type = _globals.variables.get(left_op_name, {}).get('type', 'int')
+    right_type = _globals.variables.get(right_op_name, {}).get('type', 'int')
     is_float_comparison = left_type == 'float' or right_type == 'float'
 
     coerced_temps = []
@@ -280,7 +595,7 @@ def handle_comparison(target_var_name, node, current_func_name):
         _handle_integer_comparison(left_op_name, right_op_name, op, true_label, end_label)
 
     # Store boolean result (1 for True, 0 for False) in target variable
-    gen_code.extend([
+    _globals.generated_code.extend([
         f"    LDA #0",  # Default to False
         f"    JMP {end_label}",  # Jump to end
         f"{true_label}:",
@@ -296,51 +611,94 @@ def handle_comparison(target_var_name, node, current_func_name):
         release_temp_var(temp)
 
 
+def _handle_byte_comparison(target_var_name, node, current_func_name):
+    """
+    Compares two values the range analysis proved to be in 0..255 with a
+    single unsigned CMP of their low bytes.
+    """
+    from .func_expressions import resolve_byte_operand
+    op = node.ops[0]
+    left, right = node.left, node.comparators[0]
+    if isinstance(op, (ast.Gt, ast.LtE)):
+        left, right = right, left  # a > b is b < a, a <= b is b >= a
+    left_op, left_temp = resolve_byte_operand(left, current_func_name)
+    right_op, right_temp = resolve_byte_operand(right, current_func_name)
+
+    true_label, end_label = _generate_comparison_labels()
+    branch = {ast.Eq: "BEQ", ast.NotEq: "BNE", ast.Lt: "BCC", ast.Gt: "BCC", ast.LtE: "BCS", ast.GtE: "BCS"}[type(op)]
+    _globals.generated_code.extend([
+        f"    LDA {left_op}",
+        f"    CMP {right_op}",
+        f"    {branch} {true_label}",
+        f"    LDA #0",
+        f"    JMP {end_label}",
+        f"{true_label}:",
+        f"    LDA #1",
+        f"{end_label}:",
+        f"    STA {target_var_name}",
+        f"    LDA #0",
+        f"    STA {target_var_name}+1"
+    ])
+    for temp in (left_temp, right_temp):
+        if temp:
+            release_temp_var(temp)
+
+
+def _word_operand_bytes(operand):
+    """(low, high) operands of a 16-bit variable name or a '#<int>' immediate."""
+    if operand.startswith('#'):
+        value = int(operand[1:])
+        return f"#${value & 0xFF:02X}", f"#${(value >> 8) & 0xFF:02X}"
+    return operand, f"{operand}+1"
+
+
 def _handle_comparison_for_branching(left_op, right_op, op, true_branch_label, current_func_name, negate=False):
     """
-    Handles a comparison for branching purposes. It generates the necessary
-    assembly code to compare two values (int or float) and branch to a
-    specified label if the comparison is true.
+    Handles a comparison for branching purposes: compares two 16-bit signed
+    integers and branches to true_branch_label when the comparison holds
+    (when it does not, with negate). The branches are direct; branch
+    relaxation lengthens the ones whose target is out of reach.
 
     Args:
-        left_op (str): Variable name for the left operand.
-        right_op (str): Variable name for the right operand.
+        left_op (str): Variable name or '#<int>' immediate for the left operand.
+        right_op (str): Variable name or '#<int>' immediate for the right operand.
         op (ast.cmpop): Comparison operator (e.g., ast.Eq, ast.Lt).
         true_branch_label (str): Label to jump to if the comparison is true.
         current_func_name (str, optional): Name of the current function, if any.
-        negate (bool, optional): If True, negates the comparison result (for
-                                 not ... conditions).
+        negate (bool, optional): If True, branches when the comparison is false
+                                 (for `not ...` conditions and loop exits).
     """
-    left_type = variables.get(left_op, {}).get('type', 'int')
-    right_type = variables.get(right_op, {}).get('type', 'int')
-    is_float_comparison = left_type == 'float' or right_type == 'float'
-
-    # --- Integer Comparison ---
-    if not is_float_comparison:
-        branch_ops = {
-            ast.Eq: "BEQ", ast.NotEq: "BNE",
-            ast.Lt: "BLT", ast.LtE: "BLE",
-            ast.Gt: "BGT", ast.GtE: "BGE"
-        }
-        branch_op = branch_ops.get(type(op))
-        if not branch_op:
-            report_error(f"Unsupported integer comparison operator: {type(op).__name__}", node=op)
-            return
-        if negate:
-            # Invert the condition by using the opposite branch instruction
-            branch_op = branch_op[0] + 'rev' # e.g. BEQ becomes BREV
-        
-        # Compare integers by subtracting right from left.
-        # The Carry (C), Zero (Z), Negative (N), and Overflow (V) flags will be used.
-        gen_code.extend([
-            f"    LDA {left_op}",
-            f"    SEC",      # Initialize carry for subtraction
-            f"    SBC {right_op}",
-            f"    STA temp_0",   # Store the LSB of the result (not used, but needed for carry in next operation)
-            f"    LDA {left_op}+1",
-            f"    SBC {right_op}+1"
+    code = _globals.generated_code
+    if isinstance(op, (ast.Gt, ast.LtE)):
+        left_op, right_op = right_op, left_op  # a > b is b < a, a <= b is not (b < a)
+        op = ast.Lt() if isinstance(op, ast.Gt) else ast.GtE()
+    (left_lo, left_hi), (right_lo, right_hi) = _word_operand_bytes(left_op), _word_operand_bytes(right_op)
+
+    if isinstance(op, (ast.Lt, ast.GtE)):
+        branch_if_less = isinstance(op, ast.Lt) != negate
+        code.extend([
+            f"    LDA {left_lo}",
+            f"    CMP {right_lo}",
+            f"    LDA {left_hi}",
+            f"    SBC {right_hi}",
+            "    BVC *+4",
+            "    EOR #$80",  # N xor V is the signed 'less than'
+            f"    {'BMI' if branch_if_less else 'BPL'} {true_branch_label}",
         ])
-        gen_code.append(f"    {branch_op} {true_branch_label}")
+    elif isinstance(op, (ast.Eq, ast.NotEq)):
+        if isinstance(op, ast.Eq) != negate:
+            # Branch when both bytes are equal
+            skip_label = create_label("cmp_skip", str(_globals.label_counter))
+            _globals.label_counter += 1
+            code.extend([f"    LDA {left_lo}", f"    CMP {right_lo}", f"    BNE {skip_label}",
+                         f"    LDA {left_hi}", f"    CMP {right_hi}", f"    BEQ {true_branch_label}",
+                         f"{skip_label}:"])
+        else:
+            # Branch when either byte differs
+            code.extend([f"    LDA {left_lo}", f"    CMP {right_lo}", f"    BNE {true_branch_label}",
+                         f"    LDA {left_hi}", f"    CMP {right_hi}", f"    BNE {true_branch_label}"])
+    else:
+        report_error(f"Unsupported integer comparison operator: {type(op).__name__}", node=op)
 
 
 def _handle_integer_abs(source, target): # Note: This function isn't directly used in the diff but is provided for context.
@@ -349,7 +707,7 @@ def _handle_integer_abs(source, target): # Note: This function isn't directly us
     done_label = create_label("abs_done", str(_globals.label_counter))
     _globals.label_counter += 1
     
-    gen_code.extend([
+    _globals.generated_code.extend([
         f"    LDA {source}+1", f"    BPL {pos_label}",
         f"    LDA {source}", f"    EOR #$FF", f"    STA {target}",
         f"    LDA {source}+1", f"    EOR #$FF", f"    STA {target}+1",
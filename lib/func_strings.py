@@ -3,7 +3,9 @@
 
 import ast # pyright: ignore[reportMissingModuleSource]
 import V1.globals as globals
-from lib.func_core import handle_variable, _generate_load_2_bytes_to_zp
+from lib.func_core import (
+    handle_variable, _generate_load_2_bytes_to_zp, load_ax_from_var, resolve_variable_name
+)
 import lib.routines
 
 def str_slice(var_name, node):
@@ -73,11 +75,14 @@ def str_slice(var_name, node):
         return None
 
 
-def join_str_value(var_name, node):
+FSTRING_BUFFER_SIZE = 81  # Two screen lines and the terminator; there is no bounds check
+
+
+def join_str_value(var_name, node, current_func_name=None):
     """Handles f-strings."""
     # Allocate space for the new f-string result
     string_label = f"{var_name}_str"
-    string_address = handle_variable(string_label)
+    string_address = handle_variable(string_label, size=FSTRING_BUFFER_SIZE)
 
     # 1. Initialize the destination ZP pointer (FSTRING_DEST_ZP_PTR) to string_address (start of var_name_str)
     globals.generated_code.append(f"    LDA #<{string_label} ; LSB of f-string buffer '{string_label}'")
@@ -94,13 +99,16 @@ def join_str_value(var_name, node):
             globals.data_definitions.append(f"{literal_part_label} {globals.assembly_data_types['asciiz']} \"{escaped_value}\"")
             globals.data_definitions.append(f"          {globals.assembly_data_types['byte']} 0 ; Null terminator for {literal_part_label}")
 
-            globals.generated_code.extend(_generate_load_2_bytes_to_zp(literal_part_label, globals.FSTRING_SRC_ZP_PTR))
+            globals.generated_code.extend([
+                f"    LDA #<{literal_part_label}", f"    STA ${globals.FSTRING_SRC_ZP_PTR:02X}",
+                f"    LDA #>{literal_part_label}", f"    STA ${globals.FSTRING_SRC_ZP_PTR+1:02X}",
+            ])
 
         elif isinstance(part, ast.Name) or \
              (isinstance(part, ast.FormattedValue) and isinstance(part.value, ast.Name)):
             # Variable part of the f-string
             var_node = part if isinstance(part, ast.Name) else part.value
-            var_id = var_node.id
+            var_id = resolve_variable_name(var_node.id, current_func_name)
 
             if not (var_id in globals.variables):
                 globals.report_compiler_error(f"String variable '{var_id}' (which should hold a pointer) not found for f-string.", node=var_node)
@@ -108,6 +116,12 @@ def join_str_value(var_name, node):
                 globals.used_routines.add('generic_error_msg')
                 continue # Skip this part if the variable is invalid
 
+            if globals.variables[var_id].get('type') in ('int', 'bool'):
+                # Integers are formatted in decimal straight into the buffer
+                load_ax_from_var(var_id)
+                globals.used_routines.add('fstr_cat_int')
+                globals.generated_code.append("    JSR fstr_cat_int")
+                continue
             globals.generated_code.extend(_generate_load_2_bytes_to_zp(var_id, globals.FSTRING_SRC_ZP_PTR))
         else:
             globals.report_compiler_error(f"Unsupported part type {type(part)} in f-string.", node=part)
@@ -124,7 +138,9 @@ def join_str_value(var_name, node):
     globals.generated_code.append(f"    LDY #0 ; Index for ZP indirect")
     globals.generated_code.append(f"    STA (${globals.FSTRING_DEST_ZP_PTR:02X}),Y ; Write terminator using ZP destination pointer")
 
-    # Save the address of the f-string buffer (string_address) into the Python variable (var_name)
+    # Save the address of the f-string buffer (string_address) into the Python variable (var_name),
+    # which holds a string pointer like the variables assigned a string literal
+    globals.variables.setdefault(var_name, {})['type'] = 'pointer'
     # Use the label directly for clarity and robustness
     globals.generated_code.append(f"    LDA #<{string_label}")  # Low byte of the buffer address
     globals.generated_code.append(f"    STA {var_name}")
@@ -2,6 +2,16 @@
 
 import ast
 import V1.globals as globals
+from lib import func_core
+from lib import func_expressions
+from lib import func_operations
+from lib import value_ranges
+from lib import compile_profile
+from lib.func_core import resolve_variable_name
+from lib.peephole import parse_line
+from lib.branch_relaxation import INVERSE_BRANCHES
+
+report_error = globals.report_compiler_error
 
 class FuncStructures:
     def __init__(self, ast_processor, func_core, func_operations, func_expressions, func_strings, func_dict, func_c64, func_builtins, c64_routine_library, globals):
@@ -17,72 +27,536 @@ class FuncStructures:
         self.globals = globals  # Make sure 'globals' is accessible as an attribute
 
     def process_if_node(self, node: ast.If, error_handler_func, current_func_info=None):
-        """Processes an if statement."""
-        # Generate unique labels for the if-else structure
-        else_label = self.func_core.create_label("if_else", str(self.globals.label_counter))
-        end_if_label = self.func_core.create_label("if_end", str(self.globals.label_counter))
-        self.globals.label_counter += 1
+        process_if_node(node, error_handler_func, current_func_info)
 
-        # Process the condition (it might involve a comparison or a boolean expression)
-        self._process_condition(node.test, else_label, current_func_info)
+    def process_for_node(self, node: ast.For, error_handler_func, current_func_info=None):
+        process_for_node(node, error_handler_func, current_func_info)
 
-        # Process the 'if' block's body
-        for statement in node.body:
-            self.ast_processor.process_node(statement, error_handler_func, current_func_info)
+    def process_while_node(self, node: ast.While, error_handler_func, current_func_info=None):
+        process_while_node(node, error_handler_func, current_func_info)
 
-        # Jump to the end if there's an 'else' block
-        if node.orelse:
-            self.globals.generated_code.append(f"    JMP {end_if_label}")
 
-        # Label for the 'else' block
-        self.globals.generated_code.append(f"{else_label}:")
+# --- Loops and if statements ---
+# Module-level handlers, called by ast_processor for statements inside function
+# and block bodies and by the FuncStructures methods for top-level ones.
 
-        # Process the 'else' block's body, if present
-        if node.orelse:
-            for statement in node.orelse:
-                self.ast_processor.process_node(statement, error_handler_func, current_func_info)
-
-        # Label for the end of the 'if' statement
-        self.globals.generated_code.append(f"{end_if_label}:")
-
-    def _process_condition(self, condition_node, else_label, current_func_info):
-        """Processes the condition of an if statement."""
-        if isinstance(condition_node, ast.Compare):
-            # Comparisons handled by func_operations (assuming it now includes branching logic)
-            # func_operations.handle_comparison_for_branching handles the details
-            # and generates appropriate code based on the operator.
-            # The negate flag is False for a standard 'if' condition.
-            self.func_operations.handle_comparison_for_branching(condition_node, else_label, current_func_info, negate=False)
-
-        elif isinstance(condition_node, ast.UnaryOp) and isinstance(condition_node.op, ast.Not):
-            # 'not' operator: negates the result of the inner condition
-            if isinstance(condition_node.operand, ast.Compare):
-                # Negated comparisons (like `if not x == 5:`)
-                self.func_operations.handle_comparison_for_branching(condition_node.operand, else_label, current_func_info, negate=True)
+COUNTER_OPCODES = {
+    'Y': {'load': 'LDY', 'store': 'STY', 'inc': 'INY', 'dec': 'DEY', 'cmp': 'CPY', 'from_a': 'TAY', 'to_a': 'TYA'},
+    'X': {'load': 'LDX', 'store': 'STX', 'inc': 'INX', 'dec': 'DEX', 'cmp': 'CPX', 'from_a': 'TAX', 'to_a': 'TXA'},
+}
+# Operations whose code calls a routine, which may use X and Y
+_ROUTINE_BINOPS = (ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+
+
+def _func_name(current_func_info):
+    return current_func_info.get('name') if current_func_info else None
+
+
+def _int_constant(node):
+    if isinstance(node, ast.Constant) and type(node.value) is int:
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _int_constant(node.operand)
+        return -value if value is not None else None
+    return None
+
+
+def _fits_byte(node):
+    value = _int_constant(node)
+    return 0 <= value <= 255 if value is not None else value_ranges.fits_byte(node)
+
+
+def _range_arguments(node):
+    """Returns the [start, stop, step] nodes of `for <name> in range(...)`, or None."""
+    iterator = node.iter
+    if not (isinstance(iterator, ast.Call) and isinstance(iterator.func, ast.Name) and iterator.func.id == 'range'
+            and 1 <= len(iterator.args) <= 3 and not iterator.keywords and isinstance(node.target, ast.Name)):
+        return None
+    args = list(iterator.args)
+    if len(args) == 1:
+        args.insert(0, ast.Constant(value=0))
+    if len(args) == 2:
+        args.append(ast.Constant(value=1))
+    return args
+
+
+def _resolved_names(nodes, func_name, context):
+    return {resolve_variable_name(n.id, func_name) for node in nodes for n in ast.walk(node)
+            if isinstance(n, ast.Name) and isinstance(n.ctx, context)}
+
+
+def _word_operands(node, func_name):
+    """(low, high) operands of a constant or a variable; None for anything else."""
+    value = _int_constant(node)
+    if value is not None:
+        return f"#${value & 0xFF:02X}", f"#${(value >> 8) & 0xFF:02X}"
+    if isinstance(node, ast.Name):
+        var = resolve_variable_name(node.id, func_name)
+        return var, f"{var}+1"
+    return None
+
+
+def _stable_operand(node, func_name, body, temps):
+    """
+    Returns the variable or immediate holding `node` for the whole loop: range()
+    evaluates its arguments once, so a variable the body may change is copied.
+    """
+    if _int_constant(node) is not None:
+        return _word_operands(node, func_name)
+    if isinstance(node, ast.Name) and resolve_variable_name(node.id, func_name) not in _resolved_names(body, func_name, ast.Store):
+        return _word_operands(node, func_name)
+    temp = func_core.get_temp_var()
+    temps.append(temp)
+    func_expressions.translate_expression_recursive(temp, node, func_name)
+    return temp, f"{temp}+1"
+
+
+def _register_used(lines, register):
+    """True when the code may read or change X or Y (a JSR may call anything)."""
+    opcodes = set(COUNTER_OPCODES[register].values())
+    if register == 'X':
+        opcodes |= {'TSX', 'TXS'}
+    for line in lines:
+        _, opcode, operand = parse_line(line)
+        if opcode is None:
+            continue
+        if opcode in opcodes or opcode == 'JSR' or operand.upper().replace(' ', '').endswith(f",{register}"):
+            return True
+    return False
+
+
+def _byte_counter_plan(node, args, var, func_name):
+    """
+    Decides whether a range() loop can count in X or Y. The loop variable must
+    not be assigned in the body, every value must fit in a byte, and the body
+    must not call anything (calls and routines may use both index registers).
+    Returns None, or a dict describing the counter.
+    """
+    if not globals.compiler_options.get('register_loops', True):
+        return None
+    body = node.body
+    if any(isinstance(n, (ast.Break, ast.Continue, ast.Call, ast.Return)) for s in body for n in ast.walk(s)):
+        return None
+    if any(isinstance(n, ast.BinOp) and isinstance(n.op, _ROUTINE_BINOPS) for s in body for n in ast.walk(s)):
+        return None
+    if var in _resolved_names(body, func_name, ast.Store) or globals.variables.get(var, {}).get('type') == 'float':
+        return None
+    reads = var in _resolved_names(body, func_name, ast.Load)
+
+    start, stop, step = (_int_constant(a) for a in args)
+    if start is not None and stop is not None and step:
+        values = range(start, stop, step)
+        if len(values) == 0:
+            return {'trips': 0}
+        if len(values) > 256 or min(values) < 0 or max(values) > 255:
+            return None
+        end = (start + len(values) * step) & 0xFF
+        if reads and any((value & 0xFF) == end for value in values[1:]):
+            return None  # The end test would stop the loop early
+        return {'constant': True, 'reads': reads, 'start': start, 'step': step,
+                'trips': len(values), 'last': values[-1], 'end': end}
+    if step == 1 and all(_fits_byte(a) for a in args[:2]):
+        return {'constant': False, 'reads': reads, 'start_node': args[0], 'stop_node': args[1]}
+    return None
+
+
+def _emit_byte_counter_loop(node, plan, var, error_handler_func, current_func_info):
+    """
+    Emits a range() loop counting in X or Y. The body is generated first so the
+    register it leaves alone can be chosen; returns False (with nothing
+    emitted) when it uses both.
+    Without reads of the loop variable in the body the register counts the
+    iterations down to zero (DEY/BNE, no compare) and the variable gets its
+    final value once after the loop; otherwise the register holds the variable
+    and is stored to it at the top of each iteration. Either way the variable
+    ends at the last value of the range; an empty range leaves it alone and
+    goes to the else clause.
+    """
+    from lib import ast_processor
+    gen = globals.generated_code
+    func_name = _func_name(current_func_info)
+    label_id = str(globals.label_counter)
+    globals.label_counter += 1
+    loop_label = func_core.create_label("for_loop", label_id)
+    else_label = func_core.create_label("for_else", label_id)
+    exit_label = func_core.create_label("for_exit", label_id)
+
+    temps = []
+    header_start = gen.position()
+    if not plan['constant']:
+        stop_lo, _ = _stable_operand(plan['stop_node'], func_name, node.body, temps)
+        start_lo, _ = _stable_operand(plan['start_node'], func_name, node.body, temps)
+    body_start = gen.position()
+    for statement in node.body:
+        ast_processor.process_node(statement, error_handler_func, current_func_info)
+    body = gen.lines_since(body_start)
+    register = next((r for r in ('Y', 'X') if not _register_used(body, r)), None)
+    if register is None:
+        gen.truncate(header_start)
+        for temp in temps:
+            func_core.release_temp_var(temp)
+        return False
+    ops = COUNTER_OPCODES[register]
+
+    header, footer = [], []
+    if plan['constant']:
+        if plan['reads']:
+            header = [f"    {ops['load']} #${plan['start']:02X}", "    LDA #0", f"    STA {var}+1"]
+            if abs(plan['step']) == 1:
+                footer = [f"    {ops['inc'] if plan['step'] > 0 else ops['dec']}"]
+            else:
+                footer = [f"    {ops['to_a']}", "    CLC", f"    ADC #${plan['step'] & 0xFF:02X}", f"    {ops['from_a']}"]
+            if plan['end'] != 0:
+                footer.append(f"    {ops['cmp']} #${plan['end']:02X}")
+            footer.append(f"    BNE {loop_label}")
+        else:
+            header = [f"    {ops['load']} #${plan['trips'] & 0xFF:02X}"]
+            footer = [f"    {ops['dec']}", f"    BNE {loop_label}",
+                      f"    LDA #${plan['last']:02X}", f"    STA {var}", "    LDA #0", f"    STA {var}+1"]
+    else:
+        if plan['reads']:
+            header = [f"    {ops['load']} {start_lo}", f"    {ops['cmp']} {stop_lo}", f"    BCS {else_label}",
+                      "    LDA #0", f"    STA {var}+1"]
+            footer = [f"    {ops['inc']}", f"    {ops['cmp']} {stop_lo}", f"    BNE {loop_label}"]
+        else:
+            # Iterations = stop - start, nothing to do when stop <= start
+            if _int_constant(plan['start_node']) == 0:
+                header = [f"    {ops['load']} {stop_lo}", f"    BEQ {else_label}"]
             else:
-                self.globals.report_error(f"Unsupported condition structure with 'not': {ast.dump(condition_node)}", condition_node)
-                return  # Avoid further processing if unsupported structure
-
-        elif isinstance(condition_node, ast.Name):
-            # Existing logic for direct variable names (still treated as "if var:")
-            resolved_var_name = self.func_core.resolve_variable_name(condition_node.id, current_func_info.get('name') if current_func_info else None)
-            # Check if the variable is not zero (16-bit check, assuming 16-bit integers)
-            self.globals.generated_code.extend([
-                f"    LDA {resolved_var_name}",
-                f"    ORA {resolved_var_name}+1",  # If either byte is non-zero, it's true
-                f"    BEQ {else_label}"  # Branch to 'else' if zero (condition is false)
-            ])
+                header = [f"    LDA {stop_lo}", "    SEC", f"    SBC {start_lo}", f"    BEQ {else_label}",
+                          f"    BCC {else_label}", f"    {ops['from_a']}"]
+            footer = [f"    {ops['dec']}", f"    BNE {loop_label}",
+                      f"    LDA {stop_lo}", "    SEC", "    SBC #1", f"    STA {var}", "    LDA #0", f"    STA {var}+1"]
+    header.append(f"{loop_label}:")
+    if plan['reads']:
+        header.append(f"    {ops['store']} {var}")
+    gen.insert(body_start, [f"    ; for {node.target.id}: counter in {register}"] + header)
+    gen.extend(footer)
+    gen.append(f"{else_label}:")
+    for statement in node.orelse:
+        ast_processor.process_node(statement, error_handler_func, current_func_info)
+    gen.append(f"{exit_label}:")
+    for temp in temps:
+        func_core.release_temp_var(temp)
+    return True
+
+
+# Unsigned branches after LDA left / CMP right, taken when the comparison holds
+_BYTE_COMPARE_BRANCHES = {ast.Eq: 'BEQ', ast.NotEq: 'BNE', ast.Lt: 'BCC', ast.GtE: 'BCS'}
+
+
+def _is_float_operand(node, func_name):
+    if isinstance(node, ast.Constant):
+        return isinstance(node.value, float)
+    if isinstance(node, ast.Name):
+        return globals.variables.get(resolve_variable_name(node.id, func_name), {}).get('type') == 'float'
+    return False
+
+
+def _emit_compare_jump(test, label, jump_if, func_name):
+    """Comparison half of _emit_condition_jump. Returns False for comparisons it leaves to the expression code."""
+    from lib.func_expressions import resolve_byte_operand
+    gen = globals.generated_code
+    op = type(test.ops[0])
+    left, right = test.left, test.comparators[0]
+    if op not in (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE):
+        return False
+    if op in (ast.Gt, ast.LtE):
+        left, right = right, left  # a > b is b < a, a <= b is b >= a
+        op = ast.Lt if op is ast.Gt else ast.GtE
+
+    if globals.compiler_options.get('byte_arithmetic', True) and _fits_byte(left) and _fits_byte(right):
+        left_op, left_temp = resolve_byte_operand(left, func_name)
+        right_op, right_temp = resolve_byte_operand(right, func_name)
+        branch = _BYTE_COMPARE_BRANCHES[op]
+        gen.extend([f"    LDA {left_op}", f"    CMP {right_op}",
+                    f"    {branch if jump_if else INVERSE_BRANCHES[branch]} {label}"])
+        for temp in (left_temp, right_temp):
+            if temp:
+                func_core.release_temp_var(temp)
+        return True
+
+    if _is_float_operand(left, func_name) or _is_float_operand(right, func_name):
+        return False
+    temps, operands = [], []
+    for operand in (left, right):
+        value = _int_constant(operand)
+        if value is not None:
+            operands.append(f"#{value}")
+        elif isinstance(operand, ast.Name):
+            operands.append(resolve_variable_name(operand.id, func_name))
         else:
-            # Use the correct function for reporting errors
-            self.globals.report_compiler_error(f"Unsupported condition type: {type(condition_node).__name__}", condition_node)
-
-    def _handle_and(self, node: ast.BoolOp) -> str:
-        code = ""
-        for i, value in enumerate(node.values):
-            code += self._evaluate_condition(value)
-            if i < len(node.values) - 1:
-                code += f"    beq {self.globals.get_label('end_and')}\n"
-        code += f"{self.globals.get_label('end_and')}:\n"
-        return code
-
-    
+            temp = func_core.get_temp_var()
+            temps.append(temp)
+            func_expressions.translate_expression_recursive(temp, operand, func_name)
+            operands.append(temp)
+    func_operations._handle_comparison_for_branching(operands[0], operands[1], op(), label, func_name, negate=not jump_if)
+    for temp in temps:
+        func_core.release_temp_var(temp)
+    return True
+
+
+def _emit_condition_jump(test, label, jump_if, func_name):
+    """
+    Emits code that branches to label when the truth value of `test` equals
+    jump_if and falls through otherwise. The branches are all short; branch
+    relaxation lengthens the ones whose target is out of reach.
+    """
+    gen = globals.generated_code
+    if isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not):
+        _emit_condition_jump(test.operand, label, not jump_if, func_name)
+        return
+    if isinstance(test, ast.BoolOp):
+        # Short-circuit: 'and' is decided by the first false value, 'or' by the first true one
+        deciding = isinstance(test.op, ast.Or)
+        if deciding == jump_if:
+            for value in test.values:
+                _emit_condition_jump(value, label, jump_if, func_name)
+        else:
+            skip_label = func_core.create_label("cond_skip", str(globals.label_counter))
+            globals.label_counter += 1
+            for value in test.values[:-1]:
+                _emit_condition_jump(value, skip_label, deciding, func_name)
+            _emit_condition_jump(test.values[-1], label, jump_if, func_name)
+            gen.append(f"{skip_label}:")
+        return
+    if isinstance(test, ast.Compare) and len(test.ops) == 1 and _emit_compare_jump(test, label, jump_if, func_name):
+        return
+
+    # Anything else: evaluate it and test for non-zero
+    if isinstance(test, ast.Name):
+        value, temp = resolve_variable_name(test.id, func_name), None
+    else:
+        value = temp = func_core.get_temp_var()
+        func_expressions.translate_expression_recursive(temp, test, func_name)
+    gen.extend([f"    LDA {value}", f"    ORA {value}+1", f"    {'BNE' if jump_if else 'BEQ'} {label}"])
+    if temp:
+        func_core.release_temp_var(temp)
+
+
+def _generate_block(statements, error_handler_func, current_func_info):
+    """Generates statements and returns their lines without leaving them in the program."""
+    from lib import ast_processor
+    gen = globals.generated_code
+    start = gen.position()
+    for statement in statements:
+        ast_processor.process_node(statement, error_handler_func, current_func_info)
+    lines = gen.lines_since(start)
+    gen.truncate(start)
+    return lines
+
+
+def _emit_rotated_loop(test, body_lines, step_lines, labels, func_name):
+    """
+    Lays out a loop tested at the bottom: a guard test skips the loop when the
+    condition is false from the start, then the body runs and the bottom test
+    branches back while the condition holds, so an iteration costs one taken
+    branch and no JMP. The branches are short; branch relaxation turns the
+    ones that cannot reach into a branch over a JMP. test None means loop
+    forever.
+    """
+    gen = globals.generated_code
+    loop_label, continue_label, else_label = labels
+    if test is not None:
+        _emit_condition_jump(test, else_label, False, func_name)
+    gen.append(f"{loop_label}:")
+    gen.extend(body_lines)
+    gen.append(f"{continue_label}:")
+    gen.extend(step_lines)
+    if test is None:
+        gen.append(f"    JMP {loop_label}")
+    else:
+        _emit_condition_jump(test, loop_label, True, func_name)
+    gen.append(f"{else_label}:")
+
+
+def _word_limit_operand(value):
+    """The AST node of an int constant, written as the source would write it."""
+    if value < 0:
+        return ast.UnaryOp(op=ast.USub(), operand=ast.Constant(value=-value))
+    return ast.Constant(value=value)
+
+
+def _emit_word_counter_loop(node, args, var, error_handler_func, current_func_info):
+    """
+    Emits a range() loop with a 16-bit counter, the loop variable itself unless
+    the body assigns it. The step must be a constant, so its sign is known.
+    The bottom test checks that one more step stays inside the range before
+    taking it, so the step never overflows, and the loop leaves the variable
+    at the last value of the range (untouched when the range is empty), as
+    Python does. The back branch goes to the step, laid out ahead of the body.
+    """
+    from lib import ast_processor
+    gen = globals.generated_code
+    func_name = _func_name(current_func_info)
+    step = _int_constant(args[2])
+    if not step:
+        report_error("range() step must be a non-zero integer constant.", node=node)
+        return
+    label_id = str(globals.label_counter)
+    globals.label_counter += 1
+    step_label = func_core.create_label("for_step", label_id)
+    loop_label = func_core.create_label("for_loop", label_id)
+    next_label = func_core.create_label("for_next", label_id)
+    else_label = func_core.create_label("for_else", label_id)
+    exit_label = func_core.create_label("for_exit", label_id)
+
+    temps = []
+    # range() evaluates start and stop once, in this order, before the first iteration
+    if _int_constant(args[0]) is not None or isinstance(args[0], ast.Name):
+        start_node = args[0]
+    else:
+        start = func_core.get_temp_var()
+        temps.append(start)
+        func_expressions.translate_expression_recursive(start, args[0], func_name)
+        start_node = ast.Name(id=start, ctx=ast.Load())
+    stop = _stable_operand(args[1], func_name, node.body, temps)
+    stop_node = ast.Name(id=stop[0], ctx=ast.Load()) if stop[0] in temps else args[1]
+    # The body may assign the variable without changing the values range() yields
+    counter = var
+    if var in _resolved_names(node.body, func_name, ast.Store):
+        counter = func_core.get_temp_var()
+        temps.append(counter)
+    counter_node = ast.Name(id=counter, ctx=ast.Load()) if counter != var else ast.Name(id=node.target.id, ctx=ast.Load())
+
+    guard = ast.Compare(left=start_node, ops=[ast.Lt() if step > 0 else ast.Gt()], comparators=[stop_node])
+    _emit_condition_jump(guard, else_label, False, func_name)
+    func_expressions.translate_expression_recursive(counter, start_node, func_name)
+    gen.extend([f"    JMP {loop_label}", f"{step_label}:",
+                f"    LDA {counter}", "    CLC", f"    ADC #${step & 0xFF:02X}", f"    STA {counter}",
+                f"    LDA {counter}+1", f"    ADC #${(step >> 8) & 0xFF:02X}", f"    STA {counter}+1",
+                f"{loop_label}:"])
+    if counter != var:
+        func_expressions.translate_expression_recursive(var, counter_node, func_name)
+    globals.current_loop_labels_stack.append((next_label, exit_label))
+    for statement in node.body:
+        ast_processor.process_node(statement, error_handler_func, current_func_info)
+    globals.current_loop_labels_stack.pop()
+    gen.append(f"{next_label}:")
+
+    # Another iteration when counter + step is still short of stop
+    stop_value = _int_constant(args[1])
+    if stop_value is not None:
+        limit = stop_value - step
+        if (limit > -0x8000) if step > 0 else (limit < 0x7FFF):
+            test = ast.Compare(left=counter_node, ops=[ast.Lt() if step > 0 else ast.Gt()],
+                               comparators=[_word_limit_operand(limit)])
+            _emit_condition_jump(test, step_label, True, func_name)
+        # Otherwise no value of the counter leaves room for another step
+    elif abs(step) < 0xFFFF:
+        # The distance to stop, positive inside the range, fits 16 unsigned bits even at the int16 limits
+        high, low = (stop, (counter, f"{counter}+1")) if step > 0 else ((counter, f"{counter}+1"), stop)
+        distance = abs(step) + 1
+        gen.extend([
+            "    SEC", f"    LDA {high[0]}", f"    SBC {low[0]}", "    TAX",
+            f"    LDA {high[1]}", f"    SBC {low[1]}",
+            f"    CPX #${distance & 0xFF:02X}", f"    SBC #${(distance >> 8) & 0xFF:02X}",
+            f"    BCS {step_label}",
+        ])
+    gen.append(f"{else_label}:")
+
+    for statement in node.orelse:
+        ast_processor.process_node(statement, error_handler_func, current_func_info)
+    gen.append(f"{exit_label}:")
+    for temp in temps:
+        func_core.release_temp_var(temp)
+
+
+@compile_profile.handler
+def process_for_node(node, error_handler_func, current_func_info=None):
+    """
+    Processes `for <name> in range(...)`. Loops whose values all fit in a byte
+    and whose variable the body leaves alone count in X or Y; the others use
+    a 16-bit counter in memory.
+    """
+    args = _range_arguments(node)
+    if args is None:
+        report_error("Only 'for <name> in range(...)' loops are supported.", node=node)
+        return
+    func_name = _func_name(current_func_info)
+    var = resolve_variable_name(node.target.id, func_name)
+
+    plan = _byte_counter_plan(node, args, var, func_name)
+    if plan is not None and plan.get('trips') == 0:
+        globals.generated_code.append(f"    ; for {node.target.id}: empty range, loop removed")
+        for statement in node.orelse:
+            from lib import ast_processor
+            ast_processor.process_node(statement, error_handler_func, current_func_info)
+        return
+    if plan is not None and _emit_byte_counter_loop(node, plan, var, error_handler_func, current_func_info):
+        return
+    _emit_word_counter_loop(node, args, var, error_handler_func, current_func_info)
+
+
+@compile_profile.handler
+def process_if_node(node, error_handler_func, current_func_info=None):
+    """
+    Processes an if/elif/else statement. The condition branches straight to
+    the else part; branch relaxation lengthens the branch if the body is long.
+    Constant conditions keep only the branch that runs.
+    """
+    from lib import ast_processor
+    gen = globals.generated_code
+    if isinstance(node.test, ast.Constant):
+        for statement in (node.body if node.test.value else node.orelse):
+            ast_processor.process_node(statement, error_handler_func, current_func_info)
+        return
+    label_id = str(globals.label_counter)
+    globals.label_counter += 1
+    else_label = func_core.create_label("if_else", label_id)
+    end_label = func_core.create_label("if_end", label_id)
+
+    _emit_condition_jump(node.test, else_label, False, _func_name(current_func_info))
+    for statement in node.body:
+        ast_processor.process_node(statement, error_handler_func, current_func_info)
+    if node.orelse:
+        gen.append(f"    JMP {end_label}")
+    gen.append(f"{else_label}:")
+    if node.orelse:
+        for statement in node.orelse:
+            ast_processor.process_node(statement, error_handler_func, current_func_info)
+        gen.append(f"{end_label}:")
+
+
+@compile_profile.handler
+def process_while_node(node, error_handler_func, current_func_info=None):
+    """
+    Processes a while loop, rotated so the condition is tested at the bottom.
+    `while True:` loops have no test at all.
+    """
+    from lib import ast_processor
+    gen = globals.generated_code
+    func_name = _func_name(current_func_info)
+    test = node.test
+    if isinstance(test, ast.Constant):
+        if not test.value:
+            gen.append("    ; while: false condition, loop removed")
+            for statement in node.orelse:
+                ast_processor.process_node(statement, error_handler_func, current_func_info)
+            return
+        test = None
+    label_id = str(globals.label_counter)
+    globals.label_counter += 1
+    loop_label = func_core.create_label("while_loop", label_id)
+    continue_label = func_core.create_label("while_test", label_id)
+    else_label = func_core.create_label("while_else", label_id)
+    exit_label = func_core.create_label("while_exit", label_id)
+
+    globals.current_loop_labels_stack.append((continue_label, exit_label))
+    body = _generate_block(node.body, error_handler_func, current_func_info)
+    globals.current_loop_labels_stack.pop()
+    _emit_rotated_loop(test, body, [], (loop_label, continue_label, else_label), func_name)
+    for statement in node.orelse:
+        ast_processor.process_node(statement, error_handler_func, current_func_info)
+    gen.append(f"{exit_label}:")
+
+
+@compile_profile.handler
+def process_loop_jump_node(node):
+    """Processes break and continue with the labels of the innermost loop."""
+    if not globals.current_loop_labels_stack:
+        report_error(f"'{type(node).__name__.lower()}' outside of a loop.", node=node)
+        return
+    continue_label, break_label = globals.current_loop_labels_stack[-1]
+    target = break_label if isinstance(node, ast.Break) else continue_label
+    globals.generated_code.append(f"    JMP {target}")
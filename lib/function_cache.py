@@ -0,0 +1,352 @@
+# py2c64/lib/function_cache.py
+# Per-function incremental code generation. With compiler_options['incremental']
+# set, the code generated for each FunctionDef is kept, process-wide, under a
+# fingerprint of everything it is generated from:
+#   - the function's AST after inlining, with the annotations of the analysis
+#     passes (value ranges, byte contexts) but without line numbers
+#   - the variables it can see: its params and locals, the globals it names,
+#     and the params and locals of the user functions it calls (static frames
+#     and register arguments live there), with their types, sizes, addresses,
+#     zero-page placement and ranges as _collect_variables_recursive and the
+#     analysis passes left them
+#   - the defined_functions entries (signature, labels, calling convention)
+#     of the function and of the functions it calls
+#   - the compiler options, the assembler syntax and the zero-page map
+# A function whose fingerprint is known is not generated again: its block is
+# replayed with the side effects recorded when it was generated (data
+# definitions, routines used, new and changed variables, overflow check
+# counts). The labels the block defines and its temporaries are numbered from
+# label_counter and temp_var_counter, which depend on the code generated before
+# it (names it only refers to, such as routines, are left alone); a block is
+# stored relative to the counters at its start and renumbered on replay,
+# so editing the main program or another function leaves it valid. The main
+# body, the dirty functions and the link step (temporaries, peephole, data
+# and routines) are always regenerated, and the output is the same as without
+# the cache.
+# Code generation also looks up variables no name in the function refers to
+# (the shared temp_0 scratch word, ...), so the lookups are recorded while a
+# block is generated, and the block is only replayed where the variables it
+# looked up, absent ones included, are in the same state.
+# A block is not stored when it reported errors or warnings (so that they are
+# reported again), deleted a variable or released a temporary held before it;
+# temporaries it leaves held are held again on replay. A block that allocated
+# memory (memory_pointer) is only reused at the same memory_pointer.
+# The option is off by default: in a one-shot compilation there is nothing to
+# reuse, and function bodies are a small part of the compile time next to the
+# whole-program passes. It pays off in a long-running process that compiles
+# successive versions of a program.
+
+import ast
+import copy
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+import V1.globals as globals
+from lib.func_core import _get_mangled_local_var_name
+
+MAX_BLOCKS = 4096
+# Options that do not change the generated code
+UNKEYED_OPTIONS = ('profile', 'incremental')
+_POSITION_ATTRIBUTES = ('lineno', 'col_offset', 'end_lineno', 'end_col_offset')
+# Labels and temporaries are named <prefix>_<counter value>
+_NUMBERED_NAME = re.compile(r'\b([A-Za-z_]\w*?)_(\d+)\b')
+_LABEL_NAME = re.compile(r'^[A-Za-z_]\w*$')
+
+_blocks = OrderedDict()  # fingerprint -> block, least recently used first
+_UNCACHEABLE = {}  # Stored for the functions whose block cannot be replayed
+_lock = threading.Lock()
+stats = {'reused': 0, 'generated': 0, 'uncacheable': 0}
+
+
+def invalidate():
+    """Drops every stored function block."""
+    with _lock:
+        _blocks.clear()
+        for name in stats:
+            stats[name] = 0
+
+
+def _count(name):
+    """Adds one to stats[name]: the server compiles in several threads at once."""
+    with _lock:
+        stats[name] += 1
+
+
+def _scan_ast(node, parts, identifiers):
+    """
+    Appends to `parts` the fields and the analysis annotations of `node`,
+    without positions, and adds the names it uses to `identifiers`.
+    """
+    parts.append(type(node).__name__)
+    if isinstance(node, ast.Name):
+        identifiers.add(node.id)
+    elif isinstance(node, ast.arg):
+        identifiers.add(node.arg)
+    elif isinstance(node, ast.Global):
+        identifiers.update(node.names)
+    for name, value in vars(node).items():
+        if name in _POSITION_ATTRIBUTES:
+            continue
+        parts.append(name)
+        if isinstance(value, ast.AST):
+            _scan_ast(value, parts, identifiers)
+        elif isinstance(value, list):
+            parts.append(len(value))
+            for item in value:
+                if isinstance(item, ast.AST):
+                    _scan_ast(item, parts, identifiers)
+                else:
+                    parts.append(repr(item))
+        else:
+            parts.append(repr(value))
+
+
+def _dependencies(node, identifiers):
+    """Returns (variable names, function names) the code of FunctionDef `node`, using `identifiers`, depends on."""
+    functions = {node.name} | {name for name in identifiers if name in globals.defined_functions}
+    frame_prefixes = tuple(_get_mangled_local_var_name(name, '') for name in functions)
+    names = {name for identifier in identifiers
+             for name in (identifier, _get_mangled_local_var_name(node.name, identifier))
+             if name in globals.variables}
+    names.update(name for name in globals.variables if name.startswith(frame_prefixes))
+    return names, functions
+
+
+def _fingerprint(parts, names, functions):
+    options = tuple(sorted((name, value) for name, value in globals.compiler_options.items()
+                           if name not in UNKEYED_OPTIONS))
+    material = (
+        parts,
+        [(name, globals.variables[name]) for name in sorted(names)],
+        [(name, globals.defined_functions[name]) for name in sorted(functions)],
+        options,
+        globals.CURRENT_ASSEMBLER_SYNTAX,
+        globals.zero_page.fingerprint(),
+    )
+    return hashlib.sha256(repr(material).encode()).hexdigest()
+
+
+def generate_function(node, generate):
+    """
+    Emits the code of FunctionDef `node`: `generate()` generates it, unless
+    the block of an unchanged function can be replayed.
+    """
+    if not globals.compiler_options.get('incremental'):
+        generate()
+        return
+    parts, identifiers = [], set()
+    _scan_ast(node, parts, identifiers)
+    names, functions = _dependencies(node, identifiers)
+    key = _fingerprint(parts, names, functions)
+    with _lock:
+        block = _blocks.get(key)
+        if block is not None:
+            _blocks.move_to_end(key)
+    if block is _UNCACHEABLE:
+        # Known to report warnings (or the like): generate it without recording
+        generate()
+        _count('uncacheable')
+        return
+    if block is not None and _applies(block):
+        _replay(block)
+        _count('reused')
+        return
+    identifiers.update([_get_mangled_local_var_name(node.name, identifier) for identifier in identifiers])
+    block = _record(generate, identifiers)
+    if block is None:
+        _count('uncacheable')
+        block = _UNCACHEABLE
+    else:
+        _count('generated')
+    with _lock:
+        _blocks[key] = block
+        _blocks.move_to_end(key)
+        while len(_blocks) > MAX_BLOCKS:
+            _blocks.popitem(last=False)
+
+
+def _variable_state(info):
+    return None if info is None else repr(info)
+
+
+class _LookupRecorder(dict):
+    """
+    The variables table while a block is generated: records the names looked
+    up, and the state of every variable before the block first used it.
+    """
+
+    def __init__(self, variables):
+        super().__init__(variables)
+        self.before = {}  # name -> _variable_state() before the block
+        self.looked_up = set()
+
+    def _touch(self, name, lookup=True):
+        if name not in self.before:
+            self.before[name] = _variable_state(dict.get(self, name))
+        if lookup:
+            self.looked_up.add(name)
+
+    def __getitem__(self, name):
+        self._touch(name)
+        return super().__getitem__(name)
+
+    def __contains__(self, name):
+        self._touch(name)
+        return super().__contains__(name)
+
+    def get(self, name, default=None):
+        self._touch(name)
+        return super().get(name, default)
+
+    def setdefault(self, name, default=None):
+        self._touch(name)
+        return super().setdefault(name, default)
+
+    def __setitem__(self, name, info):
+        self._touch(name, lookup=False)
+        super().__setitem__(name, info)
+
+    def __delitem__(self, name):
+        self._touch(name, lookup=False)
+        super().__delitem__(name)
+
+
+def _applies(block):
+    """True when the variables the block's code mentions are as they were when it was generated."""
+    if block['memory_start'] not in (None, globals.memory_pointer):
+        return False
+    return all(_variable_state(globals.variables.get(name)) == state for name, state in block['requires'].items())
+
+
+def _defined_names(lines, data):
+    """The labels defined by a block's code lines and data definitions."""
+    defined = set()
+    for line in lines + [entry for block in data for entry in block.split("\n")]:
+        if not line or line[0].isspace():
+            continue
+        name = line.split(None, 1)[0].rstrip(':')
+        if _LABEL_NAME.match(name):
+            defined.add(name)
+    return defined
+
+
+def _record(generate, identifiers):
+    """Runs `generate()` and returns the block it emitted, or None when it cannot be stored."""
+    context = globals.current_context()
+    label_start, temp_start, memory_start = context.label_counter, context.temp_var_counter, context.memory_pointer
+    errors, warnings = context.error_count, context.warning_count
+    position = context.generated_code.position()
+    held_temps = dict(context.temp_variables)
+    variables_before = context.variables
+    # Collect the block's own routines, data and counts, then add them to the program's
+    outer_routines, outer_data = context.used_routines, context.data_definitions
+    outer_checks, outer_peak = context.overflow_check_stats, context.temp_var_peak
+    context.used_routines, context.data_definitions = set(), []
+    context.overflow_check_stats = dict.fromkeys(outer_checks, 0)
+    context.temp_var_peak = len(held_temps)
+    recorder = context.variables = _LookupRecorder(context.variables)
+    try:
+        generate()
+    finally:
+        context.variables = dict(recorder)
+        routines, data, checks, peak = (context.used_routines, context.data_definitions,
+                                        context.overflow_check_stats, context.temp_var_peak)
+        outer_routines.update(routines)
+        outer_data.extend(data)
+        for name, count in checks.items():
+            outer_checks[name] = outer_checks.get(name, 0) + count
+        context.used_routines, context.data_definitions = outer_routines, outer_data
+        context.overflow_check_stats, context.temp_var_peak = outer_checks, max(outer_peak, peak)
+
+    if (context.has_errors or context.error_count != errors or context.warning_count != warnings
+            or any(name not in context.temp_variables for name in held_temps)):
+        return None
+    # A variable is only changed after a lookup, which makes its earlier state a requirement
+    changed = {name: context.variables[name] for name, state in recorder.before.items()
+               if name in context.variables and _variable_state(context.variables[name]) != state}
+    if any(state is not None and name not in context.variables for name, state in recorder.before.items()):
+        return None
+
+    lines = context.generated_code.lines_since(position)
+    label_end, temp_end = context.label_counter, context.temp_var_counter
+    # Names numbered by the block: <prefix>_<n> with n handed out by a counter while it was
+    # generated. A label is only the block's own when it defines it; routine names such as
+    # multiply16x16_16 look the same but are defined once, by the link step.
+    defined = _defined_names(lines, data) | set(changed)
+    renumbered = {}
+    text = "\n".join(lines + data + list(changed) + [repr(info) for info in changed.values()])
+    for match in _NUMBERED_NAME.finditer(text):
+        token, prefix, number = match.group(0), match.group(1), int(match.group(2))
+        if token in renumbered or token in variables_before or token in identifiers:
+            continue
+        if prefix == 'temp' and temp_start <= number < temp_end:
+            renumbered[token] = ('temp', prefix, number - temp_start)
+        elif token in defined and label_start <= number < label_end:
+            renumbered[token] = ('label', prefix, number - label_start)
+    pattern = None
+    if renumbered:
+        pattern = re.compile(r'\b(?:' + '|'.join(re.escape(token) for token in sorted(renumbered, key=len, reverse=True)) + r')\b')
+    return {
+        'lines': lines,
+        'data': data,
+        'routines': frozenset(routines),
+        'checks': checks,
+        'variables': copy.deepcopy(changed),
+        'renumbered': renumbered,
+        'pattern': pattern,
+        'held_temps': [name for name in context.temp_variables if name not in held_temps],
+        'requires': {name: recorder.before[name] for name in recorder.looked_up
+                     if isinstance(name, str) and name not in renumbered},
+        'label_start': label_start,
+        'label_count': label_end - label_start,
+        'temp_start': temp_start,
+        'temp_count': temp_end - temp_start,
+        'peak': peak - len(held_temps),
+        'memory_start': memory_start if context.memory_pointer != memory_start else None,
+        'memory_end': context.memory_pointer,
+    }
+
+
+def _copied(value, rename):
+    """A copy of a variable entry for a new program, with its renumbered names renamed."""
+    if isinstance(value, str):
+        return rename(value)
+    if isinstance(value, dict):
+        return {key: _copied(item, rename) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copied(item, rename) for item in value]
+    if isinstance(value, set):
+        return {_copied(item, rename) for item in value}
+    return value
+
+
+def _replay(block):
+    """Emits a stored block and its side effects, renumbered from the current counters."""
+    context = globals.current_context()
+    label_start, temp_start = context.label_counter, context.temp_var_counter
+    if block['pattern'] is not None and (label_start != block['label_start'] or temp_start != block['temp_start']):
+        names = {token: f"{prefix}_{(label_start if kind == 'label' else temp_start) + offset}"
+                 for token, (kind, prefix, offset) in block['renumbered'].items()}
+        rename = lambda text: block['pattern'].sub(lambda match: names[match.group(0)], text)
+        # One substitution over the whole block; a line may hold newlines, never a NUL
+        lines = rename("\0".join(block['lines'])).split("\0")
+        data = rename("\0".join(block['data'])).split("\0") if block['data'] else []
+    else:
+        rename = lambda text: text
+        lines, data = block['lines'], block['data']
+    context.generated_code.extend(lines)
+    context.data_definitions.extend(data)
+    context.used_routines.update(block['routines'])
+    for name, count in block['checks'].items():
+        context.overflow_check_stats[name] = context.overflow_check_stats.get(name, 0) + count
+    for name, info in block['variables'].items():
+        context.variables[rename(name)] = _copied(info, rename)
+    context.label_counter = label_start + block['label_count']
+    context.temp_var_counter = temp_start + block['temp_count']
+    context.temp_var_peak = max(context.temp_var_peak, len(context.temp_variables) + block['peak'])
+    for name in block['held_temps']:
+        context.temp_variables[rename(name)] = True
+    if block['memory_start'] is not None:
+        context.memory_pointer = block['memory_end']
@@ -0,0 +1,399 @@
+# py2c64/lib/inliner.py
+# Function inlining pass.
+# Runs on the Python AST right after parsing, before the variable collection
+# pass, and replaces calls to small user functions with their bodies:
+#   - a function whose body is a single `return expr` is inlined wherever it
+#     is called, by substituting the arguments into the expression;
+#   - a function of up to MAX_INLINE_STATEMENTS simple statements (assignments
+#     and expression statements, optionally ending with `return expr`) is
+#     inlined where its call is a statement of its own: `f(...)` or `x = f(...)`.
+# Besides saving the JSR/RTS and the argument passing, substituting constant
+# arguments turns `x * 2 + 1` into `3 * 2 + 1`, which is then folded to a
+# constant by _perform_constant_folding.
+#
+# Code growth is limited by a global budget, measured in AST nodes: each
+# inlined call costs the size of the body minus the size of the call.
+# Functions decorated with @noinline are never inlined; recursive functions
+# and functions with default, keyword or variadic parameters are skipped.
+# A function whose calls have all been inlined is removed from the program.
+
+import ast
+import copy
+import V1.globals as globals
+from lib.call_graph import find_recursive_functions
+from lib.func_expressions import _perform_constant_folding
+
+NOINLINE_DECORATOR = "noinline"
+MAX_INLINE_STATEMENTS = 4
+INLINE_BUDGET = 256  # AST nodes of code growth for the whole program
+MAX_PASSES = 3  # Inlining a function can expose calls to other inlinable ones
+
+
+def _node_count(nodes):
+    return sum(1 for node in nodes for _ in ast.walk(node))
+
+
+def _assigned_names(nodes):
+    return {n.id for node in nodes for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Store)}
+
+
+def _loaded_names(nodes):
+    return {n.id for node in nodes for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)}
+
+
+def _contains_call(node):
+    return any(isinstance(n, ast.Call) for n in ast.walk(node))
+
+
+def _evaluation_order(node, conditional=False):
+    """Yields (node, conditional) for the nodes of an expression in the order Python evaluates
+    them; `conditional` is True for the nodes that may not be evaluated at all."""
+    if isinstance(node, ast.IfExp):
+        parts = [(node.test, conditional), (node.body, True), (node.orelse, True)]
+    elif isinstance(node, ast.BoolOp):
+        parts = [(node.values[0], conditional)] + [(value, True) for value in node.values[1:]]
+    elif isinstance(node, ast.Compare):
+        parts = ([(node.left, conditional), (node.comparators[0], conditional)]
+                 + [(comparator, True) for comparator in node.comparators[1:]])
+    elif isinstance(node, ast.Dict):
+        parts = [(n, conditional) for pair in zip(node.keys, node.values) for n in pair if n is not None]
+    elif isinstance(node, (ast.Lambda, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)):
+        parts = [(child, True) for child in ast.iter_child_nodes(node)]
+    else:
+        parts = [(child, conditional) for child in ast.iter_child_nodes(node)]
+    for child, child_conditional in parts:
+        yield from _evaluation_order(child, child_conditional)
+    yield node, conditional
+
+
+def _strip_noinline(func_node):
+    """Removes the @noinline decorator; returns True if it was present."""
+    kept = [d for d in func_node.decorator_list if not (isinstance(d, ast.Name) and d.id == NOINLINE_DECORATOR)]
+    opted_out = len(kept) != len(func_node.decorator_list)
+    func_node.decorator_list = kept
+    return opted_out
+
+
+def _is_simple_statement(statement):
+    if isinstance(statement, ast.Expr):
+        return True
+    return isinstance(statement, ast.Assign) and all(isinstance(t, ast.Name) for t in statement.targets)
+
+
+def _inline_form(func_node):
+    """Returns 'expression', 'statements' or None when the function cannot be inlined."""
+    args = func_node.args
+    if args.defaults or args.kw_defaults or args.kwonlyargs or args.vararg or args.kwarg or args.posonlyargs:
+        return None
+    body = func_node.body
+    if len(body) == 1 and isinstance(body[0], ast.Return) and body[0].value is not None:
+        return 'expression'
+    if len(body) > MAX_INLINE_STATEMENTS:
+        return None
+    *statements, last = body
+    if not all(_is_simple_statement(s) for s in statements):
+        return None
+    if not (_is_simple_statement(last) or isinstance(last, ast.Return)):
+        return None
+    return 'statements'
+
+
+def _build_graph(tree, functions):
+    """Same shape as call_graph.build_call_graph, but read from the AST alone."""
+    graph = {None: set()}
+    for func_name, func_node in functions.items():
+        graph[func_name] = {n.func.id for n in ast.walk(func_node)
+                            if isinstance(n, ast.Call) and isinstance(n.func, ast.Name) and n.func.id in functions}
+    return graph
+
+
+class _Substitute(ast.NodeTransformer):
+    """Replaces names with copies of the given expressions."""
+
+    def __init__(self, mapping):
+        self.mapping = mapping
+
+    def visit_Name(self, node):
+        if node.id in self.mapping:
+            replacement = self.mapping[node.id]
+            if isinstance(replacement, str):
+                return ast.copy_location(ast.Name(id=replacement, ctx=node.ctx), node)
+            return ast.copy_location(copy.deepcopy(replacement), node)
+        return node
+
+
+class _FoldConstants(ast.NodeTransformer):
+    """Folds the constant sub-expressions exposed by the substituted arguments."""
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        folded = _perform_constant_folding(node)
+        return ast.copy_location(folded, node) if folded is not None else node
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant) and type(node.operand.value) in (int, float):
+            return ast.copy_location(ast.Constant(value=-node.operand.value), node)
+        return node
+
+
+class _Inliner:
+    def __init__(self, tree):
+        self.tree = tree
+        self.budget = globals.compiler_options.get('inline_budget', INLINE_BUDGET)
+        self.used = 0
+        self.site_counter = 0
+        self.inlined = {}  # func_name -> number of inlined calls
+        self.opted_out = set()
+        self.functions = {}
+        self.forms = {}
+
+    def find_candidates(self):
+        self.functions = {n.name: n for n in self.tree.body if isinstance(n, ast.FunctionDef)}
+        for func_node in self.functions.values():
+            if _strip_noinline(func_node):
+                self.opted_out.add(func_node.name)
+        recursive = find_recursive_functions(_build_graph(self.tree, self.functions))
+        self.forms = {}
+        for func_name, func_node in self.functions.items():
+            if func_name in self.opted_out or func_name in recursive:
+                continue
+            form = _inline_form(func_node)
+            if form:
+                self.forms[func_name] = form
+
+    def _caller_locals(self, caller):
+        if caller is None:
+            return set()
+        declared_global = {name for n in ast.walk(caller) if isinstance(n, ast.Global) for name in n.names}
+        params = {a.arg for a in caller.args.args}
+        return (_assigned_names(caller.body) | params) - declared_global
+
+    def _callee_info(self, func_name):
+        func_node = self.functions[func_name]
+        params = [a.arg for a in func_node.args.args]
+        local_names = _assigned_names(func_node.body) | set(params)
+        free_names = _loaded_names(func_node.body) - local_names
+        return func_node, params, local_names, free_names
+
+    def _try_spend(self, func_node, call):
+        growth = _node_count(func_node.body) - _node_count([call])
+        if self.used + growth > self.budget:
+            return False
+        self.used += growth
+        self.inlined[func_node.name] = self.inlined.get(func_node.name, 0) + 1
+        self.site_counter += 1
+        return True
+
+    def _calls_user_function(self, nodes):
+        return any(isinstance(n, ast.Call) and isinstance(n.func, ast.Name) and n.func.id in self.functions
+                   for node in nodes for n in ast.walk(node))
+
+    def _keeps_order(self, body, params, args):
+        """True when substituting the arguments into `body` cannot change the order of their
+        side effects. The call evaluates every argument before the body; substituted, they
+        are evaluated where the body uses them, and a variable operand is read after a call
+        next to it (`c + bump()` reads c last). So an argument with a call must be the only
+        variable the body reads and the only call it makes, and a body calling a user
+        function must not read a variable argument."""
+        callees = {id(n.func) for n in ast.walk(body) if isinstance(n, ast.Call)}
+        calls = reads = argument_reads = 0
+        for node, conditional in _evaluation_order(body):
+            if isinstance(node, ast.Name) and node.id in params:
+                arg = args[params.index(node.id)]
+                if isinstance(arg, ast.Constant):
+                    continue
+                if not _contains_call(arg):
+                    argument_reads += 1
+                elif conditional:
+                    return False  # Would not always be evaluated
+            elif isinstance(node, ast.Name) and id(node) not in callees:
+                reads += 1
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in self.functions:
+                calls += 1
+        if any(_contains_call(arg) for arg in args):
+            return not (calls or reads or argument_reads)
+        return not (calls and argument_reads)
+
+    def _matches(self, call, caller):
+        if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id in self.forms):
+            return False
+        func_name = call.func.id
+        if caller is not None and caller.name == func_name:
+            return False
+        func_node, params, _, free_names = self._callee_info(func_name)
+        if call.keywords or any(isinstance(a, ast.Starred) for a in call.args) or len(call.args) != len(params):
+            return False
+        # The callee's globals must not be shadowed by the caller's locals
+        return not (free_names & self._caller_locals(caller))
+
+    def inline_expression(self, call, caller):
+        """Returns the inlined expression for a call, or None to keep the call."""
+        if not self._matches(call, caller) or self.forms[call.func.id] != 'expression':
+            return None
+        func_node, params, _, _ = self._callee_info(call.func.id)
+        body = func_node.body[0].value
+        uses = {p: sum(1 for n in ast.walk(body) if isinstance(n, ast.Name) and n.id == p) for p in params}
+        # Arguments with calls must be evaluated exactly once, and not moved across the
+        # variables and calls evaluated around them
+        with_calls = [p for p, arg in zip(params, call.args) if _contains_call(arg)]
+        if len(with_calls) > 1 or any(uses[p] != 1 for p in with_calls):
+            return None
+        if not self._keeps_order(body, params, call.args):
+            return None
+        for p, arg in zip(params, call.args):
+            if uses[p] > 1 and not isinstance(arg, (ast.Constant, ast.Name)):
+                return None  # Would evaluate the argument several times
+        if not self._try_spend(func_node, call):
+            return None
+        inlined = _Substitute(dict(zip(params, call.args))).visit(copy.deepcopy(body))
+        return ast.copy_location(_FoldConstants().visit(inlined), call)
+
+    def inline_statement(self, statement, caller):
+        """Returns the statements replacing `f(...)` or `x = f(...)`, or None."""
+        if isinstance(statement, ast.Expr):
+            call, target = statement.value, None
+        elif isinstance(statement, ast.Assign) and len(statement.targets) == 1 and isinstance(statement.targets[0], ast.Name):
+            call, target = statement.value, statement.targets[0]
+        else:
+            return None
+        if not self._matches(call, caller) or self.forms[call.func.id] != 'statements':
+            return None
+        func_node, params, local_names, _ = self._callee_info(call.func.id)
+        *statements, last = func_node.body
+        if isinstance(last, ast.Return):
+            result = last.value
+        else:
+            statements, result = func_node.body, None
+        if target is not None and result is None:
+            return None  # `x = f()` of a function returning None
+        if not self._try_spend(func_node, call):
+            return None
+
+        prefix = f"__inl{self.site_counter}_{func_node.name}_"
+        written = _assigned_names(statements)
+        # The arguments are bound in call order; a variable argument is only read in place
+        # when no call (in an argument or the body) could change it before it is read
+        reordered = (any(_contains_call(arg) for arg in call.args)
+                     or self._calls_user_function(func_node.body))
+        mapping = {name: prefix + name for name in local_names}
+        new_body = []
+        for param, arg in zip(params, call.args):
+            if isinstance(arg, ast.Constant) and param not in written:
+                mapping[param] = arg
+            elif isinstance(arg, ast.Name) and param not in written and arg.id not in written and not reordered:
+                mapping[param] = arg
+            else:
+                new_body.append(ast.Assign(targets=[ast.Name(id=prefix + param, ctx=ast.Store())], value=arg))
+        substitute = _Substitute(mapping)
+        folder = _FoldConstants()
+        for body_statement in statements:
+            new_body.append(folder.visit(substitute.visit(copy.deepcopy(body_statement))))
+        if result is not None:
+            value = folder.visit(substitute.visit(copy.deepcopy(result)))
+            if target is not None:
+                new_body.append(ast.Assign(targets=[ast.Name(id=target.id, ctx=ast.Store())], value=value))
+            elif _contains_call(value):
+                new_body.append(ast.Expr(value=value))
+        for new_statement in new_body:
+            ast.copy_location(new_statement, statement)
+        return new_body or [ast.copy_location(ast.Pass(), statement)]
+
+    def run(self):
+        for _ in range(MAX_PASSES):
+            before = self.site_counter
+            self.find_candidates()
+            if not self.forms:
+                break
+            self._rewrite_block(self.tree.body, None)
+            if self.site_counter == before:
+                break
+        self._remove_inlined_functions()
+
+    def _rewrite_block(self, statements, caller):
+        index = 0
+        while index < len(statements):
+            statement = statements[index]
+            if isinstance(statement, ast.FunctionDef):
+                self._rewrite_block(statement.body, statement)
+                index += 1
+                continue
+            replacement = self.inline_statement(statement, caller)
+            if replacement is not None:
+                statements[index:index + 1] = replacement
+                index += len(replacement)
+                continue
+            _ExpressionInliner(self, caller).visit(statement)
+            for field in ('body', 'orelse', 'finalbody'):
+                block = getattr(statement, field, None)
+                if isinstance(block, list) and block and isinstance(block[0], ast.stmt):
+                    self._rewrite_block(block, caller)
+            for handler in getattr(statement, 'handlers', []):
+                self._rewrite_block(handler.body, caller)
+            index += 1
+
+    def _remove_inlined_functions(self):
+        still_used = {n.id for n in ast.walk(self.tree) if isinstance(n, ast.Name)}
+        self.removed = []
+        kept = []
+        for statement in self.tree.body:
+            if isinstance(statement, ast.FunctionDef) and statement.name in self.inlined and statement.name not in still_used:
+                self.removed.append(statement.name)
+                continue
+            kept.append(statement)
+        self.tree.body[:] = kept
+
+
+class _ExpressionInliner(ast.NodeTransformer):
+    """Inlines the single-expression calls inside one statement, leaving nested blocks alone."""
+
+    def __init__(self, inliner, caller):
+        self.inliner = inliner
+        self.caller = caller
+
+    def generic_visit(self, node):
+        for field, value in ast.iter_fields(node):
+            if isinstance(value, list) and value and isinstance(value[0], ast.stmt):
+                continue  # Nested blocks are rewritten statement by statement
+            if isinstance(value, list):
+                value[:] = [self.visit(item) if isinstance(item, ast.AST) else item for item in value]
+            elif isinstance(value, ast.AST):
+                setattr(node, field, self.visit(value))
+        return node
+
+    def visit_Call(self, node):
+        self.generic_visit(node)  # Inner calls first: f(g(x)) inlines g into the argument
+        inlined = self.inliner.inline_expression(node, self.caller)
+        return inlined if inlined is not None else node
+
+
+def inline_functions(tree):
+    """
+    Inlines the calls to small user functions in `tree` (in place).
+    Must run before the variable collection pass.
+
+    Returns {'sites': n_inlined_calls, 'functions': {func_name: n_calls},
+    'removed': [func_name, ...], 'budget_used': nodes, 'budget': nodes}.
+    """
+    stats = {'sites': 0, 'functions': {}, 'removed': [], 'budget_used': 0,
+             'budget': globals.compiler_options.get('inline_budget', INLINE_BUDGET)}
+    if not globals.compiler_options.get('inline', True):
+        for func_node in tree.body:
+            if isinstance(func_node, ast.FunctionDef):
+                _strip_noinline(func_node)
+        return stats
+
+    inliner = _Inliner(tree)
+    inliner.run()
+    ast.fix_missing_locations(tree)
+    stats.update({'sites': inliner.site_counter, 'functions': inliner.inlined,
+                  'removed': inliner.removed, 'budget_used': inliner.used})
+    return stats
+
+
+def format_report(stats):
+    """Returns the comment line summarizing the inlining pass."""
+    inlined = ", ".join(f"{name} x{count}" for name, count in sorted(stats['functions'].items())) or "none"
+    removed = f", removed {', '.join(stats['removed'])}" if stats['removed'] else ""
+    return (f"; Inlining: {stats['sites']} calls ({inlined}){removed}, "
+            f"budget {stats['budget_used']}/{stats['budget']} nodes")
@@ -0,0 +1,304 @@
+# py2c64/lib/peephole.py
+# Peephole optimizer for the generated program code.
+# Runs on the main program and user functions once code generation (and temp
+# allocation) is complete, before the data and routine segments are appended.
+# Every rule counts its hits so the savings can be reported in the output.
+#
+# Rules:
+#   redundant_load  - LDA/LDX/LDY of a value the register is known to hold
+#                     (this covers the classic STA x / LDA x pair)
+#   redundant_store - STA/STX/STY of a value the location is known to hold
+#   redundant_carry - CLC/SEC when the carry is already known to be clear/set
+#   jump_to_next    - JMP/Bxx to the label that immediately follows
+#   jump_chain      - JMP to a label whose first instruction is another JMP
+
+import re
+import V1.globals as globals
+
+RULES = ('redundant_load', 'redundant_store', 'redundant_carry', 'jump_to_next', 'jump_chain')
+
+OPCODES = {
+    'ADC', 'AND', 'ASL', 'BCC', 'BCS', 'BEQ', 'BIT', 'BMI', 'BNE', 'BPL', 'BRK', 'BVC', 'BVS', 'CLC',
+    'CLD', 'CLI', 'CLV', 'CMP', 'CPX', 'CPY', 'DEC', 'DEX', 'DEY', 'EOR', 'INC', 'INX', 'INY', 'JMP',
+    'JSR', 'LDA', 'LDX', 'LDY', 'LSR', 'NOP', 'ORA', 'PHA', 'PHP', 'PLA', 'PLP', 'ROL', 'ROR', 'RTI',
+    'RTS', 'SBC', 'SEC', 'SED', 'SEI', 'STA', 'STX', 'STY', 'TAX', 'TAY', 'TSX', 'TXA', 'TXS', 'TYA',
+}
+BRANCH_OPCODES = {'BCC', 'BCS', 'BEQ', 'BMI', 'BNE', 'BPL', 'BVC', 'BVS'}
+LOAD_REGISTER = {'LDA': 'A', 'LDX': 'X', 'LDY': 'Y'}
+STORE_REGISTER = {'STA': 'A', 'STX': 'X', 'STY': 'Y'}
+TRANSFERS = {'TAX': ('A', 'X'), 'TAY': ('A', 'Y'), 'TXA': ('X', 'A'), 'TYA': ('Y', 'A')}
+READ_MODIFY_WRITE = {'INC', 'DEC', 'ASL', 'LSR', 'ROL', 'ROR'}
+CLOBBERS_A = {'ADC', 'SBC', 'AND', 'ORA', 'EOR', 'PLA'}
+CLOBBERS_X = {'INX', 'DEX', 'TSX'}
+CLOBBERS_Y = {'INY', 'DEY'}
+CLOBBERS_CARRY = {'ADC', 'SBC', 'CMP', 'CPX', 'CPY', 'ASL', 'LSR', 'ROL', 'ROR', 'PLP'}
+# Instructions that set N and Z, making any earlier N/Z result dead
+SETS_NZ = {
+    'LDA', 'LDX', 'LDY', 'ADC', 'SBC', 'AND', 'ORA', 'EOR', 'CMP', 'CPX', 'CPY', 'BIT', 'INC', 'DEC',
+    'INX', 'INY', 'DEX', 'DEY', 'TAX', 'TAY', 'TXA', 'TYA', 'TSX', 'PLA', 'ASL', 'LSR', 'ROL', 'ROR', 'PLP',
+}
+# Instructions that neither read nor set N/Z and fall through to the next line
+PRESERVES_NZ = {'STA', 'STX', 'STY', 'CLC', 'SEC', 'CLD', 'SED', 'CLI', 'SEI', 'CLV', 'NOP', 'PHA', 'TXS'}
+
+IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+SYMBOL_OPERAND_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)(?:\+(\d+))?$')
+NUMERIC_OPERAND_RE = re.compile(r'^\$([0-9A-Fa-f]{1,4})$')
+EQUATE_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)\s*=\s*\$([0-9A-Fa-f]{1,4})$')
+
+# Memory that can change behind the program's back (CPU port, VIC/SID/CIA I/O)
+VOLATILE_RANGES = [(0x0000, 0x0001), (0xD000, 0xDFFF)]
+
+MAX_ITERATIONS = 10  # Rules can expose new opportunities for each other
+
+
+def parse_line(line):
+    """
+    Splits an assembly line into (label, opcode, operand).
+    Blank and comment-only lines give (None, None, None); directives, equates
+    and anything else that is not an instruction give (None, None, code).
+    """
+    code = line.split(';')[0].strip()
+    if not code:
+        return None, None, None
+    if code.endswith(':') and IDENTIFIER_RE.match(code[:-1]):
+        return code[:-1], None, None
+    parts = code.split(None, 1)
+    opcode = parts[0].upper()
+    if opcode in OPCODES:
+        return None, opcode, (parts[1].strip() if len(parts) > 1 else '')
+    if len(parts) == 1 and IDENTIFIER_RE.match(code):
+        return code, None, None  # Routine-style label without a colon
+    return None, None, code
+
+
+def _collect_equates(lines):
+    """Returns {name: address} for the `name = $xxxx` equates in the code."""
+    equates = {}
+    for line in lines:
+        match = EQUATE_RE.match(line.split(';')[0].strip())
+        if match:
+            equates[match.group(1)] = int(match.group(2), 16)
+    return equates
+
+
+def _memory_key(operand, equates):
+    """
+    Returns a canonical key for a plain (non-indexed) memory operand so that a
+    label and the address it is equated to compare equal. Returns None for
+    operands that cannot be tracked: indexed, indirect or volatile memory.
+    """
+    match = NUMERIC_OPERAND_RE.match(operand)
+    if match:
+        address = int(match.group(1), 16)
+    else:
+        match = SYMBOL_OPERAND_RE.match(operand)
+        if not match:
+            return None
+        name, offset = match.group(1), int(match.group(2) or 0)
+        if name not in equates:
+            return f"{name}+{offset}"
+        address = equates[name] + offset
+    if any(low <= address <= high for low, high in VOLATILE_RANGES):
+        return None
+    return f"${address:04X}"
+
+
+def _value_key(operand, equates):
+    """Returns the key of the value an operand loads: the immediate itself or a memory key."""
+    if operand.startswith('#'):
+        return operand.replace(' ', '')
+    return _memory_key(operand, equates)
+
+
+def _nz_flags_dead_after(lines, index):
+    """
+    True when the N/Z flags set by the instruction at `index` are overwritten
+    before anything can read them, so dropping that instruction is safe.
+    Runtime routines and user functions never read the caller's N/Z flags, so
+    a JSR ends the search too. Labels and other control flow are treated as
+    reads, since the flags would reach code this scan does not follow.
+    """
+    for line in lines[index + 1:]:
+        label, opcode, operand = parse_line(line)
+        if label is not None:
+            return False
+        if opcode is None:
+            if operand is None:
+                continue  # Blank or comment
+            return False
+        if opcode in SETS_NZ or opcode == 'JSR':
+            return True
+        if opcode not in PRESERVES_NZ:
+            return False
+    return False
+
+
+def _track_registers(lines, equates, hits):
+    """
+    Walks the code forward keeping, for A, X and Y, the set of values each is
+    known to hold, and the state of the carry. Removes the loads, stores and
+    carry instructions that would not change anything.
+    """
+    registers = {'A': set(), 'X': set(), 'Y': set()}
+    carry = None  # 0, 1 or None when unknown
+
+    def forget_all():
+        for held in registers.values():
+            held.clear()
+
+    def forget_memory(key=None):
+        # Drop one memory key, or every memory key when the target is unknown
+        for held in registers.values():
+            for value in list(held):
+                if (key is None and not value.startswith('#')) or value == key:
+                    held.discard(value)
+
+    result = []
+    for index, line in enumerate(lines):
+        label, opcode, operand = parse_line(line)
+        if opcode is None:
+            if label is not None or operand is not None:
+                # Control can arrive from elsewhere, or the line is not code we understand
+                forget_all()
+                carry = None
+            result.append(line)
+            continue
+
+        if opcode in LOAD_REGISTER:
+            register = LOAD_REGISTER[opcode]
+            value = _value_key(operand, equates)
+            if value is not None and value in registers[register] and _nz_flags_dead_after(lines, index):
+                hits['redundant_load'] += 1
+                continue
+            registers[register] = {value} if value is not None else set()
+
+        elif opcode in STORE_REGISTER:
+            register = STORE_REGISTER[opcode]
+            key = _memory_key(operand, equates)
+            if key is not None and key in registers[register]:
+                hits['redundant_store'] += 1
+                continue
+            forget_memory(key)
+            if key is not None:
+                registers[register].add(key)
+
+        elif opcode in ('CLC', 'SEC'):
+            wanted = 0 if opcode == 'CLC' else 1
+            if carry == wanted:
+                hits['redundant_carry'] += 1
+                continue
+            carry = wanted
+
+        elif opcode in TRANSFERS:
+            source, destination = TRANSFERS[opcode]
+            registers[destination] = set(registers[source])
+
+        elif opcode in READ_MODIFY_WRITE and operand and operand.upper() != 'A':
+            forget_memory(_memory_key(operand, equates))
+
+        elif opcode in READ_MODIFY_WRITE or opcode in CLOBBERS_A:
+            registers['A'] = set()
+
+        elif opcode in CLOBBERS_X:
+            registers['X'] = set()
+
+        elif opcode in CLOBBERS_Y:
+            registers['Y'] = set()
+
+        elif opcode in ('JSR', 'JMP', 'RTS', 'RTI', 'BRK'):
+            forget_all()
+            carry = None
+
+        if opcode in CLOBBERS_CARRY:
+            carry = None
+        elif opcode == 'BCC':
+            carry = 1  # Falling through means the carry was set
+        elif opcode == 'BCS':
+            carry = 0
+
+        result.append(line)
+    return result
+
+
+def _remove_jumps_to_next(lines, hits):
+    """Removes JMP/Bxx instructions whose target is reached by falling through."""
+    result = []
+    for index, line in enumerate(lines):
+        _, opcode, operand = parse_line(line)
+        if opcode == 'JMP' or opcode in BRANCH_OPCODES:
+            for following in lines[index + 1:]:
+                label, next_opcode, next_operand = parse_line(following)
+                if label == operand:
+                    hits['jump_to_next'] += 1
+                    break
+                if label is None and (next_opcode is not None or next_operand is not None):
+                    result.append(line)
+                    break
+            else:
+                result.append(line)
+            continue
+        result.append(line)
+    return result
+
+
+def _thread_jump_chains(lines, hits):
+    """Retargets JMP L1 to L2 when the first instruction at L1 is JMP L2."""
+    first_instruction = {}
+    pending_labels = []
+    for line in lines:
+        label, opcode, operand = parse_line(line)
+        if label is not None:
+            pending_labels.append(label)
+        elif opcode is not None or operand is not None:
+            for pending in pending_labels:
+                first_instruction[pending] = (opcode, operand)
+            pending_labels = []
+
+    def final_target(target):
+        seen = {target}
+        while first_instruction.get(target, (None, None))[0] == 'JMP':
+            next_target = first_instruction[target][1]
+            if next_target in seen or not IDENTIFIER_RE.match(next_target):
+                break  # Endless loop or indirect jump: leave it alone
+            seen.add(next_target)
+            target = next_target
+        return target
+
+    result = []
+    for line in lines:
+        _, opcode, operand = parse_line(line)
+        if opcode == 'JMP' and IDENTIFIER_RE.match(operand):
+            target = final_target(operand)
+            if target != operand:
+                hits['jump_chain'] += 1
+                line = line.replace(operand, target, 1)
+        result.append(line)
+    return result
+
+
+def optimize(program_lines):
+    """
+    Applies the peephole rules to `program_lines` until none of them fires.
+    Returns (optimized_lines, hits) where hits maps each rule to the number
+    of instructions it removed or rewrote.
+    """
+    hits = {rule: 0 for rule in RULES}
+    if not globals.compiler_options.get('peephole', True):
+        return program_lines, hits
+
+    equates = _collect_equates(program_lines)
+    lines = program_lines
+    for _ in range(MAX_ITERATIONS):
+        before = sum(hits.values())
+        lines = _thread_jump_chains(lines, hits)
+        lines = _remove_jumps_to_next(lines, hits)
+        lines = _track_registers(lines, equates, hits)
+        if sum(hits.values()) == before:
+            break
+    return lines, hits
+
+
+def format_report(hits):
+    """Returns the comment line summarizing the peephole hits."""
+    details = ", ".join(f"{rule} {hits[rule]}" for rule in RULES)
+    return f"; Peephole: {sum(hits.values())} hits ({details})"
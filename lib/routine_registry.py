@@ -0,0 +1,81 @@
+# py2c64/lib/routine_registry.py
+# The rendered runtime routines, shared by every compilation in the process.
+# The text of a routine only depends on the configuration: the assembler
+# syntax, the fixed zero-page map and the options that select a routine
+# variant (compiler_options['multiply']). The registry renders each routine
+# once per configuration, from routines.routines_map or the C64 library's
+# ROUTINE_GENERATORS, and keeps the text; with the dependency closures that
+# routines.py computes at import, linking a program is a set union, one
+# dictionary lookup per routine and a join.
+# This needs routine generation to be idempotent: a routine's labels derive
+# from its name, never from label_counter, and a variant of a routine (the
+# multiply family, plot set/unplot) is a routine name of its own, so the key
+# (configuration, name) identifies its text. invalidate() drops the rendered
+# routines: call it after changing a routine generator, an assembler syntax or
+# a zero-page address at run time.
+
+import threading
+
+import V1.globals as globals
+from lib import routines
+
+# Options read by the routine generators
+RENDER_OPTIONS = ('multiply',)
+
+_rendered = {}  # (configuration, routine name) -> "; Routine: name" block, or '' when no library has it
+_lock = threading.Lock()
+stats = {'hits': 0, 'renders': 0}
+
+
+def configuration():
+    """The key of the rendered routines valid for the current compilation."""
+    options = tuple(routines.multiply_variant() if name == 'multiply' else globals.compiler_options.get(name)
+                    for name in RENDER_OPTIONS)
+    return (globals.CURRENT_ASSEMBLER_SYNTAX, globals.ZERO_PAGE_MAP.fingerprint(), options)
+
+
+def invalidate():
+    """Drops every rendered routine; they are rendered again when next linked."""
+    with _lock:
+        _rendered.clear()
+        stats['hits'] = stats['renders'] = 0
+
+
+def _render(routine_name):
+    code = routines.get_routine_by_name(routine_name)
+    return f"\n; Routine: {routine_name}\n{code}" if code else ""
+
+
+def rendered_routine(routine_name, key=None):
+    """The routine's block for the routines segment, rendered at most once per configuration."""
+    key = (key or configuration(), routine_name)
+    block = _rendered.get(key)
+    if block is None:
+        block = _render(routine_name)
+        with _lock:
+            _rendered[key] = block
+            stats['renders'] += 1
+    else:
+        with _lock:
+            stats['hits'] += 1
+    return block
+
+
+def link_routines(used_routines):
+    """
+    Returns (segment, linked) for the routines used by the program and all
+    they need: the text of the routines segment, and {name: lines} of the
+    routines it holds.
+    """
+    key = configuration()
+    blocks = ["\n; --- Subroutines ---"]
+    linked = {}
+    for routine_name in sorted(routines.get_all_required_routines(used_routines)):
+        block = rendered_routine(routine_name, key)
+        if block:
+            blocks.append(block)
+            linked[routine_name] = block.count("\n") - 1
+        else:
+            # This warning should now be rare due to the improved routine loading
+            print(f"Warning: Code for routine '{routine_name}' could not be generated.")
+    return "\n".join(blocks), linked
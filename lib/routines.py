@@ -12,6 +12,27 @@ from . import c64_routine_library
 def _format_woz_routine(code_string):
     return textwrap.dedent(code_string).strip()
 
+# Text printed by the *_error_msg routines, stored right after each routine
+ERROR_MESSAGES = {
+    'overflow_msg': "OverflowError",
+    'division_by_zero_msg_string': "ZeroDivisionError",
+    'error_msg': "RuntimeError",
+    'key_error_msg_string': "KeyError",
+    'attribute_error_msg_string': "AttributeError",
+    'not_implemented_error_msg_string': "NotImplementedError",
+    'value_error_msg_string': "ValueError",
+}
+
+
+def _message_data(label):
+    """NUL-terminated message string for print_string."""
+    return [
+        label,
+        f"    {app_globals.assembly_data_types['asciiz']} \"{ERROR_MESSAGES[label]}\"",
+        f"    {app_globals.assembly_data_types['byte']} 0",
+    ]
+
+
 def check_overflow():
     # Usa app_globals per accedere a assembly_data_types se necessario per variabili locali
     # In this case, there are no local variables defined with directives.
@@ -28,6 +49,15 @@ no_overflow
     RTS"""
 
 
+def overflow_trap():
+    # Shared target of the inline overflow checks emitted after 16-bit add/sub
+    # (BVC *+5 / JMP overflow_trap), so the no-overflow path costs one branch.
+    return """
+overflow_trap
+    JSR overflow_error_msg
+    JMP end_program"""
+
+
 def overflow_error_msg():
     assembly_code = [
         f"overflow_error_msg",
@@ -37,7 +67,7 @@ def overflow_error_msg():
         "    STA temp_0+1",
         "    JMP print_string",
     ]
-    return "\n".join(assembly_code)
+    return "\n".join(assembly_code + _message_data('overflow_msg'))
 
 
 def division_by_zero_msg():
@@ -49,7 +79,7 @@ def division_by_zero_msg():
         "    STA temp_0+1",
         "    JMP print_string",
     ]
-    return "\n".join(assembly_code)
+    return "\n".join(assembly_code + _message_data('division_by_zero_msg_string'))
 
 
 def generic_error_msg():
@@ -61,7 +91,7 @@ def generic_error_msg():
         "    STA temp_0+1",
         "    JMP print_string",
     ]
-    return "\n".join(assembly_code)
+    return "\n".join(assembly_code + _message_data('error_msg'))
 
 
 def error_handler():
@@ -123,7 +153,160 @@ print_char
     ; Preserves: X, Y (CHROUT preserva X, Y)
 
     JSR ascii_to_petscii    ; Convert A from ASCII to PETSCII. A is now PETSCII.
-    JSR chrout              ; Call KERNAL CHROUT routine (address defined in data section)
+    JSR {app_globals.CHROUT_ADDRESS}              ; Call KERNAL CHROUT routine
+    RTS
+"""
+
+
+def print_newline():
+    return f"""
+print_newline
+    LDA #$0D                ; PETSCII carriage return
+    JMP {app_globals.CHROUT_ADDRESS}
+"""
+
+
+def print_space():
+    return f"""
+print_space
+    LDA #$20
+    JMP {app_globals.CHROUT_ADDRESS}
+"""
+
+
+def print_string_from_zp():
+    zp_addr = f"${app_globals.PRINT_STRING_ZP_BASE_PTR:02X}"
+    return f"""
+print_string_from_zp
+    ; Prints the NUL-terminated string whose address is in {zp_addr}/{zp_addr}+1
+    LDY #$00
+print_string_from_zp_loop
+    LDA ({zp_addr}),Y
+    BEQ print_string_from_zp_end
+    JSR print_char          ; Preserves Y
+    INY
+    BNE print_string_from_zp_loop
+    INC {zp_addr}+1         ; Next 256-byte page
+    JMP print_string_from_zp_loop
+print_string_from_zp_end
+    RTS
+"""
+
+
+def _integer_to_decimal(label, emit):
+    # Body shared by print_integer and fstr_cat_int: `emit` is the routine
+    # that outputs the character in A; it must preserve X.
+    return f"""
+{label}
+    ; Outputs the signed 16-bit integer in X (low byte) / A (high byte) in decimal.
+    ; Digits come from repeated subtraction of 10000, 1000, 100 and 10;
+    ; leading zeros are skipped and the units digit is always output.
+    STX {label}_value
+    STA {label}_value+1
+    CMP #$80
+    BCC {label}_positive
+    LDA #'-'
+    JSR {emit}
+    SEC
+    LDA #$00
+    SBC {label}_value
+    STA {label}_value
+    LDA #$00
+    SBC {label}_value+1
+    STA {label}_value+1
+{label}_positive
+    LDA #$00
+    STA {label}_started
+    LDX #$00                ; Index of the power of ten
+{label}_digit
+    LDY #'0'                ; The digit, counted in ASCII
+{label}_subtract
+    LDA {label}_value
+    SEC
+    SBC {label}_powers_lo,X
+    STA {label}_scratch
+    LDA {label}_value+1
+    SBC {label}_powers_hi,X
+    BCC {label}_emit
+    STA {label}_value+1
+    LDA {label}_scratch
+    STA {label}_value
+    INY
+    BNE {label}_subtract
+{label}_emit
+    TYA
+    CMP #'0'
+    BNE {label}_output
+    LDY {label}_started
+    BEQ {label}_next  ; Leading zero
+{label}_output
+    STA {label}_started
+    JSR {emit}            ; Preserves X
+{label}_next
+    INX
+    CPX #$04
+    BNE {label}_digit
+    LDA {label}_value
+    ORA #'0'
+    JMP {emit}
+
+{label}_powers_lo:
+    .byte <10000, <1000, <100, <10
+{label}_powers_hi:
+    .byte >10000, >1000, >100, >10
+{label}_value:
+    .byte 0, 0
+{label}_scratch:
+    .byte 0
+{label}_started:
+    .byte 0
+"""
+
+
+def print_integer():
+    return _integer_to_decimal("print_integer", app_globals.CHROUT_ADDRESS)
+
+
+def fstr_cat_int():
+    return _integer_to_decimal("fstr_cat_int", "fstr_put_char")
+
+
+def fstr_put_char():
+    return f"""
+fstr_put_char
+    ; Appends the character in A to the f-string buffer at (FSTRING_DEST_ZP_PTR)
+    ; and advances the pointer. Preserves X.
+    LDY #$00
+    STA (${app_globals.FSTRING_DEST_ZP_PTR:02X}),Y
+    INC ${app_globals.FSTRING_DEST_ZP_PTR:02X}
+    BNE fstr_put_char_done
+    INC ${app_globals.FSTRING_DEST_ZP_PTR + 1:02X}
+fstr_put_char_done
+    RTS
+"""
+
+
+def fstr_cat_str():
+    return f"""
+fstr_cat_str
+    ; Appends the null-terminated string at (FSTRING_SRC_ZP_PTR) to the f-string
+    ; buffer at (FSTRING_DEST_ZP_PTR), without its terminator, and advances the
+    ; destination pointer past the copied characters (at most 255).
+    LDY #$00
+fstr_cat_str_loop
+    LDA (${app_globals.FSTRING_SRC_ZP_PTR:02X}),Y
+    BEQ fstr_cat_str_done
+    STA (${app_globals.FSTRING_DEST_ZP_PTR:02X}),Y
+    INY
+    BNE fstr_cat_str_loop
+fstr_cat_str_done
+    TYA
+    CLC
+    ADC ${app_globals.FSTRING_DEST_ZP_PTR:02X}
+    STA ${app_globals.FSTRING_DEST_ZP_PTR:02X}
+    BCC fstr_cat_str_end
+    INC ${app_globals.FSTRING_DEST_ZP_PTR + 1:02X}
+fstr_cat_str_end
     RTS
 """
 
@@ -131,8 +314,11 @@ print_char
 routines_map = {
     'divide': lambda: divide(),
     'multiply': lambda: multiply(),
-    'multiply16x16_16': lambda: multiply16x16_16(),
+    'multiply16x16_16': lambda: multiply16x16_16_table() if multiply_variant() == 'table' else multiply16x16_16(),
     'divide16x16_16': lambda: divide16x16_16(),
+    'multiply16x16_32': lambda: multiply16x16_32_table() if multiply_variant() == 'table' else multiply16x16_32(),
+    'mul8x8_qs': lambda: mul8x8_qs(),
+    'quarter_square_tables': lambda: quarter_square_tables(),
     'end_program': lambda: end_program(),
     'error_handler': lambda: error_handler(),
     'print_error_message': lambda: print_error_message(),
@@ -142,8 +328,16 @@ routines_map = {
     'key_error_msg': lambda: key_error_msg(),
     'compare_string_const': lambda: compare_string_const(),
     'check_overflow': lambda: check_overflow(),
+    'overflow_trap': lambda: overflow_trap(),
     'print_string': lambda: print_string(),
     'print_char': lambda: print_char(),
+    'print_newline': lambda: print_newline(),
+    'print_space': lambda: print_space(),
+    'print_string_from_zp': lambda: print_string_from_zp(),
+    'print_integer': lambda: print_integer(),
+    'fstr_cat_int': lambda: fstr_cat_int(),
+    'fstr_put_char': lambda: fstr_put_char(),
+    'fstr_cat_str': lambda: fstr_cat_str(),
     'read_char': lambda: read_char(),
     'read_string': lambda: read_string(),
     'read_string_loop': lambda: read_string_loop_routine(),
@@ -861,14 +1055,14 @@ read_string_loop
 
     ; Increment the main 'input_pointer' (word variable)
     INC input_pointer
-    BNE rsl_skip_inc_high_${app_globals.label_counter} ; Use a unique label part
+    BNE rsl_skip_inc_high
     INC input_pointer+1
-rsl_skip_inc_high_${app_globals.label_counter}
+rsl_skip_inc_high
     ; Also update the ZP pointer to match for the next iteration or read_string_end
     INC ${app_globals.INPUT_ZP_PTR:02X}
-    BNE rsl_skip_inc_zp_high_${app_globals.label_counter}
+    BNE rsl_skip_inc_zp_high
     INC ${app_globals.INPUT_ZP_PTR+1:02X}
-rsl_skip_inc_zp_high_${app_globals.label_counter}
+rsl_skip_inc_zp_high
     RTS
     """
 
@@ -1007,101 +1201,288 @@ def divide():
     ]
     return "\n".join(assembly_code)
 
-def multiply16x16_16():
-    # Variabili usate (devono essere definite tramite handle_variable in func_expressions.py):
-    # m16_arg1_l, m16_arg1_h: input multiplicand (16-bit)
-    # m16_arg2_l, m16_arg2_h: input multiplier (16-bit)
-    # m16_res_l, m16_res_h: output product (16-bit)
-    # Internals:
-    # m16_p0_l, m16_p0_h: for LSB(arg1)*LSB(arg2) (16-bit)
-    # m16_term2: for LSB(arg1)*MSB(arg2) (8-bit)
-    # m16_term3: for MSB(arg1)*LSB(arg2) (8-bit)
-    # m16_mul8_val1, m16_mul8_val2: used by _multiply8x8_to_16bit_internal helper
-    # multiply_value1, multiply_value2, multiply_result: used by JSR multiply (8x8->8)
+def _m16_sign_prologue():
+    # Shared by both multiply16x16_16 variants: m16_sign keeps the sign of the
+    # product in bit 7 and the unsigned cores work on the magnitudes.
+    return """    LDA m16_arg1_h
+    EOR m16_arg2_h
+    STA m16_sign        ; Bit 7: the product is negative
+    LDA m16_arg1_h
+    BPL _m16_arg1_positive
+    LDA #0
+    SEC
+    SBC m16_arg1_l
+    STA m16_arg1_l
+    LDA #0
+    SBC m16_arg1_h
+    STA m16_arg1_h
+_m16_arg1_positive:
+    LDA m16_arg2_h
+    BPL _m16_arg2_positive
+    LDA #0
+    SEC
+    SBC m16_arg2_l
+    STA m16_arg2_l
+    LDA #0
+    SBC m16_arg2_h
+    STA m16_arg2_h
+_m16_arg2_positive:"""
+
+
+def _m16_sign_epilogue():
+    # The unsigned product in m16_res must fit in 15 bits, or be exactly
+    # 32768 when the result is negative.
+    return """    LDA m16_sign
+    BMI _m16_negate
+    LDA m16_res_h
+    BMI _m16_overflow
+    RTS
+_m16_negate:
+    LDA #0
+    SEC
+    SBC m16_res_l
+    STA m16_res_l
+    LDA #0
+    SBC m16_res_h
+    STA m16_res_h
+    BMI _m16_done       ; -1 .. -32768
+    ORA m16_res_l
+    BNE _m16_overflow   ; The magnitude was above 32768
+_m16_done:
+    RTS
+_m16_overflow:
+    JMP overflow_error_msg"""
 
+
+def multiply16x16_16():
+    # Variabili usate (devono essere definite tramite handle_variable in func_operations.py):
+    # m16_arg1_l, m16_arg1_h: input multiplicand (signed 16-bit)
+    # m16_arg2_l, m16_arg2_h: input multiplier (signed 16-bit, destroyed)
+    # m16_res_l, m16_res_h: output product (signed 16-bit)
+    # m16_p0_l, m16_p0_h: high word of the 32-bit unsigned product
+    # m16_sign: sign of the product
     return f"""
 multiply16x16_16
-    ; Multiplies m16_arg1 by m16_arg2, 16-bit result in m16_res.
-    ; Handles overflow by jumping to overflow_error_msg.
-
-    ; --- Local subroutine: _multiply8x8_to_16bit_internal ---
-    ; Input: Accumulatore (A) = fattore1, Registro X = fattore2
-    ; Output: m16_p0_h (MSB prodotto), m16_p0_l (LSB prodotto)
-    ; Usa: m16_mul8_val1, m16_mul8_val2 come temporanei
-_m16_mul8_16_start:
-    STA m16_mul8_val1   ; Salva fattore1 (Label definition)
-    STX m16_mul8_val2   ; Salva fattore2 (Label definition)
+    ; Multiplies m16_arg1 by m16_arg2 (signed), 16-bit result in m16_res.
+    ; Shift-and-add on the magnitudes; a product outside -32768..32767
+    ; jumps to overflow_error_msg.
+{_m16_sign_prologue()}
     LDA #0
-    STA m16_p0_l        ; LSB of partial product (Label definition)
-    LDX #8              ; Contatore di bit (Y non usato per evitare conflitti se chiamato da Y) (Label definition)
-_m16_mul8_16_loop:
-    LSR m16_mul8_val2   ; Bit meno significativo del moltiplicatore in Carry (Label definition)
-    BCC _m16_mul8_16_no_add (Label definition)
-    LDA m16_p0_l        ; Somma il moltiplicando (m16_mul8_val1) al LSB del prodotto
+    STA m16_p0_l
+    STA m16_p0_h
+    LDX #16
+_m16_loop:
+    LSR m16_arg2_h
+    ROR m16_arg2_l
+    BCC _m16_no_add
+    LDA m16_p0_l
     CLC
-    ADC m16_mul8_val1
+    ADC m16_arg1_l
     STA m16_p0_l
-    LDA m16_p0_h        ; Somma il riporto al MSB del prodotto
-    ADC #0
+    LDA m16_p0_h
+    ADC m16_arg1_h
     STA m16_p0_h
-_m16_mul8_16_no_add: (Label definition)
-    ROR m16_p0_h        ; Scorrimento a destra del prodotto (MSB) (Label definition)
-    ROR m16_p0_l        ; Scorrimento a destra del prodotto (LSB) (Label definition)
-    DEX (Label definition)
-    BNE _m16_mul8_16_loop (Label definition)
-    ; Result of 8x8->16bit is in m16_p0_h, m16_p0_l
-    ; End of local subroutine
-
-    ; Calculate P0 = LSB(arg1) * LSB(arg2) -> m16_p0_l, m16_p0_h
-    LDA m16_arg1_l
-    LDX m16_arg2_l
-    JSR _m16_mul8_16_start ; Call the local subroutine
-    ; m16_p0_l and m16_p0_h contain the result
-
+_m16_no_add:
+    ROR m16_p0_h
+    ROR m16_p0_l
+    ROR m16_res_h
+    ROR m16_res_l
+    DEX
+    BNE _m16_loop
     LDA m16_p0_l
-    STA m16_res_l       ; LSB of final result = LSB(P0)
+    ORA m16_p0_h
+    BNE _m16_overflow   ; The product needs more than 16 bits
+{_m16_sign_epilogue()}
+"""
 
-    ; Save MSB(P0) temporarily for subsequent sums
-    LDA m16_p0_h
-    STA m16_term2       ; Use m16_term2 for MSB(P0) initially
+def multiply16x16_32():
+    # Variabili usate (definite tramite handle_variable in func_operations.py):
+    # m32_arg1_l, m32_arg1_h: input multiplicand (16-bit)
+    # m32_arg2_l, m32_arg2_h: input multiplier (16-bit, destroyed)
+    # m32_res0..m32_res3: output product (32-bit, m32_res0 = LSB)
+    # Used by the reciprocal multiplication that replaces division by a constant.
+    return f"""
+multiply16x16_32
+    ; Multiplies m32_arg1 by m32_arg2, full 32-bit result in m32_res0..3.
+    ; Shift-and-add: each multiplier bit adds the multiplicand to the high
+    ; word, then the whole product is rotated right one bit.
+    LDA #0
+    STA m32_res2
+    STA m32_res3
+    LDX #16
+_m32_loop:
+    LSR m32_arg2_h
+    ROR m32_arg2_l
+    BCC _m32_no_add
+    LDA m32_res2
+    CLC
+    ADC m32_arg1_l
+    STA m32_res2
+    LDA m32_res3
+    ADC m32_arg1_h
+    STA m32_res3
+_m32_no_add:
+    ROR m32_res3
+    ROR m32_res2
+    ROR m32_res1
+    ROR m32_res0
+    DEX
+    BNE _m32_loop
+    RTS
+"""
 
-    ; Calculate term2_val = LSB(arg1) * MSB(arg2) (8-bit result)
-    ; Use the 'multiply' routine (8x8 -> 8 bit, input A,X, output A)
-    LDA m16_arg1_l
-    LDX m16_arg2_h      ; MSB of the second argument
-    JSR multiply        ; Result in A (from multiply_result)
-    ; Add this to m16_term2 (which contains MSB(P0))
+# --- Quarter-square multiplication ---
+# a * b == f(a + b) - f(|a - b|) with f(n) = floor(n*n / 4), so an 8x8 product
+# costs two table lookups and a subtraction instead of eight shift-and-add
+# steps. The tables take 1 KB; compiler_options['multiply'] selects them.
+
+MULTIPLY_VARIANTS = ('bitserial', 'table')
+
+
+def multiply_variant():
+    """Returns the multiply routine family selected by compiler_options['multiply']."""
+    variant = app_globals.compiler_options.get('multiply', 'bitserial')
+    if variant not in MULTIPLY_VARIANTS:
+        app_globals.report_compiler_error(
+            f"Unknown multiply variant '{variant}', using 'bitserial'. Choose one of {MULTIPLY_VARIANTS}.",
+            level="WARNING")
+        return 'bitserial'
+    return variant
+
+
+def quarter_square_tables():
+    # qsq_lo/qsq_hi: low/high bytes of floor(n*n/4) for n = 0..511
+    squares = [n * n // 4 for n in range(512)]
+    lines = ["quarter_square_tables"]
+    for label, part in (("qsq_lo", lambda v: v & 0xFF), ("qsq_hi", lambda v: v >> 8)):
+        lines.append(label)
+        for row in range(0, 512, 16):
+            lines.append("    .byte " + ", ".join(f"${part(v):02X}" for v in squares[row:row + 16]))
+    return "\n".join(lines)
+
+
+def mul8x8_qs():
+    # Variabili usate: qs_a, qs_b (fattori), qs_prod_l, qs_prod_h (prodotto a 16 bit)
+    return f"""
+mul8x8_qs
+    ; Unsigned 8x8 -> 16 bit multiply: A * X -> qs_prod_l/qs_prod_h. Uses Y.
+    STA qs_a
+    STX qs_b
     CLC
-    ADC m16_term2
-    STA m16_term2       ; m16_term2 ora = MSB(P0) + (LSB(arg1)*MSB(arg2))
-    BCS _m16_overflow   ; If there's a carry, overflow of the 16-bit result
+    ADC qs_b            ; A = low byte of a+b, Carry = bit 8
+    TAY
+    BCC _qs_sum_low
+    LDA qsq_lo+256,Y    ; f(a+b) for a+b >= 256
+    STA qs_prod_l
+    LDA qsq_hi+256,Y
+    STA qs_prod_h
+    JMP _qs_difference
+_qs_sum_low:
+    LDA qsq_lo,Y        ; f(a+b) for a+b < 256
+    STA qs_prod_l
+    LDA qsq_hi,Y
+    STA qs_prod_h
+_qs_difference:
+    LDA qs_a
+    SEC
+    SBC qs_b            ; a-b
+    BCS _qs_difference_positive
+    EOR #$FF            ; Carry is clear: ~d + 1 = -d = |a-b|
+    ADC #1
+_qs_difference_positive:
+    TAY
+    LDA qs_prod_l       ; product = f(a+b) - f(|a-b|)
+    SEC
+    SBC qsq_lo,Y
+    STA qs_prod_l
+    LDA qs_prod_h
+    SBC qsq_hi,Y
+    STA qs_prod_h
+    RTS
+"""
+
 
-    ; Calculate term3_val = MSB(arg1) * LSB(arg2) (8-bit result)
-    LDA m16_arg1_h      ; MSB of the first argument
+def multiply16x16_16_table():
+    # Same interface as multiply16x16_16 (m16_arg1, m16_arg2 -> m16_res),
+    # with the same sign handling around an unsigned quarter-square core.
+    return f"""
+multiply16x16_16
+    ; Multiplies m16_arg1 by m16_arg2 (signed), 16-bit result in m16_res (quarter squares).
+    ; Handles overflow by jumping to overflow_error_msg.
+{_m16_sign_prologue()}
+    LDA m16_arg1_l
+    LDX m16_arg2_l
+    JSR mul8x8_qs       ; LSB(arg1) * LSB(arg2)
+    LDA qs_prod_l
+    STA m16_res_l
+    LDA qs_prod_h
+    STA m16_res_h
+    LDA m16_arg1_h
+    BEQ _m16q_arg1_small
+    LDX m16_arg2_h
+    BNE _m16_overflow   ; MSB(arg1) * MSB(arg2) does not fit in 16 bits
     LDX m16_arg2_l
-    JSR multiply        ; Result in A
-    ; Add this to m16_term2
+    JSR mul8x8_qs       ; MSB(arg1) * LSB(arg2)
+    JMP _m16q_add_cross
+_m16q_arg1_small:
+    LDA m16_arg2_h
+    BEQ _m16q_done
+    LDX m16_arg1_l
+    JSR mul8x8_qs       ; MSB(arg2) * LSB(arg1)
+_m16q_add_cross:
+    LDA qs_prod_h
+    BNE _m16_overflow
+    LDA qs_prod_l
     CLC
-    ADC m16_term2
-    STA m16_res_h       ; Questo è il MSB del risultato finale
-    BCS _m16_overflow   ; Se c'è riporto, overflow
+    ADC m16_res_h
+    STA m16_res_h
+    BCS _m16_overflow
+_m16q_done:
+{_m16_sign_epilogue()}
+"""
 
-    ; Controllo finale: se MSB(arg1) != 0 E MSB(arg2) != 0, allora c'è overflow
-    ; perché il termine MSB(arg1)*MSB(arg2) sarebbe >> 16 bit.
-    LDA m16_arg1_h
-    BEQ _m16_no_final_overflow ; If MSB(arg1) is 0, no overflow from this term
-    LDA m16_arg2_h (Label definition)
-    BEQ _m16_no_final_overflow ; If MSB(arg2) is 0, no overflow from this term
-    ; Se entrambi MSB non sono zero, allora overflow
-    JMP _m16_overflow
 
-_m16_no_final_overflow: (Label definition)
+def multiply16x16_32_table():
+    # Same interface as multiply16x16_32 (m32_arg1, m32_arg2 -> m32_res0..3).
+    return f"""
+multiply16x16_32
+    ; Multiplies m32_arg1 by m32_arg2, full 32-bit result in m32_res0..3 (quarter squares).
+    LDA m32_arg1_l
+    LDX m32_arg2_l
+    JSR mul8x8_qs       ; low * low -> bytes 0-1
+    LDA qs_prod_l
+    STA m32_res0
+    LDA qs_prod_h
+    STA m32_res1
+    LDA m32_arg1_h
+    LDX m32_arg2_h
+    JSR mul8x8_qs       ; high * high -> bytes 2-3
+    LDA qs_prod_l
+    STA m32_res2
+    LDA qs_prod_h
+    STA m32_res3
+    LDA m32_arg1_l
+    LDX m32_arg2_h
+    JSR mul8x8_qs       ; cross products -> bytes 1-3
+    JSR _m32q_add_middle
+    LDA m32_arg1_h
+    LDX m32_arg2_l
+    JSR mul8x8_qs
+_m32q_add_middle:
+    LDA qs_prod_l
+    CLC
+    ADC m32_res1
+    STA m32_res1
+    LDA qs_prod_h
+    ADC m32_res2
+    STA m32_res2
+    BCC _m32q_no_carry
+    INC m32_res3
+_m32q_no_carry:
     RTS
-
-_m16_overflow:
-    JMP overflow_error_msg
 """
 
+
 def divide16x16_16():
     # Variabili usate (devono essere definite tramite handle_variable in func_expressions.py):
     # d16_orig_dividend_l, d16_orig_dividend_h: input dividendo (16-bit)
@@ -1144,7 +1525,7 @@ _d16_div_loop:
     ROL d16_quotient_h
 
     ; Shift remainder left and insert the most significant bit of the original dividend
-    ASL d16_orig_dividend_l (Label definition)
+    ASL d16_orig_dividend_l
     ROL d16_orig_dividend_h   ; The MSB of the original dividend goes into Carry
     ROL d16_rem_l             ; The Carry (dividend bit) enters the LSB of the remainder
     ROL d16_rem_h             ; Shift the remainder
@@ -1152,7 +1533,7 @@ _d16_div_loop:
     ; Compare Remainder (d16_rem) with Divisor (d16_divisor)
     ; If Remainder >= Divisor: Remainder = Remainder - Divisor; LSB quotient = 1
     SEC
-    LDA d16_rem_l (Label definition)
+    LDA d16_rem_l
     SBC d16_divisor_l
     TAY                     ; Salva LSB di (Resto - Divisore)
     LDA d16_rem_h
@@ -1165,10 +1546,10 @@ _d16_div_loop:
     STY d16_rem_l           ; Store LSB of the new remainder
     INC d16_quotient_l      ; Imposta il bit corrente del quoziente a 1
 
-_d16_remainder_less: (Label definition)
-    DEX (Label definition)
-    BNE _d16_div_loop (Label definition)
-    RTS (Label definition)
+_d16_remainder_less:
+    DEX
+    BNE _d16_div_loop
+    RTS
 """
 
 def end_program():
@@ -1188,7 +1569,7 @@ def key_error_msg():
         "    STA temp_0+1",
         "    JMP print_string",
     ]
-    return "\n".join(assembly_code)
+    return "\n".join(assembly_code + _message_data('key_error_msg_string'))
 
 def attribute_error_msg():
     assembly_code = [
@@ -1199,7 +1580,7 @@ def attribute_error_msg():
         "    STA temp_0+1",
         "    JMP print_string",
     ]
-    return "\n".join(assembly_code)
+    return "\n".join(assembly_code + _message_data('attribute_error_msg_string'))
 
 def not_implemented_error_msg():
     assembly_code = [
@@ -1210,7 +1591,7 @@ def not_implemented_error_msg():
         "    STA temp_0+1",
         "    JMP print_string",
     ]
-    return "\n".join(assembly_code)
+    return "\n".join(assembly_code + _message_data('not_implemented_error_msg_string'))
 
 def value_error_msg(): # New routine for ValueError
     assembly_code = [
@@ -1221,7 +1602,7 @@ def value_error_msg(): # New routine for ValueError
         "    STA temp_0+1",
         "    JMP print_string",
     ]
-    return "\n".join(assembly_code)
+    return "\n".join(assembly_code + _message_data('value_error_msg_string'))
 
 
 
@@ -1253,10 +1634,8 @@ def global_unhandled_exception_routine():
     Handles exceptions not caught by any try/except block.
     Prints a generic message and terminates.
     """
-    # Ensure 'unhandled_exc_msg_string' is defined in data_definitions
-    # when this routine is used.
-    app_globals.data_definitions.append(f"unhandled_exc_msg_string {app_globals.assembly_data_types['asciiz']} \"Unhandled error!\"")
-
+    # The message travels with the routine, like the *_error_msg routines: routines are
+    # linked after the data segment is built, so they must not add data definitions
     return f"""
 global_unhandled_exception_routine
     LDA #<unhandled_exc_msg_string
@@ -1265,12 +1644,16 @@ global_unhandled_exception_routine
     STA temp_0+1
     JSR print_string
     JMP end_program
+unhandled_exc_msg_string
+    {app_globals.assembly_data_types['asciiz']} "Unhandled error!"
+    {app_globals.assembly_data_types['byte']} 0
 """
 
 # Dizionario delle dipendenze tra routine
 # Dictionary of dependencies between routines
 routine_dependencies = {
     'check_overflow': {'overflow_error_msg', 'end_program'}, # end_program se check_overflow fa JMP end_program
+    'overflow_trap': {'overflow_error_msg', 'end_program'},
     'overflow_error_msg': {'print_string'},
     'division_by_zero_msg': {'print_string'},
     'key_error_msg': {'print_string'},
@@ -1279,6 +1662,8 @@ routine_dependencies = {
     'value_error_msg': {'print_string'}, # New
     'generic_error_msg': {'print_string'},
         'print_string': {'print_char'},
+    'print_string_from_zp': {'print_char'},
+    'fstr_cat_int': {'fstr_put_char'},
     'error_handler': {'print_error_message', 'end_program'},
     'print_error_message': { # Depends on which errors it handles
         'overflow_error_msg',
@@ -1291,8 +1676,12 @@ routine_dependencies = {
     },
     'check_division_by_zero': {'error_handler', 'division_by_zero_msg'}, # se chiama error_handler
     'read_string': {'read_char', 'check_max_len', 'read_string_loop', 'read_string_end'},
-    'multiply16x16_16': {'multiply', 'overflow_error_msg'}, # Depends on 8x8->8 multiply and its own error handling
+    'multiply16x16_16': {'overflow_error_msg'},
     'divide16x16_16': {'division_by_zero_msg'}, # Handles its own div by zero
+    'mul8x8_qs': {'quarter_square_tables'},
+    'gfx_draw_line': {'gfx_plot_point'}, # Plots every point of the line
+    'gfx_plot_point': {'gfx_plot_tables'},
+    'gfx_unplot_point': {'gfx_plot_tables'}, # Shares the lookup tables with gfx_plot_point
     # Wozniak/Apple II FP Dependencies
     'FP_FADD': {'FP_ALGNSWP', 'FP_ADD_MANT', 'FP_NORM', 'FP_RTLOG', 'FP_OVFL_HANDLER'},
     'FP_FSUB': {'FP_SWAP', 'FP_FCOMPL', 'FP_FADD'},
@@ -1392,18 +1781,39 @@ def print_error_message():
     ]
     return "\n".join(assembly_code)
 
-def get_all_required_routines(initial_routines_set):
-    all_routines = set(initial_routines_set)
-    queue = list(initial_routines_set)
-
-    idx = 0
-    while idx < len(queue):
-        routine_name = queue[idx]
-        idx += 1
-
-        if routine_name in routine_dependencies:
-            for dep in routine_dependencies[routine_name]:
-                if dep not in all_routines:
-                    all_routines.add(dep)
+# Dependencies that replace routine_dependencies when a routine variant is selected
+table_multiply_dependencies = {
+    'multiply16x16_16': {'mul8x8_qs', 'overflow_error_msg'},
+    'multiply16x16_32': {'mul8x8_qs'},
+}
+
+
+def _dependency_closures(variant):
+    """For every routine, the set of the routine and all the routines it needs, transitively."""
+    dependencies = dict(routine_dependencies)
+    if variant == 'table':
+        dependencies.update(table_multiply_dependencies)
+    names = set(routines_map) | set(c64_routine_library.ROUTINE_GENERATORS) | set(dependencies)
+    closures = {}
+    for name in names:
+        closure = {name}
+        queue = [name]
+        while queue:
+            for dep in dependencies.get(queue.pop(), ()):
+                if dep not in closure:
+                    closure.add(dep)
                     queue.append(dep)
+        closures[name] = frozenset(closure)
+    return closures
+
+
+# Computed once at import, for each multiply variant: linking only takes their union
+DEPENDENCY_CLOSURES = {variant: _dependency_closures(variant) for variant in MULTIPLY_VARIANTS}
+
+
+def get_all_required_routines(initial_routines_set):
+    closures = DEPENDENCY_CLOSURES[multiply_variant()]
+    all_routines = set()
+    for routine_name in initial_routines_set:
+        all_routines |= closures.get(routine_name, {routine_name})
     return all_routines
@@ -0,0 +1,194 @@
+# py2c64/lib/temp_allocation.py
+# Storage assignment for temporary variables.
+# Runs on the emitted program code once code generation is complete:
+#   1. splits the code into the main program and one region per user function,
+#   2. computes the live range of every temp in its region (first to last
+#      reference, widened over the body of any loop it is live in),
+#   3. builds the interference graph of overlapping live ranges and colors it,
+#      so temps that are never live at the same time share the same bytes,
+#   4. renames the temps to their slots and reserves each slot once, sized to
+#      the largest value it holds (2 bytes for int/pointer, 4 for float).
+
+import re
+import V1.globals as globals
+from lib.func_core import _generate_res_definition
+
+TEMP_NAME_RE = re.compile(r'\btemp_(\d+)\b')
+LABEL_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*):?$')
+JUMP_OPCODES = {'BCC', 'BCS', 'BEQ', 'BNE', 'BMI', 'BPL', 'BVC', 'BVS', 'JMP'}
+
+
+def _temp_size(var_info):
+    """Returns the bytes a temp really needs, based on what was stored in it."""
+    if var_info.get('type') == 'float' or var_info.get('is_float'):
+        return 4
+    return max(var_info.get('size', 2), 2)
+
+
+def _split_regions(lines):
+    """
+    Returns a list with the region name of every line: the name of the user
+    function whose body contains it, or None for the main program.
+    """
+    regions = [None] * len(lines)
+    for func_name, func_info in globals.defined_functions.items():
+        start = end = None
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            if start is None and stripped == f"{func_info['label']}:":
+                start = i
+            elif start is not None and stripped == f"{func_info['ret_label']}:":
+                end = i
+            elif end is not None and stripped.upper().startswith('RTS'):
+                end = i
+                break
+        if start is not None and end is not None:
+            for i in range(start, end + 1):
+                regions[i] = func_name
+    return regions
+
+
+def _instruction(line):
+    """Returns (opcode, operand) of an instruction line, or (None, None)."""
+    code = line.split(';')[0].strip()
+    if not code or LABEL_RE.match(code):
+        return None, None
+    parts = code.split(None, 1)
+    return parts[0].upper(), (parts[1].strip() if len(parts) > 1 else '')
+
+
+def _live_intervals(lines, indices, temp_names):
+    """Returns {temp: [first, last]} over the given line indices of one region."""
+    intervals = {}
+    for position, i in enumerate(indices):
+        for match in TEMP_NAME_RE.finditer(lines[i].split(';')[0]):
+            name = match.group(0)
+            if name not in temp_names:
+                continue
+            if name in intervals:
+                intervals[name][1] = position
+            else:
+                intervals[name] = [position, position]
+    return intervals
+
+
+def _extend_over_loops(lines, indices, intervals):
+    """
+    A temp that is live anywhere inside a loop (a backward jump) must stay live
+    for the whole loop, or the next iteration would read a clobbered value.
+    """
+    label_positions = {}
+    for position, i in enumerate(indices):
+        match = LABEL_RE.match(lines[i].split(';')[0].strip())
+        if match:
+            label_positions[match.group(1)] = position
+
+    loops = []
+    for position, i in enumerate(indices):
+        opcode, operand = _instruction(lines[i])
+        if opcode in JUMP_OPCODES and operand in label_positions and label_positions[operand] <= position:
+            loops.append((label_positions[operand], position))
+
+    changed = True
+    while changed:
+        changed = False
+        for loop_start, loop_end in loops:
+            for interval in intervals.values():
+                if interval[0] <= loop_end and loop_start <= interval[1]:
+                    if interval[0] > loop_start or interval[1] < loop_end:
+                        interval[0] = min(interval[0], loop_start)
+                        interval[1] = max(interval[1], loop_end)
+                        changed = True
+
+
+def _build_interference_graph(intervals):
+    """Two temps interfere when their live ranges overlap."""
+    graph = {name: set() for name in intervals}
+    names = sorted(intervals)
+    for a_index, a in enumerate(names):
+        for b in names[a_index + 1:]:
+            if intervals[a][0] <= intervals[b][1] and intervals[b][0] <= intervals[a][1]:
+                graph[a].add(b)
+                graph[b].add(a)
+    return graph
+
+
+def _color(intervals, graph, sizes):
+    """
+    Greedy coloring in order of live range start (optimal for interval graphs).
+    Prefers a free slot of the same size, then a bigger one, then grows a
+    smaller one; opens a new slot only when every slot holds a neighbour.
+    Returns ({temp: slot_index}, [slot_size, ...]).
+    """
+    assignment = {}
+    slot_sizes = []
+    for name in sorted(intervals, key=lambda n: (intervals[n][0], int(n.split('_')[1]))):
+        busy = {assignment[neighbour] for neighbour in graph[name] if neighbour in assignment}
+        free = [slot for slot in range(len(slot_sizes)) if slot not in busy]
+        size = sizes[name]
+        free.sort(key=lambda slot: (slot_sizes[slot] != size, slot_sizes[slot] < size, slot))
+        if free:
+            slot = free[0]
+            slot_sizes[slot] = max(slot_sizes[slot], size)
+        else:
+            slot = len(slot_sizes)
+            slot_sizes.append(size)
+        assignment[name] = slot
+    return assignment, slot_sizes
+
+
+def allocate_temporaries(program_lines):
+    """
+    Assigns storage to every pool temp referenced in `program_lines`.
+    Returns (rewritten_lines, stats) where stats holds the temp memory used
+    with the old LIFO pool ('bytes_before', 4 bytes per temp held at the same
+    time) and after coloring ('bytes_after').
+    """
+    temp_names = {name for name, info in globals.variables.items() if info.get('scope') == 'temp'}
+    regions = _split_regions(program_lines)
+
+    # Temps are colored per region; a temp seen in several regions keeps its own slot.
+    region_of_temp = {}
+    for i, line in enumerate(program_lines):
+        for match in TEMP_NAME_RE.finditer(line.split(';')[0]):
+            name = match.group(0)
+            if name in temp_names:
+                region = region_of_temp.setdefault(name, regions[i])
+                if region != regions[i]:
+                    region_of_temp[name] = ('shared', name)
+
+    renames = {}
+    slot_sizes = []
+    for region in sorted({r for r in region_of_temp.values()}, key=repr):
+        members = {name for name, r in region_of_temp.items() if r == region}
+        indices = [i for i, r in enumerate(regions) if r == region] if not isinstance(region, tuple) else list(range(len(program_lines)))
+        intervals = _live_intervals(program_lines, indices, members)
+        _extend_over_loops(program_lines, indices, intervals)
+        sizes = {name: _temp_size(globals.variables[name]) for name in intervals}
+        assignment, region_slot_sizes = _color(intervals, _build_interference_graph(intervals), sizes)
+        for name, slot in assignment.items():
+            renames[name] = f"temp_{globals.FIRST_POOL_TEMP + len(slot_sizes) + slot}"
+        slot_sizes.extend(region_slot_sizes)
+
+    rewritten = [TEMP_NAME_RE.sub(lambda m: renames.get(m.group(0), m.group(0)), line) for line in program_lines]
+
+    # Replace the virtual temps with their slots in the variable table
+    for name in temp_names:
+        del globals.variables[name]
+    for index, size in enumerate(slot_sizes):
+        slot_name = f"temp_{globals.FIRST_POOL_TEMP + index}"
+        globals.variables[slot_name] = {'scope': 'temp_slot', 'type': 'any', 'size': size}
+        if globals.memory_pointer + size > globals.MAX_MEMORY:
+            globals.report_compiler_error(f"Out of memory allocating temporary '{slot_name}' (size {size}).", level="ERROR")
+            break
+        globals.variables[slot_name]['address'] = globals.memory_pointer
+        globals.memory_pointer += size
+        globals.data_definitions.append(_generate_res_definition(slot_name, size))
+
+    stats = {
+        'temps': len(renames),
+        'slots': len(slot_sizes),
+        'bytes_before': globals.temp_var_peak * 4,
+        'bytes_after': sum(slot_sizes),
+    }
+    return rewritten, stats
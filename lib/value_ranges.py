@@ -0,0 +1,476 @@
+# py2c64/lib/value_ranges.py
+# Value-range analysis.
+# Computes, for every integer variable, an interval that holds every value it
+# is ever assigned, and annotates each expression node of the AST with the
+# interval of its result. Expressions and variables whose range fits in a byte
+# (0..255) are then compiled to single-byte operations: no high-byte
+# arithmetic and no overflow check, since the result cannot leave the byte.
+#
+# The analysis is flow-insensitive per variable (the range of a variable is
+# the hull of all its assignments) but uses the comparisons guarding an
+# if/while body to narrow the variables inside it, so the usual
+#     i = 0
+#     while i < 100:
+#         i = i + 1
+# gives i the range 0..100. A guard holds until its variable is assigned, and
+# does not reach into a loop that assigns the variable anywhere (or calls a
+# user function, for a global): the next iteration would read the new value.
+# Sources of ranges are literals, range() bounds,
+# masks (x & 0xFF), modulo, guarding comparisons, the arguments passed to
+# user functions and the C64 hardware functions that return a byte.
+#
+# Arguments passed to C64 function parameters declared 'size': 8 only need
+# their low byte, which add/sub/and/or/xor compute exactly from the low bytes
+# of their operands: those expressions are evaluated in 8 bits too.
+
+import ast
+import V1.globals as globals
+from lib.func_core import resolve_variable_name, _get_mangled_local_var_name
+from lib.c64_function_specs import C64_FUNCTION_SPECS, C64_HARDWARE_ALIASES
+
+BYTE_RANGE = (0, 255)
+# Anything outside this interval is beyond a 16-bit variable: the range is lost
+WORD_RANGE = (-32768, 65535)
+MAX_ITERATIONS = 30
+
+# Operations whose low result byte only depends on the low bytes of the operands
+BYTE_OPS = (ast.Add, ast.Sub, ast.BitAnd, ast.BitOr, ast.BitXor)
+
+NEGATED_COMPARISONS = {ast.Lt: ast.GtE, ast.GtE: ast.Lt, ast.Gt: ast.LtE, ast.LtE: ast.Gt, ast.Eq: ast.NotEq, ast.NotEq: ast.Eq}
+MIRRORED_COMPARISONS = {ast.Lt: ast.Gt, ast.Gt: ast.Lt, ast.LtE: ast.GtE, ast.GtE: ast.LtE, ast.Eq: ast.Eq, ast.NotEq: ast.NotEq}
+
+
+def _c64_spec(func_name):
+    return C64_FUNCTION_SPECS.get(C64_HARDWARE_ALIASES.get(func_name, func_name))
+
+
+def _clamp(low, high):
+    """Returns the interval, or WORD_RANGE when it does not fit in 16 bits."""
+    if low < WORD_RANGE[0] or high > WORD_RANGE[1]:
+        return WORD_RANGE
+    return (low, high)
+
+
+def _hull(a, b):
+    if a is None or b is None:
+        return None
+    return (min(a[0], b[0]), max(a[1], b[1]))
+
+
+def _binop_range(op, left, right):
+    """Interval of `left op right`, or None when the result is not known to be an int."""
+    if left is None or right is None:
+        return None
+    (a, b), (c, d) = left, right
+    if isinstance(op, ast.Add):
+        return _clamp(a + c, b + d)
+    if isinstance(op, ast.Sub):
+        return _clamp(a - d, b - c)
+    if isinstance(op, ast.Mult):
+        corners = (a * c, a * d, b * c, b * d)
+        return _clamp(min(corners), max(corners))
+    if isinstance(op, ast.FloorDiv):
+        if c > 0 or d < 0:
+            corners = (a // c, a // d, b // c, b // d)
+            return _clamp(min(corners), max(corners))
+        return WORD_RANGE
+    if isinstance(op, ast.Mod):
+        if c > 0:
+            return (0, d - 1) if a < 0 else (0, min(b, d - 1))
+        return WORD_RANGE
+    if isinstance(op, ast.BitAnd):
+        if a >= 0 and c >= 0:
+            return (0, min(b, d))
+        if a >= 0 or c >= 0:
+            return (0, b if a >= 0 else d)
+        return WORD_RANGE
+    if isinstance(op, (ast.BitOr, ast.BitXor)):
+        if a >= 0 and c >= 0:
+            return (0, (1 << max(b, d).bit_length()) - 1)
+        return WORD_RANGE
+    if isinstance(op, ast.RShift):
+        if a >= 0 and c == d and c >= 0:
+            return (a >> c, b >> c)
+        return WORD_RANGE
+    if isinstance(op, ast.LShift):
+        if c == d and 0 <= c < 16:
+            return _clamp(a << c, b << c)
+        return WORD_RANGE
+    return None
+
+
+def _refine(current, op, bound):
+    """Narrows `current` with `x op bound`; returns None when the branch is never taken."""
+    low, high = current
+    if isinstance(op, ast.Lt):
+        high = min(high, bound[1] - 1)
+    elif isinstance(op, ast.LtE):
+        high = min(high, bound[1])
+    elif isinstance(op, ast.Gt):
+        low = max(low, bound[0] + 1)
+    elif isinstance(op, ast.GtE):
+        low = max(low, bound[0])
+    elif isinstance(op, ast.Eq):
+        low, high = max(low, bound[0]), min(high, bound[1])
+    return (low, high) if low <= high else None
+
+
+class _RangeAnalysis:
+    def __init__(self, tree):
+        self.tree = tree
+        self.ranges = {}  # resolved var name (or ('return', func)) -> interval or None
+        self.changed = False
+        self.annotate = False
+        self.thresholds = sorted({t for node in ast.walk(tree)
+                                  if isinstance(node, ast.Constant) and type(node.value) is int
+                                  for t in (node.value - 1, node.value, node.value + 1)}
+                                 | {0, 255, 256, WORD_RANGE[0], WORD_RANGE[1]})
+
+    # --- Joining values into the variables ---
+
+    def _widen(self, old, new):
+        """Pushes a growing bound to the next threshold, so loops converge in a few passes."""
+        low, high = new
+        if low < old[0]:
+            low = max([t for t in self.thresholds if t <= low], default=WORD_RANGE[0])
+        if high > old[1]:
+            high = min([t for t in self.thresholds if t >= high], default=WORD_RANGE[1])
+        return _clamp(low, high)
+
+    def assign(self, key, value):
+        if key not in self.ranges:
+            self.ranges[key] = value
+            self.changed = True
+            return
+        old = self.ranges[key]
+        if old is None:
+            return
+        joined = _hull(old, value)
+        if joined != old:
+            self.ranges[key] = self._widen(old, joined) if joined is not None else None
+            self.changed = True
+
+    # --- Expressions ---
+
+    def expression(self, node, func_name, guards):
+        value = self._expression(node, func_name, guards)
+        if self.annotate:
+            node.value_range = value
+        return value
+
+    def _expression(self, node, func_name, guards):
+        if isinstance(node, ast.Constant):
+            if type(node.value) in (int, bool):
+                return _clamp(int(node.value), int(node.value))
+            return None
+        if isinstance(node, ast.Name):
+            key = resolve_variable_name(node.id, func_name)
+            if key in guards:
+                return guards[key]
+            if key not in self.ranges:
+                return (0, -1)  # Not assigned yet in this pass: contributes nothing
+            return self.ranges[key]
+        if isinstance(node, ast.BinOp):
+            left = self.expression(node.left, func_name, guards)
+            right = self.expression(node.right, func_name, guards)
+            if _is_empty(left) or _is_empty(right):
+                return (0, -1) if left is not None and right is not None else None
+            return _binop_range(node.op, left, right)
+        if isinstance(node, ast.UnaryOp):
+            operand = self.expression(node.operand, func_name, guards)
+            if isinstance(node.op, ast.Not):
+                return (0, 1)
+            if operand is None or _is_empty(operand):
+                return operand
+            if isinstance(node.op, ast.USub):
+                return _clamp(-operand[1], -operand[0])
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            return WORD_RANGE
+        if isinstance(node, ast.Compare):
+            for child in [node.left] + node.comparators:
+                self.expression(child, func_name, guards)
+            return (0, 1)
+        if isinstance(node, ast.BoolOp):
+            values = [self.expression(v, func_name, guards) for v in node.values]
+            result = values[0]
+            for value in values[1:]:
+                result = _hull_nonempty(result, value)
+            return result
+        if isinstance(node, ast.IfExp):
+            self.expression(node.test, func_name, guards)
+            return _hull_nonempty(self.expression(node.body, func_name, guards),
+                                  self.expression(node.orelse, func_name, guards))
+        if isinstance(node, ast.Call):
+            return self._call(node, func_name, guards)
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
+                self.expression(child, func_name, guards)
+        return None
+
+    def _call(self, node, func_name, guards):
+        args = [self.expression(arg, func_name, guards) for arg in node.args]
+        for keyword in node.keywords:
+            self.expression(keyword.value, func_name, guards)
+        if not isinstance(node.func, ast.Name):
+            return None
+        name = node.func.id
+        if name in globals.defined_functions:
+            for param, value in zip(globals.defined_functions[name]['params'], args):
+                if not _is_empty(value):
+                    self.assign(_get_mangled_local_var_name(name, param), value)
+            return self.ranges.get(('return', name), (0, -1))
+        spec = _c64_spec(name)
+        if spec:
+            if self.annotate:
+                for arg, param in zip(node.args, spec.get('params', [])):
+                    if param.get('size') == 8:
+                        _mark_byte_context(arg)
+            returned = spec.get('return')
+            return BYTE_RANGE if returned and returned.get('size') == 8 else None
+        if name in ('int', 'abs') and len(args) == 1 and args[0] is not None and not _is_empty(args[0]):
+            low, high = args[0]
+            if name == 'abs':
+                return _clamp(0 if low <= 0 <= high else min(abs(low), abs(high)), max(abs(low), abs(high)))
+            return args[0]
+        if name == 'len':
+            return (0, WORD_RANGE[1])
+        return None
+
+    # --- Guards ---
+
+    def _guards_for(self, test, func_name, guards, negate=False):
+        """Returns {var: interval} for the variables `test` (or its negation) narrows."""
+        narrowed = {}
+        tests = test.values if isinstance(test, ast.BoolOp) and isinstance(test.op, ast.And) and not negate else [test]
+        for condition in tests:
+            if not (isinstance(condition, ast.Compare) and len(condition.ops) == 1):
+                continue
+            op = condition.ops[0]
+            if negate:
+                op = NEGATED_COMPARISONS[type(op)]()
+            left, right = condition.left, condition.comparators[0]
+            if not isinstance(left, ast.Name) and isinstance(right, ast.Name):
+                left, right, op = right, left, MIRRORED_COMPARISONS[type(op)]()
+            if not isinstance(left, ast.Name):
+                continue
+            key = resolve_variable_name(left.id, func_name)
+            current = guards.get(key, self.ranges.get(key))
+            bound = self._expression(right, func_name, guards)
+            if current is None or bound is None or _is_empty(current) or _is_empty(bound):
+                continue
+            refined = _refine(current, op, bound)
+            narrowed[key] = refined if refined is not None else (0, -1)
+        return narrowed
+
+    # --- Statements ---
+
+    def _target_keys(self, node, func_name):
+        return {resolve_variable_name(n.id, func_name) for n in ast.walk(node)
+                if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Store)}
+
+    def _killed_guards(self, node, func_name, guards):
+        """The guards `node` may invalidate: its targets, and the globals when it calls a user function."""
+        killed = self._target_keys(node, func_name)
+        if any(isinstance(n, ast.Call) and isinstance(n.func, ast.Name) and n.func.id in globals.defined_functions
+               for n in ast.walk(node)):
+            killed |= {key for key in guards if globals.variables.get(key, {}).get('scope') == 'global'}
+        return killed
+
+    def _loop_guards(self, node, func_name, guards):
+        """
+        The guards that hold in every iteration of loop `node`: an assignment
+        anywhere in the loop changes the variable for the reads of the next
+        iteration, including the reads that come before it in the body.
+        """
+        killed = self._killed_guards(node, func_name, guards)
+        return {key: value for key, value in guards.items() if key not in killed}
+
+    def block(self, statements, func_name, guards):
+        guards = dict(guards)
+        for statement in statements:
+            self.statement(statement, func_name, guards)
+            # A guard no longer holds once its variable may have been reassigned
+            for key in self._killed_guards(statement, func_name, guards):
+                guards.pop(key, None)
+
+    def statement(self, node, func_name, guards):
+        if isinstance(node, ast.FunctionDef):
+            if not any(isinstance(n, ast.Return) and n.value is not None for n in ast.walk(node)):
+                self.assign(('return', node.name), (0, 0))  # Falling off the end returns 0 in A/X
+            self.block(node.body, node.name, {})
+        elif isinstance(node, ast.Assign):
+            value = self.expression(node.value, func_name, guards)
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    if not _is_empty(value):
+                        self.assign(resolve_variable_name(target.id, func_name), value)
+                else:
+                    self._unknown_targets(target, func_name, guards)
+        elif isinstance(node, ast.AugAssign):
+            if isinstance(node.target, ast.Name):
+                current = self.expression(ast.Name(id=node.target.id, ctx=ast.Load()), func_name, guards)
+                operand = self.expression(node.value, func_name, guards)
+                if _is_empty(current) or _is_empty(operand):
+                    return
+                self.assign(resolve_variable_name(node.target.id, func_name), _binop_range(node.op, current, operand))
+            else:
+                self._unknown_targets(node.target, func_name, guards)
+        elif isinstance(node, ast.Return):
+            if node.value is not None and func_name:
+                value = self.expression(node.value, func_name, guards)
+                if not _is_empty(value):
+                    self.assign(('return', func_name), value)
+        elif isinstance(node, ast.If):
+            self.expression(node.test, func_name, guards)
+            self.block(node.body, func_name, {**guards, **self._guards_for(node.test, func_name, guards)})
+            self.block(node.orelse, func_name, {**guards, **self._guards_for(node.test, func_name, guards, negate=True)})
+        elif isinstance(node, ast.While):
+            guards = self._loop_guards(node, func_name, guards)
+            self.expression(node.test, func_name, guards)
+            self.block(node.body, func_name, {**guards, **self._guards_for(node.test, func_name, guards)})
+            self.block(node.orelse, func_name, guards)
+        elif isinstance(node, ast.For):
+            self._for(node, func_name, guards)
+        else:
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, ast.expr):
+                    self.expression(child, func_name, guards)
+            self._unknown_targets(node, func_name, guards)
+            for field in ('body', 'orelse', 'finalbody'):
+                block = getattr(node, field, None)
+                if isinstance(block, list):
+                    self.block(block, func_name, guards)
+            for handler in getattr(node, 'handlers', []):
+                self.block(handler.body, func_name, guards)
+
+    def _unknown_targets(self, node, func_name, guards):
+        for key in self._target_keys(node, func_name):
+            self.assign(key, None)
+
+    def _for(self, node, func_name, guards):
+        # range() evaluates its arguments once, before the loop changes anything
+        loop_guards = self._loop_guards(node, func_name, guards)
+        target_range = None
+        iterator = node.iter
+        if (isinstance(iterator, ast.Call) and isinstance(iterator.func, ast.Name) and iterator.func.id == 'range'
+                and 1 <= len(iterator.args) <= 3):
+            bounds = [self.expression(arg, func_name, guards) for arg in iterator.args]
+            if len(bounds) == 1:
+                bounds.insert(0, (0, 0))
+            step = bounds[2] if len(bounds) == 3 else (1, 1)
+            start, stop = bounds[0], bounds[1]
+            if any(b is None for b in (start, stop, step)):
+                target_range = None
+            elif any(_is_empty(b) for b in (start, stop, step)):
+                target_range = (0, -1)
+            elif step[0] > 0:
+                target_range = (start[0], max(start[0], stop[1] - 1))
+            elif step[1] < 0:
+                target_range = (min(start[1], stop[0] + 1), start[1])
+            else:
+                target_range = WORD_RANGE
+        else:
+            self.expression(iterator, func_name, guards)
+        if isinstance(node.target, ast.Name):
+            if self.annotate:
+                node.target.value_range = target_range
+            if not _is_empty(target_range):
+                self.assign(resolve_variable_name(node.target.id, func_name), target_range)
+        else:
+            self._unknown_targets(node.target, func_name, guards)
+        self.block(node.body, func_name, loop_guards)
+        self.block(node.orelse, func_name, loop_guards)
+
+    def run(self):
+        for _ in range(MAX_ITERATIONS):
+            self.changed = False
+            self.block(self.tree.body, None, {})
+            if not self.changed:
+                break
+        else:
+            # Did not settle: give up on the ranges that were still moving
+            self.ranges = {key: None for key in self.ranges}
+        self.annotate = True
+        self.block(self.tree.body, None, {})
+
+
+def _is_empty(value):
+    return value is not None and value[0] > value[1]
+
+
+def _hull_nonempty(a, b):
+    if _is_empty(a):
+        return b
+    if _is_empty(b):
+        return a
+    return _hull(a, b)
+
+
+def _mark_byte_context(node):
+    """Marks an expression whose low byte is all that is used."""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, BYTE_OPS):
+        node.byte_context = True
+        _mark_byte_context(node.left)
+        _mark_byte_context(node.right)
+
+
+def expression_range(node):
+    """The interval computed for an expression node, or None when unknown."""
+    value = getattr(node, 'value_range', None)
+    return None if value is None or _is_empty(value) else value
+
+
+def fits_byte(node):
+    value = expression_range(node)
+    return value is not None and BYTE_RANGE[0] <= value[0] and value[1] <= BYTE_RANGE[1]
+
+
+def is_byte_operation(node):
+    """True when a BinOp can be compiled to single-byte operations."""
+    if not globals.compiler_options.get('byte_arithmetic', True):
+        return False
+    if not (isinstance(node, ast.BinOp) and isinstance(node.op, BYTE_OPS)):
+        return False
+    if expression_range(node.left) is None or expression_range(node.right) is None:
+        return False  # An operand may be a float or a string
+    return fits_byte(node) or getattr(node, 'byte_context', False)
+
+
+def analyze_value_ranges(tree):
+    """
+    Runs the range analysis on `tree`, annotating its expression nodes (for
+    8-bit code and overflow check removal), and marks the integer variables
+    that always fit in a byte as 8-bit.
+    Must run after the variable collection pass and before code generation.
+
+    Returns {'byte_variables': [names], 'int_variables': n_with_known_range}.
+    """
+    analysis = _RangeAnalysis(tree)
+    analysis.run()
+    # The low byte of a byte-sized result only depends on the low bytes of its operands
+    for node in ast.walk(tree):
+        if isinstance(node, ast.BinOp) and isinstance(node.op, BYTE_OPS) and fits_byte(node):
+            _mark_byte_context(node.left)
+            _mark_byte_context(node.right)
+
+    byte_variables = []
+    known = 0
+    for key, value in analysis.ranges.items():
+        if isinstance(key, tuple) or key not in globals.variables or value is None or _is_empty(value):
+            continue
+        var_info = globals.variables[key]
+        if var_info.get('type') in ('float', 'str', 'pointer', 'dict'):
+            continue
+        known += 1
+        var_info['value_range'] = value
+        if BYTE_RANGE[0] <= value[0] and value[1] <= BYTE_RANGE[1]:
+            var_info['is_8bit_semantic'] = True
+            byte_variables.append(key)
+    return {'byte_variables': sorted(byte_variables), 'int_variables': known}
+
+
+def format_report(stats):
+    """Returns the comment line summarizing the range analysis."""
+    names = ", ".join(stats['byte_variables']) or "none"
+    return f"; Value ranges: {len(stats['byte_variables'])} of {stats['int_variables']} int variables fit in a byte ({names})"
@@ -0,0 +1,101 @@
+# py2c64/lib/zp_allocation.py
+# Zero-page allocation pass.
+# Counts how often every variable is used (uses inside loops weigh more) and
+# moves the hottest ones from the $C100 variable area into free zero-page bytes,
+# where every LDA/STA/ADC/... is one byte shorter and one cycle faster.
+
+import ast
+import V1.globals as globals
+from lib.func_core import resolve_variable_name, variable_storage_size
+
+LOOP_WEIGHT = 8  # A use inside a loop counts as LOOP_WEIGHT uses of the enclosing level
+
+# Types whose storage is a plain block of bytes addressed through the variable's label.
+# Dictionaries are excluded: their runtime structure is laid out by the dict routines.
+ZP_ELIGIBLE_TYPES = {'int', 'bool', 'float', 'str', 'pointer', 'unknown'}
+
+
+def count_variable_uses(tree):
+    """
+    Walks the AST and returns {resolved_variable_name: weighted_use_count}.
+    Every read or write of a name counts LOOP_WEIGHT ** depth, where depth is the
+    number of enclosing for/while loops.
+    """
+    uses = {}
+
+    def visit(node, func_name, depth):
+        if isinstance(node, ast.FunctionDef):
+            for child in node.body:
+                visit(child, node.name, depth)
+            return
+        if isinstance(node, ast.For):
+            visit(node.iter, func_name, depth)  # Evaluated once, before the first iteration
+            visit(node.target, func_name, depth + 1)
+            for child in node.body:
+                visit(child, func_name, depth + 1)
+            for child in node.orelse:
+                visit(child, func_name, depth)
+            return
+        if isinstance(node, ast.While):
+            visit(node.test, func_name, depth + 1)  # Re-evaluated on every iteration
+            for child in node.body:
+                visit(child, func_name, depth + 1)
+            for child in node.orelse:
+                visit(child, func_name, depth)
+            return
+        if isinstance(node, ast.Name):
+            name = resolve_variable_name(node.id, func_name)
+            uses[name] = uses.get(name, 0) + LOOP_WEIGHT ** depth
+        for child in ast.iter_child_nodes(node):
+            visit(child, func_name, depth)
+
+    visit(tree, None, 0)
+    return uses
+
+
+def _is_eligible(var_name):
+    var_info = globals.variables.get(var_name)
+    if not var_info or 'address' in var_info:
+        return False
+    if var_info.get('scope') != 'global' or 'keys' in var_info:
+        return False
+    return var_info.get('type', 'unknown') in ZP_ELIGIBLE_TYPES
+
+
+def allocate_hot_variables(tree):
+    """
+    Assigns zero-page addresses to the most used global variables, hottest first,
+    until the free zero-page pool is exhausted. Must run after the variable
+    collection pass and before code generation.
+
+    Returns {var_name: (address, weighted_uses)} for the variables that were moved.
+    """
+    if not globals.compiler_options.get('zp_allocation', True):
+        return {}
+
+    uses = count_variable_uses(tree)
+    candidates = sorted((name for name in uses if _is_eligible(name)), key=lambda name: (-uses[name], name))
+
+    allocated = {}
+    for var_name in candidates:
+        var_info = globals.variables[var_name]
+        size = variable_storage_size(var_info)
+        address = globals.zero_page.allocate(var_name, size)
+        if address is None:
+            continue  # Too big for what is left; a smaller variable may still fit
+        var_info['address'] = address
+        var_info['size'] = size
+        var_info['zero_page'] = True
+        allocated[var_name] = (address, uses[var_name])
+    return allocated
+
+
+def generate_zero_page_equates(allocated):
+    """Returns the assembly lines binding each zero-page variable to its address."""
+    if not allocated:
+        return []
+    equ = globals.assembly_data_types['equ']
+    lines = ["; --- Zero Page Variables ---"]
+    for var_name, (address, weighted_uses) in sorted(allocated.items(), key=lambda item: item[1][0]):
+        lines.append(f"{var_name} {equ} ${address:02X} ; {weighted_uses} weighted uses")
+    return lines
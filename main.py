@@ -2,26 +2,31 @@
 
 import ast
 import traceback
+import os
 
 # Import project modules
 import V1.globals as globals
 from lib import ast_processor
 from lib import func_core
 from lib import func_structures
-from lib import routines as routine_manager # Renamed for clarity
+from lib import zp_allocation
+from lib import temp_allocation
+from lib import peephole
+from lib import branch_relaxation
+from lib import assembler
+from lib import call_graph
+from lib import inliner
+from lib import value_ranges
+from lib import func_lists
+from lib import compile_profile
+from lib import routine_registry
+from lib import compile_cache
+from lib import function_cache
 
 # Note: Other lib modules like func_expressions, func_operations, etc.,
 # are used by ast_processor and don't need to be imported directly here.
 
 # Aliases
-gen_code = globals.generated_code
-variables = globals.variables
-defined_functions = globals.defined_functions
-used_routines = globals.used_routines
-
-gen_code = globals.generated_code  # This was missing from the aliases
-
-
 report_error = globals.report_compiler_error
 create_label = func_core.create_label
 _get_mangled_local_var_name = func_core._get_mangled_local_var_name
@@ -48,6 +53,8 @@ def _get_type_of_expression(expr_node, current_func_name_context=None):
         if resolved_var_id in globals.variables:
             return globals.variables[resolved_var_id].get('type', 'unknown')
         return 'unknown'
+    elif func_lists.is_list_value(expr_node):
+        return 'list'
     elif isinstance(expr_node, ast.BinOp):
         left_type = _get_type_of_expression(expr_node.left, current_func_name_context)
         right_type = _get_type_of_expression(expr_node.right, current_func_name_context)
@@ -69,6 +76,8 @@ def _get_type_of_expression(expr_node, current_func_name_context=None):
         value_type = _get_type_of_expression(expr_node.value, current_func_name_context)
         if value_type == 'str':
             return 'str'
+        if value_type == 'list':
+            return 'int'
     elif isinstance(expr_node, ast.JoinedStr):
         return 'str'
     return 'unknown'
@@ -87,7 +96,7 @@ def _collect_variables_recursive(node, current_func_name, local_offset_ptr):
                 var_name = target.id
                 is_global = False
                 # Check for 'global' keyword declaration within the function scope
-                if current_func_name and var_name in defined_functions.get(current_func_name, {}).get('globals', set()):
+                if current_func_name and var_name in globals.defined_functions.get(current_func_name, {}).get('globals', set()):
                     is_global = True
 
                 if current_func_name and not is_global:
@@ -98,6 +107,7 @@ def _collect_variables_recursive(node, current_func_name, local_offset_ptr):
                         local_offset_ptr[0] -= 2 # Assuming 2 bytes for now
                         globals.variables[mangled_name] = {
                             'scope': 'local',
+                            'function': current_func_name,
                             'offset': local_offset_ptr[0],
                             'type': rhs_type,
                             'size': 2 # Default size
@@ -119,6 +129,13 @@ def _collect_variables_recursive(node, current_func_name, local_offset_ptr):
                         if 'scope' not in globals.variables[var_name]:
                             globals.variables[var_name]['scope'] = 'global'
                         globals.variables[var_name]['type'] = rhs_type
+                    if rhs_type == 'list':
+                        # Lists have a fixed length, stored inline at the variable's label
+                        length = func_lists.list_length(node.value)
+                        if length > func_lists.MAX_LIST_LENGTH:
+                            report_error(f"List '{var_name}' has {length} elements; at most {func_lists.MAX_LIST_LENGTH} are supported.", node.lineno)
+                        if 'length' not in globals.variables[var_name]:
+                            globals.variables[var_name].update({'length': length, 'size': max(2 * length, 2)})
 
             elif isinstance(target, ast.Subscript):
                 # This handles assignments like my_dict['key'] = value
@@ -126,6 +143,8 @@ def _collect_variables_recursive(node, current_func_name, local_offset_ptr):
                     dict_name = target.value.id # pyright: ignore[reportAttributeAccessIssue]
                     # Use the new resolver from func_core
                     resolved_var_id = resolve_variable_name(dict_name, current_func_name)
+                    if globals.variables.get(resolved_var_id, {}).get('type') == 'list':
+                        return  # Element stores leave a list a list
                     if resolved_var_id in globals.variables:
                         # Check if type is changing from its previous state
                         if globals.variables[resolved_var_id].get('type') != rhs_type:
@@ -153,10 +172,14 @@ def _collect_variables_recursive(node, current_func_name, local_offset_ptr):
                 local_offset_ptr[0] -= 2 # Assuming 2 bytes for now
                 globals.variables[mangled_name] = {
                     'scope': 'local',
+                    'function': current_func_name,
                     'offset': local_offset_ptr[0],
                     'type': 'unknown', # Type will be determined on assignment
                     'size': 2
                 }
+        elif var_name not in globals.variables:
+            # A global bound outside an assignment, e.g. a module-level loop variable
+            globals.variables[var_name] = {'scope': 'global', 'type': 'unknown', 'size': 2}
 
     elif isinstance(node, ast.FunctionDef):
         func_name = node.name
@@ -182,7 +205,7 @@ def _collect_variables_recursive(node, current_func_name, local_offset_ptr):
             mangled_param_name = _get_mangled_local_var_name(func_name, arg.arg)
             param_size = 2 # Assume all params are 2 bytes for now
             globals.variables[mangled_param_name] = {
-                'scope': 'param', 'offset': param_offset_counter, 'type': 'unknown', 'size': param_size
+                'scope': 'param', 'function': func_name, 'offset': param_offset_counter, 'type': 'unknown', 'size': param_size
             }
             param_offset_counter += param_size
 
@@ -208,13 +231,97 @@ def _collect_variables_recursive(node, current_func_name, local_offset_ptr):
             _collect_variables_recursive(child_node, current_func_name, local_offset_ptr)
 
 
-def python_to_assembly(source_code, output_file, error_handler_func):
+def write_prg(assembly, output_base):
+    """
+    Assembles the output of python_to_assembly into `<output_base>.prg`, a
+    program loading at $0801 that starts with RUN, and writes its label map
+    to `<output_base>.sym`. Returns the assembler result.
+    """
+    result = assembler.assemble(assembly)
+    _write_prg_files(output_base, result['prg'], assembler.format_symbol_map(result['symbols']))
+    return result
+
+
+def _write_prg_files(output_base, prg, symbols):
+    with open(output_base + ".prg", 'wb') as f:
+        f.write(prg)
+    with open(output_base + ".sym", 'w') as f:
+        f.write(symbols)
+
+
+def python_to_assembly(source_code, output_file, error_handler_func, context=None, cache=None):
     """
     Main function to convert a Python script into 6502 assembly.
+    Returns the assembly text, also written to `output_file` unless it is None.
+    The compilation runs in `context` (a globals.CompilationContext), by
+    default the current context of the thread; give every compilation its own
+    context to run several of them at the same time. Afterwards the context
+    keeps the state of the compilation (variables, error count, ...).
+    With compiler_options['profile'] set, the context's compile_profile then
+    holds the profile of the compilation (see lib/compile_profile.py).
+    With `cache` (a compile_cache.CompileCache), a compilation already in the
+    cache skips every pass: the context then only gets the zero-page
+    allocations of the cached compilation, and no profile.
     """
-    # Reset globals for a fresh compilation
-    globals.reset_globals()
+    if context is None:
+        context = globals.current_context()
+    with globals.use_context(context):
+        # Reset globals for a fresh compilation
+        globals.reset_globals()
+        if cache is not None:
+            key = compile_cache.cache_key(source_code)
+            entry = cache.load(key)
+            if entry is not None:
+                return _replay_cached_compilation(entry, cache, key, output_file, error_handler_func)
+        if globals.compiler_options.get('profile'):
+            compile_profile.start()
+        try:
+            assembly = _generate_assembly(source_code, output_file, error_handler_func)
+        finally:
+            compile_profile.finish()
+        if cache is not None and assembly is not None and not globals.has_errors and not context.error_count:
+            _store_compilation(cache, key, assembly, output_file)
+        return assembly
+
+
+def _store_compilation(cache, key, assembly, output_file):
+    """Stores a successful compilation, with the .prg and .sym it wrote if any."""
+    prg = symbols = None
+    if globals.compiler_options.get('prg') and output_file is not None:
+        output_base = os.path.splitext(output_file)[0]
+        with open(output_base + ".prg", 'rb') as f:
+            prg = f.read()
+        with open(output_base + ".sym", 'r') as f:
+            symbols = f.read()
+    cache.store(key, assembly, globals.zero_page.allocations(), prg, symbols)
+
+
+def _replay_cached_compilation(entry, cache, key, output_file, error_handler_func):
+    """Writes the outputs of a cached compilation, assembling (and caching) the .prg if it has none yet."""
+    assembly = entry['assembly']
+    globals.current_context().cached = True
+    globals.zero_page.restore({name: tuple(region) for name, region in entry['zero_page'].items()})
+    if output_file is not None:
+        with open(output_file, 'w') as f:
+            f.write(assembly)
+        if globals.compiler_options.get('prg'):
+            output_base = os.path.splitext(output_file)[0]
+            if entry.get('prg') is None:
+                try:
+                    result = write_prg(assembly, output_base)
+                except assembler.AssemblerError as e:
+                    error_handler_func(f"Assembly failed: {e}", e.line_number or 0)
+                    globals.has_errors = True
+                    return None
+                cache.store(key, assembly, entry['zero_page'], result['prg'],
+                            assembler.format_symbol_map(result['symbols']))
+            else:
+                _write_prg_files(output_base, entry['prg'], entry['symbols'])
+    return assembly
+
 
+def _generate_assembly(source_code, output_file, error_handler_func):
+    """The passes of python_to_assembly, each timed when profiling."""
     def _handle_conversion_error(e, node):
         """
         Centralized error handling during AST processing.
@@ -231,10 +338,31 @@ def python_to_assembly(source_code, output_file, error_handler_func):
     # --- Main execution flow of python_to_assembly ---
     try: # Gestione globale degli errori
         # 1. Analizza il codice Python in un AST
-        tree = ast.parse(source_code)
+        with compile_profile.phase('parse'):
+            tree = ast.parse(source_code)
+        compile_profile.record_ast(tree)
+        # A global labelled `a` would be read as the accumulator by `ASL a`
+        func_core.rename_register_identifiers(tree)
+
+        # 1b. Replace the calls to small functions with their bodies
+        with compile_profile.phase('inline'):
+            inline_stats = inliner.inline_functions(tree)
 
         # 2. Prima Passata: Raccogli tutte le variabili e le funzioni
-        _collect_variables_recursive(tree, None, None)
+        with compile_profile.phase('collect_variables'):
+            _collect_variables_recursive(tree, None, None)
+
+        # 2a. Find the values that fit in a byte, to compile them with 8-bit operations
+        with compile_profile.phase('value_ranges'):
+            range_stats = value_ranges.analyze_value_ranges(tree)
+
+        # 2b. Give the params and locals of non-recursive functions fixed addresses
+        with compile_profile.phase('static_frames'):
+            frame_stats = call_graph.assign_static_frames(tree)
+
+        # 2c. Move the most used variables into free zero-page bytes
+        with compile_profile.phase('zp_allocation'):
+            zp_variables = zp_allocation.allocate_hot_variables(tree)
 
         # --- Initialize the compiler's core components ---
         func_c = func_core.FuncCore()
@@ -255,43 +383,53 @@ def python_to_assembly(source_code, output_file, error_handler_func):
 
 
         # 3. Genera il boilerplate iniziale dell'assembly
-        gen_code.append(f"; Generated by py2c64 compiler")
-        gen_code.append("; --- Python Source Code ---")
+        globals.generated_code.append(f"; Generated by py2c64 compiler")
+        globals.generated_code.append("; --- Python Source Code ---")
         for line in source_code.strip().split('\n'):
-            gen_code.append(f"; {line}")
-        gen_code.append("; --------------------------")
+            globals.generated_code.append(f"; {line}")
+        globals.generated_code.append("; --------------------------")
+        globals.generated_code.extend(zp_allocation.generate_zero_page_equates(zp_variables))
+        globals.generated_code.extend(call_graph.generate_register_equates())
 
-        gen_code.append("* = $1000") # Start address for code
+        globals.generated_code.append("* = $1000") # Start address for code
 
         # 5. Second Pass: Generate code
-        gen_code.append("; --- Main Program and Functions ---")
-        gen_code.append("main:")
+        globals.generated_code.append("; --- Main Program and Functions ---")
+        globals.generated_code.append("main:")
         current_func_info = None
 
-        for node in tree.body:
-            if globals.has_errors: break
-            try:
-                if isinstance(node, ast.Assign):
-                    ast_processor.process_assign_node(node)
-                elif isinstance(node, ast.Expr): # Standalone expression (e.g. function call)
-                    ast_processor.process_expr_node(node, error_handler_func)
-                elif isinstance(node, ast.FunctionDef):
-                    ast_processor.process_function_def_node(node, error_handler_func)
-                elif isinstance(node, ast.If):
-                    func_struct.process_if_node(node, error_handler_func)
-                elif isinstance(node, ast.For):
-                    func_struct.process_for_node(node, error_handler_func)
-                elif isinstance(node, ast.While):
-                    func_struct.process_while_node(node, error_handler_func)
-                elif isinstance(node, ast.Try):
-                    ast_processor.process_try_node(node, error_handler_func)
-                elif isinstance(node, (ast.Pass, ast.Global, ast.Import, ast.ImportFrom)):
-                    pass # Already handled or no code needed
-                else:
-                    report_error(f"Unsupported top-level statement: {type(node).__name__}", node.lineno)
+        # Function bodies go after the main program's RTS, so main never runs into them
+        with compile_profile.phase('codegen'):
+            function_nodes = [node for node in tree.body if isinstance(node, ast.FunctionDef)]
+            for node in [node for node in tree.body if not isinstance(node, ast.FunctionDef)] + [None] + function_nodes:
+                if globals.has_errors: break
+                if node is None:
+                    globals.generated_code.append("rts ; End of main program")
+                    continue
+                try:
+                    if isinstance(node, ast.Assign):
+                        ast_processor.process_assign_node(node)
+                    elif isinstance(node, ast.Expr): # Standalone expression (e.g. function call)
+                        ast_processor.process_expr_node(node, error_handler_func)
+                    elif isinstance(node, ast.FunctionDef):
+                        # Replayed from the function cache when nothing it depends on changed
+                        function_cache.generate_function(
+                            node, lambda: ast_processor.process_function_def_node(node, error_handler_func))
+                    elif isinstance(node, ast.If):
+                        func_struct.process_if_node(node, error_handler_func)
+                    elif isinstance(node, ast.For):
+                        func_struct.process_for_node(node, error_handler_func)
+                    elif isinstance(node, ast.While):
+                        func_struct.process_while_node(node, error_handler_func)
+                    elif isinstance(node, ast.Try):
+                        ast_processor.process_try_node(node, error_handler_func)
+                    elif isinstance(node, (ast.Pass, ast.Global, ast.Import, ast.ImportFrom)):
+                        pass # Already handled or no code needed
+                    else:
+                        report_error(f"Unsupported top-level statement: {type(node).__name__}", node.lineno)
 
-            except Exception as e:
-                _handle_conversion_error(e, node)
+                except Exception as e:
+                    _handle_conversion_error(e, node)
 
     except SyntaxError as e:
         error_handler_func(f"Syntax Error: {e}", e.lineno)
@@ -306,43 +444,74 @@ def python_to_assembly(source_code, output_file, error_handler_func):
 
     # 6. Finalize the assembly output
     if not globals.has_errors:
-        # Add RTS at the end of the main program logic
-        gen_code.append("rts ; End of main program")
-
         # --- Assemble the final output string ---
-        program_code = gen_code.get_code()
+        # Give the temporaries their storage now that all their uses are known
+        with compile_profile.phase('temp_allocation'):
+            program_lines, temp_stats = temp_allocation.allocate_temporaries(globals.generated_code.get_code().split("\n"))
+        compile_profile.record('temps', temp_stats)
+        # Clean up the program code before the data and routines are appended
+        with compile_profile.phase('peephole'):
+            program_lines, peephole_hits = peephole.optimize(program_lines)
+        # Final layout: short branches where the target is in reach, branch over JMP elsewhere
+        with compile_profile.phase('branch_relaxation'):
+            program_lines, branch_stats = branch_relaxation.relax_branches(program_lines)
+        program_code = "\n".join(program_lines)
 
         # --- Data Segment ---
-        data_segment_lines = ["\n; --- Data Segment (Variables and Constants) ---"]
-        # Global variables (allocated with .res)
-        for name, details in sorted(variables.items()):
-            if details['scope'] == 'global':
-                size = details.get('size', 2)
-                data_segment_lines.append(f"{name} .res {size}")
-        # String literals and other data definitions
-        data_segment_lines.extend(sorted(globals.data_definitions))
-        data_segment = "\n".join(data_segment_lines)
+        with compile_profile.phase('data_segment'):
+            data_segment_lines = ["\n; --- Data Segment (Variables and Constants) ---"]
+            data_segment_lines.append(
+                f"; Temporaries: {temp_stats['temps']} temps in {temp_stats['slots']} slots, "
+                f"{temp_stats['bytes_after']} bytes (LIFO pool: {temp_stats['bytes_before']} bytes)"
+            )
+            data_segment_lines.append(peephole.format_report(peephole_hits))
+            data_segment_lines.append(branch_relaxation.format_report(branch_stats))
+            data_segment_lines.append(inliner.format_report(inline_stats))
+            data_segment_lines.append(value_ranges.format_report(range_stats))
+            data_segment_lines.append(
+                "; Overflow checks: {inline} inline, {removed} removed by range analysis, {disabled} disabled".format(
+                    **globals.overflow_check_stats)
+            )
+            data_segment_lines.append(
+                f"; Static frames: {frame_stats['functions']} functions in {frame_stats['bytes']} bytes "
+                f"({frame_stats['bytes_unshared']} bytes without sharing)"
+            )
+            # Global variables (allocated with .res), unless a data definition already reserves them
+            defined_labels = {line.split()[0] for definition in globals.data_definitions
+                              for line in definition.split("\n") if line.strip() and not line.startswith(';')}
+            for name, details in sorted(globals.variables.items()):
+                if details['scope'] == 'global' and not details.get('zero_page') and name not in defined_labels:
+                    size = details.get('size', 2)
+                    data_segment_lines.append(f"{name} .res {size}")
+            # String literals and other data definitions, in order: a definition may span
+            # several entries (a string, then its terminator byte)
+            data_segment_lines.extend(globals.data_definitions)
+            data_segment = "\n".join(data_segment_lines)
 
         # --- Routines Segment ---
-        routines_segment_lines = ["\n; --- Subroutines ---"]
-        # Get all required routines, including dependencies
-        all_routines_to_include = routine_manager.get_all_required_routines(used_routines)
-        for routine_name in sorted(list(all_routines_to_include)):
-            routine_code = routine_manager.get_routine_by_name(routine_name)
-            if routine_code:
-                routines_segment_lines.append(f"\n; Routine: {routine_name}")
-                routines_segment_lines.append(routine_code)
-            else:
-                # This warning should now be rare due to the improved routine loading
-                print(f"Warning: Code for routine '{routine_name}' could not be generated.")
-        routines_segment = "\n".join(routines_segment_lines)
+        with compile_profile.phase('routines'):
+            # All required routines, dependencies included, from the rendered routines registry
+            routines_segment, linked_routines = routine_registry.link_routines(globals.used_routines)
+        compile_profile.record('routines', linked_routines)
 
         # Combine all parts
         final_assembly = f"{program_code}\n{data_segment}\n{routines_segment}\n"
+        compile_profile.record('output_lines', final_assembly.count("\n"))
 
-        # Write to file (optional, but useful for debugging)
-        with open(output_file, 'w') as f:
-            f.write(final_assembly)
+        # Write to file (optional, but useful for debugging); None compiles in memory only
+        if output_file is not None:
+            with compile_profile.phase('write_output'):
+                with open(output_file, 'w') as f:
+                    f.write(final_assembly)
+
+        if globals.compiler_options.get('prg') and output_file is not None:
+            try:
+                with compile_profile.phase('assemble_prg'):
+                    write_prg(final_assembly, os.path.splitext(output_file)[0])
+            except assembler.AssemblerError as e:
+                error_handler_func(f"Assembly failed: {e}", e.line_number or 0)
+                globals.has_errors = True
+                return None
 
         # Return the final string for the test runner
         return final_assembly
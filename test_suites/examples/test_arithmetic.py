@@ -68,4 +68,112 @@ test_cases = [
         "code": "z = 5 + 3.14",
         "expected": "arithmetic/output_constant_folding_int_float_add.asm"
     },
+    {
+        "name": "Signed 16-bit multiplication of variables (V1)",
+        "compiler_version": "V1",
+        "code": "a = -7\nb = 3\nprint(a * b)\nc = 200\nd = 100\nprint(c * d)\ne = -300\nprint(e * b)\nprint(a * e)",
+        "expected": "arithmetic/output_multiply_signed_vars.asm"
+    },
+    {
+        "name": "Floor division of negative values by constants (V1)",
+        "compiler_version": "V1",
+        "code": "a = -7\nprint(a // 2)\nprint(a // 3)\nb = 100\nprint(b // 7)\nc = -32768\nprint(c // 10)\nprint(c // 256)\nd = 1000\nprint(d // 256)",
+        "expected": "arithmetic/output_divide_signed_by_constant.asm"
+    },
+    {
+        "name": "Multiplication of negative values by constants (V1)",
+        "compiler_version": "V1",
+        # The loops keep the range analysis from proving the products fit, so they keep their checks
+        "code": "x = -7\nprint(x * 3)\nprint(x * 2)\nfor i in range(2):\n    x = x * 10\n    print(x)\ny = -16384\nfor i in range(1):\n    y = y * 2\nprint(y)\nv = -128\nfor i in range(1):\n    v = v * 256\nprint(v)\nu = 127\nfor i in range(1):\n    u = u * 256\nprint(u)",
+        "expected": "arithmetic/output_multiply_negative_by_constant.asm"
+    },
+    {
+        "name": "Overflowing multiplication by a constant (V1)",
+        "compiler_version": "V1",
+        "code": "x = 20000\nprint(x * 2)\n# Expected output: OverflowError",
+        "output": "OverflowError",
+        "expected": "arithmetic/output_multiply_constant_overflow.asm"
+    },
+    {
+        "name": "Overflowing multiplication by a constant in a loop (V1)",
+        "compiler_version": "V1",
+        "code": "z = 10000\nfor i in range(3):\n    print(z * 3)\n    z = z + 1000\n# Expected output: 30000, then OverflowError",
+        "output": "30000\nOverflowError",
+        "expected": "arithmetic/output_multiply_constant_overflow_loop.asm"
+    },
+    {
+        "name": "Overflowing multiplication of a negative value by a constant (V1)",
+        "compiler_version": "V1",
+        "code": "w = -300\nfor i in range(2):\n    print(w * 256)\n    w = w * 2\n# Expected output: OverflowError",
+        "output": "OverflowError",
+        "expected": "arithmetic/output_multiply_negative_constant_overflow.asm"
+    },
+    {
+        "name": "Variable named a in shifts, multiplications and divisions (V1)",
+        "compiler_version": "V1",
+        "code": """
+a = 100
+a = a * 2
+print(a)
+c = 7
+a = (c & 255) * 3
+print(a)
+a = -7
+a = a // 2
+print(a)
+A = 40
+A = A // 4
+print(A)
+# Expected output: 200, 21, -4, 10
+""",
+        "expected": "arithmetic/output_variable_named_a.asm"
+    },
+    {
+        "name": "Parameter named a in a function (V1)",
+        "compiler_version": "V1",
+        "code": """
+@noinline
+def triple_half(a):
+    a = a * 3
+    return a // 2
+
+a_var = 5
+print(triple_half(-5) + a_var)
+# Expected output: -3
+""",
+        "expected": "arithmetic/output_parameter_named_a.asm"
+    },
+    {
+        "name": "Additions in nested loops under an if guard (V1)",
+        "compiler_version": "V1",
+        "code": """
+x = 3
+if x < 10:
+    for i in range(3):
+        j = 0
+        while j < 1:
+            x = x + 100
+            j = j + 1
+print(x)
+# Expected output: 303 (16-bit additions: the guard x < 10 does not hold in the loops)
+""",
+        "expected": "arithmetic/output_add_nested_loops_guard.asm"
+    },
+    {
+        "name": "Overflowing addition in nested loops under an if guard (V1)",
+        "compiler_version": "V1",
+        "code": """
+x = 3
+if x < 10:
+    for i in range(5):
+        j = 0
+        while j < 1:
+            x = x + 10000
+            j = j + 1
+        print(x)
+# Expected output: 10003, 20003, 30003, then OverflowError
+""",
+        "output": "10003\n20003\n30003\nOverflowError",
+        "expected": "arithmetic/output_add_nested_loops_guard_overflow.asm"
+    },
 ]
@@ -228,5 +228,120 @@ for x in my_list: # x = 1, 2, 3
 # Expected: outer_sum = 6
 """,
         "expected": "control_flow/output_nested_for_while_break.asm"
+    },
+    {
+        "name": "If-Elif-Else chain with printed results (V1)",
+        "compiler_version": "V1",
+        "code": """
+x = 5
+if x > 10:
+    print(1)
+elif x > 3:
+    print(2)
+else:
+    print(3)
+if x == 5:
+    print(4)
+if x < 0:
+    print(5)
+# Expected output: 2, 4
+""",
+        "expected": "control_flow/output_if_elif_else_printed.asm"
+    },
+    {
+        "name": "For loop variable after the loop, with calls in the body (V1)",
+        "compiler_version": "V1",
+        "code": """
+@noinline
+def double(x):
+    return x + x
+
+total = 0
+for i in range(1, 5):
+    total = total + double(i)
+print(i)
+for j in range(0, 17, 3):
+    total = total + double(j)
+print(j)
+k = 7
+for k in range(5, 3):
+    total = total + double(k)
+print(k)
+print(total)
+# Expected output: 4, 15, 7, 110
+""",
+        "expected": "control_flow/output_for_variable_after_loop.asm"
+    },
+    {
+        "name": "For loop at the 16-bit limits (V1)",
+        "compiler_version": "V1",
+        "code": """
+count = 0
+for i in range(0, 32767, 1000):
+    count = count + 1
+print(count)
+print(i)
+count = 0
+for i in range(32000, -32768, -1000):
+    count = count + 1
+print(count)
+print(i)
+# Expected output: 33, 32000, 65, -32000
+""",
+        "expected": "control_flow/output_for_int16_limits.asm"
+    },
+    {
+        "name": "For loop counted in a register, variable after the loop (V1)",
+        "compiler_version": "V1",
+        "code": """
+total = 0
+for i in range(250, 256):
+    total = total + i
+print(i)
+for i in range(255, 0, -5):
+    total = total + i
+print(i)
+for j in range(3, 200, 7):
+    total = total + 1
+print(j)
+n = 10
+for k in range(2, n):
+    total = total + k
+print(k)
+for m in range(n):
+    total = total + 1
+print(m)
+m = 99
+for m in range(n, 4):
+    total = total + 1
+else:
+    total = total + 1000
+print(m)
+print(total)
+# Expected output: 255, 5, 199, 9, 9, 99, 9228
+""",
+        "expected": "control_flow/output_for_register_variable_after_loop.asm"
+    },
+    {
+        "name": "Guard of an enclosing if in a loop that reassigns its variable (V1)",
+        "compiler_version": "V1",
+        "code": """
+x = 5
+c = 0
+if x < 10:
+    while c < 2:
+        y = x + 1
+        x = 500
+        c = c + 1
+print(y)
+g = 5
+if g < 10:
+    for i in range(2):
+        h = g + 1
+        g = g + 495
+print(h)
+# Expected output: 501, 501
+""",
+        "expected": "control_flow/output_guard_killed_in_loop.asm"
     }
 ]
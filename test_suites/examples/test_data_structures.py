@@ -23,4 +23,16 @@ test_cases = [
         "code": "s = {1, 2, 3, 2, 1}",
         "expected": "data_structures/output_set.asm",
     },
+    {
+        "name": "Lista: letterale, indici e somma (V1)",
+        "compiler_version": "V1",
+        "code": "a = [3, -1, 4]\nprint(a[0])\na[1] = 10\nprint(a[1])\ni = 2\nprint(a[i])\nt = 0\nfor j in range(3):\n    t = t + a[j]\nprint(t)",
+        "expected": "data_structures/output_list_literal_index.asm",
+    },
+    {
+        "name": "Lista: letterale ripetuto (V1)",
+        "compiler_version": "V1",
+        "code": "b = [0] * 5\nb[4] = 7\nprint(b[4] + b[0])",
+        "expected": "data_structures/output_list_repeated.asm",
+    },
 ]
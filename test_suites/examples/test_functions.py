@@ -70,5 +70,17 @@ test_cases = [
         "compiler_version": "V1",
         "code": "def subtract(a, b):\n  return a - b\nvar1 = 10\nvar2 = 3\nresult = subtract(var1, var2)\n# Expected: result = 7",
         "expected": "functions/output_func_two_params_vars.asm"
+    },
+    {
+        "name": "Function defined before the main program, results printed (V1)",
+        "compiler_version": "V1",
+        "code": "def double(n):\n  return n + n\nprint(double(-21))\nprint(double(100))\n# Expected output: -42, 200",
+        "expected": "functions/output_func_defined_before_main.asm"
+    },
+    {
+        "name": "Inlined function with an argument that calls a function (V1)",
+        "compiler_version": "V1",
+        "code": "c = 5\ndef bump():\n  global c\n  c = c + 6\n  return c\ndef sub(p, q):\n  return q - p\ndef sub_stmt(p, q):\n  r = q - p\n  return r\ndef late(p):\n  bump()\n  return p\nprint(sub(c, bump()))\nc = 5\nx = sub_stmt(c, bump())\nprint(x)\nc = 5\ny = late(c)\nprint(y)\n# Arguments are evaluated before the body: 6, 6, 5",
+        "expected": "functions/output_func_inline_argument_order.asm"
     }
 ]
@@ -311,5 +311,50 @@ while True: # pragma: no cover
     pass # pragma: no cover
 """,
         'expected': 'graphics/graphics_sprite_create_from_data.asm'
+    },
+    {
+        'name': 'graphics_clear_screen_and_sprite_pos_return (V1)',
+        'compiler_version': 'V1',
+        'code': """
+# The routines return to the program: each print runs
+gfx_turn_on()
+gfx_clear_screen()
+print(1)
+x = 100
+sprite_set_pos(0, x + 20, 50)
+print(2)
+gfx_turn_off()
+""",
+        'expected': 'graphics/graphics_clear_screen_and_sprite_pos_return.asm'
+    },
+    {
+        'name': 'graphics_plot_point_and_diagonals (V1)',
+        'compiler_version': 'V1',
+        'code': """
+# gfx_plot_point looks the row address up in tables built with <(n*320) / >(n*320)
+gfx_turn_on()
+gfx_clear_screen()
+gfx_plot_point(10, 20)
+gfx_draw_line(0, 0, 319, 199)
+gfx_draw_line(319, 0, 0, 199)
+print(3)
+gfx_turn_off()
+""",
+        'expected': 'graphics/graphics_plot_point_and_diagonals.asm'
+    },
+    {
+        'name': 'graphics_unplot_point (V1)',
+        'compiler_version': 'V1',
+        'code': """
+# Clears the pixel at (10, 20) and leaves its neighbour at (11, 20) set
+gfx_turn_on()
+gfx_clear_screen()
+gfx_plot_point(10, 20)
+gfx_plot_point(11, 20)
+gfx_unplot_point(10, 20)
+print(1)
+gfx_turn_off()
+""",
+        'expected': 'graphics/graphics_unplot_point.asm'
     }
 ]
@@ -4,6 +4,25 @@ test_cases = [
         "compiler_version": "V1",
         "code": 'x = input()',
         "expected": "io/output_input.asm"
+    },
+    {
+        "name": "Print interi con segno (V1)",
+        "compiler_version": "V1",
+        "code": 'x = -32768\nprint(x)\ny = x + 1\nprint(y)\nprint(-7)\nprint(0)\nprint(10000)',
+        "expected": "io/output_print_signed_integers.asm"
+    },
+    {
+        "name": "Print stringhe (V1)",
+        "compiler_version": "V1",
+        "code": 's = "hello"\nprint(s)\nprint("c64")',
+        "expected": "io/output_print_strings.asm"
+    },
+    {
+        "name": "Messaggio OverflowError (V1)",
+        "compiler_version": "V1",
+        "code": 'x = 32767\nprint(x)\ny = x + 1\nprint(y)',
+        "output": "32767\nOverflowError",
+        "expected": "io/output_print_overflow_error.asm"
     }
 
     # Aggiungi altri test case qui
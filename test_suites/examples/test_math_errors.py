@@ -8,7 +8,8 @@ try:
 except ValueError:
     print("Caught ValueError for log(0)")
 """,
-        "expected": "expected_outputs/math_errors/log_zero_error.asm"
+        "output": "Caught ValueError for log(0)",  # What CPython prints, with log from math
+        "expected": "math_errors/log_zero_error.asm"
     },
     {
         "name": "log_negative_error (V1)",
@@ -19,7 +20,8 @@ try:
 except ValueError:
     print("Caught ValueError for log(-1)")
 """,
-        "expected": "expected_outputs/math_errors/log_negative_error.asm"
+        "output": "Caught ValueError for log(-1)",  # What CPython prints, with log from math
+        "expected": "math_errors/log_negative_error.asm"
     },
     {
         "name": "log_positive_stub (V1)",
@@ -28,7 +30,7 @@ except ValueError:
 x = log(2.718) # Input > 0
 print(x) # Stub should return 0.0
 """,
-        "expected": "expected_outputs/math_errors/log_positive_stub.asm"
+        "expected": "math_errors/log_positive_stub.asm"
         # Expected output will involve FP_LOG returning 0.0 and then printing that.
     },
     {
@@ -38,7 +40,7 @@ print(x) # Stub should return 0.0
 y = exp(1.0) # Any input
 print(y) # Stub should return 1.0
 """,
-        "expected": "expected_outputs/math_errors/exp_stub.asm"
+        "expected": "math_errors/exp_stub.asm"
         # Expected output will involve FP_EXP returning 1.0 and then printing that.
     }
 ]
@@ -29,4 +29,10 @@ test_cases = [
         "code": "print('Hello, world!')",
         "expected": "strings/output_print_literal.asm"
     },
+    {
+        "name": "f-string with integer and string fields (V1)",
+        "compiler_version": "V1",
+        "code": "n = -42\ns = 'x'\nprint(f'n={n} s={s}!')\nm = 7\nt = f'{m}{m}'\nprint(t)",
+        "expected": "strings/output_fstring_int_str_fields.asm"
+    },
 ]
@@ -1,91 +1,27 @@
 ; Generated by py2c64 compiler
 ; --- Python Source Code ---
-; x1 = 10
-; x2 = 20
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a1 = 5
-; b = 3
-; c = a1 * b + (a1 - b) // 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 250
-; x2 = 10
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 10
-; x2 = 0
-; z = x1 // x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a = 10 # 00001010
-; b = 5  # 00000101
-; c = a ^ b # Expected result: 15 (00001111)
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; val1 = 255 # 11111111 00000000
-; val2 = 85  # 01010101 00000000
-; # 255 (00FF) ^ 85 (0055) = 170 (00AA)
-; res_xor = val1 ^ val2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 2 * 5
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; y = 10 // 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
 ; z = 5 + 3.14
 ; --------------------------
+; --- Zero Page Variables ---
+z = $22 ; 1 weighted uses
 * = $1000
 ; --- Main Program and Functions ---
 main:
+    LDA #$00
+    STA z+0
+    STA z+1
+    STA z+2
+    LDA #$00
+    STA z+3
 rts ; End of main program
 
 ; --- Data Segment (Variables and Constants) ---
-z .res 4
-z * = * + 2
+; Temporaries: 0 temps in 0 slots, 0 bytes (LIFO pool: 0 bytes)
+; Peephole: 2 hits (redundant_load 2, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 0 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 0 of 0 int variables fit in a byte (none)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
 
 ; --- Subroutines ---
@@ -0,0 +1,331 @@
+; Generated by py2c64 compiler
+; --- Python Source Code ---
+; a = -7
+; print(a // 2)
+; print(a // 3)
+; b = 100
+; print(b // 7)
+; c = -32768
+; print(c // 10)
+; print(c // 256)
+; d = 1000
+; print(d // 256)
+; --------------------------
+; --- Zero Page Variables ---
+a_var = $22 ; 3 weighted uses
+c = $24 ; 3 weighted uses
+b = $26 ; 2 weighted uses
+d = $28 ; 2 weighted uses
+* = $1000
+; --- Main Program and Functions ---
+main:
+    LDA #249
+    STA a_var
+    LDA #255
+    STA a_var+1
+    LDA a_var
+    STA temp_1
+    LDA a_var+1
+    STA temp_1+1
+    CMP #$80
+    ROR temp_1+1
+    ROR temp_1
+    ldx temp_1
+    lda temp_1+1
+jsr print_integer
+jsr print_newline
+    LDA a_var
+    STA m32_arg1_l
+    LDA a_var+1
+    STA m32_arg1_h
+    PHP                 ; N: the dividend is negative
+    BPL divc_pos_0
+    EOR #$FF
+    STA m32_arg1_h
+    LDA m32_arg1_l
+    EOR #$FF
+    STA m32_arg1_l
+divc_pos_0:
+    LDA #<43691
+    STA m32_arg2_l
+    LDA #>43691
+    STA m32_arg2_h
+    JSR multiply16x16_32
+    LDA m32_res2
+    STA temp_1
+    LDA m32_res3
+    STA temp_1+1
+    LSR temp_1+1
+    ROR temp_1
+    PLP
+    BPL divc_done_1
+    LDA temp_1
+    EOR #$FF
+    STA temp_1
+    LDA temp_1+1
+    EOR #$FF
+    STA temp_1+1
+divc_done_1:
+    ldx temp_1
+    lda temp_1+1
+jsr print_integer
+jsr print_newline
+    LDA #100
+    STA b
+    LDA #0
+    STA b+1
+    LDA b
+    STA m32_arg1_l
+    LDA b+1
+    STA m32_arg1_h
+    LDA #<9363
+    STA m32_arg2_l
+    LDA #>9363
+    STA m32_arg2_h
+    JSR multiply16x16_32
+    LDA m32_arg1_l
+    SEC
+    SBC m32_res2
+    STA temp_1
+    LDA m32_arg1_h
+    SBC m32_res3
+    STA temp_1+1
+    LSR temp_1+1
+    ROR temp_1
+    LDA temp_1
+    CLC
+    ADC m32_res2
+    STA temp_1
+    LDA temp_1+1
+    ADC m32_res3
+    STA temp_1+1
+    LSR temp_1+1
+    ROR temp_1
+    LSR temp_1+1
+    ROR temp_1
+    ldx temp_1
+    lda temp_1+1
+jsr print_integer
+jsr print_newline
+    LDA #0
+    STA c
+    LDA #128
+    STA c+1
+    LDA c
+    STA m32_arg1_l
+    LDA c+1
+    STA m32_arg1_h
+    PHP                 ; N: the dividend is negative
+    BPL divc_pos_2
+    EOR #$FF
+    STA m32_arg1_h
+    LDA m32_arg1_l
+    EOR #$FF
+    STA m32_arg1_l
+divc_pos_2:
+    LSR m32_arg1_h
+    ROR m32_arg1_l
+    LDA #<26215
+    STA m32_arg2_l
+    LDA #>26215
+    STA m32_arg2_h
+    JSR multiply16x16_32
+    LDA m32_res2
+    STA temp_1
+    LDA m32_res3
+    STA temp_1+1
+    LSR temp_1+1
+    ROR temp_1
+    PLP
+    BPL divc_done_3
+    LDA temp_1
+    EOR #$FF
+    STA temp_1
+    LDA temp_1+1
+    EOR #$FF
+    STA temp_1+1
+divc_done_3:
+    ldx temp_1
+    lda temp_1+1
+jsr print_integer
+jsr print_newline
+    LDA c
+    STA temp_1
+    LDA c+1
+    STA temp_1+1
+    CMP #$80
+    ROR temp_1+1
+    ROR temp_1
+    LDA temp_1+1
+    CMP #$80
+    ROR temp_1+1
+    ROR temp_1
+    LDA temp_1+1
+    CMP #$80
+    ROR temp_1+1
+    ROR temp_1
+    LDA temp_1+1
+    CMP #$80
+    ROR temp_1+1
+    ROR temp_1
+    LDA temp_1+1
+    CMP #$80
+    ROR temp_1+1
+    ROR temp_1
+    LDA temp_1+1
+    CMP #$80
+    ROR temp_1+1
+    ROR temp_1
+    LDA temp_1+1
+    CMP #$80
+    ROR temp_1+1
+    ROR temp_1
+    LDA temp_1+1
+    CMP #$80
+    ROR temp_1+1
+    ROR temp_1
+    ldx temp_1
+    lda temp_1+1
+jsr print_integer
+jsr print_newline
+    LDA #232
+    STA d
+    LDA #3
+    STA d+1
+    LDA d
+    STA temp_1
+    LDA d+1
+    STA temp_1+1
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+rts ; End of main program
+
+; --- Data Segment (Variables and Constants) ---
+; Temporaries: 6 temps in 1 slots, 2 bytes (LIFO pool: 4 bytes)
+; Peephole: 4 hits (redundant_load 4, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 4 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 1 of 4 int variables fit in a byte (b)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
+temp_0 * = * + 2
+m32_arg1_l * = * + 2
+m32_arg1_h * = * + 2
+m32_arg2_l * = * + 2
+m32_arg2_h * = * + 2
+m32_res0 * = * + 2
+m32_res1 * = * + 2
+m32_res2 * = * + 2
+m32_res3 * = * + 2
+temp_1 * = * + 2
+
+; --- Subroutines ---
+
+; Routine: multiply16x16_32
+
+multiply16x16_32
+    ; Multiplies m32_arg1 by m32_arg2, full 32-bit result in m32_res0..3.
+    ; Shift-and-add: each multiplier bit adds the multiplicand to the high
+    ; word, then the whole product is rotated right one bit.
+    LDA #0
+    STA m32_res2
+    STA m32_res3
+    LDX #16
+_m32_loop:
+    LSR m32_arg2_h
+    ROR m32_arg2_l
+    BCC _m32_no_add
+    LDA m32_res2
+    CLC
+    ADC m32_arg1_l
+    STA m32_res2
+    LDA m32_res3
+    ADC m32_arg1_h
+    STA m32_res3
+_m32_no_add:
+    ROR m32_res3
+    ROR m32_res2
+    ROR m32_res1
+    ROR m32_res0
+    DEX
+    BNE _m32_loop
+    RTS
+
+
+; Routine: print_integer
+
+print_integer
+    ; Outputs the signed 16-bit integer in X (low byte) / A (high byte) in decimal.
+    ; Digits come from repeated subtraction of 10000, 1000, 100 and 10;
+    ; leading zeros are skipped and the units digit is always output.
+    STX print_integer_value
+    STA print_integer_value+1
+    CMP #$80
+    BCC print_integer_positive
+    LDA #'-'
+    JSR $FFD2
+    SEC
+    LDA #$00
+    SBC print_integer_value
+    STA print_integer_value
+    LDA #$00
+    SBC print_integer_value+1
+    STA print_integer_value+1
+print_integer_positive
+    LDA #$00
+    STA print_integer_started
+    LDX #$00                ; Index of the power of ten
+print_integer_digit
+    LDY #'0'                ; The digit, counted in ASCII
+print_integer_subtract
+    LDA print_integer_value
+    SEC
+    SBC print_integer_powers_lo,X
+    STA print_integer_scratch
+    LDA print_integer_value+1
+    SBC print_integer_powers_hi,X
+    BCC print_integer_emit
+    STA print_integer_value+1
+    LDA print_integer_scratch
+    STA print_integer_value
+    INY
+    BNE print_integer_subtract
+print_integer_emit
+    TYA
+    CMP #'0'
+    BNE print_integer_output
+    LDY print_integer_started
+    BEQ print_integer_next  ; Leading zero
+print_integer_output
+    STA print_integer_started
+    JSR $FFD2            ; Preserves X
+print_integer_next
+    INX
+    CPX #$04
+    BNE print_integer_digit
+    LDA print_integer_value
+    ORA #'0'
+    JMP $FFD2
+
+print_integer_powers_lo:
+    .byte <10000, <1000, <100, <10
+print_integer_powers_hi:
+    .byte >10000, >1000, >100, >10
+print_integer_value:
+    .byte 0, 0
+print_integer_scratch:
+    .byte 0
+print_integer_started:
+    .byte 0
+
+
+; Routine: print_newline
+
+print_newline
+    LDA #$0D                ; PETSCII carriage return
+    JMP $FFD2
+
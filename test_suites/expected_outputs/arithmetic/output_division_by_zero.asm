@@ -1,69 +1,54 @@
 ; Generated by py2c64 compiler
 ; --- Python Source Code ---
 ; x1 = 10
-; x2 = 20
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a1 = 5
-; b = 3
-; c = a1 * b + (a1 - b) // 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 250
-; x2 = 10
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 10
 ; x2 = 0
 ; z = x1 // x2
 ; --------------------------
+; --- Zero Page Variables ---
+x1 = $22 ; 2 weighted uses
+x2 = $24 ; 2 weighted uses
+z = $26 ; 1 weighted uses
 * = $1000
 ; --- Main Program and Functions ---
 main:
+    LDA #10
+    STA x1
+    LDA #0
+    STA x1+1
+    STA x2
+    STA x2+1
+    LDA x1
+    STA d16_orig_dividend_l
+    LDA x1+1
+    STA d16_orig_dividend_h
+    LDA x2
+    STA d16_divisor_l
+    LDA x2+1
+    STA d16_divisor_h
+    JSR divide16x16_16
+    LDA d16_quotient_l
+    STA z
+    LDA d16_quotient_h
+    STA z+1
 rts ; End of main program
 
 ; --- Data Segment (Variables and Constants) ---
-d16_divisor_h .res 2
-d16_divisor_l .res 2
-d16_orig_dividend_h .res 2
-d16_orig_dividend_l .res 2
-d16_quotient_h .res 2
-d16_quotient_l .res 2
-d16_rem_h .res 2
-d16_rem_l .res 2
-temp_0 .res 2
-x1 .res 2
-x2 .res 2
-z .res 2
-d16_divisor_h * = * + 2
-d16_divisor_l * = * + 2
-d16_orig_dividend_h * = * + 2
+; Temporaries: 0 temps in 0 slots, 0 bytes (LIFO pool: 0 bytes)
+; Peephole: 2 hits (redundant_load 2, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 0 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 2 of 3 int variables fit in a byte (x1, x2)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
+temp_0 * = * + 2
 d16_orig_dividend_l * = * + 2
-d16_quotient_h * = * + 2
+d16_orig_dividend_h * = * + 2
+d16_divisor_l * = * + 2
+d16_divisor_h * = * + 2
 d16_quotient_l * = * + 2
-d16_rem_h * = * + 2
+d16_quotient_h * = * + 2
 d16_rem_l * = * + 2
-temp_0 * = * + 2
-x1 * = * + 2
-x2 * = * + 2
-z * = * + 2
+d16_rem_h * = * + 2
 
 ; --- Subroutines ---
 
@@ -119,7 +104,7 @@ _d16_div_loop:
     ROL d16_quotient_h
 
     ; Shift remainder left and insert the most significant bit of the original dividend
-    ASL d16_orig_dividend_l (Label definition)
+    ASL d16_orig_dividend_l
     ROL d16_orig_dividend_h   ; The MSB of the original dividend goes into Carry
     ROL d16_rem_l             ; The Carry (dividend bit) enters the LSB of the remainder
     ROL d16_rem_h             ; Shift the remainder
@@ -127,7 +112,7 @@ _d16_div_loop:
     ; Compare Remainder (d16_rem) with Divisor (d16_divisor)
     ; If Remainder >= Divisor: Remainder = Remainder - Divisor; LSB quotient = 1
     SEC
-    LDA d16_rem_l (Label definition)
+    LDA d16_rem_l
     SBC d16_divisor_l
     TAY                     ; Salva LSB di (Resto - Divisore)
     LDA d16_rem_h
@@ -140,10 +125,10 @@ _d16_div_loop:
     STY d16_rem_l           ; Store LSB of the new remainder
     INC d16_quotient_l      ; Imposta il bit corrente del quoziente a 1
 
-_d16_remainder_less: (Label definition)
-    DEX (Label definition)
-    BNE _d16_div_loop (Label definition)
-    RTS (Label definition)
+_d16_remainder_less:
+    DEX
+    BNE _d16_div_loop
+    RTS
 
 
 ; Routine: division_by_zero_msg
@@ -153,6 +138,9 @@ division_by_zero_msg
     LDA #>division_by_zero_msg_string
     STA temp_0+1
     JMP print_string
+division_by_zero_msg_string
+    text "ZeroDivisionError"
+    byte 0
 
 ; Routine: print_char
 
@@ -163,7 +151,7 @@ print_char
     ; Preserves: X, Y (CHROUT preserva X, Y)
 
     JSR ascii_to_petscii    ; Convert A from ASCII to PETSCII. A is now PETSCII.
-    JSR chrout              ; Call KERNAL CHROUT routine (address defined in data section)
+    JSR $FFD2              ; Call KERNAL CHROUT routine
     RTS
 
 
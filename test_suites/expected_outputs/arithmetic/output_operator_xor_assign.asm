@@ -1,62 +1,39 @@
 ; Generated by py2c64 compiler
 ; --- Python Source Code ---
-; x1 = 10
-; x2 = 20
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a1 = 5
-; b = 3
-; c = a1 * b + (a1 - b) // 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 250
-; x2 = 10
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 10
-; x2 = 0
-; z = x1 // x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
 ; a = 10 # 00001010
 ; b = 5  # 00000101
 ; c = a ^ b # Expected result: 15 (00001111)
 ; --------------------------
+; --- Zero Page Variables ---
+a_var = $22 ; 2 weighted uses
+b = $24 ; 2 weighted uses
+c = $26 ; 1 weighted uses
 * = $1000
 ; --- Main Program and Functions ---
 main:
+    LDA #10
+    STA a_var
+    LDA #0
+    STA a_var+1
+    LDA #5
+    STA b
+    LDA #0
+    STA b+1
+    LDA a_var
+    EOR b
+    STA c
+    LDA #0
+    STA c+1
 rts ; End of main program
 
 ; --- Data Segment (Variables and Constants) ---
-a .res 2
-b .res 2
-c .res 2
-temp_0 .res 2
-a * = * + 2
-b * = * + 2
-c * = * + 2
+; Temporaries: 0 temps in 0 slots, 0 bytes (LIFO pool: 0 bytes)
+; Peephole: 0 hits (redundant_load 0, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 0 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 3 of 3 int variables fit in a byte (a_var, b, c)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
 temp_0 * = * + 2
 
 ; --- Subroutines ---
@@ -1,73 +1,40 @@
 ; Generated by py2c64 compiler
 ; --- Python Source Code ---
-; x1 = 10
-; x2 = 20
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a1 = 5
-; b = 3
-; c = a1 * b + (a1 - b) // 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 250
-; x2 = 10
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 10
-; x2 = 0
-; z = x1 // x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a = 10 # 00001010
-; b = 5  # 00000101
-; c = a ^ b # Expected result: 15 (00001111)
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
 ; val1 = 255 # 11111111 00000000
 ; val2 = 85  # 01010101 00000000
 ; # 255 (00FF) ^ 85 (0055) = 170 (00AA)
 ; res_xor = val1 ^ val2
 ; --------------------------
+; --- Zero Page Variables ---
+val1 = $22 ; 2 weighted uses
+val2 = $24 ; 2 weighted uses
+res_xor = $26 ; 1 weighted uses
 * = $1000
 ; --- Main Program and Functions ---
 main:
+    LDA #255
+    STA val1
+    LDA #0
+    STA val1+1
+    LDA #85
+    STA val2
+    LDA #0
+    STA val2+1
+    LDA val1
+    EOR val2
+    STA res_xor
+    LDA #0
+    STA res_xor+1
 rts ; End of main program
 
 ; --- Data Segment (Variables and Constants) ---
-res_xor .res 2
-temp_0 .res 2
-val1 .res 2
-val2 .res 2
-res_xor * = * + 2
+; Temporaries: 0 temps in 0 slots, 0 bytes (LIFO pool: 0 bytes)
+; Peephole: 0 hits (redundant_load 0, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 0 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 3 of 3 int variables fit in a byte (res_xor, val1, val2)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
 temp_0 * = * + 2
-val1 * = * + 2
-val2 * = * + 2
 
 ; --- Subroutines ---
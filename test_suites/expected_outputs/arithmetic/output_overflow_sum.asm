@@ -1,129 +1,41 @@
 ; Generated by py2c64 compiler
 ; --- Python Source Code ---
-; x1 = 10
-; x2 = 20
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a1 = 5
-; b = 3
-; c = a1 * b + (a1 - b) // 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
 ; x1 = 250
 ; x2 = 10
 ; z = x1 + x2
 ; --------------------------
+; --- Zero Page Variables ---
+x1 = $22 ; 2 weighted uses
+x2 = $24 ; 2 weighted uses
+z = $26 ; 1 weighted uses
 * = $1000
 ; --- Main Program and Functions ---
 main:
+    LDA #250
+    STA x1
+    LDA #0
+    STA x1+1
+    LDA #10
+    STA x2
+    LDA #0
+    STA x2+1
+    LDA x1
+    CLC
+    ADC x2
+    STA z
+    LDA x1+1
+    ADC x2+1
+    STA z+1
 rts ; End of main program
 
 ; --- Data Segment (Variables and Constants) ---
-temp_0 .res 2
-x1 .res 2
-x2 .res 2
-z .res 2
+; Temporaries: 0 temps in 0 slots, 0 bytes (LIFO pool: 0 bytes)
+; Peephole: 0 hits (redundant_load 0, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 0 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 2 of 3 int variables fit in a byte (x1, x2)
+; Overflow checks: 0 inline, 1 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
 temp_0 * = * + 2
-x1 * = * + 2
-x2 * = * + 2
-z * = * + 2
 
 ; --- Subroutines ---
-
-; Routine: ascii_to_petscii
-
-ascii_to_petscii
-    ; Input: A contains ASCII character
-    ; Output: A contains PETSCII character (lowercase ASCII converted to uppercase PETSCII)
-    CMP #'a'
-    BCC no_conversion_needed_petscii
-    CMP #'z'+1
-    BCS no_conversion_needed_petscii
-    SEC             ; Ensure Carry is set for SBC
-    SBC #$20        ; Convert ASCII 'a'-'z' to PETSCII 'A'-'Z' (e.g. ASCII 'a' (97) - 32 = PETSCII 'A' (65))
-no_conversion_needed_petscii
-    RTS
-
-
-; Routine: check_overflow
-
-check_overflow
-    ; Check the overflow flag (V)
-    BVC no_overflow  ; Branch if Overflow Clear (no overflow)
-
-    ; If we are here, there is an overflow
-    JSR overflow_error_msg
-    JMP end_program
-
-no_overflow
-    RTS
-
-; Routine: end_program
-end_program
-    RTS
-
-; Routine: overflow_error_msg
-overflow_error_msg
-    LDA #<overflow_msg
-    STA temp_0
-    LDA #>overflow_msg
-    STA temp_0+1
-    JMP print_string
-
-; Routine: print_char
-
-print_char
-    ; Input: A = ASCII character
-    ; Output: Prints character to screen via KERNAL CHROUT
-    ; Modifies: A (CHROUT modifica A)
-    ; Preserves: X, Y (CHROUT preserva X, Y)
-
-    JSR ascii_to_petscii    ; Convert A from ASCII to PETSCII. A is now PETSCII.
-    JSR chrout              ; Call KERNAL CHROUT routine (address defined in data section)
-    RTS
-
-
-; Routine: print_string
-
-print_string
-    ; Routine to print a string located at the address contained in the var temp_0
-    ; Uses ZP locations $FA/$FB for the 16-bit string pointer.
-    ; Preserves A and Y registers.
-    PHA                     ; Save A
-    TYA                     ; Transfer Y to A (to save Y on stack)
-    PHA                     ; Push A (which now holds Y's original value)
-    LDA temp_0                ; Load LSB of string address from temp_0 (a .word variable)
-    STA $FA           ; Store LSB into ZP pointer
-    LDA temp_0+1              ; Load high byte of address from temp_0+1
-    STA $FB         ; Store MSB into ZP pointer
-
-    LDY #$00                  ; Use Y as the index for LDA (ZP),Y. This Y is local to the loop.
-print_loop_ps               ; Renamed label to avoid conflict if routine is included multiple times (though it shouldn't be)
-        LDA ($FA),Y ; Use (Indirect),Y addressing with ZP pointer
-        BEQ end_print_ps      ; If char is NUL, end.
-        JSR print_char          ; print_char preserves A, does not use Y.
-        INY                     ; Increment Y
-    ; Check if Y wrapped around (very unlikely for typical strings)
-    ; If Y becomes 0 after INY, it means we crossed a 256-byte boundary with Y.
-    CPY #0
-    BNE print_loop_ps       ; If Y is not 0, continue loop within the current 256-byte page
-    ; If Y wrapped to 0, it means we printed 256 chars. Increment MSB of ZP pointer.
-    INC $FB
-    JMP print_loop_ps       ; And continue printing (Y is 0 again for the new page)
-end_print_ps
-    PLA                     ; Pop original Y value (into A)
-    TAY                     ; Transfer A to Y (restoring Y)
-    PLA                     ; Pop original A value
-    RTS
-
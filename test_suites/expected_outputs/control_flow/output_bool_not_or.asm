@@ -1,636 +1,5 @@
 ; Generated by py2c64 compiler
 ; --- Python Source Code ---
-; x1 = 10
-; x2 = 20
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a1 = 5
-; b = 3
-; c = a1 * b + (a1 - b) // 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 250
-; x2 = 10
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 10
-; x2 = 0
-; z = x1 // x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a = 10 # 00001010
-; b = 5  # 00000101
-; c = a ^ b # Expected result: 15 (00001111)
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; val1 = 255 # 11111111 00000000
-; val2 = 85  # 01010101 00000000
-; # 255 (00FF) ^ 85 (0055) = 170 (00AA)
-; res_xor = val1 ^ val2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 2 * 5
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; y = 10 // 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; z = 5 + 3.14
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; my_list = [1, 2, 3]
-; for item in my_list:
-;   x = item * 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; i = 0
-; while i < 5:
-;   i = i + 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-
-while_start_0:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ while_end_0
-    JMP while_start_0
-while_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 10
-; res = 0
-; if x == 10:
-;   res = 1
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; res = 0
-; if x == 10:
-;   res = 1
-; # Expected: res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 10
-; res = 0
-; if x > 5:
-;   res = 1
-; else:
-;   res = 2
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 3
-; res = 0
-; if x > 5:
-;   res = 1
-; else:
-;   res = 2
-; # Expected: res = 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 15
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; else:
-;   res = 3
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_2
-    JMP if_end_2
-if_else_2:
-if_end_2:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 7
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; else:
-;   res = 3
-; # Expected: res = 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_2
-    JMP if_end_2
-if_else_2:
-if_end_2:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 3
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; else:
-;   res = 3
-; # Expected: res = 3
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_2
-    JMP if_end_2
-if_else_2:
-if_end_2:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 12
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_2
-if_end_2:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 8
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; # Expected: res = 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_2
-if_end_2:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 5
-; res = 0
-; if x <= y:
-;   res = 1
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 5
-; res = 0
-; if x < y:
-;   res = 1
-; # Expected: res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 10
-; y = 5
-; res = 0
-; if x > 5:
-;   if y < 10:
-;     res = 1
-;   else:
-;     res = 2
-; else:
-;   res = 3
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_2
-    JMP if_end_2
-if_else_2:
-if_end_2:
-    JMP if_end_0
-if_else_0:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; res = 0
-; if True:
-;   res = 1
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; res = 0
-; if False:
-;   res = 1
-; else:
-;   res = 2
-; # Expected: res = 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 10
-; res = 0
-; if x + 2 > y - 5:
-;   res = 1
-; # Expected: 7 > 5 -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 3
-; y = 1
-; res = 0
-; if x * 2 == y + 5:
-;   res = 1
-; # Expected: 6 == 6 -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 0
-; res = 0
-; if not x:
-;   res = 1
-; # Expected: not 0 -> True -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; res = 0
-; if not x:
-;   res = 1
-; # Expected: not 5 -> False -> res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 10
-; res = 0
-; if x > 0 and y > 0:
-;   res = 1
-; # Expected: True and True -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 0
-; res = 0
-; if x > 0 and y > 0:
-;   res = 1
-; # Expected: True and False -> res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 0
-; y = 10
-; res = 0
-; if x > 0 and y > 0: # y > 0 should not be evaluated if the compiler is smart
-;   res = 1
-; # Expected: False and True -> res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 0
-; res = 0
-; if x > 0 or y > 0: # y > 0 should not be evaluated
-;   res = 1
-; # Expected: True or False -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 0
-; y = 10
-; res = 0
-; if x > 0 or y > 0:
-;   res = 1
-; # Expected: False or True -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 0
-; y = 0
-; res = 0
-; if x > 0 or y > 0:
-;   res = 1
-; # Expected: False or False -> res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 0
-; res = 0
-; if not (x == 0 and y == 0):
-;   res = 1
-; # Expected: not (False and True) -> not False -> True -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
 ; x = 0
 ; y = 0
 ; res = 0
@@ -638,24 +7,39 @@ rts ; End of main program
 ;   res = 1
 ; # Expected: not (False or False) -> not False -> True -> res = 1
 ; --------------------------
+; --- Zero Page Variables ---
+res = $22 ; 2 weighted uses
+x = $24 ; 2 weighted uses
+y = $26 ; 2 weighted uses
 * = $1000
 ; --- Main Program and Functions ---
 main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
+    LDA #0
+    STA x
+    STA x+1
+    STA y
+    STA y+1
+    STA res
+    STA res+1
+    LDA #$00
+    CMP x
+    BCC if_else_0
+    CMP y
+    BCC if_else_0
+    LDA #1
+    STA res
+    LDA #0
+    STA res+1
+if_else_0:
 rts ; End of main program
 
 ; --- Data Segment (Variables and Constants) ---
-res .res 2
-temp_0 .res 2
-x .res 2
-y .res 2
-res * = * + 2
-temp_0 * = * + 4
-x * = * + 2
-y * = * + 2
+; Temporaries: 0 temps in 0 slots, 0 bytes (LIFO pool: 0 bytes)
+; Peephole: 6 hits (redundant_load 6, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 2 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 3 of 3 int variables fit in a byte (res, x, y)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
 
 ; --- Subroutines ---
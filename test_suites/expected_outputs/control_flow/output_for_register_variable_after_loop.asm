@@ -0,0 +1,427 @@
+; Generated by py2c64 compiler
+; --- Python Source Code ---
+; total = 0
+; for i in range(250, 256):
+;     total = total + i
+; print(i)
+; for i in range(255, 0, -5):
+;     total = total + i
+; print(i)
+; for j in range(3, 200, 7):
+;     total = total + 1
+; print(j)
+; n = 10
+; for k in range(2, n):
+;     total = total + k
+; print(k)
+; for m in range(n):
+;     total = total + 1
+; print(m)
+; m = 99
+; for m in range(n, 4):
+;     total = total + 1
+; else:
+;     total = total + 1000
+; print(m)
+; print(total)
+; # Expected output: 255, 5, 199, 9, 9, 99, 9228
+; --------------------------
+; --- Zero Page Variables ---
+total = $22 ; 100 weighted uses
+i = $24 ; 34 weighted uses
+m = $26 ; 19 weighted uses
+k = $28 ; 17 weighted uses
+j = $4B ; 9 weighted uses
+n = $4D ; 4 weighted uses
+* = $1000
+; --- Main Program and Functions ---
+main:
+    LDA #0
+    STA total
+    STA total+1
+    ; for i: counter in Y
+    LDY #$FA
+    LDA #0
+    STA i+1
+for_loop_0:
+    STY i
+    LDA total
+    CLC
+    ADC i
+    STA total
+    LDA total+1
+    ADC i+1
+    STA total+1
+    BVC *+5
+    JMP overflow_trap
+    INY
+    BNE for_loop_0
+for_else_0:
+for_exit_0:
+    LDA i
+    STA temp_1
+    LDA i+1
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+    ; for i: counter in Y
+    LDY #$FF
+    LDA #0
+    STA i+1
+for_loop_1:
+    STY i
+    LDA total
+    CLC
+    ADC i
+    STA total
+    LDA total+1
+    ADC i+1
+    STA total+1
+    BVC *+5
+    JMP overflow_trap
+    TYA
+    CLC
+    ADC #$FB
+    TAY
+    BNE for_loop_1
+for_else_1:
+for_exit_1:
+    LDA i
+    STA temp_1
+    LDA i+1
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+    ; for j: counter in Y
+    LDY #$1D
+for_loop_2:
+    LDA #1
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    LDA total
+    CLC
+    ADC temp_1
+    STA total
+    LDA total+1
+    ADC temp_1+1
+    STA total+1
+    BVC *+5
+    JMP overflow_trap
+    DEY
+    BNE for_loop_2
+    LDA #$C7
+    STA j
+    LDA #0
+    STA j+1
+for_else_2:
+for_exit_2:
+    LDA j
+    STA temp_1
+    LDA j+1
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+    LDA #10
+    STA n
+    LDA #0
+    STA n+1
+    ; for k: counter in Y
+    LDY #$02
+    CPY n
+    BCS for_else_3
+    LDA #0
+    STA k+1
+for_loop_3:
+    STY k
+    LDA total
+    CLC
+    ADC k
+    STA total
+    LDA total+1
+    ADC k+1
+    STA total+1
+    BVC *+5
+    JMP overflow_trap
+    INY
+    CPY n
+    BNE for_loop_3
+for_else_3:
+for_exit_3:
+    LDA k
+    STA temp_1
+    LDA k+1
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+    ; for m: counter in Y
+    LDY n
+    BEQ for_else_4
+for_loop_4:
+    LDA #1
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    LDA total
+    CLC
+    ADC temp_1
+    STA total
+    LDA total+1
+    ADC temp_1+1
+    STA total+1
+    BVC *+5
+    JMP overflow_trap
+    DEY
+    BNE for_loop_4
+    LDA n
+    SEC
+    SBC #1
+    STA m
+    LDA #0
+    STA m+1
+for_else_4:
+for_exit_4:
+    LDA m
+    STA temp_1
+    LDA m+1
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+    LDA #99
+    STA m
+    LDA #0
+    STA m+1
+    ; for m: counter in Y
+    LDA #$04
+    SEC
+    SBC n
+    BEQ for_else_5
+    BCC for_else_5
+    TAY
+for_loop_5:
+    LDA #1
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    LDA total
+    CLC
+    ADC temp_1
+    STA total
+    LDA total+1
+    ADC temp_1+1
+    STA total+1
+    BVC *+5
+    JMP overflow_trap
+    DEY
+    BNE for_loop_5
+    LDA #$04
+    SEC
+    SBC #1
+    STA m
+    LDA #0
+    STA m+1
+for_else_5:
+    LDA #232
+    STA temp_1
+    LDA #3
+    STA temp_1+1
+    LDA total
+    CLC
+    ADC temp_1
+    STA total
+    LDA total+1
+    ADC temp_1+1
+    STA total+1
+    BVC *+5
+    JMP overflow_trap
+for_exit_5:
+    LDA m
+    STA temp_1
+    LDA m+1
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+    LDA total
+    STA temp_1
+    LDA total+1
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+rts ; End of main program
+
+; --- Data Segment (Variables and Constants) ---
+; Temporaries: 11 temps in 1 slots, 2 bytes (LIFO pool: 4 bytes)
+; Peephole: 8 hits (redundant_load 8, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 10 short, 7 long (0 branch-over-JMP pairs shortened, 2 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 5 of 6 int variables fit in a byte (i, j, k, m, n)
+; Overflow checks: 7 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
+temp_0 * = * + 2
+temp_1 * = * + 2
+
+; --- Subroutines ---
+
+; Routine: ascii_to_petscii
+
+ascii_to_petscii
+    ; Input: A contains ASCII character
+    ; Output: A contains PETSCII character (lowercase ASCII converted to uppercase PETSCII)
+    CMP #'a'
+    BCC no_conversion_needed_petscii
+    CMP #'z'+1
+    BCS no_conversion_needed_petscii
+    SEC             ; Ensure Carry is set for SBC
+    SBC #$20        ; Convert ASCII 'a'-'z' to PETSCII 'A'-'Z' (e.g. ASCII 'a' (97) - 32 = PETSCII 'A' (65))
+no_conversion_needed_petscii
+    RTS
+
+
+; Routine: end_program
+end_program
+    RTS
+
+; Routine: overflow_error_msg
+overflow_error_msg
+    LDA #<overflow_msg
+    STA temp_0
+    LDA #>overflow_msg
+    STA temp_0+1
+    JMP print_string
+overflow_msg
+    text "OverflowError"
+    byte 0
+
+; Routine: overflow_trap
+
+overflow_trap
+    JSR overflow_error_msg
+    JMP end_program
+
+; Routine: print_char
+
+print_char
+    ; Input: A = ASCII character
+    ; Output: Prints character to screen via KERNAL CHROUT
+    ; Modifies: A (CHROUT modifica A)
+    ; Preserves: X, Y (CHROUT preserva X, Y)
+
+    JSR ascii_to_petscii    ; Convert A from ASCII to PETSCII. A is now PETSCII.
+    JSR $FFD2              ; Call KERNAL CHROUT routine
+    RTS
+
+
+; Routine: print_integer
+
+print_integer
+    ; Outputs the signed 16-bit integer in X (low byte) / A (high byte) in decimal.
+    ; Digits come from repeated subtraction of 10000, 1000, 100 and 10;
+    ; leading zeros are skipped and the units digit is always output.
+    STX print_integer_value
+    STA print_integer_value+1
+    CMP #$80
+    BCC print_integer_positive
+    LDA #'-'
+    JSR $FFD2
+    SEC
+    LDA #$00
+    SBC print_integer_value
+    STA print_integer_value
+    LDA #$00
+    SBC print_integer_value+1
+    STA print_integer_value+1
+print_integer_positive
+    LDA #$00
+    STA print_integer_started
+    LDX #$00                ; Index of the power of ten
+print_integer_digit
+    LDY #'0'                ; The digit, counted in ASCII
+print_integer_subtract
+    LDA print_integer_value
+    SEC
+    SBC print_integer_powers_lo,X
+    STA print_integer_scratch
+    LDA print_integer_value+1
+    SBC print_integer_powers_hi,X
+    BCC print_integer_emit
+    STA print_integer_value+1
+    LDA print_integer_scratch
+    STA print_integer_value
+    INY
+    BNE print_integer_subtract
+print_integer_emit
+    TYA
+    CMP #'0'
+    BNE print_integer_output
+    LDY print_integer_started
+    BEQ print_integer_next  ; Leading zero
+print_integer_output
+    STA print_integer_started
+    JSR $FFD2            ; Preserves X
+print_integer_next
+    INX
+    CPX #$04
+    BNE print_integer_digit
+    LDA print_integer_value
+    ORA #'0'
+    JMP $FFD2
+
+print_integer_powers_lo:
+    .byte <10000, <1000, <100, <10
+print_integer_powers_hi:
+    .byte >10000, >1000, >100, >10
+print_integer_value:
+    .byte 0, 0
+print_integer_scratch:
+    .byte 0
+print_integer_started:
+    .byte 0
+
+
+; Routine: print_newline
+
+print_newline
+    LDA #$0D                ; PETSCII carriage return
+    JMP $FFD2
+
+
+; Routine: print_string
+
+print_string
+    ; Routine to print a string located at the address contained in the var temp_0
+    ; Uses ZP locations $FA/$FB for the 16-bit string pointer.
+    ; Preserves A and Y registers.
+    PHA                     ; Save A
+    TYA                     ; Transfer Y to A (to save Y on stack)
+    PHA                     ; Push A (which now holds Y's original value)
+    LDA temp_0                ; Load LSB of string address from temp_0 (a .word variable)
+    STA $FA           ; Store LSB into ZP pointer
+    LDA temp_0+1              ; Load high byte of address from temp_0+1
+    STA $FB         ; Store MSB into ZP pointer
+
+    LDY #$00                  ; Use Y as the index for LDA (ZP),Y. This Y is local to the loop.
+print_loop_ps               ; Renamed label to avoid conflict if routine is included multiple times (though it shouldn't be)
+        LDA ($FA),Y ; Use (Indirect),Y addressing with ZP pointer
+        BEQ end_print_ps      ; If char is NUL, end.
+        JSR print_char          ; print_char preserves A, does not use Y.
+        INY                     ; Increment Y
+    ; Check if Y wrapped around (very unlikely for typical strings)
+    ; If Y becomes 0 after INY, it means we crossed a 256-byte boundary with Y.
+    CPY #0
+    BNE print_loop_ps       ; If Y is not 0, continue loop within the current 256-byte page
+    ; If Y wrapped to 0, it means we printed 256 chars. Increment MSB of ZP pointer.
+    INC $FB
+    JMP print_loop_ps       ; And continue printing (Y is 0 again for the new page)
+end_print_ps
+    PLA                     ; Pop original Y value (into A)
+    TAY                     ; Transfer A to Y (restoring Y)
+    PLA                     ; Pop original A value
+    RTS
+
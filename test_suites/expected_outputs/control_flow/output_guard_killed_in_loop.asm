@@ -0,0 +1,308 @@
+; Generated by py2c64 compiler
+; --- Python Source Code ---
+; x = 5
+; c = 0
+; if x < 10:
+;     while c < 2:
+;         y = x + 1
+;         x = 500
+;         c = c + 1
+; print(y)
+; g = 5
+; if g < 10:
+;     for i in range(2):
+;         h = g + 1
+;         g = g + 495
+; print(h)
+; # Expected output: 501, 501
+; --------------------------
+; --- Zero Page Variables ---
+g = $22 ; 26 weighted uses
+c = $24 ; 25 weighted uses
+x = $26 ; 18 weighted uses
+h = $28 ; 9 weighted uses
+y = $4B ; 9 weighted uses
+i = $4D ; 8 weighted uses
+* = $1000
+; --- Main Program and Functions ---
+main:
+    LDA #5
+    STA x
+    LDA #0
+    STA x+1
+    STA c
+    STA c+1
+    LDA x
+    CMP #$0A
+    LDA x+1
+    SBC #$00
+    BVC *+4
+    EOR #$80
+    BPL if_else_0
+    LDA c
+    CMP #$02
+    BCS while_else_1
+while_loop_1:
+    LDA #1
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    LDA x
+    CLC
+    ADC temp_1
+    STA y
+    LDA x+1
+    ADC temp_1+1
+    STA y+1
+    LDA #244
+    STA x
+    LDA #1
+    STA x+1
+    LDA c
+    CLC
+    ADC #$01
+    STA c
+    LDA #0
+    STA c+1
+while_test_1:
+    LDA c
+    CMP #$02
+    BCC while_loop_1
+while_else_1:
+while_exit_1:
+if_else_0:
+    LDA y
+    STA temp_1
+    LDA y+1
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+    LDA #5
+    STA g
+    LDA #0
+    STA g+1
+    LDA g
+    CMP #$0A
+    LDA g+1
+    SBC #$00
+    BVC *+4
+    EOR #$80
+    BPL if_else_2
+    ; for i: counter in Y
+    LDY #$02
+for_loop_3:
+    LDA #1
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    LDA g
+    CLC
+    ADC temp_1
+    STA h
+    LDA g+1
+    ADC temp_1+1
+    STA h+1
+    BVC *+5
+    JMP overflow_trap
+    LDA #239
+    STA temp_2
+    LDA #1
+    STA temp_2+1
+    LDA g
+    CLC
+    ADC temp_2
+    STA g
+    LDA g+1
+    ADC temp_2+1
+    STA g+1
+    BVC *+5
+    JMP overflow_trap
+    DEY
+    BNE for_loop_3
+    LDA #$01
+    STA i
+    LDA #0
+    STA i+1
+for_else_3:
+for_exit_3:
+if_else_2:
+    LDA h
+    STA temp_1
+    LDA h+1
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+rts ; End of main program
+
+; --- Data Segment (Variables and Constants) ---
+; Temporaries: 5 temps in 2 slots, 4 bytes (LIFO pool: 4 bytes)
+; Peephole: 4 hits (redundant_load 4, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 5 short, 2 long (0 branch-over-JMP pairs shortened, 2 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 2 of 6 int variables fit in a byte (c, i)
+; Overflow checks: 2 inline, 1 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
+temp_0 * = * + 2
+temp_1 * = * + 2
+temp_2 * = * + 2
+
+; --- Subroutines ---
+
+; Routine: ascii_to_petscii
+
+ascii_to_petscii
+    ; Input: A contains ASCII character
+    ; Output: A contains PETSCII character (lowercase ASCII converted to uppercase PETSCII)
+    CMP #'a'
+    BCC no_conversion_needed_petscii
+    CMP #'z'+1
+    BCS no_conversion_needed_petscii
+    SEC             ; Ensure Carry is set for SBC
+    SBC #$20        ; Convert ASCII 'a'-'z' to PETSCII 'A'-'Z' (e.g. ASCII 'a' (97) - 32 = PETSCII 'A' (65))
+no_conversion_needed_petscii
+    RTS
+
+
+; Routine: end_program
+end_program
+    RTS
+
+; Routine: overflow_error_msg
+overflow_error_msg
+    LDA #<overflow_msg
+    STA temp_0
+    LDA #>overflow_msg
+    STA temp_0+1
+    JMP print_string
+overflow_msg
+    text "OverflowError"
+    byte 0
+
+; Routine: overflow_trap
+
+overflow_trap
+    JSR overflow_error_msg
+    JMP end_program
+
+; Routine: print_char
+
+print_char
+    ; Input: A = ASCII character
+    ; Output: Prints character to screen via KERNAL CHROUT
+    ; Modifies: A (CHROUT modifica A)
+    ; Preserves: X, Y (CHROUT preserva X, Y)
+
+    JSR ascii_to_petscii    ; Convert A from ASCII to PETSCII. A is now PETSCII.
+    JSR $FFD2              ; Call KERNAL CHROUT routine
+    RTS
+
+
+; Routine: print_integer
+
+print_integer
+    ; Outputs the signed 16-bit integer in X (low byte) / A (high byte) in decimal.
+    ; Digits come from repeated subtraction of 10000, 1000, 100 and 10;
+    ; leading zeros are skipped and the units digit is always output.
+    STX print_integer_value
+    STA print_integer_value+1
+    CMP #$80
+    BCC print_integer_positive
+    LDA #'-'
+    JSR $FFD2
+    SEC
+    LDA #$00
+    SBC print_integer_value
+    STA print_integer_value
+    LDA #$00
+    SBC print_integer_value+1
+    STA print_integer_value+1
+print_integer_positive
+    LDA #$00
+    STA print_integer_started
+    LDX #$00                ; Index of the power of ten
+print_integer_digit
+    LDY #'0'                ; The digit, counted in ASCII
+print_integer_subtract
+    LDA print_integer_value
+    SEC
+    SBC print_integer_powers_lo,X
+    STA print_integer_scratch
+    LDA print_integer_value+1
+    SBC print_integer_powers_hi,X
+    BCC print_integer_emit
+    STA print_integer_value+1
+    LDA print_integer_scratch
+    STA print_integer_value
+    INY
+    BNE print_integer_subtract
+print_integer_emit
+    TYA
+    CMP #'0'
+    BNE print_integer_output
+    LDY print_integer_started
+    BEQ print_integer_next  ; Leading zero
+print_integer_output
+    STA print_integer_started
+    JSR $FFD2            ; Preserves X
+print_integer_next
+    INX
+    CPX #$04
+    BNE print_integer_digit
+    LDA print_integer_value
+    ORA #'0'
+    JMP $FFD2
+
+print_integer_powers_lo:
+    .byte <10000, <1000, <100, <10
+print_integer_powers_hi:
+    .byte >10000, >1000, >100, >10
+print_integer_value:
+    .byte 0, 0
+print_integer_scratch:
+    .byte 0
+print_integer_started:
+    .byte 0
+
+
+; Routine: print_newline
+
+print_newline
+    LDA #$0D                ; PETSCII carriage return
+    JMP $FFD2
+
+
+; Routine: print_string
+
+print_string
+    ; Routine to print a string located at the address contained in the var temp_0
+    ; Uses ZP locations $FA/$FB for the 16-bit string pointer.
+    ; Preserves A and Y registers.
+    PHA                     ; Save A
+    TYA                     ; Transfer Y to A (to save Y on stack)
+    PHA                     ; Push A (which now holds Y's original value)
+    LDA temp_0                ; Load LSB of string address from temp_0 (a .word variable)
+    STA $FA           ; Store LSB into ZP pointer
+    LDA temp_0+1              ; Load high byte of address from temp_0+1
+    STA $FB         ; Store MSB into ZP pointer
+
+    LDY #$00                  ; Use Y as the index for LDA (ZP),Y. This Y is local to the loop.
+print_loop_ps               ; Renamed label to avoid conflict if routine is included multiple times (though it shouldn't be)
+        LDA ($FA),Y ; Use (Indirect),Y addressing with ZP pointer
+        BEQ end_print_ps      ; If char is NUL, end.
+        JSR print_char          ; print_char preserves A, does not use Y.
+        INY                     ; Increment Y
+    ; Check if Y wrapped around (very unlikely for typical strings)
+    ; If Y becomes 0 after INY, it means we crossed a 256-byte boundary with Y.
+    CPY #0
+    BNE print_loop_ps       ; If Y is not 0, continue loop within the current 256-byte page
+    ; If Y wrapped to 0, it means we printed 256 chars. Increment MSB of ZP pointer.
+    INC $FB
+    JMP print_loop_ps       ; And continue printing (Y is 0 again for the new page)
+end_print_ps
+    PLA                     ; Pop original Y value (into A)
+    TAY                     ; Transfer A to Y (restoring Y)
+    PLA                     ; Pop original A value
+    RTS
+
@@ -1,458 +1,5 @@
 ; Generated by py2c64 compiler
 ; --- Python Source Code ---
-; x1 = 10
-; x2 = 20
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a1 = 5
-; b = 3
-; c = a1 * b + (a1 - b) // 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 250
-; x2 = 10
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 10
-; x2 = 0
-; z = x1 // x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a = 10 # 00001010
-; b = 5  # 00000101
-; c = a ^ b # Expected result: 15 (00001111)
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; val1 = 255 # 11111111 00000000
-; val2 = 85  # 01010101 00000000
-; # 255 (00FF) ^ 85 (0055) = 170 (00AA)
-; res_xor = val1 ^ val2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 2 * 5
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; y = 10 // 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; z = 5 + 3.14
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; my_list = [1, 2, 3]
-; for item in my_list:
-;   x = item * 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; i = 0
-; while i < 5:
-;   i = i + 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-
-while_start_0:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ while_end_0
-    JMP while_start_0
-while_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 10
-; res = 0
-; if x == 10:
-;   res = 1
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; res = 0
-; if x == 10:
-;   res = 1
-; # Expected: res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 10
-; res = 0
-; if x > 5:
-;   res = 1
-; else:
-;   res = 2
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 3
-; res = 0
-; if x > 5:
-;   res = 1
-; else:
-;   res = 2
-; # Expected: res = 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 15
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; else:
-;   res = 3
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_2
-    JMP if_end_2
-if_else_2:
-if_end_2:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 7
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; else:
-;   res = 3
-; # Expected: res = 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_2
-    JMP if_end_2
-if_else_2:
-if_end_2:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 3
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; else:
-;   res = 3
-; # Expected: res = 3
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_2
-    JMP if_end_2
-if_else_2:
-if_end_2:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 12
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_2
-if_end_2:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 8
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; # Expected: res = 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_2
-if_end_2:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 5
-; res = 0
-; if x <= y:
-;   res = 1
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 5
-; res = 0
-; if x < y:
-;   res = 1
-; # Expected: res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 10
-; y = 5
-; res = 0
-; if x > 5:
-;   if y < 10:
-;     res = 1
-;   else:
-;     res = 2
-; else:
-;   res = 3
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_2
-    JMP if_end_2
-if_else_2:
-if_end_2:
-    JMP if_end_0
-if_else_0:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; res = 0
-; if True:
-;   res = 1
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; res = 0
-; if False:
-;   res = 1
-; else:
-;   res = 2
-; # Expected: res = 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_else_0
-    JMP if_end_0
-if_else_0:
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 10
-; res = 0
-; if x + 2 > y - 5:
-;   res = 1
-; # Expected: 7 > 5 -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
 ; x = 3
 ; y = 1
 ; res = 0
@@ -460,250 +7,55 @@ rts ; End of main program
 ;   res = 1
 ; # Expected: 6 == 6 -> res = 1
 ; --------------------------
+; --- Zero Page Variables ---
+res = $22 ; 2 weighted uses
+x = $24 ; 2 weighted uses
+y = $26 ; 2 weighted uses
 * = $1000
 ; --- Main Program and Functions ---
 main:
-    LDA temp_0+1
-    LDX temp_0
-    ORA X
-    BEQ if_end_0
-if_end_0:
-rts ; End of main program
-
-; --- Data Segment (Variables and Constants) ---
-m16_arg1_h .res 2
-m16_arg1_l .res 2
-m16_arg2_h .res 2
-m16_arg2_l .res 2
-m16_mul8_val1 .res 2
-m16_mul8_val2 .res 2
-m16_p0_h .res 2
-m16_p0_l .res 2
-m16_res_h .res 2
-m16_res_l .res 2
-m16_term2 .res 2
-m16_term3 .res 2
-res .res 2
-temp_0 .res 4
-temp_1 .res 4
-temp_2 .res 2
-temp_3 .res 2
-x .res 2
-y .res 2
-m16_arg1_h * = * + 2
-m16_arg1_l * = * + 2
-m16_arg2_h * = * + 2
-m16_arg2_l * = * + 2
-m16_mul8_val1 * = * + 2
-m16_mul8_val2 * = * + 2
-m16_p0_h * = * + 2
-m16_p0_l * = * + 2
-m16_res_h * = * + 2
-m16_res_l * = * + 2
-m16_term2 * = * + 2
-m16_term3 * = * + 2
-res * = * + 2
-temp_0 * = * + 4
-temp_1 * = * + 4
-temp_2 * = * + 4
-temp_3 * = * + 4
-x * = * + 2
-y * = * + 2
-
-; --- Subroutines ---
-
-; Routine: ascii_to_petscii
-
-ascii_to_petscii
-    ; Input: A contains ASCII character
-    ; Output: A contains PETSCII character (lowercase ASCII converted to uppercase PETSCII)
-    CMP #'a'
-    BCC no_conversion_needed_petscii
-    CMP #'z'+1
-    BCS no_conversion_needed_petscii
-    SEC             ; Ensure Carry is set for SBC
-    SBC #$20        ; Convert ASCII 'a'-'z' to PETSCII 'A'-'Z' (e.g. ASCII 'a' (97) - 32 = PETSCII 'A' (65))
-no_conversion_needed_petscii
-    RTS
-
-
-; Routine: check_overflow
-
-check_overflow
-    ; Check the overflow flag (V)
-    BVC no_overflow  ; Branch if Overflow Clear (no overflow)
-
-    ; If we are here, there is an overflow
-    JSR overflow_error_msg
-    JMP end_program
-
-no_overflow
-    RTS
-
-; Routine: end_program
-end_program
-    RTS
-
-; Routine: multiply
-multiply
-    ; A: value 1
-    ; X: value 2
-    ; Load the value in B (0x0000)
-    STA multiply_value1
-    STX multiply_value2
-    ; Clear the result var
+    LDA #3
+    STA x
     LDA #0
-    STA multiply_result
-    LDY #8
-loop_multiply
-    LSR multiply_value2
-    BCC skip_addition
-    LDA multiply_result
-    CLC
-    ADC multiply_value1
-    STA multiply_result
-skip_addition
-    ASL multiply_value1
-    DEY
-    BNE loop_multiply
-    LDA multiply_result
-    RTS
-
-; Routine: multiply16x16_16
-
-multiply16x16_16
-    ; Multiplies m16_arg1 by m16_arg2, 16-bit result in m16_res.
-    ; Handles overflow by jumping to overflow_error_msg.
-
-    ; --- Local subroutine: _multiply8x8_to_16bit_internal ---
-    ; Input: Accumulatore (A) = fattore1, Registro X = fattore2
-    ; Output: m16_p0_h (MSB prodotto), m16_p0_l (LSB prodotto)
-    ; Usa: m16_mul8_val1, m16_mul8_val2 come temporanei
-_m16_mul8_16_start:
-    STA m16_mul8_val1   ; Salva fattore1 (Label definition)
-    STX m16_mul8_val2   ; Salva fattore2 (Label definition)
+    STA x+1
+    LDA #1
+    STA y
     LDA #0
-    STA m16_p0_l        ; LSB of partial product (Label definition)
-    LDX #8              ; Contatore di bit (Y non usato per evitare conflitti se chiamato da Y) (Label definition)
-_m16_mul8_16_loop:
-    LSR m16_mul8_val2   ; Bit meno significativo del moltiplicatore in Carry (Label definition)
-    BCC _m16_mul8_16_no_add (Label definition)
-    LDA m16_p0_l        ; Somma il moltiplicando (m16_mul8_val1) al LSB del prodotto
+    STA y+1
+    STA res
+    STA res+1
+    LDA x
+    STA temp_1
+    LDA x+1
+    STA temp_1+1
+    ASL temp_1
+    ROL temp_1+1
+    LDA y
     CLC
-    ADC m16_mul8_val1
-    STA m16_p0_l
-    LDA m16_p0_h        ; Somma il riporto al MSB del prodotto
-    ADC #0
-    STA m16_p0_h
-_m16_mul8_16_no_add: (Label definition)
-    ROR m16_p0_h        ; Scorrimento a destra del prodotto (MSB) (Label definition)
-    ROR m16_p0_l        ; Scorrimento a destra del prodotto (LSB) (Label definition)
-    DEX (Label definition)
-    BNE _m16_mul8_16_loop (Label definition)
-    ; Result of 8x8->16bit is in m16_p0_h, m16_p0_l
-    ; End of local subroutine
-
-    ; Calculate P0 = LSB(arg1) * LSB(arg2) -> m16_p0_l, m16_p0_h
-    LDA m16_arg1_l
-    LDX m16_arg2_l
-    JSR _m16_mul8_16_start ; Call the local subroutine
-    ; m16_p0_l and m16_p0_h contain the result
-
-    LDA m16_p0_l
-    STA m16_res_l       ; LSB of final result = LSB(P0)
-
-    ; Save MSB(P0) temporarily for subsequent sums
-    LDA m16_p0_h
-    STA m16_term2       ; Use m16_term2 for MSB(P0) initially
-
-    ; Calculate term2_val = LSB(arg1) * MSB(arg2) (8-bit result)
-    ; Use the 'multiply' routine (8x8 -> 8 bit, input A,X, output A)
-    LDA m16_arg1_l
-    LDX m16_arg2_h      ; MSB of the second argument
-    JSR multiply        ; Result in A (from multiply_result)
-    ; Add this to m16_term2 (which contains MSB(P0))
-    CLC
-    ADC m16_term2
-    STA m16_term2       ; m16_term2 ora = MSB(P0) + (LSB(arg1)*MSB(arg2))
-    BCS _m16_overflow   ; If there's a carry, overflow of the 16-bit result
-
-    ; Calculate term3_val = MSB(arg1) * LSB(arg2) (8-bit result)
-    LDA m16_arg1_h      ; MSB of the first argument
-    LDX m16_arg2_l
-    JSR multiply        ; Result in A
-    ; Add this to m16_term2
-    CLC
-    ADC m16_term2
-    STA m16_res_h       ; Questo è il MSB del risultato finale
-    BCS _m16_overflow   ; Se c'è riporto, overflow
-
-    ; Controllo finale: se MSB(arg1) != 0 E MSB(arg2) != 0, allora c'è overflow
-    ; perché il termine MSB(arg1)*MSB(arg2) sarebbe >> 16 bit.
-    LDA m16_arg1_h
-    BEQ _m16_no_final_overflow ; If MSB(arg1) is 0, no overflow from this term
-    LDA m16_arg2_h (Label definition)
-    BEQ _m16_no_final_overflow ; If MSB(arg2) is 0, no overflow from this term
-    ; Se entrambi MSB non sono zero, allora overflow
-    JMP _m16_overflow
-
-_m16_no_final_overflow: (Label definition)
-    RTS
-
-_m16_overflow:
-    JMP overflow_error_msg
-
-
-; Routine: overflow_error_msg
-overflow_error_msg
-    LDA #<overflow_msg
-    STA temp_0
-    LDA #>overflow_msg
-    STA temp_0+1
-    JMP print_string
-
-; Routine: print_char
-
-print_char
-    ; Input: A = ASCII character
-    ; Output: Prints character to screen via KERNAL CHROUT
-    ; Modifies: A (CHROUT modifica A)
-    ; Preserves: X, Y (CHROUT preserva X, Y)
-
-    JSR ascii_to_petscii    ; Convert A from ASCII to PETSCII. A is now PETSCII.
-    JSR chrout              ; Call KERNAL CHROUT routine (address defined in data section)
-    RTS
-
-
-; Routine: print_string
-
-print_string
-    ; Routine to print a string located at the address contained in the var temp_0
-    ; Uses ZP locations $FA/$FB for the 16-bit string pointer.
-    ; Preserves A and Y registers.
-    PHA                     ; Save A
-    TYA                     ; Transfer Y to A (to save Y on stack)
-    PHA                     ; Push A (which now holds Y's original value)
-    LDA temp_0                ; Load LSB of string address from temp_0 (a .word variable)
-    STA $FA           ; Store LSB into ZP pointer
-    LDA temp_0+1              ; Load high byte of address from temp_0+1
-    STA $FB         ; Store MSB into ZP pointer
+    ADC #$05
+    STA temp_2
+    LDA #0
+    STA temp_2+1
+    LDA temp_1
+    CMP temp_2
+    BNE if_else_0
+    LDA #1
+    STA res
+    LDA #0
+    STA res+1
+if_else_0:
+rts ; End of main program
 
-    LDY #$00                  ; Use Y as the index for LDA (ZP),Y. This Y is local to the loop.
-print_loop_ps               ; Renamed label to avoid conflict if routine is included multiple times (though it shouldn't be)
-        LDA ($FA),Y ; Use (Indirect),Y addressing with ZP pointer
-        BEQ end_print_ps      ; If char is NUL, end.
-        JSR print_char          ; print_char preserves A, does not use Y.
-        INY                     ; Increment Y
-    ; Check if Y wrapped around (very unlikely for typical strings)
-    ; If Y becomes 0 after INY, it means we crossed a 256-byte boundary with Y.
-    CPY #0
-    BNE print_loop_ps       ; If Y is not 0, continue loop within the current 256-byte page
-    ; If Y wrapped to 0, it means we printed 256 chars. Increment MSB of ZP pointer.
-    INC $FB
-    JMP print_loop_ps       ; And continue printing (Y is 0 again for the new page)
-end_print_ps
-    PLA                     ; Pop original Y value (into A)
-    TAY                     ; Transfer A to Y (restoring Y)
-    PLA                     ; Pop original A value
-    RTS
+; --- Data Segment (Variables and Constants) ---
+; Temporaries: 2 temps in 2 slots, 4 bytes (LIFO pool: 8 bytes)
+; Peephole: 2 hits (redundant_load 2, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 1 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 3 of 3 int variables fit in a byte (res, x, y)
+; Overflow checks: 0 inline, 1 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
+temp_0 * = * + 2
+temp_1 * = * + 2
+temp_2 * = * + 2
 
+; --- Subroutines ---
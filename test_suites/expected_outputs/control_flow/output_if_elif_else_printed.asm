@@ -0,0 +1,166 @@
+; Generated by py2c64 compiler
+; --- Python Source Code ---
+; x = 5
+; if x > 10:
+;     print(1)
+; elif x > 3:
+;     print(2)
+; else:
+;     print(3)
+; if x == 5:
+;     print(4)
+; if x < 0:
+;     print(5)
+; # Expected output: 2, 4
+; --------------------------
+; --- Zero Page Variables ---
+x = $22 ; 5 weighted uses
+* = $1000
+; --- Main Program and Functions ---
+main:
+    LDA #5
+    STA x
+    LDA #0
+    STA x+1
+    LDA #$0A
+    CMP x
+    BCS if_else_0
+    LDA #1
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+    JMP if_end_0
+if_else_0:
+    LDA #$03
+    CMP x
+    BCS if_else_1
+    LDA #2
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+    JMP if_end_1
+if_else_1:
+    LDA #3
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+if_end_1:
+if_end_0:
+    LDA x
+    CMP #$05
+    BNE if_else_2
+    LDA #4
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+if_else_2:
+    LDA x
+    CMP #$00
+    BCS if_else_3
+    LDA #5
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+if_else_3:
+rts ; End of main program
+
+; --- Data Segment (Variables and Constants) ---
+; Temporaries: 5 temps in 1 slots, 2 bytes (LIFO pool: 4 bytes)
+; Peephole: 5 hits (redundant_load 5, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 4 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 1 of 1 int variables fit in a byte (x)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
+temp_1 * = * + 2
+
+; --- Subroutines ---
+
+; Routine: print_integer
+
+print_integer
+    ; Outputs the signed 16-bit integer in X (low byte) / A (high byte) in decimal.
+    ; Digits come from repeated subtraction of 10000, 1000, 100 and 10;
+    ; leading zeros are skipped and the units digit is always output.
+    STX print_integer_value
+    STA print_integer_value+1
+    CMP #$80
+    BCC print_integer_positive
+    LDA #'-'
+    JSR $FFD2
+    SEC
+    LDA #$00
+    SBC print_integer_value
+    STA print_integer_value
+    LDA #$00
+    SBC print_integer_value+1
+    STA print_integer_value+1
+print_integer_positive
+    LDA #$00
+    STA print_integer_started
+    LDX #$00                ; Index of the power of ten
+print_integer_digit
+    LDY #'0'                ; The digit, counted in ASCII
+print_integer_subtract
+    LDA print_integer_value
+    SEC
+    SBC print_integer_powers_lo,X
+    STA print_integer_scratch
+    LDA print_integer_value+1
+    SBC print_integer_powers_hi,X
+    BCC print_integer_emit
+    STA print_integer_value+1
+    LDA print_integer_scratch
+    STA print_integer_value
+    INY
+    BNE print_integer_subtract
+print_integer_emit
+    TYA
+    CMP #'0'
+    BNE print_integer_output
+    LDY print_integer_started
+    BEQ print_integer_next  ; Leading zero
+print_integer_output
+    STA print_integer_started
+    JSR $FFD2            ; Preserves X
+print_integer_next
+    INX
+    CPX #$04
+    BNE print_integer_digit
+    LDA print_integer_value
+    ORA #'0'
+    JMP $FFD2
+
+print_integer_powers_lo:
+    .byte <10000, <1000, <100, <10
+print_integer_powers_hi:
+    .byte >10000, >1000, >100, >10
+print_integer_value:
+    .byte 0, 0
+print_integer_scratch:
+    .byte 0
+print_integer_started:
+    .byte 0
+
+
+; Routine: print_newline
+
+print_newline
+    LDA #$0D                ; PETSCII carriage return
+    JMP $FFD2
+
@@ -1,678 +1,5 @@
 ; Generated by py2c64 compiler
 ; --- Python Source Code ---
-; x1 = 10
-; x2 = 20
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a1 = 5
-; b = 3
-; c = a1 * b + (a1 - b) // 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 250
-; x2 = 10
-; z = x1 + x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x1 = 10
-; x2 = 0
-; z = x1 // x2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a = 10 # 00001010
-; b = 5  # 00000101
-; c = a ^ b # Expected result: 15 (00001111)
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; val1 = 255 # 11111111 00000000
-; val2 = 85  # 01010101 00000000
-; # 255 (00FF) ^ 85 (0055) = 170 (00AA)
-; res_xor = val1 ^ val2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 2 * 5
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; y = 10 // 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; z = 5 + 3.14
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; my_list = [1, 2, 3]
-; for item in my_list:
-;   x = item * 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; i = 0
-; while i < 5:
-;   i = i + 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 10
-; res = 0
-; if x == 10:
-;   res = 1
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; res = 0
-; if x == 10:
-;   res = 1
-; # Expected: res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 10
-; res = 0
-; if x > 5:
-;   res = 1
-; else:
-;   res = 2
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 3
-; res = 0
-; if x > 5:
-;   res = 1
-; else:
-;   res = 2
-; # Expected: res = 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 15
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; else:
-;   res = 3
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 7
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; else:
-;   res = 3
-; # Expected: res = 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 3
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; else:
-;   res = 3
-; # Expected: res = 3
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 12
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 8
-; res = 0
-; if x > 10:
-;   res = 1
-; elif x > 5:
-;   res = 2
-; # Expected: res = 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 5
-; res = 0
-; if x <= y:
-;   res = 1
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 5
-; res = 0
-; if x < y:
-;   res = 1
-; # Expected: res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 10
-; y = 5
-; res = 0
-; if x > 5:
-;   if y < 10:
-;     res = 1
-;   else:
-;     res = 2
-; else:
-;   res = 3
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; res = 0
-; if True:
-;   res = 1
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; res = 0
-; if False:
-;   res = 1
-; else:
-;   res = 2
-; # Expected: res = 2
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 10
-; res = 0
-; if x + 2 > y - 5:
-;   res = 1
-; # Expected: 7 > 5 -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 3
-; y = 1
-; res = 0
-; if x * 2 == y + 5:
-;   res = 1
-; # Expected: 6 == 6 -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 0
-; res = 0
-; if not x:
-;   res = 1
-; # Expected: not 0 -> True -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; res = 0
-; if not x:
-;   res = 1
-; # Expected: not 5 -> False -> res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 10
-; res = 0
-; if x > 0 and y > 0:
-;   res = 1
-; # Expected: True and True -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 0
-; res = 0
-; if x > 0 and y > 0:
-;   res = 1
-; # Expected: True and False -> res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 0
-; y = 10
-; res = 0
-; if x > 0 and y > 0: # y > 0 should not be evaluated if the compiler is smart
-;   res = 1
-; # Expected: False and True -> res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 0
-; res = 0
-; if x > 0 or y > 0: # y > 0 should not be evaluated
-;   res = 1
-; # Expected: True or False -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 0
-; y = 10
-; res = 0
-; if x > 0 or y > 0:
-;   res = 1
-; # Expected: False or True -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 0
-; y = 0
-; res = 0
-; if x > 0 or y > 0:
-;   res = 1
-; # Expected: False or False -> res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 5
-; y = 0
-; res = 0
-; if not (x == 0 and y == 0):
-;   res = 1
-; # Expected: not (False and True) -> not False -> True -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 0
-; y = 0
-; res = 0
-; if not (x > 0 or y > 0):
-;   res = 1
-; # Expected: not (False or False) -> not False -> True -> res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; res = 0
-; if True and False:
-;   res = 1
-; # Expected: res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a = 10
-; b = 5
-; res = 0
-; if (a ^ b): # 10^5 = 15 (non-zero, quindi True)
-;   res = 1
-; # Expected: res = 1
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a = 7
-; b = 7
-; res = 0
-; if (a ^ b): # 7^7 = 0 (zero, quindi False)
-;   res = 1
-; # Expected: res = 0
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; i = 0
-; res = 0
-; while i < 10:
-;   res = res + i
-;   i = i + 1
-;   if i == 5:
-;     break
-; # Expected: res = 0+1+2+3+4 = 10, i = 5
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; i = 0
-; res = 0
-; while i < 5:
-;   i = i + 1
-;   if i == 3:
-;     continue
-;   res = res + i
-; # Expected: i=5, res = 1+2+4+5 = 12
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; my_list = [1, 2, 3, 4, 5]
-; res = 0
-; for item in my_list:
-;   if item == 4:
-;     break
-;   res = res + item
-; # Expected: res = 1+2+3 = 6
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; my_list = [1, 2, 3, 4, 5]
-; res = 0
-; for item in my_list:
-;   if item == 3:
-;     continue
-;   res = res + item
-; # Expected: res = 1+2+4+5 = 12
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; outer_sum = 0
-; my_list = [1, 2, 3]
-; for x in my_list: # x = 1, 2, 3
-;     outer_sum = outer_sum + x
-;     y = 0
-;     while y < 2: # y = 0, 1
-;         y = y + 1 # In Python, this would be inside the loop
-;         if x == 2:
-;             break # Exits the inner while if x is 2
-;     # Se x=1, y arriva a 2. outer_sum = 1
-;     # Se x=2, y=1, break. outer_sum = 1+2=3
-;     # Se x=3, y arriva a 2. outer_sum = 3+3=6
-; # Expected: outer_sum = 6
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; my_dict = {}
-; my_dict['c'] = 3
-; del my_dict['d']
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; my_dict = {'a': 1, 'b': 2}
-; x1 = my_dict['a']
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; t = (1, 2, 3)
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; s = {1, 2, 3, 2, 1}
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a_int = 10
-; b_float_literal = 1.5
-; c_float_result = a_int + b_float_literal
-; # To observe the result, you might add: print(c_float_result)
-; # For now, we primarily verify the generated assembly for the calculation.
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a_float = 3.14
-; b_float = 2.71
-; result = a_float < b_float
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x_float = 1.5
-; y_float = 1.5
-; is_equal = x_float == y_float
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; p_float = 10.0
-; q_float = 10.000001
-; is_not_equal = p_float != q_float
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; int_val = 5
-; float_val = 4.99
-; is_greater = int_val > float_val
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; x = 3.5
-; y = -0.25
-; z = 0.0
-; # Verification of byte patterns for x, y, z in the .asm data section
-; # would be done by inspecting the generated expected_outputs/float_assignments_literals/assign_positive_float_literal.asm
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; a = -5.25
-; abs_a = abs(a)  # Expected: 5.25
-; b = 0.0
-; sgn_a = sgn(a)    # Expected: -1.0
-; sgn_b = sgn(b)    # Expected: 0.0
-; sgn_c = sgn(10.0) # Expected: 1.0
-; d = 2.0 # Placeholder for log, as FP_LOG is a stub
-; log_d = log(d)
-; log_int = log(1) # Test coercion
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-jsr integer_abs
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
-; # Test exp() stub - should call FP_EXP and handle type.
-; # FP_EXP itself will signal NotImplementedError at runtime.
-; # We are testing the compilation path to FP_EXP.
-; res_exp_float = exp(1.0)
-; res_exp_int = exp(2) # Test integer to float coercion for argument
-; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
-rts ; End of main program
-; Generated by py2c64 compiler
-; --- Python Source Code ---
 ; a = 3.5
 ; b = 3.5
 ; c = -2.0
@@ -686,26 +13,322 @@ rts ; End of main program
 ; res_ge1 = (a >= b) # Expected: True (1)
 ; res_ge2 = (a >= c) # Expected: True (1)
 ; --------------------------
-* = $1000
-; --- Main Program and Functions ---
-main:
+; --- Zero Page Variables ---
+a_var = $22 ; 9 weighted uses
+c = $26 ; 6 weighted uses
+res_eq = $28 ; 1 weighted uses
+b = $4B ; 4 weighted uses
+res_ge1 = $4F ; 1 weighted uses
+res_ge2 = $51 ; 1 weighted uses
+res_gt = $53 ; 1 weighted uses
+res_le1 = $55 ; 1 weighted uses
+res_le2 = $57 ; 1 weighted uses
+res_lt = $59 ; 1 weighted uses
+res_ne = $5B ; 1 weighted uses
+* = $1000
+; --- Main Program and Functions ---
+main:
+    LDA #$00
+    STA a_var+0
+    STA a_var+1
+    LDA #$70
+    STA a_var+2
+    LDA #$82
+    STA a_var+3
+    LDA #$00
+    STA b+0
+    STA b+1
+    LDA #$70
+    STA b+2
+    LDA #$82
+    STA b+3
+    LDA #$00
+    STA c+0
+    STA c+1
+    STA c+2
+    STA c+3
+    LDA a_var+3
+    STA $F8
+    LDA a_var+0
+    STA $F9
+    LDA a_var+1
+    STA $FA
+    LDA a_var+2
+    STA $FB
+    LDA b+3
+    STA $F4
+    LDA b+0
+    STA $F5
+    LDA b+1
+    STA $F6
+    LDA b+2
+    STA $F7
+    JSR FP_FCMP
+    BNE *+5
+    JMP FP_EQ
+    JMP cmp_true_0
+    LDA #0
+    JMP cmp_end_0
+cmp_true_0:
+    LDA #1
+cmp_end_0:
+    STA res_eq
+    LDA #0
+    STA res_eq+1
+    LDA a_var+3
+    STA $F8
+    LDA a_var+0
+    STA $F9
+    LDA a_var+1
+    STA $FA
+    LDA a_var+2
+    STA $FB
+    LDA c+3
+    STA $F4
+    LDA c+0
+    STA $F5
+    LDA c+1
+    STA $F6
+    LDA c+2
+    STA $F7
+    JSR FP_FCMP
+    BEQ *+5
+    JMP FP_NE
+    JMP cmp_true_1
+    LDA #0
+    JMP cmp_end_1
+cmp_true_1:
+    LDA #1
+cmp_end_1:
+    STA res_ne
+    LDA #0
+    STA res_ne+1
+    LDA c+3
+    STA $F8
+    LDA c+0
+    STA $F9
+    LDA c+1
+    STA $FA
+    LDA c+2
+    STA $FB
+    LDA a_var+3
+    STA $F4
+    LDA a_var+0
+    STA $F5
+    LDA a_var+1
+    STA $F6
+    LDA a_var+2
+    STA $F7
+    JSR FP_FCMP
+    BCS *+5
+    JMP FP_LT
+    JMP cmp_true_2
+    LDA #0
+    JMP cmp_end_2
+cmp_true_2:
+    LDA #1
+cmp_end_2:
+    STA res_lt
+    LDA #0
+    STA res_lt+1
+    LDA a_var+3
+    STA $F8
+    LDA a_var+0
+    STA $F9
+    LDA a_var+1
+    STA $FA
+    LDA a_var+2
+    STA $FB
+    LDA c+3
+    STA $F4
+    LDA c+0
+    STA $F5
+    LDA c+1
+    STA $F6
+    LDA c+2
+    STA $F7
+    LDA c+3
+    STA $F8
+    LDA c+0
+    STA $F9
+    LDA c+1
+    STA $FA
+    LDA c+2
+    STA $FB
+    LDA a_var+3
+    STA $F4
+    LDA a_var+0
+    STA $F5
+    LDA a_var+1
+    STA $F6
+    LDA a_var+2
+    STA $F7
+    JSR FP_FCMP
+    BCS *+5
+    JMP FP_LT
+    JMP cmp_true_3
+    LDA #0
+    JMP cmp_end_3
+cmp_true_3:
+    LDA #1
+cmp_end_3:
+    STA res_gt
+    LDA #0
+    STA res_gt+1
+    LDA a_var+3
+    STA $F8
+    LDA a_var+0
+    STA $F9
+    LDA a_var+1
+    STA $FA
+    LDA a_var+2
+    STA $FB
+    LDA b+3
+    STA $F4
+    LDA b+0
+    STA $F5
+    LDA b+1
+    STA $F6
+    LDA b+2
+    STA $F7
+    JSR FP_FCMP
+    BCC *+5
+    JMP FP_GE
+    JMP cmp_true_4
+    LDA #0
+    JMP cmp_end_4
+cmp_true_4:
+    LDA #1
+cmp_end_4:
+    STA res_le1
+    LDA #0
+    STA res_le1+1
+    LDA c+3
+    STA $F8
+    LDA c+0
+    STA $F9
+    LDA c+1
+    STA $FA
+    LDA c+2
+    STA $FB
+    LDA a_var+3
+    STA $F4
+    LDA a_var+0
+    STA $F5
+    LDA a_var+1
+    STA $F6
+    LDA a_var+2
+    STA $F7
+    JSR FP_FCMP
+    BCC *+5
+    JMP FP_GE
+    JMP cmp_true_5
+    LDA #0
+    JMP cmp_end_5
+cmp_true_5:
+    LDA #1
+cmp_end_5:
+    STA res_le2
+    LDA #0
+    STA res_le2+1
+    LDA a_var+3
+    STA $F8
+    LDA a_var+0
+    STA $F9
+    LDA a_var+1
+    STA $FA
+    LDA a_var+2
+    STA $FB
+    LDA b+3
+    STA $F4
+    LDA b+0
+    STA $F5
+    LDA b+1
+    STA $F6
+    LDA b+2
+    STA $F7
+    LDA b+3
+    STA $F8
+    LDA b+0
+    STA $F9
+    LDA b+1
+    STA $FA
+    LDA b+2
+    STA $FB
+    LDA a_var+3
+    STA $F4
+    LDA a_var+0
+    STA $F5
+    LDA a_var+1
+    STA $F6
+    LDA a_var+2
+    STA $F7
+    JSR FP_FCMP
+    BCC *+5
+    JMP FP_GE
+    JMP cmp_true_6
+    LDA #0
+    JMP cmp_end_6
+cmp_true_6:
+    LDA #1
+cmp_end_6:
+    STA res_ge1
+    LDA #0
+    STA res_ge1+1
+    LDA a_var+3
+    STA $F8
+    LDA a_var+0
+    STA $F9
+    LDA a_var+1
+    STA $FA
+    LDA a_var+2
+    STA $FB
+    LDA c+3
+    STA $F4
+    LDA c+0
+    STA $F5
+    LDA c+1
+    STA $F6
+    LDA c+2
+    STA $F7
+    LDA c+3
+    STA $F8
+    LDA c+0
+    STA $F9
+    LDA c+1
+    STA $FA
+    LDA c+2
+    STA $FB
+    LDA a_var+3
+    STA $F4
+    LDA a_var+0
+    STA $F5
+    LDA a_var+1
+    STA $F6
+    LDA a_var+2
+    STA $F7
+    JSR FP_FCMP
+    BCC *+5
+    JMP FP_GE
+    JMP cmp_true_7
+    LDA #0
+    JMP cmp_end_7
+cmp_true_7:
+    LDA #1
+cmp_end_7:
+    STA res_ge2
+    LDA #0
+    STA res_ge2+1
 rts ; End of main program
 
 ; --- Data Segment (Variables and Constants) ---
-a .res 4
-b .res 4
-c .res 4
-res_eq .res 2
-res_ge1 .res 2
-res_ge2 .res 2
-res_gt .res 2
-res_le1 .res 2
-res_le2 .res 2
-res_lt .res 2
-res_ne .res 2
-a * = * + 2
-b * = * + 2
-c * = * + 2
+; Temporaries: 0 temps in 0 slots, 0 bytes (LIFO pool: 0 bytes)
+; Peephole: 5 hits (redundant_load 5, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 0 short, 8 long (0 branch-over-JMP pairs shortened, 2 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 8 of 8 int variables fit in a byte (res_eq, res_ge1, res_ge2, res_gt, res_le1, res_le2, res_lt, res_ne)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
 
 ; --- Subroutines ---
 
@@ -891,6 +514,9 @@ attribute_error_msg
     LDA #>attribute_error_msg_string
     STA temp_0+1
     JMP print_string
+attribute_error_msg_string
+    text "AttributeError"
+    byte 0
 
 ; Routine: division_by_zero_msg
 division_by_zero_msg
@@ -899,6 +525,9 @@ division_by_zero_msg
     LDA #>division_by_zero_msg_string
     STA temp_0+1
     JMP print_string
+division_by_zero_msg_string
+    text "ZeroDivisionError"
+    byte 0
 
 ; Routine: end_program
 end_program
@@ -920,6 +549,9 @@ generic_error_msg
     LDA #>error_msg
     STA temp_0+1
     JMP print_string
+error_msg
+    text "RuntimeError"
+    byte 0
 
 ; Routine: key_error_msg
 key_error_msg
@@ -928,6 +560,9 @@ key_error_msg
     LDA #>key_error_msg_string
     STA temp_0+1
     JMP print_string
+key_error_msg_string
+    text "KeyError"
+    byte 0
 
 ; Routine: not_implemented_error_msg
 not_implemented_error_msg
@@ -936,6 +571,9 @@ not_implemented_error_msg
     LDA #>not_implemented_error_msg_string
     STA temp_0+1
     JMP print_string
+not_implemented_error_msg_string
+    text "NotImplementedError"
+    byte 0
 
 ; Routine: overflow_error_msg
 overflow_error_msg
@@ -944,6 +582,9 @@ overflow_error_msg
     LDA #>overflow_msg
     STA temp_0+1
     JMP print_string
+overflow_msg
+    text "OverflowError"
+    byte 0
 
 ; Routine: print_char
 
@@ -954,7 +595,7 @@ print_char
     ; Preserves: X, Y (CHROUT preserva X, Y)
 
     JSR ascii_to_petscii    ; Convert A from ASCII to PETSCII. A is now PETSCII.
-    JSR chrout              ; Call KERNAL CHROUT routine (address defined in data section)
+    JSR $FFD2              ; Call KERNAL CHROUT routine
     RTS
 
 
@@ -0,0 +1,136 @@
+; Generated by py2c64 compiler
+; --- Python Source Code ---
+; def double(n):
+;   return n + n
+; print(double(-21))
+; print(double(100))
+; # Expected output: -42, 200
+; --------------------------
+* = $1000
+; --- Main Program and Functions ---
+main:
+    LDA #235
+    STA temp_2
+    LDA #255
+    STA temp_2+1
+    ldx temp_2
+    JSR func_double_0
+    STX temp_2
+    STA temp_2+1
+jsr print_integer
+jsr print_newline
+    LDA #200
+    STA temp_2
+    LDA #0
+    STA temp_2+1
+    ldx temp_2
+jsr print_integer
+jsr print_newline
+rts ; End of main program
+
+func_double_0:
+    ; --- double: register arguments ---
+    stx __double_n
+    sta __double_n+1
+    LDA __double_n
+    CLC
+    ADC __double_n
+    STA temp_1
+    LDA __double_n+1
+    ADC __double_n+1
+    STA temp_1+1
+    ldx temp_1
+    lda temp_1+1
+
+func_double_ret_0:
+    RTS
+
+; --- Data Segment (Variables and Constants) ---
+; Temporaries: 4 temps in 2 slots, 4 bytes (LIFO pool: 8 bytes)
+; Peephole: 5 hits (redundant_load 4, redundant_store 0, redundant_carry 0, jump_to_next 1, jump_chain 0)
+; Branches: 0 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 1 calls (double x1), budget 3/256 nodes
+; Value ranges: 0 of 1 int variables fit in a byte (none)
+; Overflow checks: 0 inline, 1 removed by range analysis, 0 disabled
+; Static frames: 1 functions in 2 bytes (2 bytes without sharing)
+__static_frames * = * + 2
+__double_n = __static_frames+0
+temp_0 * = * + 2
+temp_1 * = * + 2
+temp_2 * = * + 2
+
+; --- Subroutines ---
+
+; Routine: print_integer
+
+print_integer
+    ; Outputs the signed 16-bit integer in X (low byte) / A (high byte) in decimal.
+    ; Digits come from repeated subtraction of 10000, 1000, 100 and 10;
+    ; leading zeros are skipped and the units digit is always output.
+    STX print_integer_value
+    STA print_integer_value+1
+    CMP #$80
+    BCC print_integer_positive
+    LDA #'-'
+    JSR $FFD2
+    SEC
+    LDA #$00
+    SBC print_integer_value
+    STA print_integer_value
+    LDA #$00
+    SBC print_integer_value+1
+    STA print_integer_value+1
+print_integer_positive
+    LDA #$00
+    STA print_integer_started
+    LDX #$00                ; Index of the power of ten
+print_integer_digit
+    LDY #'0'                ; The digit, counted in ASCII
+print_integer_subtract
+    LDA print_integer_value
+    SEC
+    SBC print_integer_powers_lo,X
+    STA print_integer_scratch
+    LDA print_integer_value+1
+    SBC print_integer_powers_hi,X
+    BCC print_integer_emit
+    STA print_integer_value+1
+    LDA print_integer_scratch
+    STA print_integer_value
+    INY
+    BNE print_integer_subtract
+print_integer_emit
+    TYA
+    CMP #'0'
+    BNE print_integer_output
+    LDY print_integer_started
+    BEQ print_integer_next  ; Leading zero
+print_integer_output
+    STA print_integer_started
+    JSR $FFD2            ; Preserves X
+print_integer_next
+    INX
+    CPX #$04
+    BNE print_integer_digit
+    LDA print_integer_value
+    ORA #'0'
+    JMP $FFD2
+
+print_integer_powers_lo:
+    .byte <10000, <1000, <100, <10
+print_integer_powers_hi:
+    .byte >10000, >1000, >100, >10
+print_integer_value:
+    .byte 0, 0
+print_integer_scratch:
+    .byte 0
+print_integer_started:
+    .byte 0
+
+
+; Routine: print_newline
+
+print_newline
+    LDA #$0D                ; PETSCII carriage return
+    JMP $FFD2
+
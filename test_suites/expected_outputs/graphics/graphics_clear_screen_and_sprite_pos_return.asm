@@ -0,0 +1,219 @@
+; Generated by py2c64 compiler
+; --- Python Source Code ---
+; # The routines return to the program: each print runs
+; gfx_turn_on()
+; gfx_clear_screen()
+; print(1)
+; x = 100
+; sprite_set_pos(0, x + 20, 50)
+; print(2)
+; gfx_turn_off()
+; --------------------------
+; --- Zero Page Variables ---
+x = $22 ; 2 weighted uses
+* = $1000
+; --- Main Program and Functions ---
+main:
+    jsr gfx_turn_on
+    jsr gfx_clear_screen
+    LDA #1
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+    LDA #100
+    STA x
+    LDA #0
+    STA x+1
+    STA temp_1
+    STA temp_1+1
+    LDA x
+    CLC
+    ADC #$14
+    STA temp_2
+    LDA #0
+    STA temp_2+1
+    LDA #50
+    STA temp_3
+    LDA #0
+    STA temp_3+1
+    ldx temp_2
+    lda temp_2+1
+    stx $b0
+    ldx temp_1
+    lda temp_3
+    jsr sprite_set_pos
+    LDA #2
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+    jsr gfx_turn_off
+rts ; End of main program
+
+; --- Data Segment (Variables and Constants) ---
+; Temporaries: 5 temps in 3 slots, 6 bytes (LIFO pool: 12 bytes)
+; Peephole: 4 hits (redundant_load 4, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 0 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 1 of 1 int variables fit in a byte (x)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
+temp_0 * = * + 2
+temp_1 * = * + 2
+temp_2 * = * + 2
+temp_3 * = * + 2
+
+; --- Subroutines ---
+
+; Routine: gfx_clear_screen
+gfx_clear_screen
+    ; --- Clear 8K HGR screen from $2000 to $3FFF ---
+    ; Based on "The Graphics Book for the Commodore 64", Sec 4.2.1.2
+    LDA #$20        ; High byte of start address ($2000)
+    STA gfx_clear_loop_store+2 ; Self-modifying: page of the STA below
+    LDA #$00        ; Value to clear memory with
+    LDX #$20        ; 32 pages of 256 bytes
+    LDY #$00        ; Low byte index
+gfx_clear_loop:
+gfx_clear_loop_store:
+    STA $2000,Y
+    INY
+    BNE gfx_clear_loop ; Clear one 256-byte page
+    INC gfx_clear_loop_store+2 ; Move to next page
+    DEX
+    BNE gfx_clear_loop
+    RTS
+
+; Routine: gfx_turn_off
+gfx_turn_off
+    ; --- Turn off HGR graphics mode ---
+    ; Based on "The Graphics Book for the Commodore 64", Sec 4.2.1.4
+
+    ; Clear bit 5 of VIC Control Register 1 ($D011) to disable bitmap mode.
+    LDA $D011
+    AND #%11011111  ; Clear bit 5
+    STA $D011
+
+    ; Point character set back to default location.
+    ; This is done by clearing bit 3 of VIC register $D018.
+    LDA $D018
+    AND #%11110111  ; Clear bit 3
+    STA $D018
+    RTS
+
+; Routine: gfx_turn_on
+gfx_turn_on
+    ; --- Turn on HGR graphics mode (320x200) ---
+    ; Based on "The Graphics Book for the Commodore 64", Sec 4.2.1.1
+
+    ; Set bit 5 of VIC Control Register 1 ($D011) to enable bitmap mode.
+    LDA $D011
+    ORA #%00100000  ; Set bit 5 for bitmap mode
+    STA $D011
+
+    ; Ensure bit 4 of VIC Control Register 2 ($D016) is clear for standard hi-res (not multi-color).
+    LDA $D016
+    AND #%11101111  ; Clear bit 4
+    STA $D016
+
+    ; Set graphics memory to start at $2000 (8192).
+    ; This is done by setting bit 3 of VIC register $D018.
+    LDA $D018
+    ORA #%00001000  ; Set bit 3
+    STA $D018
+    RTS
+
+; Routine: print_integer
+
+print_integer
+    ; Outputs the signed 16-bit integer in X (low byte) / A (high byte) in decimal.
+    ; Digits come from repeated subtraction of 10000, 1000, 100 and 10;
+    ; leading zeros are skipped and the units digit is always output.
+    STX print_integer_value
+    STA print_integer_value+1
+    CMP #$80
+    BCC print_integer_positive
+    LDA #'-'
+    JSR $FFD2
+    SEC
+    LDA #$00
+    SBC print_integer_value
+    STA print_integer_value
+    LDA #$00
+    SBC print_integer_value+1
+    STA print_integer_value+1
+print_integer_positive
+    LDA #$00
+    STA print_integer_started
+    LDX #$00                ; Index of the power of ten
+print_integer_digit
+    LDY #'0'                ; The digit, counted in ASCII
+print_integer_subtract
+    LDA print_integer_value
+    SEC
+    SBC print_integer_powers_lo,X
+    STA print_integer_scratch
+    LDA print_integer_value+1
+    SBC print_integer_powers_hi,X
+    BCC print_integer_emit
+    STA print_integer_value+1
+    LDA print_integer_scratch
+    STA print_integer_value
+    INY
+    BNE print_integer_subtract
+print_integer_emit
+    TYA
+    CMP #'0'
+    BNE print_integer_output
+    LDY print_integer_started
+    BEQ print_integer_next  ; Leading zero
+print_integer_output
+    STA print_integer_started
+    JSR $FFD2            ; Preserves X
+print_integer_next
+    INX
+    CPX #$04
+    BNE print_integer_digit
+    LDA print_integer_value
+    ORA #'0'
+    JMP $FFD2
+
+print_integer_powers_lo:
+    .byte <10000, <1000, <100, <10
+print_integer_powers_hi:
+    .byte >10000, >1000, >100, >10
+print_integer_value:
+    .byte 0, 0
+print_integer_scratch:
+    .byte 0
+print_integer_started:
+    .byte 0
+
+
+; Routine: print_newline
+
+print_newline
+    LDA #$0D                ; PETSCII carriage return
+    JMP $FFD2
+
+
+; Routine: sprite_set_pos
+sprite_set_pos
+    ; Input: X=sprite_num, A=Y, $B0=X_LSB
+    ; I registri X/Y dello sprite n sono a $D000 + 2n
+    PHA
+    TXA
+    ASL A
+    TAX
+    PLA
+    ; Imposta la posizione Y
+    STA $D001,X
+    ; Imposta la posizione X (LSB)
+    LDA $B0 ; Prende la coordinata X da una locazione ZP
+    STA $D000,X
+    RTS
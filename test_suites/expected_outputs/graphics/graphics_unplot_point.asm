@@ -0,0 +1,370 @@
+; Generated by py2c64 compiler
+; --- Python Source Code ---
+; # Clears the pixel at (10, 20) and leaves its neighbour at (11, 20) set
+; gfx_turn_on()
+; gfx_clear_screen()
+; gfx_plot_point(10, 20)
+; gfx_plot_point(11, 20)
+; gfx_unplot_point(10, 20)
+; print(1)
+; gfx_turn_off()
+; --------------------------
+* = $1000
+; --- Main Program and Functions ---
+main:
+    jsr gfx_turn_on
+    jsr gfx_clear_screen
+    LDA #10
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    LDA #20
+    STA temp_2
+    LDA #0
+    STA temp_2+1
+    ldx temp_1
+    lda temp_1+1
+    stx $b0
+    sta $b1
+    ldx temp_2
+    lda temp_2+1
+    stx $b2
+    jsr gfx_plot_point
+    LDA #11
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    LDA #20
+    STA temp_2
+    LDA #0
+    STA temp_2+1
+    ldx temp_1
+    lda temp_1+1
+    stx $b0
+    sta $b1
+    ldx temp_2
+    lda temp_2+1
+    stx $b2
+    jsr gfx_plot_point
+    LDA #10
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    LDA #20
+    STA temp_2
+    LDA #0
+    STA temp_2+1
+    ldx temp_1
+    lda temp_1+1
+    stx $b0
+    sta $b1
+    ldx temp_2
+    lda temp_2+1
+    stx $b2
+    jsr gfx_unplot_point
+    LDA #1
+    STA temp_1
+    LDA #0
+    STA temp_1+1
+    ldx temp_1
+jsr print_integer
+jsr print_newline
+    jsr gfx_turn_off
+rts ; End of main program
+
+; --- Data Segment (Variables and Constants) ---
+; Temporaries: 7 temps in 2 slots, 4 bytes (LIFO pool: 8 bytes)
+; Peephole: 1 hits (redundant_load 1, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 0 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 0 of 0 int variables fit in a byte (none)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
+temp_1 * = * + 2
+temp_2 * = * + 2
+
+; --- Subroutines ---
+
+; Routine: gfx_clear_screen
+gfx_clear_screen
+    ; --- Clear 8K HGR screen from $2000 to $3FFF ---
+    ; Based on "The Graphics Book for the Commodore 64", Sec 4.2.1.2
+    LDA #$20        ; High byte of start address ($2000)
+    STA gfx_clear_loop_store+2 ; Self-modifying: page of the STA below
+    LDA #$00        ; Value to clear memory with
+    LDX #$20        ; 32 pages of 256 bytes
+    LDY #$00        ; Low byte index
+gfx_clear_loop:
+gfx_clear_loop_store:
+    STA $2000,Y
+    INY
+    BNE gfx_clear_loop ; Clear one 256-byte page
+    INC gfx_clear_loop_store+2 ; Move to next page
+    DEX
+    BNE gfx_clear_loop
+    RTS
+
+; Routine: gfx_plot_point
+gfx_plot_point
+    ; --- Plot ('set') or unplot a point on the HGR screen ---
+    ; Based on "The Graphics Book for the Commodore 64", Sec 4.2.2.1
+    ; Input: X in $B0/$B0+1, Y in $B2
+
+    ; --- Calculate screen memory address from Y coordinate ---
+    ; Final Address = $2000 + (Y/8)*320 + (X/8)*8 + (Y%8)
+
+    ; 1. Calculate (Y/8) and (Y%8)
+    LDA $B2
+    PHA             ; Save YC for later (Y%8)
+    LSR A           ; YC / 8
+    LSR A
+    LSR A
+    TAX             ; X = YC / 8 (character row index, 0-24)
+
+    ; 2. Look up base address for the character row: (Y/8) * 320
+    ; This is much faster than multiplication.
+    LDA gfx_plot_y_lookup_hi,X
+    STA $B3+1
+    LDA gfx_plot_y_lookup_lo,X
+    STA $B3
+
+    ; 3. Add (Y%8) to get the final row address offset
+    PLA             ; Restore original YC
+    AND #%00000111  ; A = YC % 8 (row inside character, 0-7)
+    CLC
+    ADC $B3
+    STA $B3
+    BCC gfx_plot_point_no_carry_y
+    INC $B3+1
+gfx_plot_point_no_carry_y:
+
+    ; --- Calculate offset from X coordinate and add to pointer ---
+    ; 4. Calculate (X/8)*8. This is just X with the lower 3 bits cleared.
+    LDA $B0
+    AND #%11111000
+    CLC
+    ADC $B3
+    STA $B3
+    LDA $B3+1
+    ADC $B0+1 ; Add high byte of X and any carry
+    STA $B3+1
+
+    ; 5. Add base address of bitmap screen ($2000)
+    LDA $B3+1
+    CLC
+    ADC #$20
+    STA $B3+1
+
+    ; --- Calculate bit mask from X coordinate ---
+    ; 6. Get the bit position (X%8) and look up the mask
+    LDA $B0
+    AND #%00000111  ; A = X % 8
+    TAX             ; Use as index for the mask table
+    LDA gfx_plot_bit_mask,X
+    STA $B5   ; Store mask in a temporary ZP location
+
+    ; --- Modify the screen byte ---
+    ; 7. Load, modify, and store the byte
+    LDY #$00
+    LDA ($B3),Y ; Load the byte from screen memory
+    ORA $B5
+    STA ($B3),Y ; Store it back
+    RTS
+
+; Routine: gfx_plot_tables
+gfx_plot_tables
+gfx_plot_bit_mask:
+    .byte %10000000, %01000000, %00100000, %00010000, %00001000, %00000100, %00000010, %00000001
+
+gfx_plot_y_lookup_lo:
+    .byte <(0*320), <(1*320), <(2*320), <(3*320), <(4*320), <(5*320), <(6*320), <(7*320)
+    .byte <(8*320), <(9*320), <(10*320), <(11*320), <(12*320), <(13*320), <(14*320), <(15*320)
+    .byte <(16*320), <(17*320), <(18*320), <(19*320), <(20*320), <(21*320), <(22*320), <(23*320)
+    .byte <(24*320)
+
+gfx_plot_y_lookup_hi:
+    .byte >(0*320), >(1*320), >(2*320), >(3*320), >(4*320), >(5*320), >(6*320), >(7*320)
+    .byte >(8*320), >(9*320), >(10*320), >(11*320), >(12*320), >(13*320), >(14*320), >(15*320)
+    .byte >(16*320), >(17*320), >(18*320), >(19*320), >(20*320), >(21*320), >(22*320), >(23*320)
+    .byte >(24*320)
+
+; Routine: gfx_turn_off
+gfx_turn_off
+    ; --- Turn off HGR graphics mode ---
+    ; Based on "The Graphics Book for the Commodore 64", Sec 4.2.1.4
+
+    ; Clear bit 5 of VIC Control Register 1 ($D011) to disable bitmap mode.
+    LDA $D011
+    AND #%11011111  ; Clear bit 5
+    STA $D011
+
+    ; Point character set back to default location.
+    ; This is done by clearing bit 3 of VIC register $D018.
+    LDA $D018
+    AND #%11110111  ; Clear bit 3
+    STA $D018
+    RTS
+
+; Routine: gfx_turn_on
+gfx_turn_on
+    ; --- Turn on HGR graphics mode (320x200) ---
+    ; Based on "The Graphics Book for the Commodore 64", Sec 4.2.1.1
+
+    ; Set bit 5 of VIC Control Register 1 ($D011) to enable bitmap mode.
+    LDA $D011
+    ORA #%00100000  ; Set bit 5 for bitmap mode
+    STA $D011
+
+    ; Ensure bit 4 of VIC Control Register 2 ($D016) is clear for standard hi-res (not multi-color).
+    LDA $D016
+    AND #%11101111  ; Clear bit 4
+    STA $D016
+
+    ; Set graphics memory to start at $2000 (8192).
+    ; This is done by setting bit 3 of VIC register $D018.
+    LDA $D018
+    ORA #%00001000  ; Set bit 3
+    STA $D018
+    RTS
+
+; Routine: gfx_unplot_point
+gfx_unplot_point
+    ; --- Plot ('set') or unplot a point on the HGR screen ---
+    ; Based on "The Graphics Book for the Commodore 64", Sec 4.2.2.1
+    ; Input: X in $B0/$B0+1, Y in $B2
+
+    ; --- Calculate screen memory address from Y coordinate ---
+    ; Final Address = $2000 + (Y/8)*320 + (X/8)*8 + (Y%8)
+
+    ; 1. Calculate (Y/8) and (Y%8)
+    LDA $B2
+    PHA             ; Save YC for later (Y%8)
+    LSR A           ; YC / 8
+    LSR A
+    LSR A
+    TAX             ; X = YC / 8 (character row index, 0-24)
+
+    ; 2. Look up base address for the character row: (Y/8) * 320
+    ; This is much faster than multiplication.
+    LDA gfx_plot_y_lookup_hi,X
+    STA $B3+1
+    LDA gfx_plot_y_lookup_lo,X
+    STA $B3
+
+    ; 3. Add (Y%8) to get the final row address offset
+    PLA             ; Restore original YC
+    AND #%00000111  ; A = YC % 8 (row inside character, 0-7)
+    CLC
+    ADC $B3
+    STA $B3
+    BCC gfx_unplot_point_no_carry_y
+    INC $B3+1
+gfx_unplot_point_no_carry_y:
+
+    ; --- Calculate offset from X coordinate and add to pointer ---
+    ; 4. Calculate (X/8)*8. This is just X with the lower 3 bits cleared.
+    LDA $B0
+    AND #%11111000
+    CLC
+    ADC $B3
+    STA $B3
+    LDA $B3+1
+    ADC $B0+1 ; Add high byte of X and any carry
+    STA $B3+1
+
+    ; 5. Add base address of bitmap screen ($2000)
+    LDA $B3+1
+    CLC
+    ADC #$20
+    STA $B3+1
+
+    ; --- Calculate bit mask from X coordinate ---
+    ; 6. Get the bit position (X%8) and look up the mask
+    LDA $B0
+    AND #%00000111  ; A = X % 8
+    TAX             ; Use as index for the mask table
+    LDA gfx_plot_bit_mask,X
+    STA $B5   ; Store mask in a temporary ZP location
+
+    ; --- Modify the screen byte ---
+    ; 7. Load, modify, and store the byte
+    LDY #$00
+    LDA $B5
+    EOR #$FF
+    AND ($B3),Y ; Clear the bit in the screen byte
+    STA ($B3),Y ; Store it back
+    RTS
+
+; Routine: print_integer
+
+print_integer
+    ; Outputs the signed 16-bit integer in X (low byte) / A (high byte) in decimal.
+    ; Digits come from repeated subtraction of 10000, 1000, 100 and 10;
+    ; leading zeros are skipped and the units digit is always output.
+    STX print_integer_value
+    STA print_integer_value+1
+    CMP #$80
+    BCC print_integer_positive
+    LDA #'-'
+    JSR $FFD2
+    SEC
+    LDA #$00
+    SBC print_integer_value
+    STA print_integer_value
+    LDA #$00
+    SBC print_integer_value+1
+    STA print_integer_value+1
+print_integer_positive
+    LDA #$00
+    STA print_integer_started
+    LDX #$00                ; Index of the power of ten
+print_integer_digit
+    LDY #'0'                ; The digit, counted in ASCII
+print_integer_subtract
+    LDA print_integer_value
+    SEC
+    SBC print_integer_powers_lo,X
+    STA print_integer_scratch
+    LDA print_integer_value+1
+    SBC print_integer_powers_hi,X
+    BCC print_integer_emit
+    STA print_integer_value+1
+    LDA print_integer_scratch
+    STA print_integer_value
+    INY
+    BNE print_integer_subtract
+print_integer_emit
+    TYA
+    CMP #'0'
+    BNE print_integer_output
+    LDY print_integer_started
+    BEQ print_integer_next  ; Leading zero
+print_integer_output
+    STA print_integer_started
+    JSR $FFD2            ; Preserves X
+print_integer_next
+    INX
+    CPX #$04
+    BNE print_integer_digit
+    LDA print_integer_value
+    ORA #'0'
+    JMP $FFD2
+
+print_integer_powers_lo:
+    .byte <10000, <1000, <100, <10
+print_integer_powers_hi:
+    .byte >10000, >1000, >100, >10
+print_integer_value:
+    .byte 0, 0
+print_integer_scratch:
+    .byte 0
+print_integer_started:
+    .byte 0
+
+
+; Routine: print_newline
+
+print_newline
+    LDA #$0D                ; PETSCII carriage return
+    JMP $FFD2
+
@@ -0,0 +1,102 @@
+; Generated by py2c64 compiler
+; --- Python Source Code ---
+; s = "hello"
+; print(s)
+; print("c64")
+; --------------------------
+; --- Zero Page Variables ---
+s = $22 ; 2 weighted uses
+* = $1000
+; --- Main Program and Functions ---
+main:
+    LDA #<str_lit_0
+    STA s
+    LDA #>str_lit_0
+    STA s+1
+    LDA s
+    STA temp_1
+    LDA s+1
+    STA temp_1+1
+    ldx temp_1
+stx $fa
+sta $fb
+jsr print_string_from_zp
+jsr print_newline
+    LDA #<str_lit_1
+    STA temp_1
+    LDA #>str_lit_1
+    STA temp_1+1
+    ldx temp_1
+stx $fa
+sta $fb
+jsr print_string_from_zp
+jsr print_newline
+rts ; End of main program
+
+; --- Data Segment (Variables and Constants) ---
+; Temporaries: 2 temps in 1 slots, 2 bytes (LIFO pool: 4 bytes)
+; Peephole: 2 hits (redundant_load 2, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 0 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 0 of 0 int variables fit in a byte (none)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
+str_lit_0 text "hello"
+          byte 0 ; Null terminator for str_lit_0
+str_lit_1 text "c64"
+          byte 0 ; Null terminator for str_lit_1
+temp_1 * = * + 2
+
+; --- Subroutines ---
+
+; Routine: ascii_to_petscii
+
+ascii_to_petscii
+    ; Input: A contains ASCII character
+    ; Output: A contains PETSCII character (lowercase ASCII converted to uppercase PETSCII)
+    CMP #'a'
+    BCC no_conversion_needed_petscii
+    CMP #'z'+1
+    BCS no_conversion_needed_petscii
+    SEC             ; Ensure Carry is set for SBC
+    SBC #$20        ; Convert ASCII 'a'-'z' to PETSCII 'A'-'Z' (e.g. ASCII 'a' (97) - 32 = PETSCII 'A' (65))
+no_conversion_needed_petscii
+    RTS
+
+
+; Routine: print_char
+
+print_char
+    ; Input: A = ASCII character
+    ; Output: Prints character to screen via KERNAL CHROUT
+    ; Modifies: A (CHROUT modifica A)
+    ; Preserves: X, Y (CHROUT preserva X, Y)
+
+    JSR ascii_to_petscii    ; Convert A from ASCII to PETSCII. A is now PETSCII.
+    JSR $FFD2              ; Call KERNAL CHROUT routine
+    RTS
+
+
+; Routine: print_newline
+
+print_newline
+    LDA #$0D                ; PETSCII carriage return
+    JMP $FFD2
+
+
+; Routine: print_string_from_zp
+
+print_string_from_zp
+    ; Prints the NUL-terminated string whose address is in $FA/$FA+1
+    LDY #$00
+print_string_from_zp_loop
+    LDA ($FA),Y
+    BEQ print_string_from_zp_end
+    JSR print_char          ; Preserves Y
+    INY
+    BNE print_string_from_zp_loop
+    INC $FA+1         ; Next 256-byte page
+    JMP print_string_from_zp_loop
+print_string_from_zp_end
+    RTS
+
@@ -0,0 +1,25 @@
+; Generated by py2c64 compiler
+; --- Python Source Code ---
+; try:
+;     y = log(-1.0)
+; except ValueError:
+;     print("Caught ValueError for log(-1)")
+; --------------------------
+; --- Zero Page Variables ---
+y = $22 ; 1 weighted uses
+* = $1000
+; --- Main Program and Functions ---
+main:
+; Placeholder per Try block
+rts ; End of main program
+
+; --- Data Segment (Variables and Constants) ---
+; Temporaries: 0 temps in 0 slots, 0 bytes (LIFO pool: 0 bytes)
+; Peephole: 0 hits (redundant_load 0, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 0 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 0 of 0 int variables fit in a byte (none)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
+
+; --- Subroutines ---
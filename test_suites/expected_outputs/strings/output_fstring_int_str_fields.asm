@@ -0,0 +1,274 @@
+; Generated by py2c64 compiler
+; --- Python Source Code ---
+; n = -42
+; s = 'x'
+; print(f'n={n} s={s}!')
+; m = 7
+; t = f'{m}{m}'
+; print(t)
+; --------------------------
+; --- Zero Page Variables ---
+m = $22 ; 3 weighted uses
+n = $24 ; 2 weighted uses
+s = $26 ; 2 weighted uses
+t = $28 ; 2 weighted uses
+* = $1000
+; --- Main Program and Functions ---
+main:
+    LDA #214
+    STA n
+    LDA #255
+    STA n+1
+    LDA #<str_lit_0
+    STA s
+    LDA #>str_lit_0
+    STA s+1
+    LDA #<temp_1_str ; LSB of f-string buffer 'temp_1_str'
+    STA $F0
+    LDA #>temp_1_str ; MSB of f-string buffer 'temp_1_str'
+    STA $F1
+    LDA #<fstr_const_1
+    STA $EE
+    LDA #>fstr_const_1
+    STA $EF
+    JSR fstr_cat_str
+    ldx n
+    lda n+1
+    JSR fstr_cat_int
+    LDA #<fstr_const_2
+    STA $EE
+    LDA #>fstr_const_2
+    STA $EF
+    JSR fstr_cat_str
+    LDA s+0
+    STA $EE
+    LDA s+1
+    STA $EF
+    JSR fstr_cat_str
+    LDA #<fstr_const_3
+    STA $EE
+    LDA #>fstr_const_3
+    STA $EF
+    JSR fstr_cat_str
+    LDA #0 ; Null terminator
+    LDY #0 ; Index for ZP indirect
+    STA ($F0),Y ; Write terminator using ZP destination pointer
+    LDA #<temp_1_str
+    STA temp_1
+    LDA #>temp_1_str
+    STA temp_1+1
+    ldx temp_1
+stx $fa
+sta $fb
+jsr print_string_from_zp
+jsr print_newline
+    LDA #7
+    STA m
+    LDA #0
+    STA m+1
+    LDA #<t_str ; LSB of f-string buffer 't_str'
+    STA $F0
+    LDA #>t_str ; MSB of f-string buffer 't_str'
+    STA $F1
+    ldx m
+    lda m+1
+    JSR fstr_cat_int
+    ldx m
+    lda m+1
+    JSR fstr_cat_int
+    LDA #0 ; Null terminator
+    LDY #0 ; Index for ZP indirect
+    STA ($F0),Y ; Write terminator using ZP destination pointer
+    LDA #<t_str
+    STA t
+    LDA #>t_str
+    STA t+1
+    LDA t
+    STA temp_1
+    LDA t+1
+    STA temp_1+1
+    ldx temp_1
+stx $fa
+sta $fb
+jsr print_string_from_zp
+jsr print_newline
+rts ; End of main program
+
+; --- Data Segment (Variables and Constants) ---
+; Temporaries: 2 temps in 1 slots, 2 bytes (LIFO pool: 4 bytes)
+; Peephole: 2 hits (redundant_load 2, redundant_store 0, redundant_carry 0, jump_to_next 0, jump_chain 0)
+; Branches: 0 short, 0 long (0 branch-over-JMP pairs shortened, 1 layout passes)
+; Inlining: 0 calls (none), budget 0/256 nodes
+; Value ranges: 1 of 2 int variables fit in a byte (m)
+; Overflow checks: 0 inline, 0 removed by range analysis, 0 disabled
+; Static frames: 0 functions in 0 bytes (0 bytes without sharing)
+str_lit_0 text "x"
+          byte 0 ; Null terminator for str_lit_0
+temp_1_str * = * + 81
+fstr_const_1 text "n="
+          byte 0 ; Null terminator for fstr_const_1
+fstr_const_2 text " s="
+          byte 0 ; Null terminator for fstr_const_2
+fstr_const_3 text "!"
+          byte 0 ; Null terminator for fstr_const_3
+t_str * = * + 81
+temp_1 * = * + 2
+
+; --- Subroutines ---
+
+; Routine: ascii_to_petscii
+
+ascii_to_petscii
+    ; Input: A contains ASCII character
+    ; Output: A contains PETSCII character (lowercase ASCII converted to uppercase PETSCII)
+    CMP #'a'
+    BCC no_conversion_needed_petscii
+    CMP #'z'+1
+    BCS no_conversion_needed_petscii
+    SEC             ; Ensure Carry is set for SBC
+    SBC #$20        ; Convert ASCII 'a'-'z' to PETSCII 'A'-'Z' (e.g. ASCII 'a' (97) - 32 = PETSCII 'A' (65))
+no_conversion_needed_petscii
+    RTS
+
+
+; Routine: fstr_cat_int
+
+fstr_cat_int
+    ; Outputs the signed 16-bit integer in X (low byte) / A (high byte) in decimal.
+    ; Digits come from repeated subtraction of 10000, 1000, 100 and 10;
+    ; leading zeros are skipped and the units digit is always output.
+    STX fstr_cat_int_value
+    STA fstr_cat_int_value+1
+    CMP #$80
+    BCC fstr_cat_int_positive
+    LDA #'-'
+    JSR fstr_put_char
+    SEC
+    LDA #$00
+    SBC fstr_cat_int_value
+    STA fstr_cat_int_value
+    LDA #$00
+    SBC fstr_cat_int_value+1
+    STA fstr_cat_int_value+1
+fstr_cat_int_positive
+    LDA #$00
+    STA fstr_cat_int_started
+    LDX #$00                ; Index of the power of ten
+fstr_cat_int_digit
+    LDY #'0'                ; The digit, counted in ASCII
+fstr_cat_int_subtract
+    LDA fstr_cat_int_value
+    SEC
+    SBC fstr_cat_int_powers_lo,X
+    STA fstr_cat_int_scratch
+    LDA fstr_cat_int_value+1
+    SBC fstr_cat_int_powers_hi,X
+    BCC fstr_cat_int_emit
+    STA fstr_cat_int_value+1
+    LDA fstr_cat_int_scratch
+    STA fstr_cat_int_value
+    INY
+    BNE fstr_cat_int_subtract
+fstr_cat_int_emit
+    TYA
+    CMP #'0'
+    BNE fstr_cat_int_output
+    LDY fstr_cat_int_started
+    BEQ fstr_cat_int_next  ; Leading zero
+fstr_cat_int_output
+    STA fstr_cat_int_started
+    JSR fstr_put_char            ; Preserves X
+fstr_cat_int_next
+    INX
+    CPX #$04
+    BNE fstr_cat_int_digit
+    LDA fstr_cat_int_value
+    ORA #'0'
+    JMP fstr_put_char
+
+fstr_cat_int_powers_lo:
+    .byte <10000, <1000, <100, <10
+fstr_cat_int_powers_hi:
+    .byte >10000, >1000, >100, >10
+fstr_cat_int_value:
+    .byte 0, 0
+fstr_cat_int_scratch:
+    .byte 0
+fstr_cat_int_started:
+    .byte 0
+
+
+; Routine: fstr_cat_str
+
+fstr_cat_str
+    ; Appends the null-terminated string at (FSTRING_SRC_ZP_PTR) to the f-string
+    ; buffer at (FSTRING_DEST_ZP_PTR), without its terminator, and advances the
+    ; destination pointer past the copied characters (at most 255).
+    LDY #$00
+fstr_cat_str_loop
+    LDA ($EE),Y
+    BEQ fstr_cat_str_done
+    STA ($F0),Y
+    INY
+    BNE fstr_cat_str_loop
+fstr_cat_str_done
+    TYA
+    CLC
+    ADC $F0
+    STA $F0
+    BCC fstr_cat_str_end
+    INC $F1
+fstr_cat_str_end
+    RTS
+
+
+; Routine: fstr_put_char
+
+fstr_put_char
+    ; Appends the character in A to the f-string buffer at (FSTRING_DEST_ZP_PTR)
+    ; and advances the pointer. Preserves X.
+    LDY #$00
+    STA ($F0),Y
+    INC $F0
+    BNE fstr_put_char_done
+    INC $F1
+fstr_put_char_done
+    RTS
+
+
+; Routine: print_char
+
+print_char
+    ; Input: A = ASCII character
+    ; Output: Prints character to screen via KERNAL CHROUT
+    ; Modifies: A (CHROUT modifica A)
+    ; Preserves: X, Y (CHROUT preserva X, Y)
+
+    JSR ascii_to_petscii    ; Convert A from ASCII to PETSCII. A is now PETSCII.
+    JSR $FFD2              ; Call KERNAL CHROUT routine
+    RTS
+
+
+; Routine: print_newline
+
+print_newline
+    LDA #$0D                ; PETSCII carriage return
+    JMP $FFD2
+
+
+; Routine: print_string_from_zp
+
+print_string_from_zp
+    ; Prints the NUL-terminated string whose address is in $FA/$FA+1
+    LDY #$00
+print_string_from_zp_loop
+    LDA ($FA),Y
+    BEQ print_string_from_zp_end
+    JSR print_char          ; Preserves Y
+    INY
+    BNE print_string_from_zp_loop
+    INC $FA+1         ; Next 256-byte page
+    JMP print_string_from_zp_loop
+print_string_from_zp_end
+    RTS
+
@@ -1,9 +1,15 @@
-import subprocess
 import os
 import sys
 import shutil
 import argparse
 import importlib.util
+import io
+import json
+import contextlib
+import atexit
+import difflib
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 # Add the project root to sys.path to allow imports like 'V1.main' or 'V2.main'
@@ -12,6 +18,11 @@ _PROJECT_ROOT = os.path.dirname(_TEST_DIR)
 if _PROJECT_ROOT not in sys.path:
     sys.path.insert(0, _PROJECT_ROOT)
 
+EXAMPLES_DIR = os.path.join(_TEST_DIR, "examples")
+# The golden .asm files; the 'expected' key of a case is a path relative to this directory
+EXPECTED_OUTPUTS_DIR = os.path.join(_TEST_DIR, "expected_outputs")
+DEFAULT_COMPILER_VERSION = "V1"
+
 def _load_tests_from_file(version, examples_path, filename):
     """Helper to load test cases from a single file and inject the compiler version."""
     module_name = filename[:-3]  # Remove .py
@@ -23,12 +34,9 @@ def _load_tests_from_file(version, examples_path, filename):
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
         if hasattr(module, "test_cases") and isinstance(module.test_cases, list):
-            print(f"Loaded {len(module.test_cases)} test cases from {version}/{filename}")
+            print(f"Loaded {len(module.test_cases)} test cases from {filename}")
             for test_case in module.test_cases:
                 test_case['compiler_version'] = version  # Inject the version
-                # Standardize expected path to be just the filename
-                if 'expected' in test_case:
-                    test_case['expected'] = os.path.basename(test_case['expected'])
             loaded_tests.extend(module.test_cases)
         else:
             print(f"Warning: No 'test_cases' list found in {filename}")
@@ -36,56 +44,84 @@ def _load_tests_from_file(version, examples_path, filename):
         print(f"Warning: Could not create module spec for {filename}")
     return loaded_tests
 
-def load_test_cases(specific_file_name=None):
+def load_test_cases(specific_file_name=None, version=DEFAULT_COMPILER_VERSION):
     """
-    Loads test cases from the `compiler_versions` directory structure.
+    Loads the test cases of test_suites/examples/test_*.py, or of the one file
+    given by name (e.g. 'test_arithmetic.py').
     """
-    all_tests = []
-    versions_path = os.path.join(_TEST_DIR, "compiler_versions")
-
-    if not os.path.isdir(versions_path):
-        print(f"Error: Main test directory '{versions_path}' not found.")
+    if not os.path.isdir(EXAMPLES_DIR):
+        print(f"Error: Test directory '{EXAMPLES_DIR}' not found.")
         return []
 
     if specific_file_name:
-        try:
-            # Expecting format "V1/test_arithmetic.py"
-            version, filename = specific_file_name.replace("\\", "/").split("/", 1)
-        except ValueError:
-            print(f"Error: Invalid format for specific test file. Use 'VERSION/filename.py' (e.g., 'V1/test_arithmetic.py').")
-            return []
-
-        examples_path = os.path.join(versions_path, version, "examples")
-        full_specific_path = os.path.join(examples_path, filename)
-
-        if os.path.isfile(full_specific_path):
-            all_tests.extend(_load_tests_from_file(version, examples_path, filename))
-        else:
-            print(f"Error: Specified test file '{specific_file_name}' not found.")
+        filename = os.path.basename(specific_file_name)
+        if not os.path.isfile(os.path.join(EXAMPLES_DIR, filename)):
+            print(f"Error: Specified test file '{specific_file_name}' not found in '{EXAMPLES_DIR}'.")
             return []
+        filenames = [filename]
     else:
-        # Load all tests from all versions
-        for version in sorted(os.listdir(versions_path)):
-            version_dir = os.path.join(versions_path, version)
-            if not os.path.isdir(version_dir):
-                continue
-
-            examples_path = os.path.join(version_dir, "examples")
-            if not os.path.isdir(examples_path):
-                continue
-
-            for filename in sorted(os.listdir(examples_path)):
-                if filename.startswith("test_") and filename.endswith(".py"):
-                    all_tests.extend(_load_tests_from_file(version, examples_path, filename))
+        filenames = [filename for filename in sorted(os.listdir(EXAMPLES_DIR))
+                     if filename.startswith("test_") and filename.endswith(".py")]
 
+    all_tests = []
+    for filename in filenames:
+        try:
+            all_tests.extend(_load_tests_from_file(version, EXAMPLES_DIR, filename))
+        except Exception as e:
+            print(f"Warning: Could not load '{filename}': {e}")
     return all_tests
 
-def run_test(test_case, regenerate_mode=False):
-    """Executes a single test case."""
+# Options applied to the compiler's `compiler_options` before every test
+COMPILER_OPTIONS = {}
+# Compiler profiles of every compilation, collected with --profile
+COMPILE_PROFILES = []
+# (directory, max_bytes) of the on-disk compile cache given with --cache, else None
+COMPILE_CACHE = None
+# Hit/miss statistics of the compile cache, added up over every worker
+COMPILE_CACHE_STATS = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+_compile_caches = {}
+
+def _compile_cache(settings):
+    """This process's CompileCache for (directory, max_bytes) settings, or None without settings."""
+    if settings is None:
+        return None
+    if settings not in _compile_caches:
+        compile_cache = importlib.import_module("lib.compile_cache")
+        _compile_caches[settings] = compile_cache.CompileCache(*settings)
+    return _compile_caches[settings]
+
+def format_compile_cache_report():
+    compile_cache = importlib.import_module("lib.compile_cache")
+    return compile_cache.format_report(COMPILE_CACHE_STATS, _compile_cache(COMPILE_CACHE))
+
+def _new_context(compiler_version, options=None):
+    """A fresh compilation context with the runner's options, so that no state leaks between cases."""
+    compiler_globals = importlib.import_module(f"{compiler_version}.globals")
+    return compiler_globals.CompilationContext(COMPILER_OPTIONS if options is None else options)
+
+def _collect_compile_profile(context):
+    if context.compile_profile is not None:
+        COMPILE_PROFILES.append(context.compile_profile)
+
+def write_compile_profile(path):
+    """Merges the collected compiler profiles, prints them and writes them as JSON (.json) or text."""
+    compile_profile = importlib.import_module("lib.compile_profile")
+    merged = compile_profile.merge(COMPILE_PROFILES)
+    report = compile_profile.format_report(merged)
+    print(f"\n--- Compiler Profile ---\n{report}")
+    with open(path, "w") as f:
+        if path.endswith(".json"):
+            json.dump(merged, f, indent=2, sort_keys=True)
+            f.write("\n")
+        else:
+            f.write(report + "\n")
+    print(f"Compiler profile written to '{path}'.")
+
+def run_test(test_case, regenerate_mode=False, options=None, cache=None):
+    """Executes a single test case, compiling in memory in a context of its own (through `cache` if given)."""
     print(f"\n--- Starting test: {test_case['name']} ---")
     print(f"Test code:")
     print(test_case['code'])
-    temp_output_filename = "temp_output.asm"
 
     compilation_errors = []
     def test_error_handler(message, lineno):
@@ -100,14 +136,12 @@ def run_test(test_case, regenerate_mode=False):
         # Dynamically import the correct compiler's main module
         compiler_module_name = f"{compiler_version}.main"
         compiler_main = importlib.import_module(compiler_module_name)
-
-        # If the compiler has a reset function, call it. Assumes object-oriented or global reset.
-        if hasattr(compiler_main, "reset_globals"): # For V1-like structure
-            compiler_main.reset_globals()
+        context = _new_context(compiler_version, options)
 
         result_assembly_string = compiler_main.python_to_assembly(
-            test_case['code'], temp_output_filename, test_error_handler
+            test_case['code'], None, test_error_handler, context=context, cache=cache
         )
+        _collect_compile_profile(context)
 
         if compilation_errors or result_assembly_string is None:
             print(f"Test '{test_case['name']}' FAILED: Error during compilation.")
@@ -116,8 +150,7 @@ def run_test(test_case, regenerate_mode=False):
             return False
 
         if "expected" in test_case and test_case["expected"]:
-            base_expected_path = os.path.join(_TEST_DIR, "compiler_versions", compiler_version, "expected_outputs")
-            expected_filename = os.path.join(base_expected_path, test_case["expected"])
+            expected_filename = os.path.join(EXPECTED_OUTPUTS_DIR, test_case["expected"])
 
             if regenerate_mode:
                 try:
@@ -142,17 +175,10 @@ def run_test(test_case, regenerate_mode=False):
 
                 if expected_norm != generated_norm:
                     print(f"Test '{test_case['name']}' FAILED: Generated output does not match expected output.")
-                    try:
-                        with open(temp_output_filename, 'w') as f_gen:
-                            f_gen.write(result_assembly_string)
-                        diff_result = subprocess.run(
-                            ["diff", "-u", expected_filename, temp_output_filename],
-                            capture_output=True, text=True, check=False
-                        )
-                        print("--- Differences ---")
-                        print(diff_result.stdout if diff_result.stdout else "No differences found by 'diff', check whitespace/endings.")
-                    except FileNotFoundError:
-                        print("Could not find 'diff'. Raw comparison failed.")
+                    diff = difflib.unified_diff(expected_norm.splitlines(), generated_norm.splitlines(),
+                                                fromfile=expected_filename, tofile="generated", lineterm="")
+                    print("--- Differences ---")
+                    print("\n".join(diff) or "No differences found, check whitespace/endings.")
                     return False
         else:
             print("Test without expected output, showing generated content:")
@@ -167,13 +193,269 @@ def run_test(test_case, regenerate_mode=False):
     except Exception as e:
         print(f"Test '{test_case['name']}' FAILED: Error during execution: {e}")
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
     finally:
-        if os.path.exists(temp_output_filename):
-            os.remove(temp_output_filename)
         print("--- Ending test ---")
 
+# --- Parallel execution ---
+# Cases are independent: each one compiles in memory in a compilation context
+# of its own, so they can be fanned out over a process pool (-j N). A job
+# returns its result with the output it printed, its time and its compiler
+# profiles; pool.map keeps the job order, so the output and the logs are the
+# same whatever the number of workers. The last element of a job is the
+# compile cache settings; each worker opens the cache directory itself and
+# returns the hits and misses of the job.
+
+def _run_job(job):
+    """Runs one ('test', case, regenerate_mode, options, cache) or ('benchmark', case, max_cycles, options, cache) job."""
+    kind, test_case, argument, options, cache_settings = job
+    cache = _compile_cache(cache_settings)
+    stats_before = dict(cache.stats) if cache else {}
+    first_profile = len(COMPILE_PROFILES)
+    output = io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        if kind == 'test':
+            result = run_test(test_case, regenerate_mode=argument, options=options, cache=cache)
+        else:
+            result = measure_case(test_case, max_cycles=argument, options=options, cache=cache)
+    seconds = time.perf_counter() - started
+    profiles = COMPILE_PROFILES[first_profile:]
+    del COMPILE_PROFILES[first_profile:]
+    cache_stats = {name: value - stats_before[name] for name, value in cache.stats.items()} if cache else {}
+    return result, output.getvalue(), seconds, profiles, cache_stats
+
+def run_jobs(jobs, workers=1):
+    """Runs the jobs, in a pool of `workers` processes when more than one. Returns [(result, output, seconds)] in job order."""
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            outcomes = list(pool.map(_run_job, jobs))
+    else:
+        outcomes = [_run_job(job) for job in jobs]
+    results = []
+    for result, output, seconds, profiles, cache_stats in outcomes:
+        COMPILE_PROFILES.extend(profiles)
+        for name, value in cache_stats.items():
+            COMPILE_CACHE_STATS[name] += value
+        results.append((result, output, seconds))
+    return results
+
+def format_slowest(names, seconds, count=5):
+    """One line with the slowest cases."""
+    slowest = sorted(zip(names, seconds), key=lambda item: -item[1])[:count]
+    return "Slowest: " + ", ".join(f"{name} {elapsed:.2f}s" for name, elapsed in slowest)
+
+# --- Benchmark mode ---
+# Every example is compiled, assembled and run on the headless emulator; the
+# metrics below are compared against a baseline JSON so that a change making
+# the output slower or bigger fails even when its text still looks right.
+BENCHMARK_METRICS = ('cycles', 'code_bytes', 'data_bytes', 'zp_bytes')
+BENCHMARK_COMPILER_VERSION = DEFAULT_COMPILER_VERSION
+BENCHMARK_MAX_CYCLES = 5_000_000
+DEFAULT_BASELINE_FILE = os.path.join(_TEST_DIR, "benchmark_baseline.json")
+DEFAULT_THRESHOLD_PERCENT = 2.0
+CORPUS_DIR = os.path.join(_PROJECT_ROOT, "benchmarks")
+DEFAULT_CORPUS_BASELINE_FILE = os.path.join(CORPUS_DIR, "baseline.json")
+
+def load_example_cases(examples_path=None, version=BENCHMARK_COMPILER_VERSION):
+    """Loads the test cases of test_suites/examples/test_*.py, keyed as 'file::name'."""
+    examples_path = examples_path or EXAMPLES_DIR
+    cases = {}
+    for filename in sorted(os.listdir(examples_path)):
+        if not (filename.startswith("test_") and filename.endswith(".py")):
+            continue
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                file_cases = _load_tests_from_file(version, examples_path, filename)
+        except Exception as e:
+            print(f"Warning: Could not load '{filename}': {e}")
+            continue
+        for test_case in file_cases:
+            cases[f"{filename[:-3]}::{test_case['name']}"] = test_case
+    return cases
+
+def load_corpus_cases(corpus_path=CORPUS_DIR, version=BENCHMARK_COMPILER_VERSION):
+    """Loads the benchmark programs (one whole program per .py file), keyed as 'benchmarks::name'."""
+    cases = {}
+    for filename in sorted(os.listdir(corpus_path)):
+        if not filename.endswith(".py") or filename.startswith("_"):
+            continue
+        with open(os.path.join(corpus_path, filename), "r") as f:
+            code = f.read()
+        name = filename[:-3]
+        cases[f"benchmarks::{name}"] = {'name': name, 'code': code, 'compiler_version': version}
+    return cases
+
+def _c64_stubs():
+    """Stand-ins for the C64 functions and the @noinline decorator, so that CPython can run a case."""
+    specs = importlib.import_module("lib.c64_function_specs")
+    stubs = {name: (lambda *args: 0) if 'return' in spec else (lambda *args: None)
+             for name, spec in specs.C64_FUNCTION_SPECS.items()}
+    stubs.update({alias: stubs[name] for alias, name in specs.C64_HARDWARE_ALIASES.items() if name in stubs})
+    stubs['noinline'] = lambda function: function
+    stubs['input'] = lambda *args: ""
+    return stubs
+
+def expected_output(test_case):
+    """
+    The output a case must print: its 'output' key, else what CPython prints
+    running its code, followed by the name of the exception it raises, if any.
+    The C64 prints letters in upper case, so the text is upper-cased.
+    """
+    if 'output' in test_case:
+        return test_case['output'].upper()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            exec(compile(test_case['code'], test_case['name'], 'exec'), dict(_c64_stubs()))
+        except Exception as e:
+            print(type(e).__name__)
+    return output.getvalue().upper()
+
+def _normalize_output(text):
+    return "\n".join(line.rstrip() for line in text.strip().splitlines())
+
+def measure_case(test_case, max_cycles=BENCHMARK_MAX_CYCLES, options=None, cache=None):
+    """
+    Compiles, assembles and runs one test case. Returns a dict with a
+    'status' ('ok', 'compile_error', 'assemble_error', 'cycle_limit', 'brk'
+    or 'wrong_output' when the captured CHROUT output differs from
+    expected_output()) and, when the program could be built, the
+    BENCHMARK_METRICS.
+    """
+    compiler_version = test_case.get("compiler_version", BENCHMARK_COMPILER_VERSION)
+    compiler_main = importlib.import_module(f"{compiler_version}.main")
+    assembler = importlib.import_module("lib.assembler")
+    emulator = importlib.import_module("lib.emulator")
+    context = _new_context(compiler_version, options)
+
+    compilation_errors = []
+    diagnostics = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(diagnostics):
+            assembly = compiler_main.python_to_assembly(
+                test_case['code'], None,
+                lambda message, lineno: compilation_errors.append(f"L{lineno}: {message}"),
+                context=context, cache=cache
+            )
+    except Exception as e:
+        return {'status': 'compile_error', 'message': str(e)}
+    finally:
+        _collect_compile_profile(context)
+    # Errors reported through globals.report_compiler_error only reach stderr and the error count
+    reported = [line for line in diagnostics.getvalue().splitlines() if line.startswith("ERROR")]
+    if compilation_errors or assembly is None or context.error_count:
+        return {'status': 'compile_error', 'message': (compilation_errors + reported + [""])[0]}
+    zp_bytes = sum(size for _, size in context.zero_page.allocations().values())
+
+    try:
+        result = emulator.run_assembly(assembly, max_cycles=max_cycles)
+    except (assembler.AssemblerError, emulator.EmulatorError) as e:
+        return {'status': 'assemble_error', 'message': str(e)}
+    status = 'ok' if result['stopped'] == 'return' else result['stopped']
+    measured = {}
+    if status == 'ok':
+        expected = expected_output(test_case)
+        if _normalize_output(result['output']) != _normalize_output(expected):
+            status = 'wrong_output'
+            measured['message'] = f"printed {result['output'].strip()!r}, expected {expected.strip()!r}"
+    return {
+        'status': status,
+        **measured,
+        'cycles': result['cycles'],
+        'code_bytes': result['code_bytes'],
+        'data_bytes': result['data_bytes'],
+        'zp_bytes': zp_bytes,
+    }
+
+def compare_to_baseline(results, baseline, threshold_percent):
+    """
+    Returns the regressions as (case, metric, old, new) tuples. A metric
+    regresses when it grows by more than threshold_percent; a case that ran
+    in the baseline and no longer does is a regression of its status.
+    Cases the baseline could not measure are not compared.
+    """
+    regressions = []
+    for key, result in results.items():
+        old = baseline.get(key)
+        if old is None or old.get('status') != 'ok':
+            continue
+        if result['status'] != 'ok':
+            regressions.append((key, 'status', old['status'], result['status']))
+            continue
+        for metric in BENCHMARK_METRICS:
+            if result[metric] > old[metric] * (1 + threshold_percent / 100):
+                regressions.append((key, metric, old[metric], result[metric]))
+    return regressions
+
+def _percent_change(old, new):
+    if old is None or new is None or old == new:
+        return ""
+    if not old:
+        return "new"
+    return f"{(new - old) * 100 / old:+.1f}%"
+
+def format_benchmark_table(results, baseline, name_width=44):
+    """Compact table: one row per case, with the cycle change against the baseline."""
+    header = f"{'case':<{name_width}} {'status':<14} {'cycles':>9} {'delta':>7} {'code':>6} {'data':>6} {'zp':>4}"
+    rows = [header, "-" * len(header)]
+    for key, result in results.items():
+        name = key if len(key) <= name_width else key[:name_width - 3] + "..."
+        if result['status'] == 'ok' or 'cycles' in result:
+            old = baseline.get(key, {})
+            rows.append(
+                f"{name:<{name_width}} {result['status']:<14} {result['cycles']:>9} "
+                f"{_percent_change(old.get('cycles'), result['cycles']):>7} "
+                f"{result['code_bytes']:>6} {result['data_bytes']:>6} {result['zp_bytes']:>4}"
+            )
+        else:
+            rows.append(f"{name:<{name_width}} {result['status']:<14} {'-':>9} {'':>7} {'-':>6} {'-':>6} {'-':>4}")
+    return "\n".join(rows)
+
+def run_benchmarks(baseline_file, threshold_percent, update_baseline=False, max_cycles=BENCHMARK_MAX_CYCLES,
+                   cases=None, workers=1):
+    """Measures every case (by default the examples), prints the table and returns the process exit code."""
+    cases = load_example_cases() if cases is None else cases
+    started = time.perf_counter()
+    jobs = [('benchmark', test_case, max_cycles, dict(COMPILER_OPTIONS), COMPILE_CACHE) for test_case in cases.values()]
+    outcomes = run_jobs(jobs, workers)
+    results = {key: result for key, (result, _, _) in zip(cases, outcomes)}
+    elapsed = time.perf_counter() - started
+
+    baseline = {}
+    if os.path.exists(baseline_file):
+        with open(baseline_file, "r") as f:
+            baseline = json.load(f).get('cases', {})
+
+    print(format_benchmark_table(results, baseline))
+    measured = sum(1 for result in results.values() if result['status'] == 'ok')
+    print(f"\n--- Benchmark Summary ---")
+    print(f"Cases: {len(results)}, measured: {measured}, not runnable: {len(results) - measured}")
+    print(f"Time: {elapsed:.2f}s with {workers} worker(s). "
+          f"{format_slowest(list(cases), [seconds for _, _, seconds in outcomes])}")
+    if COMPILE_CACHE:
+        print(format_compile_cache_report())
+    for metric in BENCHMARK_METRICS:
+        total = sum(result[metric] for result in results.values() if result['status'] == 'ok')
+        print(f"Total {metric}: {total}")
+
+    if update_baseline or not baseline:
+        with open(baseline_file, "w") as f:
+            json.dump({'max_cycles': max_cycles, 'cases': results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to '{baseline_file}'.")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, threshold_percent)
+    for key, metric, old, new in regressions:
+        if metric == 'status':
+            print(f"REGRESSION: {key}: status {old} -> {new} {results[key].get('message', '')}".rstrip())
+        else:
+            print(f"REGRESSION: {key}: {metric} {old} -> {new} ({_percent_change(old, new) or new})")
+    print(f"Regressions past {threshold_percent}%: {len(regressions)}")
+    return 0 if not regressions else 1
+
 def _log_test_result(test_name, status, version, message="", log_file_handle=None):
     """Logs the test result to the specified file handle."""
     if log_file_handle:
@@ -188,9 +470,68 @@ if __name__ == "__main__":
     )
     parser.add_argument(
         "test_file", nargs="?", default=None,
-        help="Optional: specific test file to run in 'VERSION/filename.py' format (e.g., V1/test_arithmetic.py)."
+        help="Optional: specific test file of test_suites/examples to run (e.g., test_arithmetic.py)."
+    )
+    parser.add_argument(
+        "--no-overflow-checks", action="store_true",
+        help="Compile without integer overflow checks (shipping builds)."
+    )
+    parser.add_argument(
+        "--benchmark", action="store_true",
+        help="Compile, assemble and run every example and compare cycles and sizes against a baseline."
+    )
+    parser.add_argument(
+        "--corpus", action="store_true",
+        help="Benchmark the programs of the benchmarks/ corpus instead of the examples."
+    )
+    parser.add_argument(
+        "--baseline", default=None,
+        help="Benchmark baseline JSON file, written on the first run "
+             "(default: test_suites/benchmark_baseline.json, benchmarks/baseline.json with --corpus)."
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD_PERCENT,
+        help="Percentage a benchmark metric may grow before the run fails."
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Store the benchmark results as the new baseline."
+    )
+    parser.add_argument(
+        "--profile", metavar="FILE", default=None,
+        help="Profile every compilation (time and allocations per pass, handler and AST counts) "
+             "and write the merged profile to FILE: JSON for a .json name, a text report otherwise."
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Number of worker processes the cases are spread over (default: one per CPU; 1 runs them in this process)."
+    )
+    parser.add_argument(
+        "--cache", nargs="?", metavar="DIR", default=None, const="",
+        help="Reuse the compilations stored in an on-disk compile cache, and store the new ones "
+             "(default directory: $PY2C64_CACHE_DIR or ~/.cache/py2c64)."
+    )
+    parser.add_argument(
+        "--cache-size", type=float, default=64, metavar="MB",
+        help="Size the compile cache is kept under by evicting the least recently used entries (default 64 MB)."
     )
     args = parser.parse_args()
+    if args.cache is not None:
+        compile_cache = importlib.import_module("lib.compile_cache")
+        COMPILE_CACHE = (args.cache or compile_cache.DEFAULT_CACHE_DIR, int(args.cache_size * 1024 * 1024))
+    if args.profile:
+        COMPILER_OPTIONS['profile'] = True
+        atexit.register(write_compile_profile, args.profile)
+    if args.no_overflow_checks:
+        COMPILER_OPTIONS['overflow_checks'] = False
+    if args.benchmark or args.corpus:
+        if args.corpus:
+            baseline_file = args.baseline or DEFAULT_CORPUS_BASELINE_FILE
+            cases = load_corpus_cases()
+        else:
+            baseline_file = args.baseline or DEFAULT_BASELINE_FILE
+            cases = None
+        sys.exit(run_benchmarks(baseline_file, args.threshold, update_baseline=args.update_baseline, cases=cases,
+                                workers=args.jobs))
 
     LOGS_DIR = os.path.join(_TEST_DIR, "logs")
     PASSED_LOG_FILENAME = "passed_tests.log"
@@ -215,35 +556,40 @@ if __name__ == "__main__":
     num_regenerated = 0
     num_failed_regeneration = 0
 
+    started = time.perf_counter()
+    jobs = [('test', test_case, args.regenerate, dict(COMPILER_OPTIONS), COMPILE_CACHE) for test_case in test_cases]
     try:
-        for test_case in test_cases:
+        for test_case, (passed, output, seconds) in zip(test_cases, run_jobs(jobs, args.jobs)):
+            print(output, end="")
             version = test_case.get('compiler_version', 'UNKNOWN')
+            timing = f" ({seconds:.2f}s)"
             if args.regenerate:
                 if "expected" in test_case and test_case["expected"]:
-                    if run_test(test_case, regenerate_mode=True):
+                    if passed:
                         num_regenerated += 1
-                        _log_test_result(test_case['name'], "REGENERATED", version, "File regenerated successfully", passed_log_file)
+                        _log_test_result(test_case['name'], "REGENERATED", version, "File regenerated successfully" + timing, passed_log_file)
                     else:
-                        _log_test_result(test_case['name'], "REGENERATION FAILED", version, "Error during regeneration", failed_log_file)
+                        _log_test_result(test_case['name'], "REGENERATION FAILED", version, "Error during regeneration" + timing, failed_log_file)
                         num_failed_regeneration += 1
-                else:
-                    # Test without 'expected' file, just run it
-                    run_test(test_case, regenerate_mode=True)
             else:
-                if run_test(test_case, regenerate_mode=False):
+                if passed:
                     num_passed += 1
-                    _log_test_result(test_case['name'], "PASSED", version, "Test completed successfully", passed_log_file)
+                    _log_test_result(test_case['name'], "PASSED", version, "Test completed successfully" + timing, passed_log_file)
                 else:
-                    _log_test_result(test_case['name'], "FAILED", version, "Test did not pass or had an error", failed_log_file)
+                    _log_test_result(test_case['name'], "FAILED", version, "Test did not pass or had an error" + timing, failed_log_file)
     finally:
         if passed_log_file: passed_log_file.close()
         if failed_log_file: failed_log_file.close()
+    elapsed = time.perf_counter() - started
 
     if not test_cases:
         print(f"\nNo tests found or executed.")
         sys.exit(0 if not args.test_file else 1)
 
     print(f"\n--- Test Summary ---")
+    print(f"Time: {elapsed:.2f}s with {args.jobs} worker(s)")
+    if COMPILE_CACHE:
+        print(format_compile_cache_report())
     if args.regenerate:
         processed_count = num_regenerated + num_failed_regeneration
         print(f"Test cases processed for regeneration: {processed_count}")